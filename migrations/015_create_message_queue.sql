@@ -0,0 +1,74 @@
+-- ============================================================================
+-- CREATE MESSAGE QUEUE TABLES
+-- ============================================================================
+-- Tables backing the postgres queue backend (QUEUE_BACKEND=postgres):
+--   message_queue      pending/processing messages, claimed with SKIP LOCKED
+--   message_queue_dlq  messages that exhausted their retries
+-- ============================================================================
+
+SET search_path = app, extensions, public;
+
+DO $$
+BEGIN
+    RAISE NOTICE '==============================================';
+    RAISE NOTICE 'Creating message queue tables...';
+    RAISE NOTICE '==============================================';
+END $$;
+
+CREATE TABLE IF NOT EXISTS message_queue (
+    id             TEXT PRIMARY KEY,
+    task_name      TEXT NOT NULL,
+    payload        JSONB NOT NULL DEFAULT '{}'::jsonb,
+    status         TEXT NOT NULL DEFAULT 'pending'
+                   CHECK (status IN ('pending', 'processing')),
+    attempts       INTEGER NOT NULL DEFAULT 0,
+    lane           TEXT NOT NULL DEFAULT 'default',
+    priority       INTEGER NOT NULL DEFAULT 0,
+    correlation_id TEXT,
+    owner_id       TEXT,
+    next_retry_at  TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    locked_until   TIMESTAMP WITH TIME ZONE,
+    created_at     TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    updated_at     TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+-- Claim path: due pending messages by lane, highest priority first
+CREATE INDEX IF NOT EXISTS idx_message_queue_poll
+    ON message_queue (lane, priority DESC, created_at)
+    WHERE status = 'pending';
+CREATE INDEX IF NOT EXISTS idx_message_queue_next_retry
+    ON message_queue (next_retry_at)
+    WHERE status = 'pending';
+-- Expired leases (crashed workers)
+CREATE INDEX IF NOT EXISTS idx_message_queue_locked_until
+    ON message_queue (locked_until)
+    WHERE status = 'processing';
+
+CREATE TABLE IF NOT EXISTS message_queue_dlq (
+    id             TEXT PRIMARY KEY,
+    task_name      TEXT NOT NULL,
+    payload        JSONB NOT NULL DEFAULT '{}'::jsonb,
+    attempts       INTEGER NOT NULL DEFAULT 0,
+    lane           TEXT NOT NULL DEFAULT 'default',
+    priority       INTEGER NOT NULL DEFAULT 0,
+    correlation_id TEXT,
+    owner_id       TEXT,
+    error_reason   TEXT,
+    created_at     TIMESTAMP WITH TIME ZONE NOT NULL,
+    failed_at      TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_message_queue_dlq_task_name ON message_queue_dlq (task_name);
+CREATE INDEX IF NOT EXISTS idx_message_queue_dlq_failed_at ON message_queue_dlq (failed_at);
+
+COMMENT ON TABLE message_queue IS 'Background task queue (postgres queue backend)';
+COMMENT ON COLUMN message_queue.next_retry_at IS 'Message is not claimed before this time (delayed retries)';
+COMMENT ON COLUMN message_queue.locked_until IS 'Lease of the worker processing the message; reclaimable once expired';
+COMMENT ON TABLE message_queue_dlq IS 'Queue messages that exhausted their retries';
+
+DO $$
+BEGIN
+    RAISE NOTICE '==============================================';
+    RAISE NOTICE 'Message queue tables created!';
+    RAISE NOTICE '==============================================';
+END $$;
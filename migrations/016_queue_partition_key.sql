@@ -0,0 +1,32 @@
+-- ============================================================================
+-- MESSAGE QUEUE PARTITION KEYS
+-- ============================================================================
+-- Messages sharing a partition_key (a conversation's session key) are claimed
+-- one at a time, in enqueue order, by the postgres queue backend.
+-- ============================================================================
+
+SET search_path = app, extensions, public;
+
+DO $$
+BEGIN
+    RAISE NOTICE '==============================================';
+    RAISE NOTICE 'Adding partition keys to the message queue...';
+    RAISE NOTICE '==============================================';
+END $$;
+
+ALTER TABLE message_queue ADD COLUMN IF NOT EXISTS partition_key TEXT;
+ALTER TABLE message_queue_dlq ADD COLUMN IF NOT EXISTS partition_key TEXT;
+
+-- Partition head check: older or in-flight messages of the same key
+CREATE INDEX IF NOT EXISTS idx_message_queue_partition
+    ON message_queue (partition_key, created_at, id)
+    WHERE partition_key IS NOT NULL;
+
+COMMENT ON COLUMN message_queue.partition_key IS 'Messages with the same key are processed one at a time, in order (NULL = unordered)';
+
+DO $$
+BEGIN
+    RAISE NOTICE '==============================================';
+    RAISE NOTICE 'Message queue partition keys added!';
+    RAISE NOTICE '==============================================';
+END $$;
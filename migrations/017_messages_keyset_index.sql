@@ -0,0 +1,28 @@
+-- ============================================================================
+-- MESSAGES KEYSET PAGINATION
+-- ============================================================================
+-- Conversation history is paged by (timestamp, msg_id) instead of OFFSET.
+-- This index serves both the keyset seek and the ordered scan, and makes
+-- idx_messages_conv_ts (a prefix of it) redundant.
+-- ============================================================================
+
+SET search_path = app, extensions, public;
+
+DO $$
+BEGIN
+    RAISE NOTICE '==============================================';
+    RAISE NOTICE 'Adding messages keyset index...';
+    RAISE NOTICE '==============================================';
+END $$;
+
+CREATE INDEX IF NOT EXISTS idx_messages_conv_ts_id
+    ON messages (conv_id, timestamp, msg_id);
+
+DROP INDEX IF EXISTS idx_messages_conv_ts;
+
+DO $$
+BEGIN
+    RAISE NOTICE '==============================================';
+    RAISE NOTICE 'Messages keyset index added!';
+    RAISE NOTICE '==============================================';
+END $$;
@@ -0,0 +1,141 @@
+"""
+Benchmark: Python overhead per PostgresAsyncRepository query.
+
+Runs the generic CRUD calls used on the hot paths (create, find_by_id,
+find_by and a versioned update) against an in-memory connection that
+returns a canned row, so only the Python side is measured (building the
+SQL, converting placeholders, binding parameters and building the model):
+
+- before: the previous path. The psycopg2 sql tree is rebuilt, rendered
+  and split on %s for every call.
+- after: the asyncpg SQL is compiled once per operation and column set
+  (PostgresAsyncRepository._compile).
+
+The database round trip is not included; on a real server the stable SQL
+text additionally lets asyncpg reuse its per-connection prepared statements.
+
+Usage:
+    python scripts/benchmark/postgres_query_benchmark.py --calls 20000
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+from psycopg2 import sql
+from pydantic import BaseModel
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from src.core.database.postgres_async_repository import PostgresAsyncRepository
+
+ROW = {
+    "msg_id": "01ARZ3NDEKTSV4RRFFQ69G5FAV",
+    "conv_id": "01ARZ3NDEKTSV4RRFFQ69G5FAW",
+    "owner_id": "01ARZ3NDEKTSV4RRFFQ69G5FAX",
+    "body": "Mensagem de teste",
+    "direction": "inbound",
+    "version": 1,
+}
+
+
+class Row(BaseModel):
+    msg_id: str
+    conv_id: str
+    owner_id: str
+    body: Optional[str] = None
+    direction: str
+    version: int = 1
+
+
+class StubConnection:
+    """Returns the canned row for every statement."""
+
+    async def fetchrow(self, query, *args):
+        return ROW
+
+    async def fetch(self, query, *args):
+        return [ROW]
+
+    async def execute(self, query, *args):
+        return "UPDATE 1"
+
+
+class StubDatabase:
+    def __init__(self):
+        self.conn = StubConnection()
+
+    @asynccontextmanager
+    async def connection(self):
+        yield self.conn
+
+
+class LegacyRepository(PostgresAsyncRepository[Row]):
+    """Rebuilds and converts every statement per call (the previous behaviour)."""
+
+    def _compile(self, key: Tuple, build: Callable[[], sql.Composable]) -> str:
+        parts = build().as_string(None).split("%s")
+        new_query = []
+        for i, part in enumerate(parts[:-1]):
+            new_query.append(part)
+            new_query.append(f"${i+1}")
+        new_query.append(parts[-1])
+        return "".join(new_query)
+
+
+async def one_round(repository: PostgresAsyncRepository) -> None:
+    await repository.create(ROW)
+    await repository.find_by_id(ROW["msg_id"], id_column="msg_id")
+    await repository.find_by({"conv_id": ROW["conv_id"], "owner_id": ROW["owner_id"]}, limit=1)
+    await repository.update(
+        ROW["conv_id"],
+        {"updated_at": datetime.now(timezone.utc)},
+        id_column="conv_id",
+        current_version=1,
+    )
+
+
+async def run(repository: PostgresAsyncRepository, calls: int) -> float:
+    """Returns microseconds per query."""
+    rounds = calls // 4
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await one_round(repository)
+    elapsed = time.perf_counter() - start
+    return elapsed / (rounds * 4) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=3, help="Best of N rounds per variant")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    db = StubDatabase()
+    variants = {
+        "before": LegacyRepository(db, "app.messages", Row),
+        "after": PostgresAsyncRepository(db, "app.messages", Row),
+    }
+
+    print(f"{args.calls} queries, best of {args.rounds}")
+    print(f"{'variant':>8} {'us/query':>10}")
+    results = {}
+    for variant, repository in variants.items():
+        asyncio.run(run(repository, min(args.calls, 400)))  # Warm-up
+        results[variant] = min(
+            asyncio.run(run(repository, args.calls)) for _ in range(args.rounds)
+        )
+        print(f"{variant:>8} {results[variant]:>10.1f}")
+    print(f"speedup: {results['before'] / results['after']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+"""
+Benchmark: queue throughput and latency across backends.
+
+Drives QueueService with synthetic producers and a no-op or sleep handler,
+consumed by QueueService.start_worker at the configured concurrency.
+
+Two phases per backend:
+- throughput: enqueue all messages with no consumer running (enqueue msg/s),
+  then start the worker and drain them (dequeue msg/s).
+- latency: producers and worker run together; every message is timed from
+  enqueue to ack (p50/p95/p99).
+
+Backends: sqlite, sqlite_wal, sqs (in-memory SQS stub, needs boto3 installed),
+postgres (needs --postgres-dsn and migration 015) and bullmq (needs
+--redis-url; BullMQ opens its own Redis connections, so it cannot run
+against an in-process stand-in). For bullmq, acks are implicit and the
+latency ends when the handler returns.
+
+Usage:
+    python scripts/benchmark/queue_benchmark.py --messages 2000 --concurrency 8
+    python scripts/benchmark/queue_benchmark.py --backends sqlite_wal,sqs \\
+        --handler sleep --sleep-ms 5 --producers 4 --batch 10
+"""
+
+import argparse
+import asyncio
+import itertools
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from src.core.config import settings
+from src.core.queue.backends.sqlite import SqliteQueueBackend
+from src.core.queue.backends.sqlite_wal import SqliteWalQueueBackend
+from src.core.queue.interfaces import QueueBackend
+from src.core.queue.models import QueueMessage
+from src.core.queue.service import QueueService
+
+TASK_NAME = "benchmark"
+
+
+class InMemorySQS:
+    """
+    Minimal stand-in for the boto3 SQS client methods used by SQSBackend.
+    Received messages become invisible until deleted or their visibility
+    changes; receive_message honours WaitTimeSeconds by polling.
+    """
+
+    def __init__(self):
+        self._queues: Dict[str, Deque[dict]] = {}
+        self._in_flight: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+
+    def _queue(self, queue_url: str) -> Deque[dict]:
+        return self._queues.setdefault(queue_url, deque())
+
+    def send_message(self, QueueUrl, MessageBody, MessageAttributes=None):
+        message_id = f"sqs-{next(self._ids)}"
+        with self._lock:
+            self._queue(QueueUrl).append({"MessageId": message_id, "Body": MessageBody})
+        return {"MessageId": message_id}
+
+    def send_message_batch(self, QueueUrl, Entries):
+        successful = []
+        for entry in Entries:
+            response = self.send_message(QueueUrl, entry["MessageBody"])
+            successful.append({"Id": entry["Id"], "MessageId": response["MessageId"]})
+        return {"Successful": successful, "Failed": []}
+
+    def receive_message(self, QueueUrl, MaxNumberOfMessages=1, WaitTimeSeconds=0, **kwargs):
+        deadline = time.monotonic() + WaitTimeSeconds
+        while True:
+            with self._lock:
+                queue = self._queue(QueueUrl)
+                messages = []
+                while queue and len(messages) < MaxNumberOfMessages:
+                    message = queue.popleft()
+                    receipt = f"receipt-{next(self._ids)}"
+                    self._in_flight[receipt] = (QueueUrl, message)
+                    messages.append({**message, "ReceiptHandle": receipt})
+            if messages or time.monotonic() >= deadline:
+                return {"Messages": messages}
+            time.sleep(0.01)
+
+    def delete_message(self, QueueUrl, ReceiptHandle):
+        with self._lock:
+            self._in_flight.pop(ReceiptHandle, None)
+
+    def change_message_visibility(self, QueueUrl, ReceiptHandle, VisibilityTimeout):
+        # Retries become visible immediately; the benchmark handler never fails
+        with self._lock:
+            entry = self._in_flight.pop(ReceiptHandle, None)
+            if entry:
+                self._queue(entry[0]).append(entry[1])
+
+
+def build_backend(name: str, args: argparse.Namespace, prefix: str) -> QueueBackend:
+    if name == "sqlite":
+        return SqliteQueueBackend(db_path=f"{prefix}.db")
+
+    if name == "sqlite_wal":
+        return SqliteWalQueueBackend(
+            db_path=f"{prefix}.db",
+            batch_size=args.claim_batch_size,
+        )
+
+    if name == "sqs":
+        from src.core.queue.backends.sqs import SQSBackend
+
+        backend = SQSBackend(queue_url="memory://benchmark", region_name="us-east-1")
+        backend.sqs = InMemorySQS()
+        return backend
+
+    if name == "postgres":
+        if not args.postgres_dsn:
+            raise RuntimeError("--postgres-dsn is required for the postgres backend")
+        from src.core.database.postgres_async_session import AsyncPostgresDatabase
+        from src.core.queue.backends.postgres import PostgresQueueBackend
+
+        return PostgresQueueBackend(
+            db=AsyncPostgresDatabase(dsn=args.postgres_dsn),
+            batch_size=args.claim_batch_size,
+        )
+
+    if name == "bullmq":
+        if not args.redis_url:
+            raise RuntimeError("--redis-url is required for the bullmq backend")
+        from src.core.queue.backends.bullmq import BullMQBackend
+
+        return BullMQBackend(redis_url=args.redis_url)
+
+    raise ValueError(f"Unknown backend: {name}")
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return float("nan")
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class Probe:
+    """
+    Records enqueue-to-ack latency. The handler maps the message id to the
+    enqueue timestamp carried in its payload; the wrapped backend.ack
+    closes the measurement.
+    """
+
+    def __init__(self, service: QueueService, ack_is_explicit: bool):
+        self.service = service
+        self.latencies: List[float] = []
+        self.done = 0
+        self._awaiting_ack: Dict[str, float] = {}
+        self._ack_is_explicit = ack_is_explicit
+
+        backend = service.backend
+        original_ack = backend.ack
+
+        async def ack(message_id: str) -> None:
+            await original_ack(message_id)
+            sent_at = self._awaiting_ack.pop(message_id, None)
+            if sent_at is not None:
+                self._record(sent_at)
+
+        backend.ack = ack
+
+        original_process = service._process_message
+
+        async def process_message(message: QueueMessage) -> None:
+            await original_process(message)
+            sent_at = message.payload.get("sent_at")
+            if sent_at is None:
+                return
+            if self._ack_is_explicit:
+                self._awaiting_ack[message.id] = sent_at
+            else:
+                self._record(sent_at)
+
+        service._process_message = process_message
+
+    def _record(self, sent_at: float) -> None:
+        self.latencies.append(time.perf_counter() - sent_at)
+        self.done += 1
+
+
+def make_handler(args: argparse.Namespace) -> Callable:
+    async def noop(payload):
+        return None
+
+    async def sleep(payload):
+        await asyncio.sleep(args.sleep_ms / 1000)
+
+    return sleep if args.handler == "sleep" else noop
+
+
+async def produce(
+    service: QueueService, messages: int, producers: int, batch: int, rate: float
+) -> float:
+    """Enqueue `messages` across `producers` tasks; returns elapsed seconds."""
+    per_producer = [messages // producers] * producers
+    for i in range(messages % producers):
+        per_producer[i] += 1
+    body = "x" * 256
+    interval = producers / rate if rate else 0
+
+    async def producer(count: int):
+        sent = 0
+        while sent < count:
+            size = min(batch, count - sent)
+            tasks = [
+                {"task_name": TASK_NAME, "payload": {"body": body, "sent_at": time.perf_counter()}}
+                for _ in range(size)
+            ]
+            if size == 1:
+                await service.enqueue(tasks[0]["task_name"], tasks[0]["payload"])
+            else:
+                await service.enqueue_many(tasks)
+            sent += size
+            if interval:
+                await asyncio.sleep(interval * size)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(producer(count) for count in per_producer))
+    return time.perf_counter() - start
+
+
+async def wait_for(predicate: Callable[[], bool], timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise TimeoutError("Benchmark did not drain in time")
+        await asyncio.sleep(0.005)
+
+
+async def stop(worker: asyncio.Task, backend: QueueBackend) -> None:
+    worker.cancel()
+    try:
+        await worker
+    except asyncio.CancelledError:
+        pass
+    if isinstance(backend, SqliteWalQueueBackend):
+        await backend.flush()
+
+
+def start_service(name: str, args: argparse.Namespace, tmp: str, phase: str):
+    """
+    Fresh backend per phase: a cancelled worker may still hold an in-flight
+    poll (e.g. SQS long polling) that would swallow the next phase's messages.
+    """
+    backend = build_backend(name, args, os.path.join(tmp, f"{name}-{phase}"))
+    service = QueueService(backend=backend)
+    service.register_handler(TASK_NAME, make_handler(args))
+    probe = Probe(service, ack_is_explicit=name != "bullmq")
+    return backend, service, probe
+
+
+async def run_backend(name: str, args: argparse.Namespace, tmp: str) -> dict:
+    result = {}
+
+    # Phase 1: throughput (enqueue, then drain)
+    if name != "bullmq":
+        backend, service, probe = start_service(name, args, tmp, "throughput")
+        try:
+            elapsed = await produce(service, args.messages, args.producers, args.batch, 0)
+            result["enqueue_per_sec"] = args.messages / elapsed
+
+            start = time.perf_counter()
+            worker = asyncio.create_task(service.start_worker())
+            await wait_for(lambda: probe.done >= args.messages, args.timeout)
+            result["dequeue_per_sec"] = args.messages / (time.perf_counter() - start)
+            await stop(worker, backend)
+        finally:
+            close(backend)
+
+    # Phase 2: latency (producers and worker together)
+    backend, service, probe = start_service(name, args, tmp, "latency")
+    try:
+        worker = asyncio.create_task(service.start_worker())
+        elapsed = await produce(
+            service, args.messages, args.producers, args.batch, args.rate
+        )
+        if name == "bullmq":
+            result["enqueue_per_sec"] = args.messages / elapsed
+        await wait_for(lambda: probe.done >= args.messages, args.timeout)
+        await stop(worker, backend)
+    finally:
+        close(backend)
+
+    latencies = sorted(probe.latencies)
+    for pct in (50, 95, 99):
+        result[f"p{pct}_ms"] = percentile(latencies, pct) * 1000
+    return result
+
+
+def close(backend: QueueBackend) -> None:
+    if isinstance(backend, SqliteWalQueueBackend):
+        backend.close()
+
+
+def fmt(value: Optional[float], digits: int = 0) -> str:
+    return "-" if value is None else f"{value:.{digits}f}"
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--backends", default="sqlite,sqlite_wal,sqs")
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--producers", type=int, default=1)
+    parser.add_argument("--batch", type=int, default=1, help="Messages per enqueue_many call")
+    parser.add_argument("--rate", type=float, default=0, help="Latency phase target msg/s (0 = as fast as possible)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Worker handler concurrency")
+    parser.add_argument("--handler", choices=("noop", "sleep"), default="noop")
+    parser.add_argument("--sleep-ms", type=float, default=5.0)
+    parser.add_argument("--claim-batch-size", type=int, default=10)
+    parser.add_argument("--timeout", type=float, default=300.0)
+    parser.add_argument("--postgres-dsn", default=os.getenv("BENCHMARK_POSTGRES_DSN"))
+    parser.add_argument("--redis-url", default=os.getenv("BENCHMARK_REDIS_URL"))
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    settings.queue.worker_concurrency = args.concurrency
+    settings.queue.task_concurrency = {}
+    settings.queue.min_idle_wait = 0.001
+    settings.queue.max_idle_wait = 0.05
+
+    print(
+        f"Messages: {args.messages}  producers: {args.producers}  batch: {args.batch}  "
+        f"concurrency: {args.concurrency}  handler: {args.handler}"
+    )
+    header = ("backend", "enqueue/s", "dequeue/s", "p50 ms", "p95 ms", "p99 ms")
+    print(f"{header[0]:<12}" + "".join(f"{h:>12}" for h in header[1:]))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in args.backends.split(","):
+            name = name.strip()
+            try:
+                r = await run_backend(name, args, tmp)
+            except (ImportError, RuntimeError) as e:
+                print(f"{name:<12} skipped: {e}")
+                continue
+            print(
+                f"{name:<12}{fmt(r.get('enqueue_per_sec')):>12}{fmt(r.get('dequeue_per_sec')):>12}"
+                f"{fmt(r['p50_ms'], 2):>12}{fmt(r['p95_ms'], 2):>12}{fmt(r['p99_ms'], 2):>12}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,132 @@
+"""
+Benchmark: Whisper transcription throughput on CPU.
+
+Transcribes a set of clips through TranscriptionEngine (all submitted at
+once, as concurrent transcribe_audio tasks would) and reports audio-seconds
+transcribed per wall-second, for each worker count given.
+
+Clips come from --audio (files or directories of .ogg/.mp3/.wav/...); each is
+submitted --repeat times. Without --audio, synthetic 5 s clips are generated
+(a tone with noise: fine for measuring throughput, not for accuracy; with
+VAD on, most of it may be trimmed, so prefer real voice notes).
+
+The model is downloaded on first use, so run once to warm the cache.
+
+Usage:
+    python scripts/benchmark/transcription_benchmark.py --audio samples/ --workers 1,2,4
+    python scripts/benchmark/transcription_benchmark.py --model tiny --clips 16 --no-vad
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from faster_whisper.audio import decode_audio
+
+from src.modules.ai.services.transcription_engine import TranscriptionEngine
+from src.modules.ai.services.transcription_service import TranscriptionService
+
+SAMPLE_RATE = 16000
+AUDIO_EXTENSIONS = {".ogg", ".oga", ".opus", ".mp3", ".wav", ".m4a", ".flac", ".webm"}
+
+
+def collect_audio(paths: List[str]) -> List[str]:
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(
+                str(p) for p in sorted(Path(path).rglob("*"))
+                if p.suffix.lower() in AUDIO_EXTENSIONS
+            )
+        else:
+            files.append(path)
+    return files
+
+
+def generate_clips(count: int, seconds: float, directory: str) -> List[str]:
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    files = []
+    for i in range(count):
+        signal = 0.3 * np.sin(2 * np.pi * (180 + 20 * i) * t) + 0.05 * rng.standard_normal(t.size)
+        path = os.path.join(directory, f"clip_{i}.wav")
+        with wave.open(path, "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(SAMPLE_RATE)
+            f.writeframes((np.clip(signal, -1, 1) * 32767).astype(np.int16).tobytes())
+        files.append(path)
+    return files
+
+
+async def run(service: TranscriptionService, args: argparse.Namespace, clips: List[str]) -> float:
+    engine = TranscriptionEngine(service)
+    start = time.perf_counter()
+    texts = await asyncio.gather(*[engine.transcribe(clip, args.language) for clip in clips])
+    elapsed = time.perf_counter() - start
+    await engine.close()
+    empty = sum(1 for text in texts if not text)
+    if empty:
+        print(f"  note: {empty}/{len(texts)} clips produced no text")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--audio", nargs="*", default=[], help="Audio files or directories")
+    parser.add_argument("--clips", type=int, default=8, help="Synthetic clips when --audio is not given")
+    parser.add_argument("--clip-seconds", type=float, default=5.0)
+    parser.add_argument("--repeat", type=int, default=1, help="Submit each clip N times")
+    parser.add_argument("--model", default="base")
+    parser.add_argument("--compute-type", default="int8")
+    parser.add_argument("--beam-size", type=int, default=5)
+    parser.add_argument("--workers", default="1,2", help="Comma-separated worker counts to compare")
+    parser.add_argument("--cpu-threads", type=int, default=0, help="Threads per worker (0 = cores / workers)")
+    parser.add_argument("--language", default=None, help="Skip language detection (e.g. pt)")
+    parser.add_argument("--no-vad", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        clips = collect_audio(args.audio) if args.audio else generate_clips(args.clips, args.clip_seconds, tmp)
+        if not clips:
+            parser.error("no audio files found")
+        clips = clips * args.repeat
+        audio_seconds = sum(len(decode_audio(clip)) / SAMPLE_RATE for clip in clips)
+
+        cores = os.cpu_count() or 1
+        print(f"{len(clips)} clips, {audio_seconds:.1f} audio-seconds, {cores} CPU cores, model={args.model}")
+        print(f"{'workers':>8} {'threads':>8} {'wall s':>9} {'audio-s/wall-s':>15}")
+
+        for workers in [int(w) for w in args.workers.split(",") if w]:
+            service = TranscriptionService(
+                model_size=args.model,
+                device="cpu",
+                compute_type=args.compute_type,
+                beam_size=args.beam_size,
+                num_workers=workers,
+                cpu_threads=args.cpu_threads or max(1, cores // workers),
+                vad_filter=not args.no_vad,
+            )
+            service.model  # Load outside the timed section
+
+            elapsed = asyncio.run(run(service, args, clips))
+            service.shutdown()
+            print(f"{workers:>8} {service.cpu_threads:>8} {elapsed:>9.2f} {audio_seconds / elapsed:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
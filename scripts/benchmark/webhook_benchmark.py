@@ -0,0 +1,218 @@
+"""
+Benchmark: /webhooks/inbound ingestion, requests per second per worker.
+
+Serves two copies of the inbound endpoint from one event loop (the
+equivalent of a single uvicorn worker) and drives each with signed
+Twilio-style form posts sent straight through the ASGI interface (no
+sockets or HTTP client, so only server-side handling is measured):
+
+- before: the previous path. parse_twilio_payload builds the Pydantic model,
+  the signature check re-reads the form and builds a new RequestValidator,
+  and the model is dumped by alias for the queue.
+- after: the form is parsed once (read_twilio_form), checked with the cached
+  per-account TwilioSignatureValidator and enqueued as the raw dict via
+  TwilioWebhookService.enqueue_webhook_form.
+
+The queue is an in-memory stub that JSON-encodes the payload (as the real
+backends do), so the numbers isolate request handling; HTTP parsing by
+uvicorn itself is not included.
+
+Usage:
+    python scripts/benchmark/webhook_benchmark.py --requests 5000 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from unittest.mock import MagicMock
+from urllib.parse import urlencode
+
+from fastapi import Depends, FastAPI, Header, HTTPException, Request
+from twilio.request_validator import RequestValidator
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from src.core.config import settings
+from src.modules.channels.twilio.api.dependencies import parse_twilio_payload, read_twilio_form
+from src.modules.channels.twilio.models.domain import TwilioWhatsAppPayload
+from src.modules.channels.twilio.services.twilio_webhook_service import TwilioWebhookService
+from src.modules.channels.twilio.services.webhook.signature_validator import TwilioSignatureValidator
+
+AUTH_TOKEN = "benchmark-auth-token"
+
+
+class StubQueueService:
+    """Serialises payloads like a real backend and drops them."""
+
+    def __init__(self):
+        self.enqueued = 0
+
+    def register_handler(self, *args, **kwargs):
+        pass
+
+    async def enqueue(self, task_name, payload, **kwargs):
+        json.dumps(payload)
+        self.enqueued += 1
+
+
+def make_form(i: int) -> Dict[str, str]:
+    return {
+        "MessageSid": f"SM{i:032d}",
+        "AccountSid": settings.twilio.account_sid,
+        "Body": f"Mensagem de teste {i}",
+        "MessageType": "text",
+        "From": "whatsapp:+5511999999999",
+        "WaId": "5511999999999",
+        "ProfileName": "Benchmark",
+        "To": "whatsapp:+14155238886",
+        "NumMedia": "0",
+        "NumSegments": "1",
+        "SmsStatus": "received",
+        "ApiVersion": "2010-04-01",
+        "ChannelMetadata": '{"type": "whatsapp", "data": {"context": {}}}',
+    }
+
+
+def build_app(queue: StubQueueService) -> FastAPI:
+    app = FastAPI()
+    service = TwilioWebhookService(
+        owner_resolver=MagicMock(),
+        message_handler=MagicMock(),
+        audio_processor=MagicMock(),
+        ai_processor=MagicMock(),
+        queue_service=queue,
+    )
+    signature_validator = TwilioSignatureValidator()
+
+    async def legacy_payload(request: Request) -> TwilioWhatsAppPayload:
+        return await parse_twilio_payload(dict(await request.form()))
+
+    async def legacy_validate(
+        request: Request, signature: Optional[str] = Header(None, alias="X-Twilio-Signature")
+    ):
+        validator = RequestValidator(settings.twilio.auth_token)
+        if not validator.validate(str(request.url), await request.form(), signature):
+            raise HTTPException(status_code=403, detail="Invalid signature")
+
+    async def fast_validate(
+        request: Request,
+        form_data: Dict[str, str] = Depends(read_twilio_form),
+        signature: Optional[str] = Header(None, alias="X-Twilio-Signature"),
+    ):
+        if not await signature_validator.validate(str(request.url), form_data, signature):
+            raise HTTPException(status_code=403, detail="Invalid signature")
+
+    @app.post("/before/webhooks/inbound")
+    async def before(
+        payload: TwilioWhatsAppPayload = Depends(legacy_payload),
+        _: None = Depends(legacy_validate),
+    ):
+        return await service.enqueue_webhook_event(payload)
+
+    @app.post("/after/webhooks/inbound")
+    async def after(
+        form_data: Dict[str, str] = Depends(read_twilio_form),
+        _: None = Depends(fast_validate),
+    ):
+        return await service.enqueue_webhook_form(form_data)
+
+    return app
+
+
+async def call(app: FastAPI, path: str, body: bytes, signature: str) -> int:
+    """Send one POST straight through the ASGI interface; returns the status."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "server": ("bench", 80),
+        "client": ("127.0.0.1", 50000),
+        "root_path": "",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [
+            (b"host", b"bench"),
+            (b"content-type", b"application/x-www-form-urlencoded"),
+            (b"content-length", str(len(body)).encode()),
+            (b"x-twilio-signature", signature.encode()),
+        ],
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def run(app: FastAPI, variant: str, requests: int, concurrency: int) -> float:
+    path = f"/{variant}/webhooks/inbound"
+    validator = RequestValidator(AUTH_TOKEN)
+    bodies = []
+    for i in range(requests):
+        form = make_form(i)
+        signature = validator.compute_signature(f"http://bench{path}", form)
+        bodies.append((urlencode(form).encode(), signature))
+
+    counter = iter(range(requests))
+    failures = 0
+
+    async def worker():
+        nonlocal failures
+        for i in counter:
+            if await call(app, path, *bodies[i]) != 200:
+                failures += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - start
+
+    if failures:
+        print(f"  {variant}: {failures} failed requests")
+    return requests / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=3, help="Best of N rounds per variant")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    settings.twilio.account_sid = settings.twilio.account_sid or "AC_benchmark"
+    settings.twilio.auth_token = AUTH_TOKEN
+
+    queue = StubQueueService()
+    app = build_app(queue)
+
+    print(f"{args.requests} requests, concurrency {args.concurrency}, best of {args.rounds}")
+    print(f"{'variant':>8} {'req/s':>10}")
+    results = {}
+    for variant in ("before", "after"):
+        asyncio.run(run(app, variant, min(args.requests, 200), args.concurrency))  # Warm-up
+        results[variant] = max(
+            asyncio.run(run(app, variant, args.requests, args.concurrency))
+            for _ in range(args.rounds)
+        )
+        print(f"{variant:>8} {results[variant]:>10.0f}")
+    print(f"speedup: {results['after'] / results['before']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
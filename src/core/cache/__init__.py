@@ -0,0 +1,18 @@
+"""Cache backends (in-process TTL LRU, disk-backed Sqlite, shared Redis and a two-tier cache) and an async adapter."""
+
+from .async_cache import AsyncCache
+from .interfaces import CacheBackend
+from .memory import TTLCache
+from .redis_cache import RedisCache
+from .sqlite_cache import SqliteCache
+from .tiered import CacheStats, TieredCache
+
+__all__ = [
+    "AsyncCache",
+    "CacheBackend",
+    "CacheStats",
+    "TTLCache",
+    "RedisCache",
+    "SqliteCache",
+    "TieredCache",
+]
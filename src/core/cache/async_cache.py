@@ -0,0 +1,51 @@
+from typing import Any, Callable, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from src.core.utils.logging import get_logger
+
+from .interfaces import CacheBackend
+from .memory import TTLCache
+
+logger = get_logger(__name__)
+
+
+class AsyncCache:
+    """
+    Awaitable access to a CacheBackend from the event loop.
+
+    In-process caches (TTLCache) are called directly; other backends (Redis,
+    Sqlite) run in the threadpool so a round-trip doesn't block the loop.
+    When `unavailable_message` is given, cache errors are logged with it and
+    the call returns None (for callers that only use the cache as an
+    optimization); otherwise they propagate.
+    """
+
+    def __init__(self, cache: CacheBackend, unavailable_message: Optional[str] = None):
+        self.cache = cache
+        self.in_process = isinstance(cache, TTLCache)
+        self.unavailable_message = unavailable_message
+
+    async def _call(self, func: Callable[..., Any], *args: Any) -> Any:
+        try:
+            if self.in_process:
+                return func(*args)
+            return await run_in_threadpool(func, *args)
+        except Exception as e:
+            if self.unavailable_message is None:
+                raise
+            logger.warning(self.unavailable_message, error=str(e))
+            return None
+
+    async def get(self, key: str) -> Optional[Any]:
+        return await self._call(self.cache.get, key)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        await self._call(self.cache.set, key, value, ttl)
+
+    async def add(self, key: str, value: Any, ttl: Optional[float] = None) -> Optional[bool]:
+        """True if stored, False if key was cached (None on a swallowed error)."""
+        return await self._call(self.cache.add, key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        await self._call(self.cache.delete, key)
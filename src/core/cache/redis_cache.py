@@ -0,0 +1,60 @@
+import json
+from typing import Any, Optional
+
+from src.core.utils.logging import get_logger
+
+from .interfaces import CacheBackend
+
+logger = get_logger(__name__)
+
+
+class RedisCache(CacheBackend):
+    """
+    Shared cache on Redis (synchronous client, JSON values).
+    Errors are logged and treated as cache misses, so an unavailable Redis
+    degrades to uncached behaviour instead of failing requests.
+    """
+
+    def __init__(self, redis_url: str, prefix: str = "cache:", default_ttl: float = 300.0):
+        import redis
+
+        self.prefix = prefix
+        self.default_ttl = default_ttl
+        self.redis = redis.from_url(redis_url, decode_responses=True)
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def _ttl_ms(self, ttl: Optional[float]) -> int:
+        return max(1, int((self.default_ttl if ttl is None else ttl) * 1000))
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = self.redis.get(self._key(key))
+        except Exception as e:
+            logger.warning("Redis cache get failed", key=key, error=str(e))
+            return None
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        try:
+            self.redis.set(self._key(key), json.dumps(value), px=self._ttl_ms(ttl))
+        except Exception as e:
+            logger.warning("Redis cache set failed", key=key, error=str(e))
+
+    def add(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        try:
+            return bool(
+                self.redis.set(
+                    self._key(key), json.dumps(value), px=self._ttl_ms(ttl), nx=True
+                )
+            )
+        except Exception as e:
+            logger.warning("Redis cache add failed", key=key, error=str(e))
+            return True
+
+    def delete(self, key: str) -> None:
+        try:
+            self.redis.delete(self._key(key))
+        except Exception as e:
+            logger.warning("Redis cache delete failed", key=key, error=str(e))
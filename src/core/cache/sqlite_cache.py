@@ -0,0 +1,139 @@
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from .interfaces import CacheBackend
+
+
+class SqliteCache(CacheBackend):
+    """
+    Disk-backed cache with per-entry TTL, stored in a Sqlite file.
+    Survives restarts and is shared by processes on the same host.
+
+    Bounded by max_entries: when a write takes the table over the limit,
+    expired entries are purged first, then the least recently read ones.
+    Values must be JSON-serialisable. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "cache.db",
+        max_entries: int = 10000,
+        default_ttl: float = 86400.0,
+    ):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_entries_accessed ON cache_entries (accessed_at)"
+        )
+        return conn
+
+    def _expires_at(self, now: float, ttl: Optional[float]) -> float:
+        return now + (self.default_ttl if ttl is None else ttl)
+
+    def _evict(self, now: float) -> None:
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()
+        if count <= self.max_entries:
+            return
+        self._conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+        self._conn.execute(
+            """
+            DELETE FROM cache_entries WHERE key IN (
+                SELECT key FROM cache_entries ORDER BY accessed_at
+                LIMIT MAX((SELECT COUNT(*) FROM cache_entries) - ?, 0)
+            )
+            """,
+            (self.max_entries,),
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                return None
+            self._conn.execute(
+                "UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO cache_entries (key, value, expires_at, accessed_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    value = excluded.value,
+                    expires_at = excluded.expires_at,
+                    accessed_at = excluded.accessed_at
+                """,
+                (key, json.dumps(value), self._expires_at(now, ttl), now),
+            )
+            self._evict(now)
+
+    def add(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        now = time.time()
+        with self._lock:
+            # An expired entry does not block the claim
+            cursor = self._conn.execute(
+                """
+                INSERT INTO cache_entries (key, value, expires_at, accessed_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    value = excluded.value,
+                    expires_at = excluded.expires_at,
+                    accessed_at = excluded.accessed_at
+                WHERE cache_entries.expires_at <= ?
+                """,
+                (key, json.dumps(value), self._expires_at(now, ttl), now, now),
+            )
+            stored = cursor.rowcount > 0
+            if stored:
+                self._evict(now)
+            return stored
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()
+        return count
@@ -0,0 +1,99 @@
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+from .interfaces import CacheBackend
+from .memory import TTLCache
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters of a TieredCache."""
+
+    local_hits: int = 0
+    remote_hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    deletes: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.local_hits + self.remote_hits
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "hits": self.hits, "hit_rate": round(self.hit_rate, 4)}
+
+
+class TieredCache(CacheBackend):
+    """
+    In-process TTL LRU in front of an optional shared cache (e.g. RedisCache).
+
+    Reads try the local tier first and fill it from the shared tier; writes
+    and deletes go to both. Local entries live at most `local_ttl` seconds,
+    which bounds how stale one process can be after another one writes.
+    Hits and misses are counted in `stats`.
+    """
+
+    def __init__(
+        self,
+        remote: Optional[CacheBackend] = None,
+        max_entries: int = 10000,
+        default_ttl: float = 60.0,
+        local_ttl: float = 5.0,
+    ):
+        self.remote = remote
+        self.default_ttl = default_ttl
+        self.local_ttl = local_ttl
+        self.local = TTLCache(max_entries=max_entries, default_ttl=default_ttl)
+        self.stats = CacheStats()
+        self._stats_lock = threading.Lock()
+
+    def _count(self, field: str) -> None:
+        with self._stats_lock:
+            setattr(self.stats, field, getattr(self.stats, field) + 1)
+
+    def _local_ttl(self, ttl: Optional[float]) -> float:
+        ttl = self.default_ttl if ttl is None else ttl
+        # Without a shared tier the local entry is the only copy
+        return ttl if self.remote is None else min(ttl, self.local_ttl)
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.local.get(key)
+        if value is not None:
+            self._count("local_hits")
+            return value
+
+        if self.remote is not None:
+            value = self.remote.get(key)
+            if value is not None:
+                self._count("remote_hits")
+                self.local.set(key, value, self.local_ttl)
+                return value
+
+        self._count("misses")
+        return None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self._count("sets")
+        self.local.set(key, value, self._local_ttl(ttl))
+        if self.remote is not None:
+            self.remote.set(key, value, ttl)
+
+    def add(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        if self.remote is not None:
+            if not self.remote.add(key, value, ttl):
+                return False
+            self.local.set(key, value, self._local_ttl(ttl))
+            return True
+        return self.local.add(key, value, ttl)
+
+    def delete(self, key: str) -> None:
+        self._count("deletes")
+        self.local.delete(key)
+        if self.remote is not None:
+            self.remote.delete(key)
@@ -25,6 +25,10 @@ class ConversationSettings(BaseSettings):
     min_conversation_duration: int = Field(
         default=30, description="Minimum duration in seconds before allowing closure"
     )
+    sweep_max_batches: int = Field(
+        default=50,
+        description="Max set-based batches per expiration/idle sweep (Postgres backend)",
+    )
     closure_keywords: list[str] = Field(
         default=[
             "tchau",
@@ -69,6 +73,13 @@ class DatabaseSettings(BaseSettings):
         default=10,
         description="Postgres pool maximum connections (used when backend=postgres)",
     )
+    statement_cache_size: int = Field(
+        default=256,
+        description=(
+            "Prepared statements cached per asyncpg connection "
+            "(0 disables, e.g. behind pgbouncer in transaction mode)"
+        ),
+    )
 
     model_config = SettingsConfigDict(
         env_prefix="DATABASE_",
@@ -115,6 +126,62 @@ class TwilioSettings(BaseSettings):
     internal_api_key: str | None = Field(
         default=None, description="Internal API key for sender.py and internal services"
     )
+    webhook_dedup_enabled: bool = Field(
+        default=True,
+        description="Drop retried webhook deliveries (same MessageSid) before enqueueing",
+    )
+    webhook_dedup_ttl_seconds: int = Field(
+        default=3600, description="How long a MessageSid is remembered for dedup"
+    )
+    webhook_dedup_max_entries: int = Field(
+        default=10000, description="MessageSids kept in the in-process dedup index"
+    )
+    ai_coalesce_enabled: bool = Field(
+        default=True,
+        description="Merge rapid-fire inbound messages into a single agent turn",
+    )
+    ai_coalesce_window_seconds: float = Field(
+        default=2.0,
+        description="Quiet period after the latest inbound message before the agent runs",
+    )
+    ai_coalesce_max_messages: int = Field(
+        default=10, description="Most inbound messages merged into one agent turn"
+    )
+    http_max_connections: int = Field(
+        default=100, description="Pooled keep-alive connections to the Twilio API"
+    )
+    http_max_concurrency_per_account: int = Field(
+        default=10, description="Max in-flight Twilio API requests per account"
+    )
+    http_max_retries_on_429: int = Field(
+        default=3, description="Retries of a rate-limited (429) Twilio API request"
+    )
+    http_timeout_seconds: float = Field(
+        default=30.0, description="Timeout of Twilio API requests"
+    )
+    send_rate_per_second: float = Field(
+        default=80.0, description="Sustained outbound messages/s per (owner, sender number)"
+    )
+    send_burst: int = Field(
+        default=80, description="Outbound messages allowed in a burst per sender number"
+    )
+    media_download_dir: str = Field(
+        default="downloads", description="Directory for downloaded inbound media"
+    )
+    media_max_bytes: int = Field(
+        default=16 * 1024 * 1024, description="Largest inbound media file accepted (bytes)"
+    )
+    media_allowed_types: list[str] = Field(
+        default=["audio/*", "image/*", "video/*", "application/pdf"],
+        description="Content-Type patterns accepted for inbound media",
+    )
+    media_download_timeout_seconds: float = Field(
+        default=50.0, description="Timeout of inbound media downloads"
+    )
+    send_rate_limiter_backend: str = Field(
+        default="local",
+        description="Where sender rate-limit buckets live (local, redis); redis uses CACHE_REDIS_URL",
+    )
 
     model_config = SettingsConfigDict(
         env_prefix="TWILIO_",
@@ -125,6 +192,65 @@ class TwilioSettings(BaseSettings):
     )
 
 
+class CacheSettings(BaseSettings):
+    """Shared cache settings."""
+
+    redis_url: str | None = Field(
+        default=None,
+        description="Redis URL for caches shared across processes (unset = in-process only)",
+    )
+    tenant_ttl_seconds: int = Field(
+        default=30,
+        description=(
+            "TTL of cached (account_sid, to_number) -> Twilio account resolutions; "
+            "kept in-process, so this bounds how long other processes miss account changes"
+        ),
+    )
+    tenant_negative_ttl_seconds: int = Field(
+        default=10, description="TTL of cached failed Twilio account resolutions"
+    )
+    tenant_max_entries: int = Field(
+        default=10000, description="Twilio account resolutions kept in-process"
+    )
+    access_ttl_seconds: int = Field(
+        default=300, description="TTL of cached owner subscription-access decisions"
+    )
+    access_negative_ttl_seconds: int = Field(
+        default=30, description="TTL of cached denied subscription-access decisions"
+    )
+    access_local_ttl_seconds: int = Field(
+        default=30,
+        description="Max TTL of access decisions when Redis is not configured (no cross-process invalidation)",
+    )
+    features_catalog_ttl_seconds: int = Field(
+        default=600, description="TTL of cached feature catalog entries (by feature_key)"
+    )
+    usage_summary_ttl_seconds: int = Field(
+        default=30, description="TTL of cached per-owner feature usage summaries"
+    )
+    usage_summary_max_entries: int = Field(
+        default=10000, description="Owner usage summaries kept in-process"
+    )
+    feature_access_ttl_seconds: int = Field(
+        default=60, description="TTL of cached (owner, feature) access decisions"
+    )
+    feature_access_local_ttl_seconds: int = Field(
+        default=5,
+        description="Max age of in-process copies of access decisions when Redis is configured",
+    )
+    feature_access_max_entries: int = Field(
+        default=10000, description="Access decisions kept in-process"
+    )
+
+    model_config = SettingsConfigDict(
+        env_prefix="CACHE_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore"
+    )
+
+
 class APISettings(BaseSettings):
     """API server settings."""
 
@@ -217,6 +343,35 @@ class WhisperSettings(BaseSettings):
         default=5,
         description="Beam size for decoding. Higher values improve accuracy but slow down transcription.",
     )
+    num_workers: int = Field(
+        default=1,
+        description="Parallel transcriptions (CTranslate2 workers sharing one loaded model)",
+    )
+    cpu_threads: int = Field(
+        default=0, description="CPU threads per worker (0 = library default)"
+    )
+    vad_filter: bool = Field(
+        default=True, description="Trim silence with voice-activity detection before decoding"
+    )
+    vad_min_silence_ms: int = Field(
+        default=500, description="Minimum silence (ms) that VAD cuts out"
+    )
+    language: str | None = Field(
+        default=None,
+        description="Default language code; skips auto-detection (user preference 'language' wins)",
+    )
+    cache_enabled: bool = Field(
+        default=True, description="Reuse transcripts of identical audio (keyed by content hash)"
+    )
+    cache_db_path: str = Field(
+        default="transcriptions.db", description="Sqlite file holding cached transcripts"
+    )
+    cache_ttl_seconds: int = Field(
+        default=30 * 86400, description="How long a cached transcript is kept"
+    )
+    cache_max_entries: int = Field(
+        default=50000, description="Cached transcripts kept before least recently used are evicted"
+    )
 
     model_config = SettingsConfigDict(
         env_prefix="WHISPER_",
@@ -239,11 +394,81 @@ class QueueSettings(BaseSettings):
     """Queue configuration."""
 
     backend: str = Field(
-        default="sqlite", description="Queue backend type (sqlite, redis, sqs)"
+        default="sqlite",
+        description="Queue backend type (sqlite, sqlite_wal, postgres, bullmq, sqs)",
     )
     sqlite_db_path: str = Field(
         default="queue.db", description="Path to Sqlite database file for queue"
     )
+    sqlite_batch_size: int = Field(
+        default=10,
+        description="Messages claimed per transaction by the sqlite_wal backend",
+    )
+    sqlite_ack_batch_size: int = Field(
+        default=50,
+        description="Acks buffered before a batched delete by the sqlite_wal backend",
+    )
+    postgres_batch_size: int = Field(
+        default=10,
+        description="Most messages claimed per SKIP LOCKED query by the postgres backend (never more than free consumer slots)",
+    )
+    visibility_timeout_seconds: int = Field(
+        default=300,
+        description="Lease on a claimed message before another worker may reclaim it",
+    )
+    reap_interval_seconds: float = Field(
+        default=60.0,
+        description="How often workers return messages with expired leases to pending",
+    )
+    worker_concurrency: int = Field(
+        default=1, description="Maximum handlers running at once per worker process"
+    )
+    task_concurrency: dict[str, int] = Field(
+        default_factory=dict,
+        description='Per-task handler limits, e.g. {"transcribe_audio": 2}',
+    )
+    worker_shutdown_timeout: float = Field(
+        default=30.0,
+        description="Seconds to wait for in-flight handlers when the worker stops",
+    )
+    # Consumer wakeup
+    notify_backend: str = Field(
+        default="local",
+        description="How producers wake idle consumers (local, redis); the postgres backend uses LISTEN/NOTIFY",
+    )
+    min_idle_wait: float = Field(
+        default=0.05,
+        description="Initial wait (s) when the queue is empty; doubles while idle",
+    )
+    max_idle_wait: float = Field(
+        default=1.0, description="Maximum wait (s) between polls of an empty queue"
+    )
+    # Lanes / routing
+    lane_priorities: dict[str, int] = Field(
+        default={"realtime": 10, "default": 0, "bulk": -10},
+        description="Known lanes and their dequeue priority (higher first)",
+    )
+    task_lanes: dict[str, str] = Field(
+        default={
+            "process_twilio_event": "realtime",
+            "process_ai_response": "realtime",
+            "send_whatsapp_message": "realtime",
+            "transcribe_audio": "realtime",
+            "generate_embedding": "bulk",
+            "cleanup_ai_logs": "bulk",
+            "process_idle_conversations": "bulk",
+            "process_expired_conversations": "bulk",
+        },
+        description="Default lane per task name (unlisted tasks use 'default')",
+    )
+    worker_lanes: list[str] = Field(
+        default_factory=list,
+        description="Lanes consumed by this worker (empty = all lanes)",
+    )
+    sqs_lane_queue_urls: dict[str, str] = Field(
+        default_factory=dict,
+        description="Optional SQS queue URL per lane (falls back to sqs_queue_url)",
+    )
     redis_url: str = Field(
         default="redis://localhost:6379", description="Redis connection URL for BullMQ"
     )
@@ -413,6 +638,7 @@ class Settings(BaseSettings):
     database: DatabaseSettings = Field(default_factory=DatabaseSettings)
     supabase: SupabaseSettings = Field(default_factory=SupabaseSettings)
     twilio: TwilioSettings = Field(default_factory=TwilioSettings)
+    cache: CacheSettings = Field(default_factory=CacheSettings)
     api: APISettings = Field(default_factory=APISettings)
     security: SecuritySettings = Field(default_factory=SecuritySettings)
     log: LogSettings = Field(default_factory=LogSettings)
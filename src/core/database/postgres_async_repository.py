@@ -2,7 +2,8 @@
 PostgreSQL implementation of the Repository Pattern using asyncpg.
 """
 
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, Type, TypeVar, Union
 import json
 
 from src.core.utils import get_logger
@@ -14,9 +15,32 @@ logger = get_logger(__name__)
 T = TypeVar("T")  # Pydantic Model
 
 
+@lru_cache(maxsize=1024)
+def _to_asyncpg_placeholders(query_str: str) -> str:
+    """Replace %s with $1, $2, ... (memoized: most queries are constant strings)."""
+    # We need to be careful if %s appears in literals, but with parametrized queries
+    # literals should be handled by params.
+    parts = query_str.split('%s')
+    if len(parts) == 1:
+        return query_str
+
+    new_query = []
+    for i, part in enumerate(parts[:-1]):
+        new_query.append(part)
+        new_query.append(f"${i+1}")
+    new_query.append(parts[-1])
+
+    return "".join(new_query)
+
+
 class PostgresAsyncRepository(Generic[T]):
     """
     PostgreSQL implementation of IRepository using asyncpg.
+
+    The generic CRUD statements are compiled to asyncpg SQL once per
+    operation and column set and kept in `_compiled`, so hot paths skip
+    rebuilding and rendering the psycopg2 sql tree. Stable SQL text also
+    lets asyncpg reuse its per-connection prepared statements.
     """
 
     def __init__(self, db: AsyncPostgresDatabase, table_name: str, model_class: Type[T]):
@@ -31,6 +55,9 @@ class PostgresAsyncRepository(Generic[T]):
         else:
             self.table_identifier = sql.SQL('"{}"').format(sql.SQL(table_name))
 
+        # (operation, columns...) -> asyncpg SQL string
+        self._compiled: Dict[Tuple, str] = {}
+
     def _id(self, name: str) -> sql.Composable:
         """
         Helper to quote identifiers without needing a connection context.
@@ -38,34 +65,29 @@ class PostgresAsyncRepository(Generic[T]):
         """
         return sql.SQL('"{}"').format(sql.SQL(name))
 
-    def _convert_query_to_asyncpg(self, query: sql.Composable) -> str:
+    def _convert_query_to_asyncpg(self, query: Union[sql.Composable, str]) -> str:
         """
         Convert psycopg2 sql object to string and replace %s with $1, $2, etc.
+        Strings are taken as already compiled (see _compile).
         """
+        if isinstance(query, str):
+            return query
         # We use a dummy context to get the string; standard SQL usually works.
         # If specific quoting is needed, this might be slightly off without a real conn,
         # but for identifiers it's usually fine in standard Postgres.
-        query_str = query.as_string(None)
-        
-        # Replace %s with $1, $2, ...
-        # We need to be careful if %s appears in literals, but with parametrized queries
-        # literals should be handled by params.
-        
-        parts = query_str.split('%s')
-        if len(parts) == 1:
-            return query_str
-        
-        new_query = []
-        for i, part in enumerate(parts[:-1]):
-            new_query.append(part)
-            new_query.append(f"${i+1}")
-        new_query.append(parts[-1])
-        
-        return "".join(new_query)
+        return _to_asyncpg_placeholders(query.as_string(None))
+
+    def _compile(self, key: Tuple, build: Callable[[], sql.Composable]) -> str:
+        """Return the asyncpg SQL for key, building it on first use."""
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = self._convert_query_to_asyncpg(build())
+            self._compiled[key] = compiled
+        return compiled
 
     async def _execute_query(
         self,
-        query: sql.Composable,
+        query: Union[sql.Composable, str],
         params: tuple = None,
         fetch_one: bool = False,
         fetch_all: bool = False,
@@ -105,17 +127,20 @@ class PostgresAsyncRepository(Generic[T]):
                 raise
 
     async def create(self, data: Dict[str, Any]) -> Optional[T]:
-        columns = data.keys()
+        columns = tuple(data.keys())
         # Automatically serialize dicts to JSON strings for asyncpg
         values = [
             json.dumps(v) if isinstance(v, dict) else v 
             for v in data.values()
         ]
 
-        query = sql.SQL("INSERT INTO {} ({}) VALUES ({}) RETURNING *").format(
-            self.table_identifier,
-            sql.SQL(", ").join(map(self._id, columns)),
-            sql.SQL(", ").join(sql.Placeholder() * len(columns)),
+        query = self._compile(
+            ("create",) + columns,
+            lambda: sql.SQL("INSERT INTO {} ({}) VALUES ({}) RETURNING *").format(
+                self.table_identifier,
+                sql.SQL(", ").join(map(self._id, columns)),
+                sql.SQL(", ").join(sql.Placeholder() * len(columns)),
+            ),
         )
 
         result = await self._execute_query(
@@ -127,8 +152,11 @@ class PostgresAsyncRepository(Generic[T]):
         return None
 
     async def find_by_id(self, id_value: Any, id_column: str = "id") -> Optional[T]:
-        query = sql.SQL("SELECT * FROM {} WHERE {} = %s").format(
-            self.table_identifier, self._id(id_column)
+        query = self._compile(
+            ("find_by_id", id_column),
+            lambda: sql.SQL("SELECT * FROM {} WHERE {} = %s").format(
+                self.table_identifier, self._id(id_column)
+            ),
         )
 
         result = await self._execute_query(query, (id_value,), fetch_one=True)
@@ -147,8 +175,6 @@ class PostgresAsyncRepository(Generic[T]):
         if not data:
             return await self.find_by_id(id_value, id_column)
 
-        where_clause = sql.SQL("{} = %s").format(self._id(id_column))
-        
         # Serialize dicts to JSON strings
         params_list = [
             json.dumps(v) if isinstance(v, dict) else v 
@@ -167,18 +193,22 @@ class PostgresAsyncRepository(Generic[T]):
                 ]
                 params_list.append(id_value)
             
-            where_clause = where_clause + sql.SQL(" AND version = %s")
             params_list.append(current_version)
 
-        set_clauses = [
-            sql.SQL("{} = %s").format(self._id(k))
-            for k in data.keys()
-        ]
+        columns = tuple(data.keys())
+        versioned = current_version is not None
 
-        query = sql.SQL("UPDATE {} SET {} WHERE ").format(
-            self.table_identifier,
-            sql.SQL(", ").join(set_clauses),
-        ) + where_clause + sql.SQL(" RETURNING *")
+        def build() -> sql.Composable:
+            where_clause = sql.SQL("{} = %s").format(self._id(id_column))
+            if versioned:
+                where_clause = where_clause + sql.SQL(" AND version = %s")
+            set_clauses = [sql.SQL("{} = %s").format(self._id(k)) for k in columns]
+            return sql.SQL("UPDATE {} SET {} WHERE ").format(
+                self.table_identifier,
+                sql.SQL(", ").join(set_clauses),
+            ) + where_clause + sql.SQL(" RETURNING *")
+
+        query = self._compile(("update", id_column, versioned) + columns, build)
 
         result = await self._execute_query(query, tuple(params_list), fetch_one=True)
 
@@ -187,65 +217,55 @@ class PostgresAsyncRepository(Generic[T]):
         return None
 
     async def delete(self, id_value: Union[int, str], id_column: str = "id") -> bool:
-        query = sql.SQL("DELETE FROM {} WHERE {} = %s").format(
-            self.table_identifier, self._id(id_column)
+        query = self._compile(
+            ("delete", id_column),
+            lambda: sql.SQL("DELETE FROM {} WHERE {} = %s").format(
+                self.table_identifier, self._id(id_column)
+            ),
         )
 
         rowcount = await self._execute_query(query, (id_value,))
         return rowcount > 0
 
-    async def find_by(self, filters: Dict[str, Any], limit: int = 100) -> List[T]:
-        conditions = []
-        values = []
-
-        for k, v in filters.items():
-            conditions.append(
-                sql.SQL("{} = %s").format(self._id(k))
-            )
-            values.append(v)
-
-        where_clause = (
+    def _where(self, columns: Tuple[str, ...]) -> sql.Composable:
+        conditions = [sql.SQL("{} = %s").format(self._id(k)) for k in columns]
+        return (
             sql.SQL(" WHERE {}").format(sql.SQL(" AND ").join(conditions))
             if conditions
             else sql.SQL("")
         )
-        limit_clause = sql.SQL(" LIMIT %s")
 
-        query = (
-            sql.SQL("SELECT * FROM {}").format(self.table_identifier)
-            + where_clause
-            + limit_clause
+    async def find_by(self, filters: Dict[str, Any], limit: int = 100) -> List[T]:
+        columns = tuple(filters.keys())
+
+        query = self._compile(
+            ("find_by",) + columns,
+            lambda: (
+                sql.SQL("SELECT * FROM {}").format(self.table_identifier)
+                + self._where(columns)
+                + sql.SQL(" LIMIT %s")
+            ),
         )
 
-        params = tuple(values) + (limit,)
+        params = tuple(filters.values()) + (limit,)
 
         results = await self._execute_query(query, params, fetch_all=True)
 
         return [self.model_class(**row) for row in results]
 
     async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
-        conditions = []
-        values = []
-
-        if filters:
-            for k, v in filters.items():
-                conditions.append(
-                    sql.SQL("{} = %s").format(self._id(k))
+        filters = filters or {}
+        columns = tuple(filters.keys())
+
+        query = self._compile(
+            ("count",) + columns,
+            lambda: (
+                sql.SQL("SELECT COUNT(*) as count FROM {}").format(
+                    self.table_identifier
                 )
-                values.append(v)
-
-        where_clause = (
-            sql.SQL(" WHERE {}").format(sql.SQL(" AND ").join(conditions))
-            if conditions
-            else sql.SQL("")
-        )
-
-        query = (
-            sql.SQL("SELECT COUNT(*) as count FROM {}").format(
-                self.table_identifier
-            )
-            + where_clause
+                + self._where(columns)
+            ),
         )
 
-        result = await self._execute_query(query, tuple(values), fetch_one=True)
+        result = await self._execute_query(query, tuple(filters.values()), fetch_one=True)
         return result["count"] if result else 0
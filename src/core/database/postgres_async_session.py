@@ -1,13 +1,27 @@
+from contextvars import ContextVar
 from typing import Optional
 import asyncpg
 from contextlib import asynccontextmanager
 
 class AsyncPostgresDatabase:
-    def __init__(self, *, dsn: str, minconn: int = 1, maxconn: int = 10):
+    def __init__(
+        self,
+        *,
+        dsn: str,
+        minconn: int = 1,
+        maxconn: int = 10,
+        statement_cache_size: int = 100,
+    ):
         self.dsn = dsn
         self.minconn = minconn
         self.maxconn = maxconn
+        # Prepared statements kept per connection by asyncpg (0 disables)
+        self.statement_cache_size = statement_cache_size
         self._pool: Optional[asyncpg.Pool] = None
+        # Connection of the enclosing transaction() in the current task
+        self._bound: ContextVar[Optional[asyncpg.Connection]] = ContextVar(
+            f"postgres_async_connection_{id(self)}", default=None
+        )
 
     async def connect(self):
         """Initialize the connection pool."""
@@ -16,6 +30,7 @@ class AsyncPostgresDatabase:
                 dsn=self.dsn,
                 min_size=self.minconn,
                 max_size=self.maxconn,
+                statement_cache_size=self.statement_cache_size,
                 server_settings={
                     "search_path": "app,extensions,public"
                 }
@@ -29,9 +44,43 @@ class AsyncPostgresDatabase:
 
     @asynccontextmanager
     async def connection(self):
-        """Acquire a connection from the pool."""
+        """
+        Acquire a connection from the pool, or reuse the one bound by an
+        enclosing transaction().
+        """
+        bound = self._bound.get()
+        if bound is not None:
+            yield bound
+            return
+
         if not self._pool:
             await self.connect()
         
         async with self._pool.acquire() as conn:
             yield conn
+
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        Run the block in one transaction on one connection.
+
+        Every connection() opened in the block (i.e. every repository call
+        sharing this database) reuses that connection, so the calls commit
+        or roll back together. Nested blocks become savepoints.
+
+        The binding follows the current task's context: tasks spawned in the
+        block inherit it, and must not use the database concurrently.
+        """
+        bound = self._bound.get()
+        if bound is not None:
+            async with bound.transaction():
+                yield bound
+            return
+
+        async with self.connection() as conn:
+            async with conn.transaction():
+                token = self._bound.set(conn)
+                try:
+                    yield conn
+                finally:
+                    self._bound.reset(token)
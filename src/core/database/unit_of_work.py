@@ -0,0 +1,27 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from src.core.database.postgres_async_session import AsyncPostgresDatabase
+
+
+class AsyncUnitOfWork:
+    """
+    Groups repository calls into one atomic unit.
+
+    With a Postgres database, begin() opens a transaction that every
+    PostgresAsyncRepository on the same AsyncPostgresDatabase joins (see
+    AsyncPostgresDatabase.transaction). Without one (e.g. the Supabase
+    backend) begin() is a no-op and each call commits on its own.
+    """
+
+    def __init__(self, db: Optional[AsyncPostgresDatabase] = None):
+        self.db = db
+
+    @asynccontextmanager
+    async def begin(self) -> AsyncIterator[None]:
+        if self.db is None:
+            yield
+            return
+
+        async with self.db.transaction():
+            yield
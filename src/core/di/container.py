@@ -127,12 +127,14 @@ class Container(containers.DeclarativeContainer):
     # Twilio
     twilio_account_repository = twilio.twilio_account_repository
     twilio_service = twilio.twilio_service
+    twilio_send_rate_limiter = twilio.twilio_send_rate_limiter
     twilio_account_service = twilio.twilio_account_service
     twilio_webhook_owner_resolver = twilio.twilio_webhook_owner_resolver
     twilio_webhook_message_handler = twilio.twilio_webhook_message_handler
     twilio_webhook_audio_processor = twilio.twilio_webhook_audio_processor
     twilio_webhook_ai_processor = twilio.twilio_webhook_ai_processor
     twilio_webhook_service = twilio.twilio_webhook_service
+    twilio_signature_validator = twilio.twilio_signature_validator
 
     # Billing
     features_catalog_repository = billing.features_catalog_repository
@@ -145,6 +147,7 @@ class Container(containers.DeclarativeContainer):
     
     features_catalog_service = billing.features_catalog_service
     feature_usage_service = billing.feature_usage_service
+    feature_access_cache = billing.feature_access_cache
     billing_plan_service = billing.plan_service
     billing_subscription_service = billing.subscription_service
     stripe_service = billing.stripe_service
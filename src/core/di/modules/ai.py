@@ -1,4 +1,5 @@
 from dependency_injector import containers, providers
+from src.core.cache import SqliteCache
 from src.core.config.settings import settings
 
 # Repositories
@@ -27,6 +28,8 @@ from src.modules.ai.memory.repositories.impl.postgres.vector_memory_repository i
 
 # Services
 from src.modules.ai.services.transcription_service import TranscriptionService
+from src.modules.ai.services.transcription_engine import TranscriptionEngine
+from src.modules.ai.services.transcription_cache import TranscriptionCache
 from src.modules.ai.ai_result.services.ai_log_thought_service import AILogThoughtService
 from src.modules.ai.ai_result.services.ai_result_service import AIResultService
 from src.modules.ai.memory.services.hybrid_memory_service import HybridMemoryService
@@ -127,6 +130,31 @@ class AIContainer(containers.DeclarativeContainer):
         device=settings.whisper.device,
         compute_type=settings.whisper.compute_type,
         beam_size=settings.whisper.beam_size,
+        num_workers=settings.whisper.num_workers,
+        cpu_threads=settings.whisper.cpu_threads,
+        vad_filter=settings.whisper.vad_filter,
+        vad_min_silence_ms=settings.whisper.vad_min_silence_ms,
+        language=settings.whisper.language,
+    )
+
+    transcription_engine = providers.Singleton(
+        TranscriptionEngine,
+        transcription_service=transcription_service,
+    )
+
+    transcription_cache_store = providers.Singleton(
+        lambda enabled, **kwargs: SqliteCache(**kwargs) if enabled else None,
+        enabled=settings.whisper.cache_enabled,
+        db_path=settings.whisper.cache_db_path,
+        max_entries=settings.whisper.cache_max_entries,
+        default_ttl=settings.whisper.cache_ttl_seconds,
+    )
+
+    transcription_cache = providers.Singleton(
+        lambda cache, **kwargs: TranscriptionCache(cache, **kwargs) if cache is not None else None,
+        cache=transcription_cache_store,
+        ttl=settings.whisper.cache_ttl_seconds,
+        namespace=settings.whisper.size,
     )
 
     ai_result_service = providers.Factory(
@@ -1,5 +1,7 @@
 from dependency_injector import containers, providers
 
+from src.core.cache import TieredCache, TTLCache
+from src.core.config.settings import settings
 from src.modules.billing.repositories.impl.supabase.features_catalog_repository import SupabaseFeaturesCatalogRepository
 from src.modules.billing.repositories.impl.supabase.feature_usage_repository import SupabaseFeatureUsageRepository
 from src.modules.billing.repositories.impl.supabase.plan_repository import SupabasePlanRepository
@@ -22,6 +24,7 @@ from src.modules.billing.services.plan_service import PlanService
 from src.modules.billing.services.subscription_service import SubscriptionService
 from src.modules.billing.services.stripe_service import StripeService
 from src.modules.billing.services.webhook_handler_service import WebhookHandlerService
+from src.modules.billing.services.subscription_access_cache import SubscriptionAccessCache
 
 
 class BillingContainer(containers.DeclarativeContainer):
@@ -74,16 +77,42 @@ class BillingContainer(containers.DeclarativeContainer):
         postgres=providers.Factory(PostgresSubscriptionEventRepository, db=core.postgres_db),
     )
 
+    # Process-wide caches shared by the (per-request) services below
+    features_catalog_cache = providers.Singleton(
+        TTLCache,
+        max_entries=1000,
+        default_ttl=settings.cache.features_catalog_ttl_seconds,
+    )
+
+    usage_summary_cache = providers.Singleton(
+        TTLCache,
+        max_entries=settings.cache.usage_summary_max_entries,
+        default_ttl=settings.cache.usage_summary_ttl_seconds,
+    )
+
+    # In-process LRU in front of the shared cache (Redis) when configured
+    feature_access_cache = providers.Singleton(
+        TieredCache,
+        remote=core.shared_cache,
+        max_entries=settings.cache.feature_access_max_entries,
+        default_ttl=settings.cache.feature_access_ttl_seconds,
+        local_ttl=settings.cache.feature_access_local_ttl_seconds,
+    )
+
     # Services
     features_catalog_service = providers.Factory(
         FeaturesCatalogService,
-        catalog_repository=features_catalog_repository
+        catalog_repository=features_catalog_repository,
+        cache=features_catalog_cache,
     )
 
     feature_usage_service = providers.Factory(
         FeatureUsageService,
         usage_repository=feature_usage_repository,
-        catalog_service=features_catalog_service
+        catalog_service=features_catalog_service,
+        cache_service=feature_access_cache,
+        summary_cache=usage_summary_cache,
+        access_ttl=settings.cache.feature_access_ttl_seconds,
     )
 
     plan_service = providers.Factory(
@@ -104,8 +133,17 @@ class BillingContainer(containers.DeclarativeContainer):
 
     stripe_service = providers.Singleton(StripeService)
 
+    subscription_access_cache = providers.Singleton(
+        SubscriptionAccessCache,
+        cache=core.owner_cache,
+        ttl=settings.cache.access_ttl_seconds,
+        negative_ttl=settings.cache.access_negative_ttl_seconds,
+        local_ttl=settings.cache.access_local_ttl_seconds,
+    )
+
     webhook_handler_service = providers.Factory(
         WebhookHandlerService,
         subscription_service=subscription_service,
-        plan_service=plan_service
+        plan_service=plan_service,
+        access_cache=subscription_access_cache
     )
@@ -1,5 +1,8 @@
 from dependency_injector import containers, providers
 
+from src.core.config.settings import settings
+from src.core.database.unit_of_work import AsyncUnitOfWork
+
 # Repositories
 from src.modules.conversation.repositories.impl.supabase.conversation_repository import SupabaseConversationRepository
 from src.modules.conversation.repositories.impl.postgres.conversation_repository import PostgresConversationRepository
@@ -33,13 +36,24 @@ class ConversationContainer(containers.DeclarativeContainer):
         postgres=providers.Factory(PostgresMessageRepository, db=core.postgres_async_db),
     )
 
+    # One transaction across both repositories (no-op on Supabase)
+    unit_of_work = providers.Selector(
+        core.db_backend,
+        supabase=providers.Factory(AsyncUnitOfWork),
+        postgres=providers.Factory(AsyncUnitOfWork, db=core.postgres_async_db),
+    )
+
     # Components
     conversation_finder = providers.Factory(
         ConversationFinder, repository=conversation_repository
     )
 
     conversation_lifecycle = providers.Factory(
-        ConversationLifecycle, repository=conversation_repository
+        ConversationLifecycle,
+        repository=conversation_repository,
+        # Only Postgres sweeps set-based; other backends would fall back to per-row updates
+        bulk_sweeps=providers.Callable(lambda backend: backend == "postgres", core.db_backend),
+        sweep_max_batches=settings.conversation.sweep_max_batches,
     )
 
     conversation_closer = providers.Factory(ConversationCloser)
@@ -52,4 +66,5 @@ class ConversationContainer(containers.DeclarativeContainer):
         finder=conversation_finder,
         lifecycle=conversation_lifecycle,
         closer=conversation_closer,
+        unit_of_work=unit_of_work,
     )
@@ -4,6 +4,7 @@ from src.core.database.session import DatabaseConnection
 from src.core.database.postgres_session import PostgresDatabase
 from src.core.database.postgres_async_session import AsyncPostgresDatabase
 from src.core.queue.service import QueueService
+from src.core.cache import RedisCache, TTLCache
 
 class CoreContainer(containers.DeclarativeContainer):
     """
@@ -31,7 +32,19 @@ class CoreContainer(containers.DeclarativeContainer):
         dsn=settings.database.url,
         minconn=settings.database.pool_min_conn,
         maxconn=settings.database.pool_max_conn,
+        statement_cache_size=settings.database.statement_cache_size,
     )
 
     # Core Services
     queue_service = providers.Singleton(QueueService)
+
+    # Shared (cross-process) cache; None when CACHE_REDIS_URL is unset
+    shared_cache = providers.Singleton(
+        lambda url: RedisCache(url) if url else None, settings.cache.redis_url
+    )
+
+    # Shared cache when configured, otherwise an in-process one
+    owner_cache = providers.Singleton(
+        lambda shared: shared if shared is not None else TTLCache(),
+        shared_cache,
+    )
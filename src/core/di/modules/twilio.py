@@ -1,5 +1,10 @@
 from dependency_injector import containers, providers
 
+from src.core.cache import TTLCache
+from src.core.ratelimit import create_rate_limiter
+
+from src.core.config.settings import settings
+
 # Repositories
 from src.modules.channels.twilio.repositories.impl.supabase.account_repository import SupabaseTwilioAccountRepository
 from src.modules.channels.twilio.repositories.impl.postgres.account_repository import PostgresTwilioAccountRepository
@@ -7,11 +12,15 @@ from src.modules.channels.twilio.repositories.impl.postgres.account_repository i
 # Services
 from src.modules.channels.twilio.services.twilio_account_service import TwilioAccountService
 from src.modules.channels.twilio.services.twilio_service import TwilioService
+from src.modules.channels.twilio.services.http_client import PooledTwilioHttpClient
 from src.modules.channels.twilio.services.twilio_webhook_service import TwilioWebhookService
 from src.modules.channels.twilio.services.webhook.owner_resolver import TwilioWebhookOwnerResolver
 from src.modules.channels.twilio.services.webhook.message_handler import TwilioWebhookMessageHandler
 from src.modules.channels.twilio.services.webhook.audio_processor import TwilioWebhookAudioProcessor
+from src.modules.channels.twilio.services.webhook.signature_validator import TwilioSignatureValidator
 from src.modules.channels.twilio.services.webhook.ai_processor import TwilioWebhookAIProcessor
+from src.modules.channels.twilio.services.webhook.coalescer import TwilioWebhookCoalescer
+from src.modules.channels.twilio.services.webhook.deduplicator import TwilioWebhookDeduplicator
 
 
 class TwilioContainer(containers.DeclarativeContainer):
@@ -33,19 +42,64 @@ class TwilioContainer(containers.DeclarativeContainer):
     )
 
     # Services
+    # Process-wide so connections and per-account limits are shared
+    twilio_http_client = providers.Singleton(
+        PooledTwilioHttpClient,
+        max_connections=settings.twilio.http_max_connections,
+        max_per_account=settings.twilio.http_max_concurrency_per_account,
+        max_retries=settings.twilio.http_max_retries_on_429,
+        timeout=settings.twilio.http_timeout_seconds,
+    )
+
+    # Per-(owner, sender number) outbound token buckets
+    twilio_send_rate_limiter = providers.Singleton(
+        create_rate_limiter,
+        backend=settings.twilio.send_rate_limiter_backend,
+        rate=settings.twilio.send_rate_per_second,
+        burst=settings.twilio.send_burst,
+        redis_url=settings.cache.redis_url,
+    )
+
     twilio_service = providers.Factory(
-        TwilioService, twilio_repo=twilio_account_repository
+        TwilioService,
+        twilio_repo=twilio_account_repository,
+        http_client=twilio_http_client,
+    )
+
+    # In-process only: cached accounts carry auth tokens. Other processes
+    # cannot invalidate it, so its TTL stays short
+    twilio_account_cache = providers.Singleton(
+        TTLCache,
+        max_entries=settings.cache.tenant_max_entries,
+        default_ttl=settings.cache.tenant_ttl_seconds,
     )
 
     twilio_account_service = providers.Factory(
-        TwilioAccountService, twilio_account_repo=twilio_account_repository
+        TwilioAccountService,
+        twilio_account_repo=twilio_account_repository,
+        account_cache=twilio_account_cache,
+        negative_ttl=settings.cache.tenant_negative_ttl_seconds,
     )
 
     # Webhook Components
+    # AccountSid -> RequestValidator; in-process only (validators hold auth tokens)
+    twilio_signature_validator_cache = providers.Singleton(
+        TTLCache,
+        max_entries=settings.cache.tenant_max_entries,
+        default_ttl=settings.cache.tenant_ttl_seconds,
+    )
+
+    twilio_signature_validator = providers.Factory(
+        TwilioSignatureValidator,
+        twilio_account_service=twilio_account_service,
+        validator_cache=twilio_signature_validator_cache,
+    )
+
     twilio_webhook_owner_resolver = providers.Factory(
         TwilioWebhookOwnerResolver,
         twilio_account_service=twilio_account_service,
         identity_service=identity.identity_service,
+        access_cache=billing.subscription_access_cache,
     )
 
     twilio_webhook_message_handler = providers.Factory(
@@ -55,11 +109,24 @@ class TwilioContainer(containers.DeclarativeContainer):
         queue_service=core.queue_service,
     )
 
+    # Process-wide so in-process markers are shared by every task
+    twilio_webhook_coalescer = providers.Singleton(
+        lambda enabled, **kwargs: TwilioWebhookCoalescer(**kwargs) if enabled else None,
+        enabled=settings.twilio.ai_coalesce_enabled,
+        window_seconds=settings.twilio.ai_coalesce_window_seconds,
+        max_messages=settings.twilio.ai_coalesce_max_messages,
+        shared_cache=core.shared_cache,
+    )
+
     twilio_webhook_audio_processor = providers.Factory(
         TwilioWebhookAudioProcessor,
         transcription_service=ai.transcription_service,
+        transcription_engine=ai.transcription_engine,
+        transcription_cache=ai.transcription_cache,
+        identity_service=identity.identity_service,
         queue_service=core.queue_service,
         message_handler=twilio_webhook_message_handler,
+        coalescer=twilio_webhook_coalescer,
     )
 
     twilio_webhook_ai_processor = providers.Factory(
@@ -70,6 +137,16 @@ class TwilioContainer(containers.DeclarativeContainer):
         agent_factory=ai.agent_factory,
         queue_service=core.queue_service,
         message_handler=twilio_webhook_message_handler,
+        coalescer=twilio_webhook_coalescer,
+    )
+
+    # Process-wide so the dedup index survives across requests
+    twilio_webhook_deduplicator = providers.Singleton(
+        lambda enabled, **kwargs: TwilioWebhookDeduplicator(**kwargs) if enabled else None,
+        enabled=settings.twilio.webhook_dedup_enabled,
+        ttl_seconds=settings.twilio.webhook_dedup_ttl_seconds,
+        max_entries=settings.twilio.webhook_dedup_max_entries,
+        shared_cache=core.shared_cache,
     )
 
     twilio_webhook_service = providers.Factory(
@@ -79,4 +156,5 @@ class TwilioContainer(containers.DeclarativeContainer):
         audio_processor=twilio_webhook_audio_processor,
         ai_processor=twilio_webhook_ai_processor,
         queue_service=core.queue_service,
+        deduplicator=twilio_webhook_deduplicator,
     )
@@ -1,7 +1,7 @@
 import asyncio
 import json
 import logging
-from typing import Awaitable, Callable, Optional
+from typing import Awaitable, Callable, Dict, List, Optional
 
 from bullmq import Queue, Worker
 from redis import asyncio as aioredis
@@ -9,7 +9,8 @@ from redis import asyncio as aioredis
 from src.core.config import settings
 
 from ..interfaces import QueueBackend
-from ..models import QueueMessage
+from ..models import DEFAULT_LANE, QueueMessage
+from ..sequencer import PartitionSequencer
 
 logger = logging.getLogger(__name__)
 
@@ -17,17 +18,34 @@ logger = logging.getLogger(__name__)
 class BullMQBackend(QueueBackend):
     """
     BullMQ backend implementation.
+    Each lane is a separate BullMQ queue ("default_queue", "realtime_queue", ...)
+    consumed by its own Worker, so bulk lanes never delay latency-critical ones.
     """
 
-    def __init__(self, redis_url: str):
+    def __init__(self, redis_url: str, lanes: Optional[List[str]] = None):
         self.redis_url = redis_url
-        self.queue_name = "default_queue"
+        self.queue_name = self._queue_name(DEFAULT_LANE)
+        self.lanes = lanes or [DEFAULT_LANE]
         # Parse redis_url to dict for bullmq
         # redis://[:password@]host[:port][/db]
         self.redis_opts = self._parse_redis_url(redis_url)
 
         self.queue = Queue(self.queue_name, {"connection": self.redis_opts})
+        self.queues: Dict[str, Queue] = {DEFAULT_LANE: self.queue}
         self.worker: Optional[Worker] = None
+        self.workers: List[Worker] = []
+
+    @staticmethod
+    def _queue_name(lane: str) -> str:
+        return f"{lane}_queue"
+
+    def _get_queue(self, lane: str) -> Queue:
+        """Lane queues other than the default are created on first use."""
+        if lane not in self.queues:
+            self.queues[lane] = Queue(
+                self._queue_name(lane), {"connection": self.redis_opts}
+            )
+        return self.queues[lane]
 
     def _parse_redis_url(self, url: str) -> dict:
         """
@@ -44,6 +62,14 @@ class BullMQBackend(QueueBackend):
             "db": kwargs.get("db", 0),
         }
 
+    @staticmethod
+    def _job_opts(message: QueueMessage) -> dict:
+        return {
+            "jobId": message.id,  # Use our ID as job ID
+            "removeOnComplete": True,
+            "removeOnFail": False,  # Keep failed jobs for inspection
+        }
+
     async def enqueue(self, message: QueueMessage) -> str:
         """Add message to queue."""
         # BullMQ job data
@@ -51,18 +77,37 @@ class BullMQBackend(QueueBackend):
 
         # We map message.task_name to job name, but BullMQ uses job name for processor routing usually.
         # Here we use a generic processor, so job name can be the task name.
-        job = await self.queue.add(
-            message.task_name,
-            job_data,
-            {
-                "jobId": message.id,  # Use our ID as job ID
-                "removeOnComplete": True,
-                "removeOnFail": False,  # Keep failed jobs for inspection
-            },
+        job = await self._get_queue(message.lane).add(
+            message.task_name, job_data, self._job_opts(message)
         )
         return str(job.id)
 
-    async def dequeue(self) -> Optional[QueueMessage]:
+    async def enqueue_many(self, messages: List[QueueMessage]) -> List[str]:
+        """Add messages with one addBulk call per lane queue."""
+        by_lane: Dict[str, List[QueueMessage]] = {}
+        for message in messages:
+            by_lane.setdefault(message.lane, []).append(message)
+
+        job_ids: Dict[str, str] = {}
+        for lane, lane_messages in by_lane.items():
+            jobs = await self._get_queue(lane).addBulk(
+                [
+                    {
+                        "name": message.task_name,
+                        "data": message.model_dump(mode="json"),
+                        "opts": self._job_opts(message),
+                    }
+                    for message in lane_messages
+                ]
+            )
+            for message, job in zip(lane_messages, jobs):
+                job_ids[message.id] = str(job.id)
+
+        return [job_ids[message.id] for message in messages]
+
+    async def dequeue(
+        self, lanes: Optional[List[str]] = None
+    ) -> Optional[QueueMessage]:
         """
         BullMQ is push-based mostly via Worker.
         Manual dequeue is complex. We rely on start_consuming.
@@ -86,11 +131,38 @@ class BullMQBackend(QueueBackend):
         pass
 
     async def start_consuming(
-        self, handler: Callable[[QueueMessage], Awaitable[None]]
+        self,
+        handler: Callable[[QueueMessage], Awaitable[None]],
+        concurrency: int = 1,
+        task_concurrency: Optional[Dict[str, int]] = None,
+        shutdown_timeout: float = 30.0,
+        lanes: Optional[List[str]] = None,
+        min_idle_wait: float = 0.05,
+        max_idle_wait: float = 1.0,
+        reap_interval: float = 60.0,
     ) -> None:
         """
-        Start BullMQ Worker.
+        Start one BullMQ Worker per consumed lane (default: all known lanes).
+        Concurrency is delegated to the BullMQ Workers; per-task limits are
+        enforced with semaphores around the handler, and messages sharing a
+        partition_key run one at a time within this process. Polling options of the
+        default loop (idle waits, reap interval) do not apply: BullMQ Workers
+        block on Redis and BullMQ handles stalled jobs itself.
         """
+        task_slots = {
+            name: asyncio.Semaphore(limit)
+            for name, limit in (task_concurrency or {}).items()
+        }
+
+        sequencer = PartitionSequencer()
+
+        async def handle(message: QueueMessage) -> None:
+            task_slot = task_slots.get(message.task_name)
+            if task_slot:
+                async with task_slot:
+                    await handler(message)
+            else:
+                await handler(message)
 
         async def process_job(job, token):
             # Convert job.data back to QueueMessage
@@ -107,18 +179,24 @@ class BullMQBackend(QueueBackend):
                     f"Processing BullMQ job {job.id} (Task: {message.task_name})"
                 )
 
-                await handler(message)
+                await sequencer.run(message.partition_key, lambda: handle(message))
 
                 return "completed"
             except Exception as e:
                 logger.error(f"Error processing BullMQ job {job.id}: {e}")
                 raise e  # BullMQ Worker handles this as failure/retry
 
-        logger.info(f"Starting BullMQ Worker on queue '{self.queue_name}'...")
-
-        self.worker = Worker(
-            self.queue_name, process_job, {"connection": self.redis_opts}
-        )
+        for lane in lanes or self.lanes:
+            queue_name = self._queue_name(lane)
+            logger.info(f"Starting BullMQ Worker on queue '{queue_name}'...")
+            self.workers.append(
+                Worker(
+                    queue_name,
+                    process_job,
+                    {"connection": self.redis_opts, "concurrency": concurrency},
+                )
+            )
+        self.worker = self.workers[0]
 
         # Worker runs in background. We need to keep this method alive if it's expected to block.
         # But QueueService.start_worker expects to control the loop?
@@ -130,6 +208,8 @@ class BullMQBackend(QueueBackend):
         try:
             await stop_event.wait()  # Block forever until cancelled
         except asyncio.CancelledError:
-            logger.info("Stopping BullMQ Worker...")
-            await self.worker.close()
-            await self.queue.close()
+            logger.info("Stopping BullMQ Workers...")
+            for worker in self.workers:
+                await worker.close()
+            for queue in self.queues.values():
+                await queue.close()
@@ -0,0 +1,373 @@
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import asyncpg  # type: ignore[import-untyped]
+
+from src.core.database.postgres_async_session import AsyncPostgresDatabase
+
+from ..interfaces import MAX_RETRIES, QueueBackend
+from ..models import DEFAULT_LANE, QueueMessage
+from ..notifier import LocalQueueNotifier
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "queue_wakeup"
+
+MESSAGE_COLUMNS = (
+    "id, task_name, payload, attempts, created_at, correlation_id, owner_id, "
+    "lane, priority, partition_key"
+)
+
+
+class PostgresQueueNotifier(LocalQueueNotifier):
+    """
+    Wakes consumers through Postgres LISTEN/NOTIFY.
+    Producers (in any process) issue pg_notify in the enqueue transaction;
+    a dedicated listening connection sets the local event on delivery.
+    """
+
+    def __init__(self, dsn: str, channel: str = NOTIFY_CHANNEL):
+        super().__init__()
+        self.dsn = dsn
+        self.channel = channel
+        self._listener: Optional[asyncpg.Connection] = None
+
+    def _on_notification(self, connection, pid, channel, payload) -> None:
+        if self._event is not None:
+            self._event.set()
+
+    async def _ensure_listening(self) -> None:
+        if self._listener is not None and not self._listener.is_closed():
+            return
+        try:
+            # LISTEN is bound to the session, so this cannot be a pooled connection
+            self._listener = await asyncpg.connect(dsn=self.dsn)
+            await self._listener.add_listener(self.channel, self._on_notification)
+        except Exception as e:
+            logger.warning(f"Queue LISTEN unavailable, falling back to polling: {e}")
+            self._listener = None
+
+    async def wait(self, timeout: float) -> bool:
+        self._bind()
+        await self._ensure_listening()
+        return await super().wait(timeout)
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            await self._listener.close()
+            self._listener = None
+
+
+class PostgresQueueBackend(QueueBackend):
+    """
+    Postgres queue backend.
+
+    - Batch claims with SELECT ... FOR UPDATE SKIP LOCKED, so any number of
+      worker nodes can share the queue without blocking each other. The
+      consumer loop claims at most one message per free handler slot, so a
+      claimed message is always heartbeated and never waits behind others.
+    - Claimed rows get a lease (locked_until); rows whose lease expired
+      (crashed worker) are claimed again with attempts + 1, until they reach
+      MAX_RETRIES and the reaper moves them to the DLQ.
+    - Retries are delayed via next_retry_at; failed messages move to the
+      message_queue_dlq table.
+    - enqueue_with_connection() lets callers enqueue inside their own
+      transaction (e.g. the one persisting the inbound message).
+    - Messages with a partition_key are claimed in order, one at a time per
+      key: only the oldest message of a partition is claimable, and only
+      while no other message of it holds a live lease (migration 016).
+    """
+
+    def __init__(
+        self,
+        db: AsyncPostgresDatabase,
+        batch_size: int = 10,
+        visibility_timeout: int = 300,
+        table_name: str = "message_queue",
+        dlq_table_name: str = "message_queue_dlq",
+    ):
+        self.db = db
+        self.batch_size = batch_size
+        self.visibility_timeout: int = visibility_timeout
+        self.table_name = table_name
+        self.dlq_table_name = dlq_table_name
+        self.notifier = PostgresQueueNotifier(dsn=db.dsn)
+
+    def _row_to_message(self, row: Dict[str, Any]) -> QueueMessage:
+        payload = row["payload"]
+        if isinstance(payload, str):
+            payload = json.loads(payload)
+
+        return QueueMessage(
+            id=row["id"],
+            task_name=row["task_name"],
+            payload=payload,
+            attempts=row["attempts"],
+            created_at=row["created_at"],
+            status="processing",
+            correlation_id=row["correlation_id"],
+            owner_id=row["owner_id"],
+            lane=row["lane"] or DEFAULT_LANE,
+            priority=row["priority"] or 0,
+            partition_key=row.get("partition_key"),
+        )
+
+    async def enqueue(self, message: QueueMessage) -> str:
+        """Add message to queue."""
+        async with self.db.connection() as conn:
+            async with conn.transaction():
+                await self.enqueue_with_connection(conn, message)
+        return message.id
+
+    async def enqueue_many(self, messages: List[QueueMessage]) -> List[str]:
+        """Add several messages in a single transaction."""
+        if not messages:
+            return []
+        async with self.db.connection() as conn:
+            async with conn.transaction():
+                return await self.enqueue_many_with_connection(conn, messages)
+
+    async def enqueue_with_connection(
+        self, conn: asyncpg.Connection, message: QueueMessage
+    ) -> str:
+        """
+        Insert the message using the caller's connection.
+        If conn is inside a transaction, the message (and the wakeup
+        notification) only becomes visible when that transaction commits.
+        """
+        await self.enqueue_many_with_connection(conn, [message])
+        return message.id
+
+    async def enqueue_many_with_connection(
+        self, conn: asyncpg.Connection, messages: List[QueueMessage]
+    ) -> List[str]:
+        """Batch variant of enqueue_with_connection (one wakeup per lane)."""
+        await conn.executemany(
+            f"""
+            INSERT INTO {self.table_name} (
+                id, task_name, payload, status, attempts, created_at,
+                correlation_id, owner_id, lane, priority, partition_key
+            ) VALUES ($1, $2, $3::jsonb, 'pending', $4, $5, $6, $7, $8, $9, $10)
+            """,
+            [
+                (
+                    message.id,
+                    message.task_name,
+                    json.dumps(message.payload),
+                    message.attempts,
+                    message.created_at,
+                    message.correlation_id,
+                    message.owner_id,
+                    message.lane,
+                    message.priority,
+                    message.partition_key,
+                )
+                for message in messages
+            ],
+        )
+        for lane in dict.fromkeys(message.lane for message in messages):
+            await conn.execute("SELECT pg_notify($1, $2)", NOTIFY_CHANNEL, lane)
+        logger.debug(f"Enqueued {len(messages)} messages")
+        return [message.id for message in messages]
+
+    async def dequeue(
+        self, lanes: Optional[List[str]] = None
+    ) -> Optional[QueueMessage]:
+        """Get next message (highest priority first)."""
+        messages = await self.dequeue_batch(1, lanes)
+        return messages[0] if messages else None
+
+    async def dequeue_batch(
+        self, max_messages: int, lanes: Optional[List[str]] = None
+    ) -> List[QueueMessage]:
+        """
+        Claim up to max_messages: pending rows that are due, plus rows whose
+        lease expired (attempts is bumped for those). Expired rows that are
+        out of retries are left for reap_expired() to dead-letter.
+        """
+        lane_sql = "AND lane = ANY($3::text[])" if lanes else ""
+        params: List[Any] = [max_messages, float(self.visibility_timeout)]
+        if lanes:
+            params.append(list(lanes))
+
+        query = f"""
+            WITH claimed AS (
+                SELECT id FROM {self.table_name} m
+                WHERE (
+                    (status = 'pending' AND next_retry_at <= NOW())
+                    OR (
+                        status = 'processing'
+                        AND locked_until < NOW()
+                        AND attempts < {MAX_RETRIES}
+                    )
+                )
+                {lane_sql}
+                AND (
+                    partition_key IS NULL
+                    OR NOT EXISTS (
+                        SELECT 1 FROM {self.table_name} other
+                        WHERE other.partition_key = m.partition_key
+                        AND other.id <> m.id
+                        AND (
+                            (other.status = 'processing' AND other.locked_until >= NOW())
+                            OR (other.created_at, other.id) < (m.created_at, m.id)
+                        )
+                    )
+                )
+                ORDER BY priority DESC, created_at ASC
+                LIMIT $1
+                FOR UPDATE SKIP LOCKED
+            )
+            UPDATE {self.table_name} q
+            SET status = 'processing',
+                attempts = q.attempts + CASE WHEN q.status = 'processing' THEN 1 ELSE 0 END,
+                locked_until = NOW() + make_interval(secs => $2),
+                updated_at = NOW()
+            FROM claimed
+            WHERE q.id = claimed.id
+            RETURNING {", ".join("q." + c.strip() for c in MESSAGE_COLUMNS.split(","))}
+        """
+
+        try:
+            async with self.db.connection() as conn:
+                rows = await conn.fetch(query, *params)
+        except Exception as e:
+            logger.error(f"Error dequeueing: {e}")
+            return []
+
+        messages = [self._row_to_message(dict(row)) for row in rows]
+        # RETURNING does not guarantee order
+        messages.sort(key=lambda m: (-m.priority, m.created_at))
+        return messages
+
+    async def ack(self, message_id: str) -> None:
+        """Mark as completed (remove from queue)."""
+        async with self.db.connection() as conn:
+            await conn.execute(f"DELETE FROM {self.table_name} WHERE id = $1", message_id)
+        logger.debug(f"Acked message {message_id}")
+
+    async def nack(self, message_id: str, retry_after: int = 0) -> None:
+        """Return to pending with a delay."""
+        async with self.db.connection() as conn:
+            await conn.execute(
+                f"""
+                UPDATE {self.table_name}
+                SET status = 'pending',
+                    attempts = attempts + 1,
+                    next_retry_at = NOW() + make_interval(secs => $2),
+                    locked_until = NULL,
+                    updated_at = NOW()
+                WHERE id = $1
+                """,
+                message_id,
+                float(retry_after),
+            )
+        logger.debug(f"Nacked message {message_id} (retry in {retry_after}s)")
+
+    async def fail(self, message_id: str, error: str = "") -> None:
+        """Move message to the DLQ table."""
+        async with self.db.connection() as conn:
+            await conn.execute(
+                f"""
+                WITH moved AS (
+                    DELETE FROM {self.table_name} WHERE id = $1 RETURNING *
+                )
+                INSERT INTO {self.dlq_table_name} (
+                    id, task_name, payload, attempts, created_at,
+                    correlation_id, owner_id, lane, priority, partition_key,
+                    error_reason
+                )
+                SELECT id, task_name, payload, attempts, created_at,
+                       correlation_id, owner_id, lane, priority, partition_key, $2
+                FROM moved
+                """,
+                message_id,
+                error,
+            )
+        logger.error(f"Moved message {message_id} to DLQ. Reason: {error}")
+
+    async def extend_lease(self, message_id: str) -> None:
+        """Heartbeat: push locked_until forward while the handler runs."""
+        async with self.db.connection() as conn:
+            await conn.execute(
+                f"""
+                UPDATE {self.table_name}
+                SET locked_until = NOW() + make_interval(secs => $2)
+                WHERE id = $1 AND status = 'processing'
+                """,
+                message_id,
+                float(self.visibility_timeout),
+            )
+
+    async def reap_expired(self) -> int:
+        """
+        Return messages with expired leases to pending (attempts + 1).
+        Messages that already used MAX_RETRIES attempts move to the DLQ.
+        """
+        async with self.db.connection() as conn:
+            async with conn.transaction():
+                failed = await conn.fetch(
+                    f"""
+                    WITH moved AS (
+                        DELETE FROM {self.table_name}
+                        WHERE status = 'processing'
+                        AND locked_until < NOW()
+                        AND attempts >= $1
+                        RETURNING *
+                    )
+                    INSERT INTO {self.dlq_table_name} (
+                        id, task_name, payload, attempts, created_at,
+                        correlation_id, owner_id, lane, priority, partition_key,
+                        error_reason
+                    )
+                    SELECT id, task_name, payload, attempts + 1, created_at,
+                           correlation_id, owner_id, lane, priority, partition_key,
+                           'Lease expired'
+                    FROM moved
+                    RETURNING id
+                    """,
+                    MAX_RETRIES,
+                )
+                reaped = await conn.fetch(
+                    f"""
+                    UPDATE {self.table_name}
+                    SET status = 'pending',
+                        attempts = attempts + 1,
+                        next_retry_at = NOW(),
+                        locked_until = NULL,
+                        updated_at = NOW()
+                    WHERE status = 'processing' AND locked_until < NOW()
+                    RETURNING id
+                    """
+                )
+
+        if failed:
+            logger.error(f"Moved {len(failed)} messages with expired leases to DLQ")
+        return len(reaped) + len(failed)
+
+    async def start_consuming(
+        self,
+        handler: Callable[[QueueMessage], Awaitable[None]],
+        concurrency: int = 1,
+        task_concurrency: Optional[Dict[str, int]] = None,
+        shutdown_timeout: float = 30.0,
+        lanes: Optional[List[str]] = None,
+        min_idle_wait: float = 0.05,
+        max_idle_wait: float = 1.0,
+        reap_interval: float = 60.0,
+    ) -> None:
+        """Run the default consumer loop and stop listening when it stops."""
+        try:
+            await super().start_consuming(
+                handler,
+                concurrency=concurrency,
+                task_concurrency=task_concurrency,
+                shutdown_timeout=shutdown_timeout,
+                lanes=lanes,
+                min_idle_wait=min_idle_wait,
+                max_idle_wait=max_idle_wait,
+                reap_interval=reap_interval,
+            )
+        finally:
+            await self.notifier.close()
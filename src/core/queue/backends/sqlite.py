@@ -4,27 +4,67 @@ import logging
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
-from ..interfaces import QueueBackend
-from ..models import QueueMessage
+from ..interfaces import MAX_RETRIES, QueueBackend
+from ..models import DEFAULT_LANE, QueueMessage
 
 logger = logging.getLogger(__name__)
 
+# Columns read back when a message is claimed (see _row_to_message)
+MESSAGE_COLUMNS = (
+    "id, task_name, payload, attempts, created_at, correlation_id, owner_id, "
+    "lane, priority, partition_key"
+)
+
+# Only the oldest live message of a partition is claimable, and only while no
+# other message of that partition is being processed
+PARTITION_HEAD_FILTER = """
+AND (
+    partition_key IS NULL
+    OR NOT EXISTS (
+        SELECT 1 FROM message_queue AS other
+        WHERE other.partition_key = message_queue.partition_key
+        AND other.id != message_queue.id
+        AND (
+            other.status = 'processing'
+            OR (
+                other.status = 'pending'
+                AND (other.created_at, other.id) < (message_queue.created_at, message_queue.id)
+            )
+        )
+    )
+)
+"""
+
 
 class SqliteQueueBackend(QueueBackend):
     """
     Sqlite implementation of the queue backend.
     Suitable for development and simple deployments.
+
+    Claimed messages hold a lease (locked_until) that the consumer extends
+    while the handler runs; reap_expired() returns messages whose lease
+    expired (e.g. the worker died) to pending.
+
+    Messages with a partition_key are handed out in order, one at a time per
+    key, across all consumers of the database.
     """
 
-    def __init__(self, db_path: str = "queue.db"):
+    def __init__(self, db_path: str = "queue.db", visibility_timeout: int = 300):
         self.db_path = db_path
+        self.visibility_timeout: int = visibility_timeout
         self._init_db()
 
+    def _lease_expiry(self, now: datetime) -> datetime:
+        return now + timedelta(seconds=self.visibility_timeout)
+
     def _get_conn(self):
         return sqlite3.connect(self.db_path)
 
+    def _release_conn(self, conn):
+        conn.close()
+
     def _init_db(self):
         """Initialize the queue table."""
         conn = self._get_conn()
@@ -44,16 +84,27 @@ class SqliteQueueBackend(QueueBackend):
             next_retry_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             correlation_id TEXT,
             owner_id TEXT,
-            error_reason TEXT
+            error_reason TEXT,
+            lane TEXT NOT NULL DEFAULT 'default',
+            priority INTEGER NOT NULL DEFAULT 0,
+            locked_until TIMESTAMP,
+            partition_key TEXT
         )
         """
         )
 
-        # Try to add error_reason column if it doesn't exist (for migration)
-        try:
-            cursor.execute("ALTER TABLE message_queue ADD COLUMN error_reason TEXT")
-        except sqlite3.OperationalError:
-            pass  # Column likely already exists
+        # Try to add newer columns if they don't exist (for migration)
+        for column_ddl in (
+            "error_reason TEXT",
+            "lane TEXT NOT NULL DEFAULT 'default'",
+            "priority INTEGER NOT NULL DEFAULT 0",
+            "locked_until TIMESTAMP",
+            "partition_key TEXT",
+        ):
+            try:
+                cursor.execute(f"ALTER TABLE message_queue ADD COLUMN {column_ddl}")
+            except sqlite3.OperationalError:
+                pass  # Column likely already exists
 
         # Create index for polling
         cursor.execute(
@@ -63,55 +114,112 @@ class SqliteQueueBackend(QueueBackend):
         """
         )
 
+        # Index for lane-filtered, priority-ordered polling
+        cursor.execute(
+            """
+        CREATE INDEX IF NOT EXISTS idx_queue_lane_poll
+        ON message_queue (status, lane, priority DESC, created_at)
+        """
+        )
+
+        # Index for the partition head check
+        cursor.execute(
+            """
+        CREATE INDEX IF NOT EXISTS idx_queue_partition
+        ON message_queue (partition_key, status, created_at)
+        WHERE partition_key IS NOT NULL
+        """
+        )
+
+        # Index for the reaper (expired leases)
+        cursor.execute(
+            """
+        CREATE INDEX IF NOT EXISTS idx_queue_lease
+        ON message_queue (status, locked_until)
+        """
+        )
+
         conn.commit()
-        conn.close()
+        self._release_conn(conn)
 
     async def enqueue(self, message: QueueMessage) -> str:
         """Add message to queue."""
         loop = asyncio.get_event_loop()
         await loop.run_in_executor(None, self._enqueue_sync, message)
+        await self.notifier.notify()
         return message.id
 
+    async def enqueue_many(self, messages: List[QueueMessage]) -> List[str]:
+        """Add several messages in a single transaction."""
+        if not messages:
+            return []
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, self._enqueue_many_sync, messages)
+        await self.notifier.notify()
+        return [message.id for message in messages]
+
     def _enqueue_sync(self, message: QueueMessage):
+        self._enqueue_many_sync([message])
+
+    def _enqueue_many_sync(self, messages: List[QueueMessage]):
         conn = self._get_conn()
         cursor = conn.cursor()
 
         try:
-            cursor.execute(
+            now = datetime.utcnow()
+            cursor.executemany(
                 """
             INSERT INTO message_queue (
                 id, task_name, payload, status, attempts, 
                 created_at, updated_at, next_retry_at,
-                correlation_id, owner_id
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                correlation_id, owner_id, lane, priority, partition_key
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
-                (
-                    message.id,
-                    message.task_name,
-                    json.dumps(message.payload),
-                    "pending",
-                    message.attempts,
-                    message.created_at,
-                    datetime.utcnow(),
-                    datetime.utcnow(),
-                    message.correlation_id,
-                    message.owner_id,
-                ),
+                [
+                    (
+                        message.id,
+                        message.task_name,
+                        json.dumps(message.payload),
+                        "pending",
+                        message.attempts,
+                        message.created_at,
+                        now,
+                        now,
+                        message.correlation_id,
+                        message.owner_id,
+                        message.lane,
+                        message.priority,
+                        message.partition_key,
+                    )
+                    for message in messages
+                ],
             )
             conn.commit()
-            logger.debug(f"Enqueued message {message.id}")
+            logger.debug(f"Enqueued {len(messages)} messages")
         except Exception as e:
-            logger.error(f"Failed to enqueue message: {e}")
+            conn.rollback()
+            logger.error(f"Failed to enqueue messages: {e}")
             raise
         finally:
-            conn.close()
+            self._release_conn(conn)
 
-    async def dequeue(self) -> Optional[QueueMessage]:
-        """Get next pending message."""
+    async def dequeue(
+        self, lanes: Optional[List[str]] = None
+    ) -> Optional[QueueMessage]:
+        """Get next pending message (highest priority first)."""
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._dequeue_sync)
-
-    def _dequeue_sync(self) -> Optional[QueueMessage]:
+        return await loop.run_in_executor(None, self._dequeue_sync, lanes)
+
+    def _lane_filter(self, lanes: Optional[List[str]]) -> Tuple[str, tuple]:
+        """SQL condition (and params) restricting a poll to the given lanes."""
+        if not lanes:
+            return "", ()
+        placeholders = ", ".join("?" for _ in lanes)
+        return f"AND lane IN ({placeholders})", tuple(lanes)
+
+    def _dequeue_sync(
+        self, lanes: Optional[List[str]] = None
+    ) -> Optional[QueueMessage]:
         conn = self._get_conn()
         cursor = conn.cursor()
 
@@ -121,18 +229,21 @@ class SqliteQueueBackend(QueueBackend):
             cursor.execute("BEGIN EXCLUSIVE")
 
             now = datetime.utcnow()
+            lane_sql, lane_params = self._lane_filter(lanes)
 
             # Find candidate
             cursor.execute(
-                """
-            SELECT id, task_name, payload, attempts, created_at, correlation_id, owner_id
+                f"""
+            SELECT {MESSAGE_COLUMNS}
             FROM message_queue
             WHERE status = 'pending' 
             AND next_retry_at <= ?
-            ORDER BY created_at ASC
+            {lane_sql}
+            {PARTITION_HEAD_FILTER}
+            ORDER BY priority DESC, created_at ASC
             LIMIT 1
             """,
-                (now,),
+                (now, *lane_params),
             )
 
             row = cursor.fetchone()
@@ -141,52 +252,64 @@ class SqliteQueueBackend(QueueBackend):
                 conn.rollback()
                 return None
 
-            (
-                msg_id,
-                task_name,
-                payload_json,
-                attempts,
-                created_at,
-                correlation_id,
-                owner_id,
-            ) = row
+            msg_id = row[0]
 
             # Update status
             cursor.execute(
                 """
             UPDATE message_queue
-            SET status = 'processing', updated_at = ?
+            SET status = 'processing', updated_at = ?, locked_until = ?
             WHERE id = ?
             """,
-                (now, msg_id),
+                (now, self._lease_expiry(now), msg_id),
             )
 
             conn.commit()
 
-            # Parse payload
-            try:
-                if isinstance(created_at, str):
-                    created_at = datetime.fromisoformat(created_at)
-            except ValueError:
-                created_at = datetime.utcnow()  # Fallback
-
-            return QueueMessage(
-                id=msg_id,
-                task_name=task_name,
-                payload=json.loads(payload_json),
-                attempts=attempts,
-                created_at=created_at,
-                status="processing",
-                correlation_id=correlation_id,
-                owner_id=owner_id,
-            )
+            return self._row_to_message(row)
 
         except Exception as e:
             logger.error(f"Error dequeueing: {e}")
             conn.rollback()
             return None
         finally:
-            conn.close()
+            self._release_conn(conn)
+
+    def _row_to_message(self, row) -> QueueMessage:
+        """Build a processing QueueMessage from a claimed row."""
+        (
+            msg_id,
+            task_name,
+            payload_json,
+            attempts,
+            created_at,
+            correlation_id,
+            owner_id,
+            lane,
+            priority,
+            partition_key,
+        ) = row
+
+        # Parse payload
+        try:
+            if isinstance(created_at, str):
+                created_at = datetime.fromisoformat(created_at)
+        except ValueError:
+            created_at = datetime.utcnow()  # Fallback
+
+        return QueueMessage(
+            id=msg_id,
+            task_name=task_name,
+            payload=json.loads(payload_json),
+            attempts=attempts,
+            created_at=created_at,
+            status="processing",
+            correlation_id=correlation_id,
+            owner_id=owner_id,
+            lane=lane or DEFAULT_LANE,
+            priority=priority or 0,
+            partition_key=partition_key,
+        )
 
     async def ack(self, message_id: str) -> None:
         """Mark as completed (remove from queue)."""
@@ -206,7 +329,7 @@ class SqliteQueueBackend(QueueBackend):
             conn.commit()
             logger.debug(f"Acked message {message_id}")
         finally:
-            conn.close()
+            self._release_conn(conn)
 
     async def nack(self, message_id: str, retry_after: int = 0) -> None:
         """Mark as pending again with delay."""
@@ -224,6 +347,7 @@ class SqliteQueueBackend(QueueBackend):
             SET status = 'pending', 
                 attempts = attempts + 1,
                 next_retry_at = ?,
+                locked_until = NULL,
                 updated_at = ?
             WHERE id = ?
             """,
@@ -232,7 +356,7 @@ class SqliteQueueBackend(QueueBackend):
             conn.commit()
             logger.debug(f"Nacked message {message_id} (retry in {retry_after}s)")
         finally:
-            conn.close()
+            self._release_conn(conn)
 
     async def fail(self, message_id: str, error: str = "") -> None:
         """Mark message as permanently failed (DLQ)."""
@@ -247,6 +371,7 @@ class SqliteQueueBackend(QueueBackend):
                 """
             UPDATE message_queue
             SET status = 'failed', 
+                locked_until = NULL,
                 updated_at = ?,
                 error_reason = ?
             WHERE id = ?
@@ -256,4 +381,89 @@ class SqliteQueueBackend(QueueBackend):
             conn.commit()
             logger.error(f"Marked message {message_id} as FAILED. Reason: {error}")
         finally:
-            conn.close()
+            self._release_conn(conn)
+
+    async def extend_lease(self, message_id: str) -> None:
+        """Heartbeat: push locked_until forward while the handler runs."""
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, self._extend_lease_sync, message_id)
+
+    def _extend_lease_sync(self, message_id: str):
+        conn = self._get_conn()
+        cursor = conn.cursor()
+        try:
+            now = datetime.utcnow()
+            cursor.execute(
+                """
+            UPDATE message_queue
+            SET locked_until = ?, updated_at = ?
+            WHERE id = ? AND status = 'processing'
+            """,
+                (self._lease_expiry(now), now, message_id),
+            )
+            conn.commit()
+        finally:
+            self._release_conn(conn)
+
+    async def reap_expired(self) -> int:
+        """
+        Return messages whose lease expired to pending with attempts + 1.
+        Messages that already used all their retries are marked failed.
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self._reap_expired_sync)
+
+    def _reap_expired_sync(self) -> int:
+        conn = self._get_conn()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+
+            now = datetime.utcnow()
+            # Rows claimed before locked_until existed expire from updated_at
+            expired = """
+            status = 'processing'
+            AND (
+                locked_until < ?
+                OR (locked_until IS NULL AND updated_at < ?)
+            )
+            """
+            expired_params = (now, now - timedelta(seconds=self.visibility_timeout))
+
+            cursor.execute(
+                f"""
+            UPDATE message_queue
+            SET status = 'failed',
+                attempts = attempts + 1,
+                locked_until = NULL,
+                updated_at = ?,
+                error_reason = 'Lease expired'
+            WHERE {expired} AND attempts >= ?
+            """,
+                (now, *expired_params, MAX_RETRIES),
+            )
+            failed = cursor.rowcount
+
+            cursor.execute(
+                f"""
+            UPDATE message_queue
+            SET status = 'pending',
+                attempts = attempts + 1,
+                next_retry_at = ?,
+                locked_until = NULL,
+                updated_at = ?
+            WHERE {expired}
+            """,
+                (now, now, *expired_params),
+            )
+            reaped = cursor.rowcount
+            conn.commit()
+
+            if failed:
+                logger.error(f"Marked {failed} messages with expired leases as FAILED")
+            return reaped + failed
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._release_conn(conn)
@@ -0,0 +1,273 @@
+import asyncio
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from ..models import QueueMessage
+from .sqlite import MESSAGE_COLUMNS, PARTITION_HEAD_FILTER, SqliteQueueBackend
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteWalQueueBackend(SqliteQueueBackend):
+    """
+    High-throughput Sqlite backend.
+
+    Differences from SqliteQueueBackend:
+    - One long-lived connection per executor thread (no connect/close per call).
+    - WAL journal mode, so readers and the writer don't block each other.
+    - Messages are claimed in batches with a single UPDATE ... RETURNING
+      (the consumer loop claims at most one message per free handler slot).
+    - Acks are buffered and deleted in one transaction (flushed on the next
+      claim, when the buffer is full, every ack_flush_interval seconds while
+      consuming, or when the consumer stops). Acks of messages with a
+      partition_key are flushed right away, since their 'processing' row
+      blocks the rest of the partition.
+
+    Buffered acks make delivery at-least-once: a crash before the flush
+    means those messages are processed again.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "queue.db",
+        batch_size: int = 10,
+        ack_batch_size: int = 50,
+        visibility_timeout: int = 300,
+        ack_flush_interval: float = 1.0,
+    ):
+        self.batch_size = batch_size
+        self.ack_batch_size = ack_batch_size
+        self.ack_flush_interval = ack_flush_interval
+
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._conn_lock = threading.Lock()
+
+        # Only touched from the event loop thread
+        self._pending_acks: List[str] = []
+        self._partitioned: Set[str] = set()
+
+        super().__init__(db_path=db_path, visibility_timeout=visibility_timeout)
+
+    def _get_conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+            with self._conn_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _release_conn(self, conn):
+        # Connections are long-lived; they are closed in close()
+        pass
+
+    def _rolling_back(self, operation: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a base-class sync operation, rolling back on error.
+        The base class closes its connection after every call; here the
+        connection is reused, so a failed statement must not leave its
+        transaction open for the next caller on this thread.
+        """
+        try:
+            return operation(*args)
+        except Exception:
+            self._get_conn().rollback()
+            raise
+
+    def _enqueue_many_sync(self, messages: List[QueueMessage]):
+        return self._rolling_back(super()._enqueue_many_sync, messages)
+
+    def _nack_sync(self, message_id: str, retry_after: int):
+        return self._rolling_back(super()._nack_sync, message_id, retry_after)
+
+    def _fail_sync(self, message_id: str, error: str):
+        return self._rolling_back(super()._fail_sync, message_id, error)
+
+    def _extend_lease_sync(self, message_id: str):
+        return self._rolling_back(super()._extend_lease_sync, message_id)
+
+    async def dequeue(
+        self, lanes: Optional[List[str]] = None
+    ) -> Optional[QueueMessage]:
+        """Get next pending message, flushing buffered acks."""
+        messages = await self.dequeue_batch(1, lanes)
+        return messages[0] if messages else None
+
+    async def dequeue_batch(
+        self, max_messages: int, lanes: Optional[List[str]] = None
+    ) -> List[QueueMessage]:
+        """Claim up to max_messages in one transaction, flushing buffered acks."""
+        acks, self._pending_acks = self._pending_acks, []
+        loop = asyncio.get_event_loop()
+        try:
+            messages = await loop.run_in_executor(
+                None, self._claim_batch_sync, max_messages, acks, lanes
+            )
+        except Exception as e:
+            logger.error(f"Error dequeueing batch: {e}")
+            # Keep acks for the next flush attempt
+            self._pending_acks.extend(acks)
+            return []
+
+        self._partitioned.update(m.id for m in messages if m.partition_key)
+        return messages
+
+    def _claim_batch_sync(
+        self,
+        max_messages: int,
+        acks: List[str],
+        lanes: Optional[List[str]] = None,
+    ) -> List[QueueMessage]:
+        conn = self._get_conn()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+
+            if acks:
+                self._delete_sync(cursor, acks)
+
+            now = datetime.utcnow()
+            lane_sql, lane_params = self._lane_filter(lanes)
+            cursor.execute(
+                f"""
+            UPDATE message_queue
+            SET status = 'processing', updated_at = ?, locked_until = ?
+            WHERE id IN (
+                SELECT id FROM message_queue
+                WHERE status = 'pending'
+                AND next_retry_at <= ?
+                {lane_sql}
+                {PARTITION_HEAD_FILTER}
+                ORDER BY priority DESC, created_at ASC
+                LIMIT ?
+            )
+            RETURNING {MESSAGE_COLUMNS}
+            """,
+                (now, self._lease_expiry(now), now, *lane_params, max_messages),
+            )
+            rows = cursor.fetchall()
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+        # RETURNING does not guarantee order
+        rows.sort(key=lambda row: (-(row[8] or 0), str(row[4])))
+        return [self._row_to_message(row) for row in rows]
+
+    def _delete_sync(self, cursor: sqlite3.Cursor, message_ids: List[str]):
+        cursor.executemany(
+            "DELETE FROM message_queue WHERE id = ?",
+            [(message_id,) for message_id in message_ids],
+        )
+        logger.debug(f"Acked {len(message_ids)} messages")
+
+    async def ack(self, message_id: str) -> None:
+        """
+        Buffer the ack; rows are deleted in batches. Partitioned messages
+        are flushed before returning, so the consumer only releases the
+        partition once the next message of it is claimable.
+        """
+        self._pending_acks.append(message_id)
+        partitioned = message_id in self._partitioned
+        self._partitioned.discard(message_id)
+        if partitioned or len(self._pending_acks) >= self.ack_batch_size:
+            try:
+                await self.flush()
+            except Exception as e:
+                # Acks stay buffered and are retried on the next claim
+                logger.error(f"Failed to flush buffered acks: {e}")
+
+    async def nack(self, message_id: str, retry_after: int = 0) -> None:
+        self._partitioned.discard(message_id)
+        await super().nack(message_id, retry_after)
+
+    async def fail(self, message_id: str, error: str = "") -> None:
+        self._partitioned.discard(message_id)
+        await super().fail(message_id, error)
+
+    async def flush(self) -> None:
+        """Delete buffered acks in one transaction."""
+        acks, self._pending_acks = self._pending_acks, []
+        if not acks:
+            return
+
+        loop = asyncio.get_event_loop()
+        try:
+            await loop.run_in_executor(None, self._flush_sync, acks)
+        except Exception:
+            self._pending_acks.extend(acks)
+            raise
+
+    def _flush_sync(self, acks: List[str]):
+        conn = self._get_conn()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            self._delete_sync(cursor, acks)
+            conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to flush buffered acks: {e}")
+            conn.rollback()
+            raise
+
+    async def _flush_loop(self, interval: float) -> None:
+        """
+        Flush buffered acks periodically. Acked rows stay 'processing' without
+        a heartbeat until flushed, so this must run well within their lease.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                # Acks stay buffered and are retried on the next flush
+                logger.error(f"Failed to flush buffered acks: {e}")
+
+    async def start_consuming(
+        self,
+        handler: Callable[[QueueMessage], Awaitable[None]],
+        concurrency: int = 1,
+        task_concurrency: Optional[Dict[str, int]] = None,
+        shutdown_timeout: float = 30.0,
+        lanes: Optional[List[str]] = None,
+        min_idle_wait: float = 0.05,
+        max_idle_wait: float = 1.0,
+        reap_interval: float = 60.0,
+    ) -> None:
+        """Run the default consumer loop, flushing acks periodically and when it stops."""
+        flusher = asyncio.create_task(
+            self._flush_loop(
+                min(self.ack_flush_interval, self.visibility_timeout / 3)
+            )
+        )
+        try:
+            await super().start_consuming(
+                handler,
+                concurrency=concurrency,
+                task_concurrency=task_concurrency,
+                shutdown_timeout=shutdown_timeout,
+                lanes=lanes,
+                min_idle_wait=min_idle_wait,
+                max_idle_wait=max_idle_wait,
+                reap_interval=reap_interval,
+            )
+        finally:
+            flusher.cancel()
+            await self.flush()
+
+    def close(self) -> None:
+        """Close every connection opened by this backend."""
+        with self._conn_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
@@ -1,7 +1,7 @@
 import asyncio
 import json
 import logging
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 
 import boto3
 from botocore.exceptions import ClientError
@@ -12,10 +12,18 @@ from ..models import QueueMessage
 
 logger = logging.getLogger(__name__)
 
+SQS_MAX_BATCH_SIZE = 10
+
 
 class SQSBackend(QueueBackend):
     """
     AWS SQS backend implementation.
+    Lanes map to separate SQS queues via lane_queue_urls; lanes without a
+    dedicated queue share queue_url.
+    On FIFO queues (".fifo" URLs) the partition_key becomes the
+    MessageGroupId, so SQS itself delivers each partition in order, one
+    message at a time; on standard queues ordering is only enforced within
+    a consumer process.
     """
 
     def __init__(
@@ -24,8 +32,12 @@ class SQSBackend(QueueBackend):
         region_name: str,
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
+        lane_queue_urls: Optional[Dict[str, str]] = None,
     ):
         self.queue_url = queue_url
+        self.lane_queue_urls = lane_queue_urls or {}
+        # Receipt handles are only valid for the queue they came from
+        self._receipt_queues: Dict[str, str] = {}
         self.sqs = boto3.client(
             "sqs",
             region_name=region_name,
@@ -50,36 +62,126 @@ class SQSBackend(QueueBackend):
         # We can set `QueueMessage.id` to `ReceiptHandle` for dequeued messages.
         # This seems safe because `id` is just a string identifier for the system to track the message instance.
 
+    def _lane_queue_url(self, lane: str) -> str:
+        return self.lane_queue_urls.get(lane, self.queue_url)
+
+    @staticmethod
+    def _ordering_params(queue_url: str, message: QueueMessage) -> Dict[str, str]:
+        """MessageGroupId/MessageDeduplicationId required by FIFO queues."""
+        if not queue_url.endswith(".fifo"):
+            return {}
+        return {
+            "MessageGroupId": message.partition_key or message.id,
+            "MessageDeduplicationId": message.id,
+        }
+
+    def _poll_queue_urls(self, lanes: Optional[List[str]]) -> List[str]:
+        """Distinct queue URLs to poll, in lane priority order."""
+        if lanes:
+            urls = [self._lane_queue_url(lane) for lane in lanes]
+        else:
+            urls = list(self.lane_queue_urls.values()) + [self.queue_url]
+        return list(dict.fromkeys(urls))
+
     async def enqueue(self, message: QueueMessage) -> str:
         """Add message to SQS."""
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, self._enqueue_sync, message)
 
     def _enqueue_sync(self, message: QueueMessage) -> str:
+        queue_url = self._lane_queue_url(message.lane)
         try:
             response = self.sqs.send_message(
-                QueueUrl=self.queue_url,
+                QueueUrl=queue_url,
                 MessageBody=message.model_dump_json(),
                 MessageAttributes={
                     "TaskName": {"StringValue": message.task_name, "DataType": "String"}
                 },
+                **self._ordering_params(queue_url, message),
             )
             return response.get("MessageId")
         except ClientError as e:
             logger.error(f"SQS enqueue error: {e}")
             raise
 
-    async def dequeue(self) -> Optional[QueueMessage]:
-        """Retrieve message from SQS."""
+    async def enqueue_many(self, messages: List[QueueMessage]) -> List[str]:
+        """Add messages with send_message_batch (10 per request, per lane queue)."""
+        if not messages:
+            return []
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._dequeue_sync)
+        return await loop.run_in_executor(None, self._enqueue_many_sync, messages)
+
+    def _enqueue_many_sync(self, messages: List[QueueMessage]) -> List[str]:
+        by_queue: Dict[str, List[QueueMessage]] = {}
+        for message in messages:
+            by_queue.setdefault(self._lane_queue_url(message.lane), []).append(message)
+
+        sqs_ids: Dict[str, str] = {}
+        for queue_url, queue_messages in by_queue.items():
+            for start in range(0, len(queue_messages), SQS_MAX_BATCH_SIZE):
+                chunk = queue_messages[start : start + SQS_MAX_BATCH_SIZE]
+                try:
+                    response = self.sqs.send_message_batch(
+                        QueueUrl=queue_url,
+                        Entries=[
+                            {
+                                # Batch entry ids must be unique within the request
+                                "Id": str(i),
+                                "MessageBody": message.model_dump_json(),
+                                "MessageAttributes": {
+                                    "TaskName": {
+                                        "StringValue": message.task_name,
+                                        "DataType": "String",
+                                    }
+                                },
+                                **self._ordering_params(queue_url, message),
+                            }
+                            for i, message in enumerate(chunk)
+                        ],
+                    )
+                except ClientError as e:
+                    logger.error(f"SQS enqueue error: {e}")
+                    raise
+
+                failed = response.get("Failed") or []
+                if failed:
+                    reasons = ", ".join(f.get("Message", f.get("Code", "")) for f in failed)
+                    logger.error(f"SQS batch enqueue failed for {len(failed)} messages: {reasons}")
+                    raise RuntimeError(f"SQS batch enqueue failed: {reasons}")
 
-    def _dequeue_sync(self) -> Optional[QueueMessage]:
+                for entry in response.get("Successful", []):
+                    sqs_ids[chunk[int(entry["Id"])].id] = entry["MessageId"]
+
+        return [sqs_ids[message.id] for message in messages]
+
+    async def dequeue(
+        self, lanes: Optional[List[str]] = None
+    ) -> Optional[QueueMessage]:
+        """Retrieve message from SQS, polling lane queues in priority order."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self._dequeue_sync, lanes)
+
+    def _dequeue_sync(
+        self, lanes: Optional[List[str]] = None
+    ) -> Optional[QueueMessage]:
+        queue_urls = self._poll_queue_urls(lanes)
+        # Long polling only when there is a single queue; otherwise a long
+        # poll on a low-priority queue would delay higher-priority ones.
+        wait_seconds = 5 if len(queue_urls) == 1 else 0
+        for queue_url in queue_urls:
+            msg = self._receive_sync(queue_url, wait_seconds)
+            if msg:
+                return msg
+        return None
+
+    def _receive_sync(
+        self, queue_url: str, wait_seconds: int
+    ) -> Optional[QueueMessage]:
         try:
             response = self.sqs.receive_message(
-                QueueUrl=self.queue_url,
+                QueueUrl=queue_url,
                 MaxNumberOfMessages=1,
-                WaitTimeSeconds=5,  # Long polling
+                WaitTimeSeconds=wait_seconds,  # Long polling
                 AttributeNames=["All"],
                 MessageAttributeNames=["All"],
             )
@@ -101,6 +203,7 @@ class SQSBackend(QueueBackend):
                 # SQS needs ReceiptHandle to delete message, not the original MessageID.
                 # When we dequeued, we created a "processing instance" of this message.
                 queue_msg.id = receipt_handle
+                self._receipt_queues[receipt_handle] = queue_url
 
                 return queue_msg
             except ValidationError as e:
@@ -124,7 +227,8 @@ class SQSBackend(QueueBackend):
     def _ack_sync(self, receipt_handle: str):
         try:
             self.sqs.delete_message(
-                QueueUrl=self.queue_url, ReceiptHandle=receipt_handle
+                QueueUrl=self._receipt_queues.pop(receipt_handle, self.queue_url),
+                ReceiptHandle=receipt_handle,
             )
         except ClientError as e:
             logger.error(f"SQS ack error: {e}")
@@ -137,7 +241,7 @@ class SQSBackend(QueueBackend):
     def _nack_sync(self, receipt_handle: str, retry_after: int):
         try:
             self.sqs.change_message_visibility(
-                QueueUrl=self.queue_url,
+                QueueUrl=self._receipt_queues.pop(receipt_handle, self.queue_url),
                 ReceiptHandle=receipt_handle,
                 VisibilityTimeout=retry_after,
             )
@@ -149,6 +253,7 @@ class SQSBackend(QueueBackend):
         Mark message as permanently failed.
         Relying on SQS Redrive Policy (DLQ).
         """
+        self._receipt_queues.pop(message_id, None)
         logger.warning(f"Manual fail requested for message {message_id}. Reason: {error}")
         pass
 
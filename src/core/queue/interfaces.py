@@ -1,18 +1,42 @@
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Awaitable, Callable, Optional
+from typing import Awaitable, Callable, Dict, List, Optional, Set
 
 from src.core.utils.logging import get_logger
 from .models import QueueMessage
+from .notifier import LocalQueueNotifier, QueueNotifier
+from .sequencer import PartitionSequencer
 
 logger = get_logger(__name__)
 
+MAX_RETRIES = 3  # Hardcoded for now, or move to settings
+
 
 class QueueBackend(ABC):
     """
     Abstract base class for queue backends.
     """
 
+    _notifier: Optional[QueueNotifier] = None
+
+    # Lease (seconds) on claimed messages; None = backend has no leases
+    visibility_timeout: Optional[int] = None
+
+    # Most messages the consumer loop claims per round-trip; it never claims
+    # more than it has free handler slots for
+    batch_size: int = 1
+
+    @property
+    def notifier(self) -> QueueNotifier:
+        """Wakeup channel between producers and idle consumers (in-process by default)."""
+        if self._notifier is None:
+            self._notifier = LocalQueueNotifier()
+        return self._notifier
+
+    @notifier.setter
+    def notifier(self, notifier: QueueNotifier) -> None:
+        self._notifier = notifier
+
     @abstractmethod
     async def enqueue(self, message: QueueMessage) -> str:
         """
@@ -21,15 +45,43 @@ class QueueBackend(ABC):
         """
         pass
 
+    async def enqueue_many(self, messages: List[QueueMessage]) -> List[str]:
+        """
+        Add several messages to the queue.
+        Default implementation calls enqueue repeatedly; backends that can
+        write a batch in one round-trip should override it.
+        """
+        return [await self.enqueue(message) for message in messages]
+
     @abstractmethod
-    async def dequeue(self) -> Optional[QueueMessage]:
+    async def dequeue(
+        self, lanes: Optional[List[str]] = None
+    ) -> Optional[QueueMessage]:
         """
         Retrieve and lock the next message from the queue.
         Returns None if queue is empty.
         Used by pull-based backends.
+        When lanes is given, only messages from those lanes are returned,
+        highest priority first.
         """
         pass
 
+    async def dequeue_batch(
+        self, max_messages: int, lanes: Optional[List[str]] = None
+    ) -> List[QueueMessage]:
+        """
+        Retrieve and lock up to max_messages from the queue.
+        Default implementation calls dequeue repeatedly; backends that can
+        claim several rows in one round-trip should override it.
+        """
+        messages: List[QueueMessage] = []
+        while len(messages) < max_messages:
+            msg = await self.dequeue(lanes)
+            if msg is None:
+                break
+            messages.append(msg)
+        return messages
+
     @abstractmethod
     async def ack(self, message_id: str) -> None:
         """
@@ -53,51 +105,225 @@ class QueueBackend(ABC):
         """
         pass
 
+    async def extend_lease(self, message_id: str) -> None:
+        """
+        Heartbeat: push the lease of a message being processed forward by
+        visibility_timeout. No-op for backends without leases.
+        """
+        pass
+
+    async def reap_expired(self) -> int:
+        """
+        Return messages whose lease expired (crashed worker) to pending,
+        bumping their attempts. Returns the number of messages reaped.
+        """
+        return 0
+
     async def start_consuming(
-        self, handler: Callable[[QueueMessage], Awaitable[None]]
+        self,
+        handler: Callable[[QueueMessage], Awaitable[None]],
+        concurrency: int = 1,
+        task_concurrency: Optional[Dict[str, int]] = None,
+        shutdown_timeout: float = 30.0,
+        lanes: Optional[List[str]] = None,
+        min_idle_wait: float = 0.05,
+        max_idle_wait: float = 1.0,
+        reap_interval: float = 60.0,
     ) -> None:
         """
         Start consuming messages and pass them to handler.
         This method might block or run forever.
         Default implementation for pull-based backends (polling).
+
+        Up to `concurrency` handlers run at once as asyncio tasks.
+        `task_concurrency` optionally caps specific task names
+        (e.g. {"transcribe_audio": 2}); a message waiting for its task slot
+        keeps its global slot, so per-task limits should stay below
+        `concurrency`. On cancel, in-flight handlers are drained for up to
+        `shutdown_timeout` seconds before being cancelled.
+        `lanes` restricts consumption to those lanes (None = all).
+        When the queue is empty the loop waits on the notifier, so an enqueue
+        wakes it immediately; the fallback poll interval doubles from
+        `min_idle_wait` up to `max_idle_wait` while the queue stays empty.
+        When batch_size > 1, the loop claims as many messages as it has free
+        handler slots (at most batch_size) in one dequeue_batch() call, so
+        no claimed message waits in a buffer without a handler.
+        For backends with leases, each message heartbeats from the moment it
+        is dequeued (including while it waits for its partition or task slot)
+        until it is acked, nacked or failed, and expired leases are reaped
+        every `reap_interval` seconds.
+        Messages with a partition_key run one at a time per key, in dequeue
+        order (backends that can, only hand out the head of each partition).
         """
-        MAX_RETRIES = 3  # Hardcoded for now, or move to settings
+        logger.info(
+            "Starting consumer loop",
+            backend=self.__class__.__name__,
+            concurrency=concurrency,
+            lanes=lanes,
+        )
 
-        logger.info("Starting consumer loop", backend=self.__class__.__name__)
+        slots = asyncio.Semaphore(concurrency)
+        task_slots = {
+            name: asyncio.Semaphore(limit)
+            for name, limit in (task_concurrency or {}).items()
+        }
+        in_flight: Set[asyncio.Task] = set()
+        sequencer = PartitionSequencer()
+        idle_wait = min_idle_wait
+        reaper = (
+            asyncio.create_task(self._reap_loop(reap_interval))
+            if self.visibility_timeout
+            else None
+        )
+
+        async def handle(
+            msg: QueueMessage, heartbeat: Optional[asyncio.Task]
+        ) -> None:
+            task_slot = task_slots.get(msg.task_name)
+            if task_slot:
+                async with task_slot:
+                    await self._handle_message(handler, msg, heartbeat)
+            else:
+                await self._handle_message(handler, msg, heartbeat)
+
+        async def run(msg: QueueMessage) -> None:
+            # The lease must outlive the wait for the partition and task slot
+            heartbeat = self._start_heartbeat(msg.id)
+            try:
+                await sequencer.run(
+                    msg.partition_key, lambda: handle(msg, heartbeat)
+                )
+            finally:
+                if heartbeat:
+                    heartbeat.cancel()
+                slots.release()
 
         while True:
             try:
-                msg = await self.dequeue()
-                if msg:
-                    try:
-                        await handler(msg)
-                        await self.ack(msg.id)
-                    except Exception as e:
-                        # Check max retries
-                        if msg.attempts >= MAX_RETRIES:
-                            logger.error(
-                                "Message failed permanently",
-                                message_id=msg.id,
-                                attempts=msg.attempts,
-                                error=str(e),
-                            )
-                            await self.fail(msg.id, error=str(e))
-                        else:
-                            # Exponential backoff: 10s, 20s, 40s...
-                            retry_after = 10 * (2 ** msg.attempts)
-                            logger.warning(
-                                "Message failed, retrying",
-                                message_id=msg.id,
-                                attempts=msg.attempts,
-                                retry_after=retry_after,
-                                error=str(e),
-                            )
-                            await self.nack(msg.id, retry_after=retry_after)
+                await slots.acquire()
+                free = 1
+                while free < self.batch_size and not slots.locked():
+                    await slots.acquire()
+                    free += 1
+                try:
+                    messages = await self._claim(free, lanes)
+                except BaseException:
+                    for _ in range(free):
+                        slots.release()
+                    raise
+
+                for _ in range(free - len(messages)):
+                    slots.release()
+                if messages:
+                    idle_wait = min_idle_wait
+                    for msg in messages:
+                        task = asyncio.create_task(run(msg))
+                        in_flight.add(task)
+                        task.add_done_callback(in_flight.discard)
                 else:
-                    await asyncio.sleep(1)
+                    if await self.notifier.wait(idle_wait):
+                        idle_wait = min_idle_wait
+                    else:
+                        idle_wait = min(idle_wait * 2, max_idle_wait)
             except asyncio.CancelledError:
-                logger.info("Consumer loop cancelled")
+                logger.info("Consumer loop cancelled", in_flight=len(in_flight))
+                if reaper:
+                    reaper.cancel()
+                await self._drain(in_flight, shutdown_timeout)
                 break
             except Exception as e:
                 logger.error("Error in consumer loop", error=str(e))
                 await asyncio.sleep(5)
+
+    async def _claim(
+        self, max_messages: int, lanes: Optional[List[str]]
+    ) -> List[QueueMessage]:
+        """Claim up to max_messages for the consumer loop (one round-trip)."""
+        if max_messages == 1:
+            msg = await self.dequeue(lanes)
+            return [msg] if msg else []
+        return await self.dequeue_batch(max_messages, lanes)
+
+    async def _handle_message(
+        self,
+        handler: Callable[[QueueMessage], Awaitable[None]],
+        msg: QueueMessage,
+        heartbeat: Optional[asyncio.Task] = None,
+    ) -> None:
+        """
+        Run handler for one message and ack, nack (retry) or fail it.
+        The heartbeat (started here unless the caller already did) stops
+        before the message is settled.
+        """
+        if heartbeat is None:
+            heartbeat = self._start_heartbeat(msg.id)
+        try:
+            try:
+                await handler(msg)
+            finally:
+                if heartbeat:
+                    heartbeat.cancel()
+            await self.ack(msg.id)
+        except Exception as e:
+            # Check max retries
+            if msg.attempts >= MAX_RETRIES:
+                logger.error(
+                    "Message failed permanently",
+                    message_id=msg.id,
+                    attempts=msg.attempts,
+                    error=str(e),
+                )
+                await self.fail(msg.id, error=str(e))
+            else:
+                # Exponential backoff: 10s, 20s, 40s...
+                retry_after = 10 * (2 ** msg.attempts)
+                logger.warning(
+                    "Message failed, retrying",
+                    message_id=msg.id,
+                    attempts=msg.attempts,
+                    retry_after=retry_after,
+                    error=str(e),
+                )
+                await self.nack(msg.id, retry_after=retry_after)
+
+    def _start_heartbeat(self, message_id: str) -> Optional[asyncio.Task]:
+        """Start extending the lease of a claimed message (None without leases)."""
+        if not self.visibility_timeout:
+            return None
+        return asyncio.create_task(
+            self._heartbeat(message_id, self.visibility_timeout / 3)
+        )
+
+    async def _heartbeat(self, message_id: str, interval: float) -> None:
+        """Extend the lease of a claimed message every `interval` seconds."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.extend_lease(message_id)
+            except Exception as e:
+                logger.warning(
+                    "Failed to extend message lease", message_id=message_id, error=str(e)
+                )
+
+    async def _reap_loop(self, interval: float) -> None:
+        """Periodically return messages with expired leases to pending."""
+        while True:
+            try:
+                reaped = await self.reap_expired()
+                if reaped:
+                    logger.warning("Reaped messages with expired leases", count=reaped)
+            except Exception as e:
+                logger.error("Error reaping expired leases", error=str(e))
+            await asyncio.sleep(interval)
+
+    async def _drain(self, in_flight: Set[asyncio.Task], timeout: float) -> None:
+        """Wait for in-flight handlers, cancelling those still running after timeout."""
+        if not in_flight:
+            return
+
+        done, pending = await asyncio.wait(set(in_flight), timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.warning("Cancelled in-flight handlers on shutdown", count=len(pending))
+            await asyncio.gather(*pending, return_exceptions=True)
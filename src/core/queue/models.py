@@ -4,6 +4,8 @@ from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, Field
 
+DEFAULT_LANE = "default"
+
 
 class QueueMessage(BaseModel):
     """
@@ -17,6 +19,14 @@ class QueueMessage(BaseModel):
     attempts: int = 0
     status: str = "pending"  # pending, processing, failed, completed
 
+    # Routing: workers subscribe to lanes; higher priority is dequeued first
+    lane: str = DEFAULT_LANE
+    priority: int = 0
+
+    # Messages sharing a partition key (e.g. a conversation's session key) are
+    # processed one at a time, in enqueue order; None = no ordering
+    partition_key: Optional[str] = None
+
     # Optional metadata
     correlation_id: Optional[str] = None
     owner_id: Optional[str] = None
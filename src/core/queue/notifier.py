@@ -0,0 +1,107 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.core.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class QueueNotifier(ABC):
+    """
+    Wakes idle consumers as soon as a message is enqueued,
+    so the consumer loop does not have to poll on a fixed interval.
+    """
+
+    @abstractmethod
+    async def notify(self) -> None:
+        """Signal that a new message is available."""
+        pass
+
+    @abstractmethod
+    async def wait(self, timeout: float) -> bool:
+        """
+        Wait until notified or until timeout expires.
+        Returns True if woken by a notification.
+        """
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class LocalQueueNotifier(QueueNotifier):
+    """
+    In-process notifier backed by an asyncio.Event.
+    Covers producers and consumers sharing the same backend instance;
+    notify() is safe to call from other threads or event loops.
+    """
+
+    def __init__(self):
+        self._event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _bind(self) -> asyncio.Event:
+        loop = asyncio.get_running_loop()
+        if self._event is None or self._loop is not loop:
+            self._event = asyncio.Event()
+            self._loop = loop
+        return self._event
+
+    async def notify(self) -> None:
+        event, loop = self._event, self._loop
+        if event is None or loop is None or loop.is_closed():
+            return  # Nobody is waiting yet
+
+        if asyncio.get_running_loop() is loop:
+            event.set()
+        else:
+            loop.call_soon_threadsafe(event.set)
+
+    async def wait(self, timeout: float) -> bool:
+        event = self._bind()
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            event.clear()
+
+
+class RedisQueueNotifier(QueueNotifier):
+    """
+    Cross-process notifier using a Redis list: notify() pushes a token and
+    idle consumers block on BLPOP, so each enqueue wakes one consumer.
+    Falls back to plain timeouts if Redis is unavailable.
+    """
+
+    def __init__(
+        self, redis_url: str, key: str = "queue:wakeup", max_tokens: int = 100
+    ):
+        from redis import asyncio as aioredis
+
+        self.key = key
+        self.max_tokens = max_tokens
+        self.redis = aioredis.from_url(redis_url)
+
+    async def notify(self) -> None:
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.lpush(self.key, 1)
+                # Bound the backlog of tokens when no consumer is listening
+                pipe.ltrim(self.key, 0, self.max_tokens - 1)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("Failed to publish queue wakeup", error=str(e))
+
+    async def wait(self, timeout: float) -> bool:
+        try:
+            return await self.redis.blpop([self.key], timeout=timeout) is not None
+        except Exception as e:
+            logger.warning("Failed to wait for queue wakeup", error=str(e))
+            await asyncio.sleep(timeout)
+            return False
+
+    async def close(self) -> None:
+        await self.redis.aclose()
@@ -0,0 +1,42 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class PartitionSequencer:
+    """
+    Runs coroutines one at a time per partition key, in submission order,
+    while different keys run concurrently.
+
+    Each call waits for the previous call with the same key to finish
+    (successfully or not); calls without a key run immediately.
+    """
+
+    def __init__(self):
+        # Completion future of the most recent call per key
+        self._tails: Dict[str, asyncio.Future] = {}
+
+    async def run(self, key: Optional[str], func: Callable[[], Awaitable[T]]) -> T:
+        if key is None:
+            return await func()
+
+        previous = self._tails.get(key)
+        done = asyncio.get_running_loop().create_future()
+        self._tails[key] = done
+        try:
+            if previous is not None:
+                # shield: cancelling this waiter must not cancel the previous call
+                await asyncio.shield(previous)
+            return await func()
+        finally:
+            if previous is not None and not previous.done():
+                # Cancelled while waiting: the next call still waits for previous
+                previous.add_done_callback(lambda _: self._release(key, done))
+            else:
+                self._release(key, done)
+
+    def _release(self, key: str, done: asyncio.Future) -> None:
+        done.set_result(None)
+        if self._tails.get(key) is done:
+            del self._tails[key]
@@ -1,13 +1,14 @@
 import asyncio
 import logging
 from datetime import datetime
-from typing import Any, Awaitable, Callable, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from src.core.config import settings
 
 from .backends.sqlite import SqliteQueueBackend
 from .interfaces import QueueBackend
-from .models import QueueMessage
+from .models import DEFAULT_LANE, QueueMessage
+from .notifier import QueueNotifier, RedisQueueNotifier
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +19,12 @@ class QueueService:
     """
 
     def __init__(self, backend: Optional[QueueBackend] = None):
-        self.backend = backend or self._init_backend()
+        if backend is None:
+            backend = self._init_backend()
+            notifier = self._init_notifier()
+            if notifier is not None:
+                backend.notifier = notifier
+        self.backend = backend
         self._handlers: Dict[str, Callable[[Dict[str, Any]], Awaitable[None]]] = {}
 
     def _init_backend(self) -> QueueBackend:
@@ -32,12 +38,44 @@ class QueueService:
             redis_url = "redis://localhost:6379"
 
         if backend_type == "sqlite":
-            return SqliteQueueBackend(db_path=db_path)
+            return SqliteQueueBackend(
+                db_path=db_path,
+                visibility_timeout=settings.queue.visibility_timeout_seconds,
+            )
+
+        if backend_type == "sqlite_wal":
+            from .backends.sqlite_wal import SqliteWalQueueBackend
+
+            return SqliteWalQueueBackend(
+                db_path=db_path,
+                batch_size=settings.queue.sqlite_batch_size,
+                ack_batch_size=settings.queue.sqlite_ack_batch_size,
+                visibility_timeout=settings.queue.visibility_timeout_seconds,
+            )
+
+        if backend_type == "postgres":
+            from src.core.database.postgres_async_session import AsyncPostgresDatabase
+
+            from .backends.postgres import PostgresQueueBackend
+
+            db = AsyncPostgresDatabase(
+                dsn=settings.database.url,
+                minconn=settings.database.pool_min_conn,
+                maxconn=settings.database.pool_max_conn,
+                statement_cache_size=settings.database.statement_cache_size,
+            )
+            return PostgresQueueBackend(
+                db=db,
+                batch_size=settings.queue.postgres_batch_size,
+                visibility_timeout=settings.queue.visibility_timeout_seconds,
+            )
 
         if backend_type == "bullmq":
             from .backends.bullmq import BullMQBackend
 
-            return BullMQBackend(redis_url=redis_url)
+            return BullMQBackend(
+                redis_url=redis_url, lanes=list(settings.queue.lane_priorities)
+            )
 
         if backend_type == "sqs":
             from .backends.sqs import SQSBackend
@@ -50,10 +88,20 @@ class QueueService:
                 region_name=settings.queue.aws_region,
                 aws_access_key_id=settings.queue.aws_access_key_id,
                 aws_secret_access_key=settings.queue.aws_secret_access_key,
+                lane_queue_urls=settings.queue.sqs_lane_queue_urls,
             )
 
         raise ValueError(f"Unsupported queue backend: {backend_type}")
 
+    def _init_notifier(self) -> Optional[QueueNotifier]:
+        """Notifier override from settings (None keeps the backend's own)."""
+        notify_backend = getattr(settings.queue, "notify_backend", "local")
+
+        if notify_backend == "redis":
+            return RedisQueueNotifier(redis_url=settings.queue.redis_url)
+
+        return None
+
     def register_handler(
         self, task_name: str, handler: Callable[[Dict[str, Any]], Awaitable[None]]
     ):
@@ -62,14 +110,50 @@ class QueueService:
         logger.info(f"Registered handler for task: {task_name}")
 
     async def enqueue(self, task_name: str, payload: Dict[str, Any], **kwargs) -> str:
-        """Enqueue a task."""
-        message = QueueMessage(
+        """
+        Enqueue a task.
+
+        Optional kwargs: correlation_id, owner_id, lane, priority and
+        partition_key. Without an explicit lane the task is routed by
+        settings.queue.task_lanes; without an explicit priority it inherits
+        the lane's priority. Tasks with the same partition_key are processed
+        one at a time, in enqueue order.
+        """
+        return await self.backend.enqueue(
+            self._build_message(task_name, payload, **kwargs)
+        )
+
+    async def enqueue_many(self, tasks: List[Dict[str, Any]]) -> List[str]:
+        """
+        Enqueue several tasks in one backend round-trip.
+
+        Each task is a dict with task_name, payload and any of the optional
+        kwargs accepted by enqueue(). Returns the message IDs in order.
+        """
+        if not tasks:
+            return []
+        messages = [self._build_message(**task) for task in tasks]
+        return await self.backend.enqueue_many(messages)
+
+    def _build_message(
+        self, task_name: str, payload: Dict[str, Any], **kwargs
+    ) -> QueueMessage:
+        lane = kwargs.get("lane") or settings.queue.task_lanes.get(
+            task_name, DEFAULT_LANE
+        )
+        priority = kwargs.get("priority")
+        if priority is None:
+            priority = settings.queue.lane_priorities.get(lane, 0)
+
+        return QueueMessage(
             task_name=task_name,
             payload=payload,
             correlation_id=kwargs.get("correlation_id"),
             owner_id=kwargs.get("owner_id"),
+            lane=lane,
+            priority=priority,
+            partition_key=kwargs.get("partition_key"),
         )
-        return await self.backend.enqueue(message)
 
     async def _process_message(self, message: QueueMessage):
         """
@@ -83,13 +167,26 @@ class QueueService:
         logger.info(f"Processing task {message.task_name} (ID: {message.id})")
         await handler(message.payload)
 
-    async def start_worker(self, interval: float = 1.0):
+    def _resolve_lanes(self, lanes: Optional[List[str]]) -> Optional[List[str]]:
+        """Lanes to consume, highest priority first (None = all lanes)."""
+        lanes = lanes or settings.queue.worker_lanes
+        if not lanes:
+            return None
+        priorities = settings.queue.lane_priorities
+        return sorted(lanes, key=lambda lane: priorities.get(lane, 0), reverse=True)
+
+    async def start_worker(
+        self, interval: float = 1.0, lanes: Optional[List[str]] = None
+    ):
         """
         Start the worker loop (runs until cancelled).
         Delegates to backend's start_consuming which handles the loop mechanism (pull vs push).
+        `lanes` restricts the worker to those lanes (default: settings.queue.worker_lanes, or all).
         """
+        lanes = self._resolve_lanes(lanes)
         logger.info("Starting queue worker service...")
         logger.info(f"Using backend: {settings.queue.backend}")
+        logger.info(f"Consuming lanes: {lanes or 'all'}")
 
         # We pass self._process_message as the handler to the backend.
         # The backend is responsible for:
@@ -97,4 +194,13 @@ class QueueService:
         # 2. Calling this handler
         # 3. Ack/Nack based on success/failure
 
-        await self.backend.start_consuming(self._process_message)
+        await self.backend.start_consuming(
+            self._process_message,
+            concurrency=settings.queue.worker_concurrency,
+            task_concurrency=settings.queue.task_concurrency,
+            shutdown_timeout=settings.queue.worker_shutdown_timeout,
+            lanes=lanes,
+            min_idle_wait=settings.queue.min_idle_wait,
+            max_idle_wait=settings.queue.max_idle_wait,
+            reap_interval=settings.queue.reap_interval_seconds,
+        )
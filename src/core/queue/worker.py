@@ -15,6 +15,17 @@ logger = get_logger("worker")
 
 
 async def main():
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--lanes",
+        type=lambda value: [lane.strip() for lane in value.split(",") if lane.strip()],
+        default=None,
+        help="Comma-separated lanes to consume (e.g. realtime,default). Default: all",
+    )
+    args = parser.parse_args()
+
     setup_observability()
     container = Container()
     container.wire(modules=[__name__])
@@ -63,7 +74,10 @@ async def main():
     message_repo = container.message_repository()
     
     from src.modules.channels.twilio.workers.outbound_worker import TwilioOutboundWorker
-    outbound_worker = TwilioOutboundWorker(twilio_service, message_repo)
+    from src.modules.channels.twilio.utils.helpers import close_media_client
+    outbound_worker = TwilioOutboundWorker(
+        twilio_service, message_repo, rate_limiter=container.twilio_send_rate_limiter()
+    )
     
     queue_service.register_handler(
         "send_whatsapp_message", 
@@ -95,12 +109,16 @@ async def main():
     logger.info("Services initialized. Starting worker...")
 
     try:
-        await queue_service.start_worker()
+        await queue_service.start_worker(lanes=args.lanes)
     except KeyboardInterrupt:
         logger.info("Worker stopped by user.")
     except Exception as e:
         logger.error(f"Worker crashed: {e}")
         sys.exit(1)
+    finally:
+        await twilio_service.http_client.close()
+        await outbound_worker.rate_limiter.close()
+        await close_media_client()
 
 
 if __name__ == "__main__":
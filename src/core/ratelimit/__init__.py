@@ -0,0 +1,13 @@
+"""Token-bucket rate limiters (in-process and shared via Redis)."""
+
+from .factory import create_rate_limiter
+from .interfaces import RateLimiter
+from .local import LocalTokenBucketLimiter
+from .redis_limiter import RedisTokenBucketLimiter
+
+__all__ = [
+    "RateLimiter",
+    "LocalTokenBucketLimiter",
+    "RedisTokenBucketLimiter",
+    "create_rate_limiter",
+]
@@ -0,0 +1,18 @@
+from typing import Optional
+
+from .interfaces import RateLimiter
+from .local import LocalTokenBucketLimiter
+from .redis_limiter import RedisTokenBucketLimiter
+
+
+def create_rate_limiter(
+    backend: str, rate: float, burst: int, redis_url: Optional[str] = None, **kwargs
+) -> RateLimiter:
+    """Build a rate limiter for the configured backend ("local" or "redis")."""
+    if backend == "redis":
+        if not redis_url:
+            raise ValueError("Redis rate limiter requires a redis_url")
+        return RedisTokenBucketLimiter(redis_url, rate, burst, **kwargs)
+    if backend == "local":
+        return LocalTokenBucketLimiter(rate, burst, **kwargs)
+    raise ValueError(f"Unknown rate limiter backend: {backend}")
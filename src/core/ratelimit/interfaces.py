@@ -0,0 +1,63 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+
+class RateLimiter(ABC):
+    """
+    Token bucket per key with adaptive rate.
+
+    Each key starts at `rate` tokens/second with a bucket of `burst` tokens.
+    `penalize` (e.g. on an upstream 429) blocks the key for the Retry-After
+    delay and halves its rate, down to `min_rate`; the rate then grows back
+    by 10% of `rate` every `recovery_seconds` without further penalties.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        min_rate: Optional[float] = None,
+        recovery_seconds: float = 30.0,
+        default_penalty: float = 1.0,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate if min_rate is not None else rate / 8
+        self.recovery_seconds = recovery_seconds
+        self.default_penalty = default_penalty
+        # Waiters on the same key are released in arrival order (per process)
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def _lock(self, key: str) -> asyncio.Lock:
+        if key not in self._locks:
+            self._locks[key] = asyncio.Lock()
+        return self._locks[key]
+
+    async def acquire(self, key: str) -> float:
+        """
+        Wait until a token for key is available and consume it.
+        Returns the number of seconds waited.
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        async with self._lock(key):
+            while True:
+                wait = await self._try_acquire(key)
+                if wait <= 0:
+                    return loop.time() - started
+                await asyncio.sleep(wait)
+
+    @abstractmethod
+    async def _try_acquire(self, key: str) -> float:
+        """Consume a token if available; otherwise return seconds until one is."""
+        pass
+
+    @abstractmethod
+    async def penalize(self, key: str, retry_after: Optional[float] = None) -> None:
+        """Back off key for retry_after seconds (default_penalty when None) and slow it down."""
+        pass
+
+    async def close(self) -> None:
+        """Release connections held by the limiter."""
+        pass
@@ -0,0 +1,67 @@
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from .interfaces import RateLimiter
+
+
+@dataclass
+class _Bucket:
+    tokens: float
+    updated: float
+    rate: float
+    blocked_until: float = 0.0
+    adjusted: float = 0.0
+
+
+class LocalTokenBucketLimiter(RateLimiter):
+    """
+    In-process token buckets. Limits are per process, so with N workers the
+    effective rate is N times the configured one; use the Redis limiter to
+    share buckets across processes.
+    """
+
+    def __init__(self, rate: float, burst: int, **kwargs):
+        super().__init__(rate, burst, **kwargs)
+        self._buckets: Dict[str, _Bucket] = {}
+
+    def _bucket(self, key: str, now: float) -> _Bucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = _Bucket(tokens=float(self.burst), updated=now, rate=self.rate)
+            self._buckets[key] = bucket
+            return bucket
+
+        # Additive recovery after a penalty
+        if bucket.rate < self.rate and now - bucket.adjusted >= self.recovery_seconds:
+            bucket.rate = min(self.rate, bucket.rate + self.rate * 0.1)
+            bucket.adjusted = now
+
+        bucket.tokens = min(
+            float(self.burst), bucket.tokens + (now - bucket.updated) * bucket.rate
+        )
+        bucket.updated = now
+        return bucket
+
+    async def _try_acquire(self, key: str) -> float:
+        now = time.monotonic()
+        bucket = self._bucket(key, now)
+        if bucket.blocked_until > now:
+            return bucket.blocked_until - now
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            return 0.0
+        return (1 - bucket.tokens) / bucket.rate
+
+    async def penalize(self, key: str, retry_after: Optional[float] = None) -> None:
+        now = time.monotonic()
+        bucket = self._bucket(key, now)
+        delay = self.default_penalty if retry_after is None else retry_after
+        bucket.blocked_until = max(bucket.blocked_until, now + delay)
+        bucket.rate = max(self.min_rate, bucket.rate / 2)
+        bucket.tokens = 0.0
+        bucket.adjusted = now
+
+    def current_rate(self, key: str) -> float:
+        bucket = self._buckets.get(key)
+        return bucket.rate if bucket else self.rate
@@ -0,0 +1,103 @@
+import math
+from typing import Optional
+
+from src.core.utils.logging import get_logger
+
+from .interfaces import RateLimiter
+from .local import LocalTokenBucketLimiter
+
+logger = get_logger(__name__)
+
+# Bucket state lives in a hash; Redis server time keeps workers on one clock.
+# Floats are returned as strings (Lua numbers are truncated to integers).
+_NOW = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+"""
+
+ACQUIRE_SCRIPT = _NOW + """
+local base = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local recovery = tonumber(ARGV[3])
+local s = redis.call('HMGET', KEYS[1], 'tokens', 'updated', 'rate', 'blocked_until', 'adjusted')
+local tokens = tonumber(s[1]) or burst
+local updated = tonumber(s[2]) or now
+local rate = tonumber(s[3]) or base
+local blocked = tonumber(s[4]) or 0
+local adjusted = tonumber(s[5]) or 0
+if rate < base and now - adjusted >= recovery then
+  rate = math.min(base, rate + base * 0.1)
+  adjusted = now
+end
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate)
+local wait = 0
+if blocked > now then
+  wait = blocked - now
+elseif tokens >= 1 then
+  tokens = tokens - 1
+else
+  wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now),
+  'rate', tostring(rate), 'blocked_until', tostring(blocked), 'adjusted', tostring(adjusted))
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return tostring(wait)
+"""
+
+PENALIZE_SCRIPT = _NOW + """
+local base = tonumber(ARGV[1])
+local min_rate = tonumber(ARGV[2])
+local delay = tonumber(ARGV[3])
+local s = redis.call('HMGET', KEYS[1], 'rate', 'blocked_until')
+local rate = math.max(min_rate, (tonumber(s[1]) or base) / 2)
+local blocked = math.max(tonumber(s[2]) or 0, now + delay)
+redis.call('HSET', KEYS[1], 'tokens', '0', 'updated', tostring(now),
+  'rate', tostring(rate), 'blocked_until', tostring(blocked), 'adjusted', tostring(now))
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return tostring(rate)
+"""
+
+
+class RedisTokenBucketLimiter(RateLimiter):
+    """
+    Token buckets shared by all processes through Redis (one hash per key,
+    updated atomically by Lua scripts). If Redis is unavailable the limiter
+    degrades to an in-process bucket rather than blocking sends.
+    """
+
+    def __init__(self, redis_url: str, rate: float, burst: int, prefix: str = "ratelimit:", **kwargs):
+        from redis import asyncio as aioredis
+
+        super().__init__(rate, burst, **kwargs)
+        self.prefix = prefix
+        self.redis = aioredis.from_url(redis_url)
+        self._acquire = self.redis.register_script(ACQUIRE_SCRIPT)
+        self._penalize = self.redis.register_script(PENALIZE_SCRIPT)
+        self._fallback = LocalTokenBucketLimiter(rate, burst, **kwargs)
+        # Long enough to recover from min_rate back to rate
+        self.state_ttl = int(math.ceil(self.recovery_seconds * 10 + burst / self.min_rate)) + 60
+
+    async def _try_acquire(self, key: str) -> float:
+        try:
+            wait = await self._acquire(
+                keys=[self.prefix + key],
+                args=[self.rate, self.burst, self.recovery_seconds, self.state_ttl],
+            )
+            return float(wait)
+        except Exception as e:
+            logger.warning("Redis rate limiter unavailable, using local bucket", key=key, error=str(e))
+            return await self._fallback._try_acquire(key)
+
+    async def penalize(self, key: str, retry_after: Optional[float] = None) -> None:
+        delay = self.default_penalty if retry_after is None else retry_after
+        try:
+            await self._penalize(
+                keys=[self.prefix + key],
+                args=[self.rate, self.min_rate, delay, self.state_ttl],
+            )
+        except Exception as e:
+            logger.warning("Redis rate limiter unavailable, using local bucket", key=key, error=str(e))
+        await self._fallback.penalize(key, retry_after)
+
+    async def close(self) -> None:
+        await self.redis.aclose()
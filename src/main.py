@@ -43,6 +43,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down Owner API application")
+    await container.twilio.twilio_http_client().close()
 
 
 # Create FastAPI app
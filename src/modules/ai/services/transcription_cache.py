@@ -0,0 +1,40 @@
+from typing import Optional
+
+from src.core.cache import AsyncCache, CacheBackend
+
+KEY_PREFIX = "transcription:"
+
+
+class TranscriptionCache:
+    """
+    Content-addressed transcript cache.
+
+    Entries are keyed by the media digest (computed while the file streams
+    in) and the requested language, so a forwarded voice note or a retried
+    task is answered without running Whisper again. `namespace` (the model
+    size) keeps transcripts from different models apart.
+    """
+
+    def __init__(
+        self,
+        cache: CacheBackend,
+        ttl: float = 30 * 86400.0,
+        namespace: str = "",
+        hash_algorithm: str = "sha256",
+    ):
+        self.cache = cache
+        self.ttl = ttl
+        self.namespace = namespace
+        self.hash_algorithm = hash_algorithm
+        # A broken cache must never fail the transcription
+        self._cache = AsyncCache(cache, unavailable_message="Transcription cache unavailable")
+
+    def _key(self, digest: str, language: Optional[str]) -> str:
+        return f"{KEY_PREFIX}{self.namespace}:{self.hash_algorithm}:{digest}:{language or 'auto'}"
+
+    async def get(self, digest: str, language: Optional[str] = None) -> Optional[str]:
+        """Cached transcript for the media digest, or None on a miss."""
+        return await self._cache.get(self._key(digest, language))
+
+    async def set(self, digest: str, transcript: str, language: Optional[str] = None) -> None:
+        await self._cache.set(self._key(digest, language), transcript, self.ttl)
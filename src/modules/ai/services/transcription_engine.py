@@ -0,0 +1,45 @@
+import asyncio
+from typing import Optional, Set
+
+from src.core.utils import get_logger
+from src.modules.ai.services.transcription_service import TranscriptionService
+
+logger = get_logger(__name__)
+
+
+class TranscriptionEngine:
+    """
+    Async front for TranscriptionService.
+
+    Each file is submitted straight to the service's model pool (one thread
+    per CTranslate2 worker), so concurrent clips decode in parallel right
+    away. The event loop's threadpool is not used, so a long transcription
+    never holds one of its threads. faster-whisper only batches the segments
+    of a single file, so waiting to group clips would add latency without
+    adding throughput.
+    """
+
+    def __init__(self, transcription_service: TranscriptionService):
+        self.transcription_service = transcription_service
+        self._in_flight: Set[asyncio.Future] = set()
+
+    async def transcribe(self, audio_path: str, language: Optional[str] = None) -> str:
+        """Transcribe one file on the model pool."""
+        future = asyncio.wrap_future(
+            self.transcription_service.submit(audio_path, language)
+        )
+        self._in_flight.add(future)
+        future.add_done_callback(self._in_flight.discard)
+        return await future
+
+    async def close(self) -> None:
+        """
+        Cancel transcriptions that have not started and wait until every
+        caller has been released.
+        """
+        in_flight = list(self._in_flight)
+        for future in in_flight:
+            future.cancel()
+        if in_flight:
+            logger.info("Cancelled in-flight transcriptions", count=len(in_flight))
+            await asyncio.gather(*in_flight, return_exceptions=True)
@@ -1,4 +1,6 @@
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
 
 from faster_whisper import WhisperModel
@@ -12,6 +14,12 @@ class TranscriptionService:
     """
     Service to handle audio transcription using Faster-Whisper.
     Should be registered as a Singleton to avoid reloading the model.
+
+    The model is loaded with `num_workers` CTranslate2 workers, so up to
+    `num_workers` transcriptions run in parallel from different threads
+    (each using `cpu_threads` cores; 0 = library default). Calls beyond that
+    wait for a free worker instead of oversubscribing the CPU. submit() runs
+    transcriptions on a pool with one thread per worker.
     """
 
     def __init__(
@@ -20,37 +28,58 @@ class TranscriptionService:
         device: str = "cpu",
         compute_type: str = "int8",
         beam_size: int = 5,
+        num_workers: int = 1,
+        cpu_threads: int = 0,
+        vad_filter: bool = True,
+        vad_min_silence_ms: int = 500,
+        language: Optional[str] = None,
     ):
         self.model_size = model_size
         self.device = device
         self.compute_type = compute_type
         self.beam_size = beam_size
+        self.num_workers = max(1, num_workers)
+        self.cpu_threads = cpu_threads
+        self.vad_filter = vad_filter
+        self.vad_min_silence_ms = vad_min_silence_ms
+        self.language = language
         self._model: Optional[WhisperModel] = None
+        self._load_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.num_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     @property
     def model(self) -> WhisperModel:
         """Lazy load the model."""
         if self._model is None:
-            logger.info(
-                "Loading Whisper model...",
-                model_size=self.model_size,
-                device=self.device,
-                compute_type=self.compute_type,
-            )
-            self._model = WhisperModel(
-                self.model_size, device=self.device, compute_type=self.compute_type
-            )
-            logger.info("Whisper model loaded successfully")
+            with self._load_lock:
+                if self._model is None:
+                    logger.info(
+                        "Loading Whisper model...",
+                        model_size=self.model_size,
+                        device=self.device,
+                        compute_type=self.compute_type,
+                        num_workers=self.num_workers,
+                    )
+                    self._model = WhisperModel(
+                        self.model_size,
+                        device=self.device,
+                        compute_type=self.compute_type,
+                        cpu_threads=self.cpu_threads,
+                        num_workers=self.num_workers,
+                    )
+                    logger.info("Whisper model loaded successfully")
         return self._model
 
     def transcribe(self, audio_path: str, language: Optional[str] = None) -> str:
         """
         Transcribe audio file to text.
-        
+
         Args:
             audio_path: Path to the audio file
-            language: Language code (default: None for auto-detection)
-            
+            language: Language code (default: service language, or None for
+                auto-detection)
+
         Returns:
             Transcribed text or empty string if failed
         """
@@ -60,24 +89,50 @@ class TranscriptionService:
 
         try:
             logger.info("Starting transcription", path=audio_path)
-            
-            # Run transcription
-            segments, info = self.model.transcribe(
-                audio_path, language=language, beam_size=self.beam_size
-            )
-            
-            # Combine segments
-            text = " ".join([segment.text for segment in segments]).strip()
-            
+
+            with self._slots:
+                # Run transcription (segments are decoded lazily, so join
+                # them while holding the worker slot)
+                segments, info = self.model.transcribe(
+                    audio_path,
+                    language=language or self.language,
+                    beam_size=self.beam_size,
+                    vad_filter=self.vad_filter,
+                    vad_parameters={"min_silence_duration_ms": self.vad_min_silence_ms},
+                )
+
+                # Combine segments
+                text = " ".join([segment.text for segment in segments]).strip()
+
             logger.info(
                 "Transcription completed",
                 text_preview=text[:50] + "..." if len(text) > 50 else text,
                 language=info.language,
                 probability=info.language_probability,
+                duration=info.duration,
             )
-            
+
             return text
-            
+
         except Exception as e:
             logger.error("Error during transcription", error=str(e), path=audio_path)
             return ""
+
+    def submit(self, audio_path: str, language: Optional[str] = None) -> Future:
+        """
+        Queue a transcription on the model pool (one thread per worker).
+        The returned future resolves to the text ("" on failure).
+        """
+        if self._executor is None:
+            with self._load_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.num_workers, thread_name_prefix="whisper"
+                    )
+        return self._executor.submit(self.transcribe, audio_path, language)
+
+    def shutdown(self) -> None:
+        """Stop the model pool, dropping transcriptions that have not started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
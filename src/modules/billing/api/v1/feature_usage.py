@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from dependency_injector.wiring import inject, Provide
 
+from src.core.cache import TieredCache
 from src.core.di.container import Container
 from src.modules.billing.services.feature_usage_service import FeatureUsageService
 
@@ -69,3 +70,11 @@ def check_feature_access(
         is_approaching_limit=result.is_approaching_limit,
         is_critical=result.is_critical
     )
+
+@router.get("/cache/stats", response_model=Dict[str, Any])
+@inject
+def get_access_cache_stats(
+    cache: TieredCache = Depends(Provide[Container.feature_access_cache])
+):
+    """Hit/miss counters of this process's feature-access cache."""
+    return cache.stats.to_dict()
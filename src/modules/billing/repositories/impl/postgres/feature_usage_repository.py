@@ -1,9 +1,10 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from psycopg2 import sql
 
 from src.core.database.postgres_repository import PostgresRepository
 from src.core.utils import get_logger
+from src.modules.billing.models.feature import Feature
 from src.modules.billing.models.feature_usage import FeatureUsage
 from src.modules.billing.repositories.interfaces import IFeatureUsageRepository
 from src.modules.billing.exceptions import BillingRepositoryError
@@ -24,6 +25,22 @@ class PostgresFeatureUsageRepository(PostgresRepository[FeatureUsage], IFeatureU
     def find_all_by_owner(self, owner_id: str) -> List[FeatureUsage]:
         return self.find_by({"owner_id": owner_id})
 
+    def find_all_with_features_by_owner(self, owner_id: str) -> List[Tuple[FeatureUsage, Feature]]:
+        query = sql.SQL("""
+            SELECT u.*, row_to_json(f.*) AS feature
+            FROM {table} u
+            JOIN features_catalog f ON f.feature_id = u.feature_id
+            WHERE u.owner_id = %s
+        """).format(table=self.table_identifier)
+
+        rows = self._execute_query(query, (owner_id,), fetch_all=True)
+        result = []
+        for row in rows:
+            row = dict(row)
+            feature = Feature(**row.pop("feature"))
+            result.append((self.model_class(**row), feature))
+        return result
+
     def increment(self, owner_id: str, feature_id: str, amount: int) -> FeatureUsage:
         query = sql.SQL("""
             UPDATE {table}
@@ -1,7 +1,8 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from src.core.database.supabase_repository import SupabaseRepository
 from src.core.utils import get_logger
+from src.modules.billing.models.feature import Feature
 from src.modules.billing.models.feature_usage import FeatureUsage
 from src.modules.billing.repositories.interfaces import IFeatureUsageRepository
 from src.modules.billing.exceptions import BillingRepositoryError
@@ -42,6 +43,26 @@ class SupabaseFeatureUsageRepository(SupabaseRepository[FeatureUsage], IFeatureU
             logger.error("find_all_by_owner_failed", owner_id=owner_id, error=str(e))
             raise BillingRepositoryError(f"Failed to find all feature usages for owner {owner_id}", original_error=e)
 
+    def find_all_with_features_by_owner(self, owner_id: str) -> List[Tuple[FeatureUsage, Feature]]:
+        try:
+            # Embedded resource: PostgREST joins features_catalog via the FK
+            result = (
+                self.client.table(self.table_name)
+                .select("*, features_catalog(*)")
+                .eq("owner_id", owner_id)
+                .execute()
+            )
+            rows = []
+            for item in result.data:
+                feature_data = item.pop("features_catalog", None)
+                if not feature_data:
+                    continue
+                rows.append((self.model_class(**item), Feature(**feature_data)))
+            return rows
+        except Exception as e:
+            logger.error("find_all_with_features_by_owner_failed", owner_id=owner_id, error=str(e))
+            raise BillingRepositoryError(f"Failed to find feature usages for owner {owner_id}", original_error=e)
+
     def increment(self, owner_id: str, feature_id: str, amount: int) -> FeatureUsage:
         # We try to use the RPC if available, otherwise fallback to read-update
         # But wait, the RPC takes feature_key, here we have feature_id.
@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from src.core.database.interface import IRepository
 from src.modules.billing.models.feature import Feature
 from src.modules.billing.models.feature_usage import FeatureUsage
@@ -25,6 +25,11 @@ class IFeatureUsageRepository(IRepository[FeatureUsage]):
     def find_all_by_owner(self, owner_id: str) -> List[FeatureUsage]:
         pass
 
+    @abstractmethod
+    def find_all_with_features_by_owner(self, owner_id: str) -> List[Tuple[FeatureUsage, Feature]]:
+        """Usage records of an owner joined with their catalog features (one query)."""
+        pass
+
     @abstractmethod
     def increment(self, owner_id: str, feature_id: str, amount: int) -> FeatureUsage:
         pass
@@ -1,7 +1,9 @@
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
+from src.core.cache import TTLCache
+from src.modules.billing.models.feature import Feature
 from src.modules.billing.models.feature_usage import FeatureUsage
 from src.modules.billing.models.plan_feature import PlanFeature
 from src.modules.billing.services.features_catalog_service import FeaturesCatalogService
@@ -49,6 +51,7 @@ class FeatureUsageSummary:
     period_end: Optional[datetime]
     is_active: bool
     is_override: bool
+    feature_id: Optional[str] = None
 
 
 class QuotaExceededError(Exception):
@@ -61,6 +64,11 @@ class QuotaExceededError(Exception):
 class FeatureUsageService:
     """
     Tracks and manages feature usage per tenant.
+
+    Access decisions are cached in `cache_service` (see TieredCache) for
+    `access_ttl` seconds. Usage summaries are read on every AI turn;
+    `summary_cache` (process-wide, short TTL) keeps them per owner and is
+    invalidated by usage changes made in this process.
     """
 
     def __init__(
@@ -68,12 +76,20 @@ class FeatureUsageService:
         usage_repository: IFeatureUsageRepository,
         catalog_service: FeaturesCatalogService,
         cache_service=None,
-        logger=None
+        logger=None,
+        summary_cache: Optional[TTLCache] = None,
+        access_ttl: float = 60.0,
     ):
         self.usage_repo = usage_repository
         self.catalog_service = catalog_service
         self.cache = cache_service
         self.logger = logger
+        self.summary_cache = summary_cache
+        self.access_ttl = access_ttl
+
+    def _invalidate_summary(self, owner_id: str) -> None:
+        if self.summary_cache is not None:
+            self.summary_cache.delete(owner_id)
 
     def initialize_features_for_tenant(
         self,
@@ -116,8 +132,55 @@ class FeatureUsageService:
                     f"quota={plan_feature.quota_limit}"
                 )
 
+        self._invalidate_summary(owner_id)
         return created_usages
 
+    def _access_key(self, owner_id: str, feature_key: str) -> str:
+        return f"feature_access:{owner_id}:{feature_key}"
+
+    def _cache_access(self, owner_id: str, feature_key: str, result: FeatureAccessResult) -> None:
+        if self.cache:
+            self.cache.set(
+                self._access_key(owner_id, feature_key), asdict(result), ttl=self.access_ttl
+            )
+
+    def _access_result(
+        self, owner_id: str, feature: Feature, usage: FeatureUsage
+    ) -> FeatureAccessResult:
+        """Access decision for an active usage record."""
+        if usage.quota_limit is not None:
+            if usage.current_usage >= usage.quota_limit:
+                return FeatureAccessResult(
+                    allowed=False,
+                    reason="Quota exceeded",
+                    current_usage=usage.current_usage,
+                    quota_limit=usage.quota_limit,
+                    percentage_used=100.0,
+                    feature_id=feature.feature_id,
+                    owner_id=owner_id
+                )
+            percentage = (usage.current_usage / usage.quota_limit) * 100
+            return FeatureAccessResult(
+                allowed=True,
+                reason="OK",
+                current_usage=usage.current_usage,
+                quota_limit=usage.quota_limit,
+                percentage_used=round(percentage, 2),
+                feature_id=feature.feature_id,
+                owner_id=owner_id
+            )
+
+        # Unlimited
+        return FeatureAccessResult(
+            allowed=True,
+            reason="OK",
+            current_usage=usage.current_usage,
+            quota_limit=None,
+            percentage_used=0.0,
+            feature_id=feature.feature_id,
+            owner_id=owner_id
+        )
+
     def check_feature_access(
         self,
         owner_id: str,
@@ -129,8 +192,7 @@ class FeatureUsageService:
         """
         # Try cache first
         if use_cache and self.cache:
-            cache_key = f"feature_access:{owner_id}:{feature_key}"
-            cached = self.cache.get(cache_key)
+            cached = self.cache.get(self._access_key(owner_id, feature_key))
             if cached:
                 return FeatureAccessResult(**cached)
 
@@ -160,45 +222,11 @@ class FeatureUsageService:
                 quota_limit=usage.quota_limit
             )
 
-        # Check quota
-        if usage.quota_limit is not None:
-            if usage.current_usage >= usage.quota_limit:
-                result = FeatureAccessResult(
-                    allowed=False,
-                    reason="Quota exceeded",
-                    current_usage=usage.current_usage,
-                    quota_limit=usage.quota_limit,
-                    percentage_used=100.0,
-                    feature_id=feature.feature_id,
-                    owner_id=owner_id
-                )
-            else:
-                percentage = (usage.current_usage / usage.quota_limit) * 100
-                result = FeatureAccessResult(
-                    allowed=True,
-                    reason="OK",
-                    current_usage=usage.current_usage,
-                    quota_limit=usage.quota_limit,
-                    percentage_used=round(percentage, 2),
-                    feature_id=feature.feature_id,
-                    owner_id=owner_id
-                )
-        else:
-            # Unlimited
-            result = FeatureAccessResult(
-                allowed=True,
-                reason="OK",
-                current_usage=usage.current_usage,
-                quota_limit=None,
-                percentage_used=0.0,
-                feature_id=feature.feature_id,
-                owner_id=owner_id
-            )
+        result = self._access_result(owner_id, feature, usage)
 
         # Cache the result
-        if use_cache and self.cache:
-            cache_key = f"feature_access:{owner_id}:{feature_key}"
-            self.cache.set(cache_key, result.to_dict(), ttl=60)
+        if use_cache:
+            self._cache_access(owner_id, feature_key, result)
 
         return result
 
@@ -211,6 +239,8 @@ class FeatureUsageService:
     ) -> FeatureUsage:
         """
         Increment feature usage counter.
+        The cached access decision is replaced with one built from the
+        updated counter (write-through), so the next check needs no query.
         """
         # Check access first
         if check_access:
@@ -232,11 +262,7 @@ class FeatureUsageService:
             amount=amount
         )
 
-        # Invalidate cache
-        if self.cache:
-            cache_key = f"feature_access:{owner_id}:{feature_key}"
-            self.cache.delete(cache_key)
-
+        self._write_through(owner_id, feature_key, feature, updated_usage)
         return updated_usage
 
     def decrement_usage(
@@ -246,7 +272,7 @@ class FeatureUsageService:
         amount: int = 1
     ) -> FeatureUsage:
         """
-        Decrement feature usage counter.
+        Decrement feature usage counter (cache updated write-through).
         """
         feature = self.catalog_service.get_feature_by_key(feature_key)
 
@@ -256,29 +282,33 @@ class FeatureUsageService:
             amount=amount
         )
 
-        # Invalidate cache
-        if self.cache:
-            cache_key = f"feature_access:{owner_id}:{feature_key}"
-            self.cache.delete(cache_key)
-
+        self._write_through(owner_id, feature_key, feature, updated_usage)
         return updated_usage
 
-    def get_usage_summary(self, owner_id: str) -> Dict[str, FeatureUsageSummary]:
+    def _write_through(
+        self, owner_id: str, feature_key: str, feature: Feature, usage: FeatureUsage
+    ) -> None:
+        if self.cache:
+            if usage.is_active:
+                self._cache_access(owner_id, feature_key, self._access_result(owner_id, feature, usage))
+            else:
+                self.cache.delete(self._access_key(owner_id, feature_key))
+        self._invalidate_summary(owner_id)
+
+    def get_usage_summary(
+        self, owner_id: str, use_cache: bool = True
+    ) -> Dict[str, FeatureUsageSummary]:
         """
         Get usage summary for all features of a tenant.
+        Usage rows and their catalog features are read in one joined query.
         """
-        usages = self.usage_repo.find_all_by_owner(owner_id)
-        
+        if use_cache and self.summary_cache is not None:
+            cached = self.summary_cache.get(owner_id)
+            if cached is not None:
+                return dict(cached)
+
         summary = {}
-        for usage in usages:
-            # We assume we can get feature details. In a real scenario we might need to bulk fetch or join.
-            # For now, we'll fetch individually or assume usage has feature info if ORM is smart,
-            # but repository pattern usually returns model only.
-            # Let's assume usage.feature_id is available.
-            feature = self.catalog_service.catalog_repo.find_by_id(usage.feature_id, id_column="feature_id")
-            if not feature:
-                continue
-            
+        for usage, feature in self.usage_repo.find_all_with_features_by_owner(owner_id):
             percentage = 0.0
             if usage.quota_limit and usage.quota_limit > 0:
                 percentage = (usage.current_usage / usage.quota_limit) * 100
@@ -292,7 +322,10 @@ class FeatureUsageService:
                 period_start=usage.period_start,
                 period_end=usage.period_end,
                 is_active=usage.is_active,
-                is_override=usage.is_override
+                is_override=usage.is_override,
+                feature_id=feature.feature_id,
             )
-        
-        return summary
+
+        if self.summary_cache is not None:
+            self.summary_cache.set(owner_id, summary)
+        return dict(summary)
@@ -1,6 +1,7 @@
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
+from src.core.cache import TTLCache
 from src.modules.billing.models.feature import Feature, FeatureCreate, FeatureUpdate
 from src.modules.billing.enums.feature_type import FeatureType
 from src.modules.billing.repositories.interfaces import IFeaturesCatalogRepository
@@ -9,10 +10,28 @@ from src.modules.billing.repositories.interfaces import IFeaturesCatalogReposito
 class FeaturesCatalogService:
     """
     Manages the global feature catalog.
+
+    The catalog only changes on deploys and admin edits, so lookups by key
+    are served from `cache` (process-wide) when given. Edits made through
+    this service invalidate it; other processes pick them up after the TTL.
     """
 
-    def __init__(self, catalog_repository: IFeaturesCatalogRepository):
+    def __init__(
+        self,
+        catalog_repository: IFeaturesCatalogRepository,
+        cache: Optional[TTLCache] = None,
+    ):
         self.catalog_repo = catalog_repository
+        self.cache = cache
+
+    def invalidate_cache(self, feature_key: Optional[str] = None) -> None:
+        """Drop a cached feature (or the whole catalog when no key is given)."""
+        if self.cache is None:
+            return
+        if feature_key is None:
+            self.cache.clear()
+        else:
+            self.cache.delete(feature_key)
 
     def create_feature(
         self,
@@ -47,13 +66,23 @@ class FeaturesCatalogService:
             "metadata": metadata or {}
         }
 
-        return self.catalog_repo.create(feature_data)
+        feature = self.catalog_repo.create(feature_data)
+        self.invalidate_cache(feature_key)
+        return feature
 
     def get_feature_by_key(self, feature_key: str) -> Feature:
         """Get feature by its unique key."""
+        if self.cache is not None:
+            feature = self.cache.get(feature_key)
+            if feature is not None:
+                return feature
+
         feature = self.catalog_repo.find_by_key(feature_key)
         if not feature:
             raise ValueError(f"Feature '{feature_key}' not found in catalog")
+
+        if self.cache is not None:
+            self.cache.set(feature_key, feature)
         return feature
 
     def get_all_features(
@@ -93,4 +122,5 @@ class FeaturesCatalogService:
                 "metadata": metadata
             }
         )
+        self.invalidate_cache(feature_key)
         return updated
@@ -0,0 +1,43 @@
+from typing import Optional
+
+from src.core.cache import AsyncCache, CacheBackend
+
+KEY_PREFIX = "billing:access:"
+
+
+class SubscriptionAccessCache:
+    """
+    Caches the subscription-access decision per owner.
+
+    Granted access is kept for `ttl` seconds, denied access for the shorter
+    `negative_ttl` so a new subscription is picked up quickly even if its
+    invalidation is missed. Stripe webhook handling invalidates the owner's
+    entry explicitly.
+
+    With an in-process cache that invalidation only reaches the process
+    handling the webhook, so both TTLs are capped at `local_ttl`.
+    """
+
+    def __init__(
+        self,
+        cache: CacheBackend,
+        ttl: float = 300.0,
+        negative_ttl: float = 30.0,
+        local_ttl: float = 30.0,
+    ):
+        self.cache = cache
+        self._cache = AsyncCache(cache)
+        in_process = self._cache.in_process
+        self.ttl = min(ttl, local_ttl) if in_process else ttl
+        self.negative_ttl = min(negative_ttl, local_ttl) if in_process else negative_ttl
+
+    async def get(self, owner_id: str) -> Optional[bool]:
+        """Cached decision for owner_id, or None on a miss."""
+        return await self._cache.get(KEY_PREFIX + owner_id)
+
+    async def set(self, owner_id: str, has_access: bool) -> None:
+        ttl = self.ttl if has_access else self.negative_ttl
+        await self._cache.set(KEY_PREFIX + owner_id, has_access, ttl)
+
+    async def invalidate(self, owner_id: str) -> None:
+        await self._cache.delete(KEY_PREFIX + owner_id)
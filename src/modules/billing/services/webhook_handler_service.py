@@ -6,6 +6,7 @@ from datetime import datetime
 from src.modules.billing.services.subscription_service import SubscriptionService
 from src.modules.billing.services.plan_service import PlanService
 from src.modules.billing.enums.subscription_status import SubscriptionStatus
+from src.modules.billing.services.subscription_access_cache import SubscriptionAccessCache
 
 logger = structlog.get_logger()
 
@@ -17,16 +18,23 @@ class WebhookHandlerService:
     def __init__(
         self,
         subscription_service: SubscriptionService,
-        plan_service: PlanService
+        plan_service: PlanService,
+        access_cache: Optional[SubscriptionAccessCache] = None
     ):
         self.subscription_service = subscription_service
         self.plan_service = plan_service
+        self.access_cache = access_cache
 
     async def _run_sync(self, func, *args, **kwargs):
         """Helper to run sync functions in thread executor to avoid blocking event loop."""
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, lambda: func(*args, **kwargs))
 
+    async def _invalidate_access(self, owner_id: str):
+        """Forget the cached access decision after the owner's subscription changed."""
+        if self.access_cache:
+            await self.access_cache.invalidate(owner_id)
+
     async def handle_event(self, event: Dict[str, Any]):
         """
         Dispatch Stripe event to appropriate handler.
@@ -94,6 +102,7 @@ class WebhookHandlerService:
                 "checkout_session_id": session.get('id')
             }
         )
+        await self._invalidate_access(client_reference_id)
         logger.info(f"Created subscription for user {client_reference_id}")
 
     async def _handle_invoice_payment_succeeded(self, invoice: Dict[str, Any]):
@@ -121,6 +130,7 @@ class WebhookHandlerService:
                 subscription.subscription_id,
                 {"status": SubscriptionStatus.ACTIVE}
             )
+             await self._invalidate_access(subscription.owner_id)
              logger.info(f"Updated subscription {subscription.subscription_id} status to ACTIVE")
 
         # Update period end?
@@ -153,4 +163,5 @@ class WebhookHandlerService:
             reason="Canceled via Stripe",
             triggered_by="stripe"
         )
+        await self._invalidate_access(subscription.owner_id)
         logger.info(f"Canceled subscription {subscription.subscription_id} due to Stripe event")
@@ -1,4 +1,5 @@
-from typing import Optional
+from typing import Dict, Optional
+from urllib.parse import parse_qsl
 
 from dependency_injector.wiring import Provide, inject
 from fastapi import Depends, Header, HTTPException, Request
@@ -6,13 +7,31 @@ from fastapi import Depends, Header, HTTPException, Request
 from src.core.config import settings
 from src.core.di.container import Container
 from src.modules.channels.twilio.models.domain import TwilioWhatsAppPayload
-from src.modules.channels.twilio.services.twilio_service import TwilioService
+from src.modules.channels.twilio.services.webhook.signature_validator import \
+    TwilioSignatureValidator
 
 
-async def parse_twilio_payload(request: Request) -> TwilioWhatsAppPayload:
-    """Parse Twilio form data into payload model"""
+async def read_twilio_form(request: Request) -> Dict[str, str]:
+    """
+    Parse the Twilio form body once per request.
+    FastAPI caches dependency results per request, so the payload parser and
+    the signature check share this dict. Twilio posts urlencoded bodies,
+    which are decoded directly (much cheaper than the generic form parser).
+    """
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("application/x-www-form-urlencoded"):
+        body = await request.body()
+        return dict(parse_qsl(body.decode("utf-8"), keep_blank_values=True))
+
     form_data = await request.form()
+    # Twilio never uploads files; keep the text fields only
+    return {key: value for key, value in form_data.items() if isinstance(value, str)}
+
 
+async def parse_twilio_payload(
+    form_data: Dict[str, str] = Depends(read_twilio_form),
+) -> TwilioWhatsAppPayload:
+    """Parse Twilio form data into payload model"""
     return TwilioWhatsAppPayload(
         message_sid=form_data.get("MessageSid"),
         account_sid=form_data.get("AccountSid"),  # Owner
@@ -46,9 +65,12 @@ async def parse_twilio_payload(request: Request) -> TwilioWhatsAppPayload:
 @inject
 async def validate_twilio_request(
     request: Request,
+    form_data: Dict[str, str] = Depends(read_twilio_form),
     X_Twilio_Signature: Optional[str] = Header(None, alias="X-Twilio-Signature"),
     x_api_key: Optional[str] = Header(None, alias="X-API-Key"),
-    twilio_service: TwilioService = Depends(Provide[Container.twilio_service]),
+    signature_validator: TwilioSignatureValidator = Depends(
+        Provide[Container.twilio_signature_validator]
+    ),
 ):
     """
     Validate request authenticity (API Key or Twilio Signature).
@@ -65,9 +87,8 @@ async def validate_twilio_request(
                 raise HTTPException(403, "Invalid API key")
 
         elif X_Twilio_Signature:
-            # Use injected service for validation
-            is_valid = twilio_service.validate_webhook_signature(
-                str(request.url), await request.form(), X_Twilio_Signature
+            is_valid = await signature_validator.validate(
+                str(request.url), form_data, X_Twilio_Signature
             )
             if not is_valid:
                 raise HTTPException(status_code=403, detail="Invalid signature")
@@ -2,15 +2,16 @@
 API routes for Twilio webhook integration.
 """
 
+from typing import Dict
+
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends
 
 from src.core.di.container import Container
 from src.core.utils import get_logger
 from src.modules.channels.twilio.api.dependencies import (
-    parse_twilio_payload, validate_twilio_request)
+    read_twilio_form, validate_twilio_request)
 from src.modules.channels.twilio.dtos import TwilioWebhookResponseDTO
-from src.modules.channels.twilio.models.domain import TwilioWhatsAppPayload
 from src.modules.channels.twilio.services.twilio_webhook_service import \
     TwilioWebhookService
 
@@ -22,7 +23,7 @@ router = APIRouter(prefix="/webhooks", tags=["webhooks"])
 @router.post("/inbound", response_model=TwilioWebhookResponseDTO)
 @inject
 async def handle_inbound_message(
-    payload: TwilioWhatsAppPayload = Depends(parse_twilio_payload),
+    form_data: Dict[str, str] = Depends(read_twilio_form),
     service: TwilioWebhookService = Depends(Provide[Container.twilio_webhook_service]),
     _: None = Depends(validate_twilio_request),
 ):
@@ -31,17 +32,19 @@ async def handle_inbound_message(
 
     This endpoint receives webhooks when a message is sent to a Twilio number.
     It enqueues the raw event for async processing to ensure immediate 200 OK.
+    The form is parsed once and enqueued as-is; the worker builds the payload
+    model.
     """
     logger.info(
         "Received inbound message (Async Enqueue)",
-        from_number=payload.from_number,
-        to_number=payload.to_number,
-        message_sid=payload.message_sid,
+        from_number=form_data.get("From"),
+        to_number=form_data.get("To"),
+        message_sid=form_data.get("MessageSid"),
     )
 
     try:
         # Now fully async - just enqueue and return
-        return await service.enqueue_webhook_event(payload)
+        return await service.enqueue_webhook_form(form_data)
     except Exception as e:
         logger.error("Error enqueuing inbound message", error=str(e))
         # Don't raise HTTPException to avoid Twilio retries
@@ -51,7 +54,7 @@ async def handle_inbound_message(
 @router.post("/outbound", response_model=TwilioWebhookResponseDTO)
 @inject
 async def handle_outbound_message(
-    payload: TwilioWhatsAppPayload = Depends(parse_twilio_payload),
+    form_data: Dict[str, str] = Depends(read_twilio_form),
     service: TwilioWebhookService = Depends(Provide[Container.twilio_webhook_service]),
     _: None = Depends(validate_twilio_request),
 ):
@@ -63,14 +66,14 @@ async def handle_outbound_message(
     """
     logger.info(
         "Received outbound message (Async Enqueue)",
-        from_number=payload.from_number,
-        to_number=payload.to_number,
-        message_sid=payload.message_sid,
+        from_number=form_data.get("From"),
+        to_number=form_data.get("To"),
+        message_sid=form_data.get("MessageSid"),
     )
 
     try:
         # Now fully async - just enqueue and return
-        return await service.enqueue_webhook_event(payload)
+        return await service.enqueue_webhook_form(form_data)
     except Exception as e:
         logger.error("Error enqueuing outbound message", error=str(e))
         # Don't raise HTTPException to avoid Twilio retries
@@ -0,0 +1,23 @@
+from typing import Optional
+
+from src.core.utils.exceptions import AppError
+
+
+class TwilioRateLimitError(AppError):
+    """
+    Raised when Twilio keeps rejecting requests with 429 after transport retries.
+    For split messages, sent_chunks/first_sid describe the chunks that were
+    delivered before the 429, so a retry can resume after them.
+    """
+
+    def __init__(
+        self,
+        message: str = "Twilio rate limit exceeded",
+        retry_after: Optional[float] = None,
+        sent_chunks: int = 0,
+        first_sid: Optional[str] = None,
+    ):
+        self.retry_after = retry_after
+        self.sent_chunks = sent_chunks
+        self.first_sid = first_sid
+        super().__init__(message)
@@ -0,0 +1,155 @@
+"""
+Pooled asynchronous HTTP transport for the Twilio SDK.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+from twilio.http import AsyncHttpClient  # type: ignore[import-untyped]
+from twilio.http.response import Response  # type: ignore[import-untyped]
+
+from src.core.utils import get_logger
+
+logger = get_logger(__name__)
+
+_twilio_logger = logging.getLogger("twilio.http_client")
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After in seconds (only the delta-seconds form is used by Twilio)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+class PooledTwilioHttpClient(AsyncHttpClient):
+    """
+    Twilio AsyncHttpClient backed by a single keep-alive httpx.AsyncClient.
+
+    - Connections are pooled across all accounts (`max_connections`).
+    - Each account (basic-auth username, i.e. the Account SID) has at most
+      `max_per_account` requests in flight.
+    - A 429 pauses the whole account for Retry-After seconds (exponential
+      backoff when the header is missing) and the request is retried up to
+      `max_retries` times; the last 429 is returned to the SDK, which raises
+      TwilioRestException.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_per_account: int = 10,
+        max_retries: int = 3,
+        timeout: float = 30.0,
+        backoff_base: float = 1.0,
+    ):
+        super().__init__(_twilio_logger, True, timeout)
+        self.max_connections = max_connections
+        self.max_per_account = max_per_account
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self._client: Optional[httpx.AsyncClient] = None
+        self._slots: Dict[str, asyncio.Semaphore] = {}
+        self._paused_until: Dict[str, float] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # Created lazily so it binds to the running event loop
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                timeout=self.timeout,
+            )
+        return self._client
+
+    def _slot(self, account: str) -> asyncio.Semaphore:
+        if account not in self._slots:
+            self._slots[account] = asyncio.Semaphore(self.max_per_account)
+        return self._slots[account]
+
+    def pause(self, account: str, seconds: float) -> None:
+        """Hold back every request of an account for `seconds`."""
+        until = time.monotonic() + seconds
+        self._paused_until[account] = max(self._paused_until.get(account, 0.0), until)
+
+    def paused_for(self, account: str) -> float:
+        """Seconds left on the account's 429 pause (0 when not paused)."""
+        return max(0.0, self._paused_until.get(account, 0.0) - time.monotonic())
+
+    async def _wait_if_paused(self, account: str) -> None:
+        delay = self._paused_until.get(account, 0.0) - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, object]] = None,
+        data: Optional[Dict[str, object]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        auth: Optional[Tuple[str, str]] = None,
+        timeout: Optional[float] = None,
+        allow_redirects: bool = False,
+    ) -> Response:
+        if timeout is not None and timeout <= 0:
+            raise ValueError(timeout)
+
+        account = auth[0] if auth else ""
+        kwargs: Dict[str, Any] = {
+            "method": method.upper(),
+            "url": url,
+            "params": params,
+            "data": data,
+            "headers": headers,
+        }
+        self.log_request(kwargs)
+
+        async with self._slot(account):
+            attempt = 0
+            while True:
+                await self._wait_if_paused(account)
+                response = await self.client.request(
+                    **kwargs,
+                    auth=auth,
+                    timeout=timeout if timeout is not None else self.timeout,
+                    follow_redirects=allow_redirects,
+                )
+                if response.status_code != 429:
+                    break
+
+                delay = parse_retry_after(response.headers.get("Retry-After"))
+                if delay is None:
+                    delay = self.backoff_base * (2 ** attempt)
+                # Recorded even when giving up, so callers can see paused_for()
+                self.pause(account, delay)
+                if attempt >= self.max_retries:
+                    break
+                attempt += 1
+                logger.warning(
+                    "Twilio rate limited request, backing off",
+                    account_sid=account,
+                    retry_after=delay,
+                    attempt=attempt,
+                )
+
+        self.log_response(response.status_code, response)
+        self._test_only_last_response = Response(
+            response.status_code, response.text, response.headers
+        )
+        return self._test_only_last_response
+
+    async def close(self) -> None:
+        """Close pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -1,5 +1,6 @@
 from typing import Optional
 
+from src.core.cache import TTLCache
 from src.core.config import settings
 from src.core.utils import get_logger
 from src.modules.channels.twilio.models.domain import TwilioAccount
@@ -8,14 +9,27 @@ from src.modules.channels.twilio.repositories.account_repository import \
 
 logger = get_logger(__name__)
 
+# Cached marker for "no account matches"; the cache itself returns None on a miss
+_NOT_FOUND = False
+
 
 class TwilioAccountService:
     """
     Service to handle Twilio Account logic.
     """
 
-    def __init__(self, twilio_account_repo: TwilioAccountRepository):
+    def __init__(
+        self,
+        twilio_account_repo: TwilioAccountRepository,
+        account_cache: Optional[TTLCache] = None,
+        negative_ttl: float = 60.0,
+    ):
         self.repo = twilio_account_repo
+        # Process-wide (account_sid, to_number) -> account cache; in-process
+        # only, since cached accounts carry auth tokens. Account and phone
+        # number changes show up once entries expire, so keep its TTL short
+        self.account_cache = account_cache
+        self.negative_ttl = negative_ttl
 
     async def resolve_account(
         self, to_number: Optional[str], account_sid: Optional[str]
@@ -27,11 +41,20 @@ class TwilioAccountService:
         1. Try by Account SID
         2. Try by Phone Number
         3. Fallback to default from settings (Development only ideally)
+
+        Results (including failed lookups) are cached per
+        (account_sid, to_number) when an account cache is configured.
         """
         normalized_to_number = to_number or ""
         if normalized_to_number.startswith("whatsapp:"):
             normalized_to_number = normalized_to_number.split(":", 1)[1]
 
+        cache_key = f"{account_sid or ''}:{normalized_to_number}"
+        if self.account_cache is not None:
+            cached = self.account_cache.get(cache_key)
+            if cached is not None:
+                return cached or None
+
         account = None
 
         # 1. Try by Account SID
@@ -54,4 +77,10 @@ class TwilioAccountService:
                 account_sid=account_sid,
             )
 
+        if self.account_cache is not None:
+            if account:
+                self.account_cache.set(cache_key, account)
+            else:
+                self.account_cache.set(cache_key, _NOT_FOUND, ttl=self.negative_ttl)
+
         return account
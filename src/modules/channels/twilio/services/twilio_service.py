@@ -2,9 +2,8 @@
 Twilio service for sending and receiving messages.
 """
 
-import asyncio
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 from twilio.base.exceptions import TwilioRestException
 from twilio.rest import Client as TwilioClient
@@ -12,7 +11,10 @@ from twilio.rest import Client as TwilioClient
 
 from src.core.config import settings
 from src.core.utils import get_logger
+from src.modules.channels.twilio.exceptions import TwilioRateLimitError
 from src.modules.channels.twilio.models.results import TwilioMessageResult
+from src.modules.channels.twilio.services.http_client import \
+    PooledTwilioHttpClient
 from src.modules.channels.twilio.repositories.account_repository import \
     TwilioAccountRepository
 from src.modules.conversation.enums.message_direction import MessageDirection
@@ -26,14 +28,21 @@ class TwilioService:
     Handles sending and receiving messages via Twilio.
     """
 
-    def __init__(self, twilio_repo: TwilioAccountRepository):
+    def __init__(
+        self,
+        twilio_repo: TwilioAccountRepository,
+        http_client: Optional[PooledTwilioHttpClient] = None,
+    ):
         """
         Initialize Twilio service.
 
         Args:
             twilio_repo: Twilio account repository
+            http_client: Shared async transport (pooled connections,
+                per-account concurrency and 429 back-pressure)
         """
         self.twilio_repo = twilio_repo
+        self.http_client = http_client or PooledTwilioHttpClient()
         self._clients: Dict[str, TwilioClient] = {}
 
     async def _get_client(self, owner_id: str) -> Optional[TwilioClient]:
@@ -63,7 +72,9 @@ class TwilioService:
             ):
                 logger.info("Using default Twilio credentials (Development Mode)")
                 client = TwilioClient(
-                    settings.twilio.account_sid, settings.twilio.auth_token
+                    settings.twilio.account_sid,
+                    settings.twilio.auth_token,
+                    http_client=self.http_client,
                 )
                 self._clients[owner_id] = client
                 return client
@@ -72,7 +83,9 @@ class TwilioService:
 
         # Create client
         try:
-            client = TwilioClient(account.account_sid, account.auth_token)
+            client = TwilioClient(
+                account.account_sid, account.auth_token, http_client=self.http_client
+            )
             self._clients[owner_id] = client
             return client
         except TwilioRestException as e:
@@ -106,6 +119,8 @@ class TwilioService:
         to_number: str,
         body: str,
         media_url: Optional[str] = None,
+        start_chunk: int = 0,
+        before_chunk: Optional[Callable[[], Awaitable[Any]]] = None,
     ) -> Optional[TwilioMessageResult]:
         """
         Send a message via Twilio.
@@ -116,9 +131,18 @@ class TwilioService:
             from_number: Sender phone number (Twilio number)
             body: Message body
             media_url: Optional media URL
+            start_chunk: Index of the first chunk to send; chunks before it
+                were delivered by an earlier, rate-limited attempt
+            before_chunk: Awaited before each chunk is sent (e.g. to take a
+                rate limiter token per Twilio request)
 
         Returns:
             TwilioMessageResult object or None
+
+        Raises:
+            TwilioRateLimitError: Twilio still answered 429 after the
+                transport's retries; callers should back off and retry
+                from its sent_chunks.
         """
         # Only send via fake sender in development environment
         if settings.api.environment == "development" and settings.api.use_fake_sender:
@@ -144,31 +168,30 @@ class TwilioService:
             first_message = None
             last_message = None
             total_media = 0
+            sent_chunks = start_chunk
 
             for i, chunk in enumerate(chunks):
-                message_params = {"body": chunk, "from_": from_number, "to": to_number}
+                if i < start_chunk:
+                    continue
+
+                message_params: Dict[str, Any] = {
+                    "body": chunk,
+                    "from_": from_number,
+                    "to": to_number,
+                }
 
                 # Attach media only to the first chunk
                 if i == 0 and media_url:
                     message_params["media_url"] = [media_url]
 
-                # Run blocking Twilio call in threadpool using asyncio.to_thread
-                def _send():
-                    try:
-                        return client.messages.create(**message_params)
-                    except Exception as e:
-                        logger.error(f"Error inside thread: {e}")
-                        raise
-
-                message = await asyncio.to_thread(_send)
-                
-                # Debug logging
-                if hasattr(message, 'sid'):
-                     pass
-                else:
-                     logger.error(f"DEBUG: message object does not have sid! type={type(message)}")
-
-                if i == 0:
+                if before_chunk:
+                    await before_chunk()
+
+                # Chunks stay sequential so they arrive in order
+                message = await client.messages.create_async(**message_params)
+                sent_chunks = i + 1
+
+                if first_message is None:
                     first_message = message
                 last_message = message
 
@@ -182,7 +205,7 @@ class TwilioService:
                     from_=from_number,
                 )
 
-            if not last_message:
+            if not first_message or not last_message:
                 return None
 
             return TwilioMessageResult(
@@ -197,6 +220,12 @@ class TwilioService:
                 error_message=last_message.error_message,
             )
         except TwilioRestException as e:
+            if e.status == 429:
+                raise TwilioRateLimitError(
+                    retry_after=self.http_client.paused_for(client.username),
+                    sent_chunks=sent_chunks,
+                    first_sid=first_message.sid if first_message else None,
+                ) from e
             logger.error(
                 "Error sending message via Twilio", error=str(e), error_code=e.code
             )
@@ -220,10 +249,7 @@ class TwilioService:
             return None
 
         try:
-            def _fetch():
-                return client.messages(message_sid).fetch()
-                
-            message = await asyncio.to_thread(_fetch)
+            message = await client.messages(message_sid).fetch_async()
 
             return TwilioMessageResult(
                 sid=message.sid,
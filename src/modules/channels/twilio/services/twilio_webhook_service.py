@@ -1,6 +1,8 @@
 
 import uuid
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from pydantic import ValidationError
 
 from src.core.utils.exceptions import DuplicateError
 from src.core.queue.service import QueueService
@@ -9,8 +11,10 @@ from src.modules.channels.twilio.dtos import TwilioWebhookResponseDTO
 from src.modules.channels.twilio.models.domain import TwilioWhatsAppPayload
 from src.modules.channels.twilio.services.webhook.ai_processor import TwilioWebhookAIProcessor
 from src.modules.channels.twilio.services.webhook.audio_processor import TwilioWebhookAudioProcessor
+from src.modules.channels.twilio.services.webhook.deduplicator import TwilioWebhookDeduplicator
 from src.modules.channels.twilio.services.webhook.message_handler import TwilioWebhookMessageHandler
 from src.modules.channels.twilio.services.webhook.owner_resolver import TwilioWebhookOwnerResolver
+from src.modules.channels.twilio.utils.helpers import conversation_partition_key
 from src.modules.conversation.enums.message_type import MessageType
 from src.modules.conversation.enums.conversation_status import ConversationStatus
 
@@ -31,12 +35,14 @@ class TwilioWebhookService:
         audio_processor: TwilioWebhookAudioProcessor,
         ai_processor: TwilioWebhookAIProcessor,
         queue_service: QueueService,
+        deduplicator: Optional[TwilioWebhookDeduplicator] = None,
     ):
         self.owner_resolver = owner_resolver
         self.message_handler = message_handler
         self.audio_processor = audio_processor
         self.ai_processor = ai_processor
         self.queue_service = queue_service
+        self.deduplicator = deduplicator
 
         # Register queue handlers
         self.queue_service.register_handler(
@@ -53,19 +59,47 @@ class TwilioWebhookService:
         self, payload: TwilioWhatsAppPayload
     ) -> TwilioWebhookResponseDTO:
         """
-        Enqueue the raw webhook event for async processing.
-        Returns immediate 200 OK to Twilio.
+        Enqueue a parsed webhook event for async processing.
+        """
+        return await self.enqueue_webhook_form(payload.model_dump(by_alias=True))
+
+    async def enqueue_webhook_form(
+        self, form_data: Dict[str, Any]
+    ) -> TwilioWebhookResponseDTO:
+        """
+        Enqueue the raw webhook form (Twilio field names) for async processing.
+        Returns immediate 200 OK to Twilio; the worker validates the payload.
         """
         # Determine owner_id from AccountSid (fast check, no DB if possible, but currently resolver needs DB)
         # Note: We can pass payload to queue and let worker resolve owner.
         # But QueueService.enqueue takes optional owner_id.
         # For now, we'll let the worker resolve the owner to avoid DB hit here.
-        
-        await self.queue_service.enqueue(
-            "process_twilio_event",
-            payload.model_dump(by_alias=True),
-            correlation_id=payload.message_sid or str(uuid.uuid4())
-        )
+
+        # Twilio retries deliveries; drop the ones we already enqueued
+        message_sid = form_data.get("MessageSid")
+        if self.deduplicator and message_sid:
+            if not await self.deduplicator.claim(message_sid):
+                logger.info("Duplicate webhook delivery ignored", message_sid=message_sid)
+                return TwilioWebhookResponseDTO(
+                    success=True,
+                    message="Duplicate event ignored",
+                    conv_id=None,
+                    msg_id=None
+                )
+
+        try:
+            await self.queue_service.enqueue(
+                "process_twilio_event",
+                form_data,
+                correlation_id=message_sid or str(uuid.uuid4()),
+                partition_key=conversation_partition_key(
+                    form_data.get("From"), form_data.get("To")
+                ),
+            )
+        except Exception:
+            if self.deduplicator and message_sid:
+                await self.deduplicator.release(message_sid)
+            raise
         
         return TwilioWebhookResponseDTO(
             success=True,
@@ -80,8 +114,18 @@ class TwilioWebhookService:
         Rehydrates payload and calls process_webhook logic.
         """
         try:
-            # Rehydrate payload
+            # Rehydrate payload (raw form or model dump, both keyed by alias)
             payload = TwilioWhatsAppPayload(**payload_dict)
+        except ValidationError as e:
+            # Malformed webhook: retrying cannot fix it
+            logger.error(
+                "Discarding invalid webhook event",
+                message_sid=payload_dict.get("MessageSid"),
+                error=str(e),
+            )
+            return
+
+        try:
             await self.process_webhook(payload)
         except Exception as e:
             logger.error("Failed to process webhook event task", error=str(e))
@@ -1,5 +1,5 @@
 import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 
 from starlette.concurrency import run_in_threadpool
@@ -10,11 +10,14 @@ from src.modules.ai.engines.lchain.core.agents.agent_factory import AgentFactory
 from src.modules.channels.twilio.models.domain import TwilioWhatsAppPayload
 from src.modules.identity.services.identity_service import IdentityService
 from src.modules.identity.utils.profile_memory import extract_profile_name, should_forget_profile
+from src.modules.channels.twilio.services.webhook.coalescer import TwilioWebhookCoalescer
 from src.modules.channels.twilio.services.webhook.message_handler import TwilioWebhookMessageHandler
+from src.modules.channels.twilio.utils.helpers import conversation_partition_key
 
 # Billing Services for Feature/Agent Resolution
 from src.modules.billing.services.feature_usage_service import FeatureUsageService
 from src.modules.billing.services.features_catalog_service import FeaturesCatalogService
+from src.modules.conversation.models.message import Message
 
 logger = get_logger(__name__)
 
@@ -36,6 +39,7 @@ class TwilioWebhookAIProcessor:
         agent_factory: AgentFactory,
         queue_service: QueueService,
         message_handler: TwilioWebhookMessageHandler,
+        coalescer: Optional[TwilioWebhookCoalescer] = None,
     ):
         self.identity_service = identity_service
         self.feature_usage_service = feature_usage_service
@@ -43,6 +47,8 @@ class TwilioWebhookAIProcessor:
         self.agent_factory = agent_factory
         self.queue_service = queue_service
         self.message_handler = message_handler
+        # Merges rapid-fire messages into one agent turn (None = one turn per message)
+        self.coalescer = coalescer
 
     async def enqueue_ai_task(
         self,
@@ -52,6 +58,8 @@ class TwilioWebhookAIProcessor:
         payload_dump: Dict[str, Any],
         correlation_id: str,
     ):
+        if self.coalescer and conversation_id and msg_id:
+            await self.coalescer.mark(conversation_id, msg_id)
         await self.queue_service.enqueue(
             task_name="process_ai_response",
             payload={
@@ -63,6 +71,12 @@ class TwilioWebhookAIProcessor:
             },
             correlation_id=correlation_id,
             owner_id=owner_id,
+            # Own partition: a debouncing turn must not hold up the webhooks
+            partition_key=conversation_partition_key(
+                payload_dump.get("from_number"),
+                payload_dump.get("to_number"),
+                stage="ai",
+            ),
         )
 
     async def handle_ai_response_task(self, task_payload: Dict[str, Any]):
@@ -71,59 +85,78 @@ class TwilioWebhookAIProcessor:
         """
         logger.info("Worker received handle_ai_response_task", task_payload=task_payload)
         payload = TwilioWhatsAppPayload(**task_payload["payload"])
+        conversation_id = task_payload["conversation_id"]
+        msg_id = task_payload["msg_id"]
+
+        turn_messages = None
+        coalescer = self.coalescer
+        if coalescer:
+            if not await coalescer.wait_turn(conversation_id, msg_id):
+                logger.info(
+                    "AI turn merged into a newer message",
+                    msg_id=msg_id,
+                    conversation_id=conversation_id,
+                )
+                return
+            turn_messages = await self.load_turn_messages(
+                coalescer, conversation_id, msg_id
+            )
 
         await self.handle_ai_response(
             owner_id=task_payload["owner_id"],
-            conversation_id=task_payload["conversation_id"],
-            msg_id=task_payload["msg_id"],
+            conversation_id=conversation_id,
+            msg_id=msg_id,
             payload=payload,
             correlation_id=task_payload["correlation_id"],
+            turn_messages=turn_messages,
         )
+
+    async def load_turn_messages(
+        self, coalescer: TwilioWebhookCoalescer, conversation_id: str, msg_id: str
+    ) -> Optional[List[Message]]:
+        """Inbound messages answered by msg_id's turn (None = just the payload)."""
+        try:
+            recent = await self.message_handler.conversation_service.get_recent_messages(
+                conversation_id, limit=coalescer.max_messages * 2
+            )
+        except Exception as e:
+            logger.warning("Could not load messages to coalesce", error=str(e))
+            return None
+        return coalescer.turn_messages(recent, msg_id) or None
     
     async def resolve_agent_feature(self, owner_id: str) -> Optional[ResolvedAgentFeature]:
         """
         Resolve which agent/feature should handle the message for this owner.
         Uses Billing Service to check enabled features.
+
+        The usage summary is a single joined query (cached per owner) and
+        carries each feature_id, so no catalog lookups are needed here.
         """
         try:
             # Get usage summary (includes active status)
             summary = await run_in_threadpool(self.feature_usage_service.get_usage_summary, owner_id)
-            
+
             # Simple Logic: Return the first active feature that matches a known agent type
             # In a real scenario, we might have a specific "routing_agent" or "primary_agent" config
             # For now, we look for 'finance' or 'relationships' or fallback to any active.
-            
             preferred_agents = ["finance", "relationships", "identity"]
-            
-            # 1. Check preferred agents first
-            for agent_key in preferred_agents:
-                if agent_key in summary and summary[agent_key].is_active:
-                    # We need the feature_id. Summary keys are feature_keys.
-                    # We can get it from the summary object we just fetched if available?
-                    # The summary object has feature_name but maybe not feature_id directly exposed in keys?
-                    # Wait, FeatureUsageSummary in billing/services/feature_usage_service.py 
-                    # doesn't seem to have feature_id in the dataclass definition I read earlier?
-                    # Let's check: feature_key, feature_name, current_usage...
-                    # It doesn't have feature_id. We might need to fetch it from catalog or usage repo.
-                    
-                    # But we have FeaturesCatalogService.
+            candidates = [key for key in preferred_agents if key in summary]
+            candidates += [key for key in summary if key not in preferred_agents]
+
+            for key in candidates:
+                usage = summary[key]
+                if not usage.is_active:
+                    continue
+                feature_id = usage.feature_id
+                if not feature_id:
+                    # Summaries built without the catalog join
                     feature = await run_in_threadpool(
-                        self.features_catalog_service.get_feature_by_key, 
-                        agent_key
+                        self.features_catalog_service.get_feature_by_key, key
                     )
-                    if feature:
-                         return ResolvedAgentFeature(name=feature.feature_key, feature_id=feature.feature_id)
+                    feature_id = feature.feature_id if feature else None
+                if feature_id:
+                    return ResolvedAgentFeature(name=key, feature_id=feature_id)
 
-            # 2. Fallback to any active feature
-            for key, usage in summary.items():
-                if usage.is_active:
-                     feature = await run_in_threadpool(
-                        self.features_catalog_service.get_feature_by_key, 
-                        key
-                    )
-                     if feature:
-                        return ResolvedAgentFeature(name=feature.feature_key, feature_id=feature.feature_id)
-            
             return None
 
         except Exception as e:
@@ -137,11 +170,27 @@ class TwilioWebhookAIProcessor:
         msg_id: str,
         payload: TwilioWhatsAppPayload,
         correlation_id: str,
+        turn_messages: Optional[List[Message]] = None,
     ):
         """
         Background task to run AI agent and send response.
+        turn_messages (oldest first) are answered together in one agent turn.
         """
         logger.info("Starting AI processing", correlation_id=correlation_id)
+        inbound_tasks: List[Dict[str, Any]] = []
+
+        fragments: List[Tuple[Optional[str], str]] = [(msg_id, payload.body)]
+        if turn_messages:
+            fragments = [(m.msg_id, m.body) for m in turn_messages]
+            if len(fragments) > 1:
+                logger.info(
+                    "Coalesced inbound messages into one turn",
+                    count=len(fragments),
+                    correlation_id=correlation_id,
+                )
+            payload = payload.model_copy(
+                update={"body": "\n".join(body for _, body in fragments)}
+            )
 
         try:
             # 1. Get User Context
@@ -229,29 +278,27 @@ class TwilioWebhookAIProcessor:
                 "additional_context": additional_context,
             }
 
-            if user and payload.body and str(payload.body).strip():
-                try:
-                    await self.queue_service.enqueue(
-                        task_name="generate_embedding",
-                        payload={
-                            "content": payload.body,
+            for fragment_id, content in fragments:
+                if not user or not content or not str(content).strip():
+                    continue
+                # Enqueued together with the reply (see send_and_persist_response)
+                inbound_tasks.append(
+                    {
+                        "task_name": "generate_embedding",
+                        "payload": {
+                            "content": content,
                             "metadata": {
-                                "msg_id": msg_id,
+                                "msg_id": fragment_id,
                                 "conv_id": conversation_id,
                                 "owner_id": owner_id,
                                 "user_id": user.user_id,
                                 "role": "user",
                             },
                         },
-                        owner_id=owner_id,
-                        correlation_id=correlation_id,
-                    )
-                except Exception as e:
-                    logger.warning(
-                        "Failed to enqueue inbound embedding task",
-                        error=str(e),
-                        correlation_id=correlation_id,
-                    )
+                        "owner_id": owner_id,
+                        "correlation_id": correlation_id,
+                    }
+                )
 
             # 3. Run Agent (Synchronous Blocking Call)
             if user:
@@ -288,6 +335,7 @@ class TwilioWebhookAIProcessor:
                 body=response_text,
                 correlation_id=correlation_id,
                 user_id=user.user_id if user else None,
+                extra_tasks=inbound_tasks,
             )
 
             logger.info("AI response processed and sent", correlation_id=correlation_id)
@@ -313,4 +361,5 @@ class TwilioWebhookAIProcessor:
                 body=error_message,
                 correlation_id=correlation_id,
                 is_error=True,
+                extra_tasks=inbound_tasks,
             )
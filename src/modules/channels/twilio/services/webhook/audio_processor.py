@@ -5,10 +5,15 @@ from typing import Dict, Any, Optional
 from starlette.concurrency import run_in_threadpool
 
 from src.core.utils import get_logger
-from src.modules.channels.twilio.utils.helpers import download_media
+from src.modules.channels.twilio.utils.helpers import (
+    conversation_partition_key, fetch_media)
 from src.core.queue.service import QueueService
+from src.modules.ai.services.transcription_cache import TranscriptionCache
+from src.modules.ai.services.transcription_engine import TranscriptionEngine
 from src.modules.ai.services.transcription_service import TranscriptionService
+from src.modules.channels.twilio.services.webhook.coalescer import TwilioWebhookCoalescer
 from src.modules.channels.twilio.services.webhook.message_handler import TwilioWebhookMessageHandler
+from src.modules.identity.services.identity_service import IdentityService
 
 logger = get_logger(__name__)
 
@@ -22,10 +27,23 @@ class TwilioWebhookAudioProcessor:
         transcription_service: Optional[TranscriptionService],
         queue_service: QueueService,
         message_handler: TwilioWebhookMessageHandler,
+        transcription_engine: Optional[TranscriptionEngine] = None,
+        identity_service: Optional[IdentityService] = None,
+        transcription_cache: Optional[TranscriptionCache] = None,
+        coalescer: Optional[TwilioWebhookCoalescer] = None,
     ):
         self.transcription_service = transcription_service
         self.queue_service = queue_service
         self.message_handler = message_handler
+        self.transcription_engine = transcription_engine or (
+            TranscriptionEngine(transcription_service) if transcription_service else None
+        )
+        # Used to read the sender's language preference (skips auto-detect)
+        self.identity_service = identity_service
+        # Transcripts keyed by media content hash (repeated/forwarded audio)
+        self.transcription_cache = transcription_cache
+        # Lets the transcribed message join a burst of text messages
+        self.coalescer = coalescer
 
     async def enqueue_transcription_task(
         self,
@@ -49,8 +67,33 @@ class TwilioWebhookAudioProcessor:
             },
             correlation_id=correlation_id,
             owner_id=owner_id,
+            partition_key=conversation_partition_key(
+                payload_dump.get("from_number"), payload_dump.get("to_number")
+            ),
         )
 
+    async def _language_hint(self, payload_dump: Optional[Dict[str, Any]]) -> Optional[str]:
+        """
+        Language from the sender's preferences, if known. Best effort: any
+        failure means auto-detect, never a dropped transcription.
+        """
+        from_number = (payload_dump or {}).get("from_number")
+        if not self.identity_service or not from_number:
+            return None
+        try:
+            user = await run_in_threadpool(
+                self.identity_service.get_user_by_phone,
+                from_number.replace("whatsapp:", "").strip(),
+            )
+            # Not every user model carries preferences
+            preferences = getattr(user, "preferences", None)
+            if isinstance(preferences, dict):
+                language = preferences.get("language")
+                return language if isinstance(language, str) and language else None
+        except Exception as e:
+            logger.warning("Could not resolve language hint", error=str(e))
+        return None
+
     async def handle_audio_transcription_task(self, task_payload: Dict[str, Any]):
         """
         Handler for async audio transcription.
@@ -59,33 +102,51 @@ class TwilioWebhookAudioProcessor:
         
         msg_id = task_payload.get("msg_id")
         media_url = task_payload.get("media_url")
-        media_type = task_payload.get("media_type")
+        # The response Content-Type wins; this only picks the file extension
+        media_type: str = task_payload.get("media_type") or ""
         owner_id = task_payload.get("owner_id")
         conversation_id = task_payload.get("conversation_id")
         payload_dump = task_payload.get("payload_dump")
         
-        if not all([msg_id, media_url]):
+        if not msg_id or not media_url:
             logger.error("Missing required fields for transcription task")
             return
 
         media_content = None
         try:
-            # 1. Download Media
-            media_content = await run_in_threadpool(
-                download_media,
+            # 1. Download Media (hashed while streaming when caching)
+            media = await fetch_media(
                 media_type=media_type,
-                media_url=media_url
+                media_url=media_url,
+                hash_algorithm=(
+                    self.transcription_cache.hash_algorithm if self.transcription_cache else None
+                ),
             )
-            
-            if not media_content or not self.transcription_service:
-                logger.warning("Failed to download media or transcription service unavailable")
+            if media is None:
+                logger.warning("Failed to download media")
                 return
+            # Set before any early return so the file is always cleaned up
+            media_content = media.path
 
-            # 2. Transcribe
-            logger.info("Transcribing audio file...")
-            transcription = await run_in_threadpool(
-                self.transcription_service.transcribe, media_content
-            )
+            if not self.transcription_engine:
+                logger.warning("Transcription service unavailable")
+                return
+
+            # 2. Transcribe (unless this exact audio was transcribed before)
+            language = task_payload.get("language") or await self._language_hint(payload_dump)
+            transcription = None
+            if self.transcription_cache and media.digest:
+                transcription = await self.transcription_cache.get(media.digest, language)
+                if transcription:
+                    logger.info("Transcription cache hit", digest=media.digest)
+
+            if not transcription:
+                logger.info("Transcribing audio file...")
+                transcription = await self.transcription_engine.transcribe(
+                    media_content, language=language
+                )
+                if transcription and self.transcription_cache and media.digest:
+                    await self.transcription_cache.set(media.digest, transcription, language)
             
             if transcription:
                 logger.info("Audio transcribed successfully: %s", transcription)
@@ -100,6 +161,8 @@ class TwilioWebhookAudioProcessor:
                     payload_dump["body"] = new_body
 
                 # 4. Enqueue AI Response Task (Chain the next step)
+                if self.coalescer and conversation_id and msg_id:
+                    await self.coalescer.mark(conversation_id, msg_id)
                 await self.queue_service.enqueue(
                     task_name="process_ai_response",
                     payload={
@@ -110,7 +173,12 @@ class TwilioWebhookAudioProcessor:
                         "correlation_id": str(uuid.uuid4()),
                     },
                     correlation_id=str(uuid.uuid4()),
-                    owner_id=owner_id
+                    owner_id=owner_id,
+                    partition_key=conversation_partition_key(
+                        (payload_dump or {}).get("from_number"),
+                        (payload_dump or {}).get("to_number"),
+                        stage="ai",
+                    ),
                 )
             else:
                 logger.warning("Transcription returned empty result")
@@ -0,0 +1,98 @@
+import asyncio
+import time
+from typing import List, Optional
+
+from src.core.cache import AsyncCache, CacheBackend, TTLCache
+from src.modules.conversation.enums.message_direction import MessageDirection
+from src.modules.conversation.models.message import Message
+
+
+class TwilioWebhookCoalescer:
+    """
+    Debounces agent turns per conversation, so a burst of short WhatsApp
+    messages gets one agent run and one reply instead of one per fragment.
+
+    Every AI task records itself as the conversation's latest inbound message
+    when it is enqueued. When it runs, it waits until `window_seconds` have
+    passed since the latest message; if a newer message arrived meanwhile the
+    task steps aside (the newer task answers the whole burst). The surviving
+    task merges every inbound message since the last reply (see
+    turn_messages).
+
+    The marker lives in the shared cache when configured, so it is seen by
+    every worker process; otherwise in an in-process TTL cache.
+    """
+
+    KEY_PREFIX = "twilio:coalesce:"
+
+    def __init__(
+        self,
+        window_seconds: float = 2.0,
+        max_messages: int = 10,
+        shared_cache: Optional[CacheBackend] = None,
+    ):
+        self.window_seconds = window_seconds
+        self.max_messages = max_messages
+        self.cache = shared_cache if shared_cache is not None else TTLCache()
+        # Coalescing is an optimization: on cache errors every message gets its own turn
+        self._cache = AsyncCache(self.cache, unavailable_message="Coalesce cache unavailable")
+        # Markers only matter for one window; keep them a little longer
+        self._ttl = max(60.0, window_seconds * 10)
+
+    async def mark(self, conversation_id: str, msg_id: str) -> None:
+        """Record msg_id as the latest inbound message of the conversation."""
+        await self._cache.set(
+            self.KEY_PREFIX + conversation_id,
+            {"msg_id": msg_id, "at": time.time()},
+            self._ttl,
+        )
+
+    async def wait_turn(self, conversation_id: str, msg_id: str) -> bool:
+        """
+        Wait for the conversation to go quiet. Returns False if a newer
+        message superseded msg_id (its own task will answer the burst).
+        """
+        while True:
+            latest = await self._cache.get(self.KEY_PREFIX + conversation_id)
+            if not latest:
+                return True
+            if latest.get("msg_id") != msg_id:
+                return False
+            remaining = latest["at"] + self.window_seconds - time.time()
+            if remaining <= 0:
+                return True
+            await asyncio.sleep(remaining)
+
+    def turn_messages(self, messages: List[Message], msg_id: str) -> List[Message]:
+        """
+        Messages answered by msg_id's turn, oldest first.
+
+        While no reply follows msg_id, the turn is the whole run of inbound
+        messages since the last reply, including ones after msg_id: a late
+        mark (e.g. an audio note whose transcription finished inside a newer
+        text's window) supersedes the newer messages' tasks, so this turn
+        must answer them. Once a reply follows msg_id, that reply already
+        covered its neighbours and the turn is msg_id alone.
+        Messages without text yet (e.g. audio still being transcribed) are
+        skipped; they get their own turn. At most max_messages (the newest)
+        are kept.
+        """
+        index = next((i for i, m in enumerate(messages) if m.msg_id == msg_id), None)
+        if index is None:
+            return []
+
+        inbound = MessageDirection.INBOUND.value
+        start, end = index, index + 1
+        while start > 0 and messages[start - 1].direction == inbound:
+            start -= 1
+        while end < len(messages) and messages[end].direction == inbound:
+            end += 1
+        if end < len(messages):
+            return [messages[index]]
+
+        turn = [
+            message
+            for i, message in enumerate(messages[start:end], start)
+            if i == index or (message.body and message.body.strip())
+        ]
+        return turn[-self.max_messages:]
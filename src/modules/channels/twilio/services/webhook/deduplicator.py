@@ -0,0 +1,54 @@
+from typing import Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from src.core.cache import CacheBackend, TTLCache
+from src.core.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class TwilioWebhookDeduplicator:
+    """
+    Drops retried Twilio webhook deliveries at enqueue time, keyed on MessageSid.
+
+    An in-process TTL LRU catches retries that hit the same API process; the
+    optional shared cache catches retries load-balanced to another replica.
+    """
+
+    KEY_PREFIX = "twilio:webhook:"
+
+    def __init__(
+        self,
+        ttl_seconds: int = 3600,
+        max_entries: int = 10000,
+        shared_cache: Optional[CacheBackend] = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.local = TTLCache(max_entries=max_entries, default_ttl=ttl_seconds)
+        self.shared_cache = shared_cache
+
+    async def claim(self, message_sid: str) -> bool:
+        """
+        Record a delivery. Returns False if this MessageSid was already seen
+        within the TTL (i.e. the delivery is a retry and should be dropped).
+        """
+        key = self.KEY_PREFIX + message_sid
+        if not self.local.add(key, 1):
+            return False
+
+        if self.shared_cache is not None:
+            claimed = await run_in_threadpool(
+                self.shared_cache.add, key, 1, self.ttl_seconds
+            )
+            if not claimed:
+                return False
+
+        return True
+
+    async def release(self, message_sid: str) -> None:
+        """Forget a MessageSid (e.g. enqueue failed), so Twilio's retry is accepted."""
+        key = self.KEY_PREFIX + message_sid
+        self.local.delete(key)
+        if self.shared_cache is not None:
+            await run_in_threadpool(self.shared_cache.delete, key)
@@ -1,5 +1,5 @@
 import uuid
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from starlette.concurrency import run_in_threadpool
 
@@ -8,6 +8,7 @@ from src.core.queue.service import QueueService
 from src.modules.channels.twilio.dtos import TwilioWebhookResponseDTO
 from src.modules.channels.twilio.models.domain import TwilioWhatsAppPayload
 from src.modules.channels.twilio.services.twilio_service import TwilioService
+from src.modules.channels.twilio.utils.helpers import conversation_partition_key
 from src.modules.conversation.dtos.message_dto import MessageCreateDTO
 from src.modules.conversation.enums.message_direction import MessageDirection
 from src.modules.conversation.enums.message_owner import MessageOwner
@@ -33,38 +34,35 @@ class TwilioWebhookMessageHandler:
         self.twilio_service = twilio_service
         self.queue_service = queue_service
 
-    async def _enqueue_embedding(self, message: Message):
-        """Enqueue embedding generation task."""
+    def build_embedding_task(self, message: Message) -> Optional[Dict[str, Any]]:
+        """Embedding generation task for a persisted message (None if it has no text)."""
         if not message.body or not message.body.strip():
-            return
-            
-        try:
-            user_id = None
-            if isinstance(message.metadata, dict):
-                user_id = message.metadata.get("user_id")
+            return None
 
-            # Safe serialization for timestamp
-            timestamp_str = None
-            if message.timestamp:
-                timestamp_str = message.timestamp.isoformat()
+        user_id = None
+        if isinstance(message.metadata, dict):
+            user_id = message.metadata.get("user_id")
 
-            await self.queue_service.enqueue(
-                task_name="generate_embedding",
-                payload={
-                    "content": message.body,
-                    "metadata": {
-                        "msg_id": message.msg_id,
-                        "conv_id": message.conv_id,
-                        "owner_id": message.owner_id,
-                        "user_id": user_id,
-                        "role": "user" if message.message_owner == MessageOwner.USER else "assistant",
-                        "timestamp": timestamp_str
-                    }
-                },
-                owner_id=message.owner_id
-            )
-        except Exception as e:
-            logger.error(f"Failed to enqueue embedding task for msg {message.msg_id}: {e}")
+        # Safe serialization for timestamp
+        timestamp_str = None
+        if message.timestamp:
+            timestamp_str = message.timestamp.isoformat()
+
+        return {
+            "task_name": "generate_embedding",
+            "payload": {
+                "content": message.body,
+                "metadata": {
+                    "msg_id": message.msg_id,
+                    "conv_id": message.conv_id,
+                    "owner_id": message.owner_id,
+                    "user_id": user_id,
+                    "role": "user" if message.message_owner == MessageOwner.USER else "assistant",
+                    "timestamp": timestamp_str
+                }
+            },
+            "owner_id": message.owner_id,
+        }
 
     def determine_message_type(
         self, num_media: int, media_content_type: Optional[str]
@@ -206,9 +204,12 @@ class TwilioWebhookMessageHandler:
         correlation_id: str,
         is_error: bool = False,
         user_id: str | None = None,
+        extra_tasks: Optional[List[Dict[str, Any]]] = None,
     ):
         """
         Helper to persist response and enqueue sending task.
+        extra_tasks (QueueService.enqueue_many task dicts) are enqueued in the
+        same batch as the sending task.
         """
         try:
             # 1. Persist Outbound Message FIRST (Status: Pending)
@@ -245,23 +246,32 @@ class TwilioWebhookMessageHandler:
                 logger.error("Failed to persist outbound message", correlation_id=correlation_id)
                 return
 
-            # 2. Enqueue Sending Task
-            await self.queue_service.enqueue(
-                task_name="send_whatsapp_message",
-                payload={
+            # 2. Enqueue Sending Task, the outbound embedding and any
+            # caller tasks (e.g. inbound embedding) in one round-trip
+            tasks = [
+                {
+                    "task_name": "send_whatsapp_message",
+                    "payload": {
+                        "owner_id": owner_id,
+                        "msg_id": message.msg_id,
+                        "from_number": sender_number,
+                        "to_number": recipient_number,
+                        "body": body,
+                        "correlation_id": correlation_id,
+                    },
                     "owner_id": owner_id,
-                    "msg_id": message.msg_id,
-                    "from_number": sender_number,
-                    "to_number": recipient_number,
-                    "body": body,
                     "correlation_id": correlation_id,
-                },
-                owner_id=owner_id,
-                correlation_id=correlation_id
-            )
-            
-            # 3. Enqueue Embedding (Optimistic)
-            await self._enqueue_embedding(message)
+                    "partition_key": conversation_partition_key(
+                        sender_number, recipient_number
+                    ),
+                }
+            ]
+            embedding_task = self.build_embedding_task(message)
+            if embedding_task:
+                tasks.append(embedding_task)
+            tasks.extend(extra_tasks or [])
+
+            await self.queue_service.enqueue_many(tasks)
 
         except Exception as e:
             logger.error(
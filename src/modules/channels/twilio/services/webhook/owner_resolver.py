@@ -1,5 +1,8 @@
+from typing import Optional
+
 from fastapi import HTTPException
 from src.core.utils import get_logger
+from src.modules.billing.services.subscription_access_cache import SubscriptionAccessCache
 from src.modules.channels.twilio.models.domain import TwilioWhatsAppPayload
 from src.modules.channels.twilio.services.twilio_account_service import TwilioAccountService
 from src.modules.identity.services.identity_service import IdentityService
@@ -16,9 +19,11 @@ class TwilioWebhookOwnerResolver:
         self,
         twilio_account_service: TwilioAccountService,
         identity_service: IdentityService,
+        access_cache: Optional[SubscriptionAccessCache] = None,
     ):
         self.twilio_account_service = twilio_account_service
         self.identity_service = identity_service
+        self.access_cache = access_cache
 
     async def resolve_owner_id(self, payload: TwilioWhatsAppPayload) -> str:
         """
@@ -44,6 +49,15 @@ class TwilioWebhookOwnerResolver:
         """
         Validate if the owner has an active plan/access.
         """
-        return await run_in_threadpool(
+        if self.access_cache:
+            cached = await self.access_cache.get(owner_id)
+            if cached is not None:
+                return cached
+
+        has_access = await run_in_threadpool(
             self.identity_service.validate_owner_access, owner_id
         )
+
+        if self.access_cache:
+            await self.access_cache.set(owner_id, has_access)
+        return has_access
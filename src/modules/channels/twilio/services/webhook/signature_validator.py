@@ -0,0 +1,67 @@
+from typing import Dict, Optional, Tuple
+
+from twilio.request_validator import RequestValidator  # type: ignore[import-untyped]
+
+from src.core.cache import TTLCache
+from src.core.config import settings
+from src.core.utils import get_logger
+from src.modules.channels.twilio.services.twilio_account_service import TwilioAccountService
+
+logger = get_logger(__name__)
+
+
+class TwilioSignatureValidator:
+    """
+    Validates X-Twilio-Signature against the auth token of the account that
+    sent the webhook (AccountSid), falling back to the default token.
+
+    One RequestValidator is built per AccountSid and kept in
+    `validator_cache` (process-wide), so the token lookup happens once per
+    account per TTL rather than on every request.
+    """
+
+    def __init__(
+        self,
+        twilio_account_service: Optional[TwilioAccountService] = None,
+        validator_cache: Optional[TTLCache] = None,
+    ):
+        self.twilio_account_service = twilio_account_service
+        self.validator_cache = validator_cache if validator_cache is not None else TTLCache()
+
+    async def _auth_token(
+        self, account_sid: str, to_number: Optional[str]
+    ) -> Tuple[Optional[str], bool]:
+        """Token for account_sid and whether it may be cached."""
+        if account_sid and account_sid != settings.twilio.account_sid and self.twilio_account_service:
+            try:
+                account = await self.twilio_account_service.resolve_account(to_number, account_sid)
+            except Exception as e:
+                # Use the default token for now, but look the account up again next time
+                logger.warning("Could not resolve account for signature", error=str(e))
+                return settings.twilio.auth_token, False
+            # Resolution may fall back to another account; only its own token signs
+            if account and account.account_sid == account_sid and account.auth_token:
+                return account.auth_token, True
+        return settings.twilio.auth_token, True
+
+    async def get_validator(
+        self, account_sid: Optional[str], to_number: Optional[str] = None
+    ) -> Optional[RequestValidator]:
+        key = account_sid or ""
+        validator = self.validator_cache.get(key)
+        if validator is None:
+            token, cacheable = await self._auth_token(key, to_number)
+            if not token:
+                return None
+            validator = RequestValidator(token)
+            if cacheable:
+                self.validator_cache.set(key, validator)
+        return validator
+
+    async def validate(self, url: str, params: Dict[str, str], signature: str) -> bool:
+        """Check the signature of a webhook whose form body is `params`."""
+        validator = await self.get_validator(params.get("AccountSid"), params.get("To"))
+        if validator is None:
+            logger.warning("No auth token available for webhook validation")
+            return False
+        return validator.validate(url, params, signature)
@@ -1,69 +1,186 @@
+import fnmatch
+import hashlib
 import mimetypes
 import os
-from typing import Optional
+import tempfile
+from dataclasses import dataclass
+from typing import List, Optional
 
-import requests
+import httpx
 
 from src.core.config import settings
 from src.core.utils import get_logger
+from src.modules.conversation.components.conversation_finder import \
+    ConversationFinder
 
 logger = get_logger(__name__)
 
+CHUNK_SIZE = 64 * 1024
 
-def download_media(media_type: str, media_url: str) -> Optional[str]:
+# Shared across downloads so connections to Twilio/S3 are kept alive
+_media_client: Optional[httpx.AsyncClient] = None
+
+
+@dataclass
+class DownloadedMedia:
+    """Media file streamed to disk."""
+
+    path: str
+    content_type: str
+    size: int
+    digest: Optional[str] = None
+
+
+def conversation_partition_key(
+    from_number: Optional[str],
+    to_number: Optional[str],
+    stage: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Queue partition key for a conversation: its session key, so every task of
+    one chat is processed in order while different chats run in parallel.
+    A stage (e.g. "ai") gives that step its own ordered partition, so it
+    does not hold up the conversation's other tasks.
+    """
+    if not from_number or not to_number:
+        return None
+    key = ConversationFinder.calculate_session_key(from_number, to_number)
+    return f"{key}#{stage}" if stage else key
+
+
+def get_media_client() -> httpx.AsyncClient:
+    """Pooled client used for media downloads (created on first use)."""
+    global _media_client
+    if _media_client is None or _media_client.is_closed:
+        _media_client = httpx.AsyncClient(
+            timeout=settings.twilio.media_download_timeout_seconds,
+            follow_redirects=True,  # Twilio media redirects to its CDN
+        )
+    return _media_client
+
+
+async def close_media_client() -> None:
+    global _media_client
+    if _media_client is not None:
+        await _media_client.aclose()
+        _media_client = None
+
+
+def _guess_extension(media_type: str) -> str:
+    ext = mimetypes.guess_extension(media_type)
+    if not ext:
+        # Fallback simples
+        parts = media_type.split("/")
+        ext = f".{parts[-1]}" if len(parts) > 1 else ""
+    return ext
+
+
+def _is_allowed(content_type: str, allowed_types: List[str]) -> bool:
+    return any(fnmatch.fnmatch(content_type, pattern) for pattern in allowed_types)
+
+
+async def fetch_media(
+    media_type: str,
+    media_url: str,
+    max_bytes: Optional[int] = None,
+    allowed_types: Optional[List[str]] = None,
+    hash_algorithm: Optional[str] = None,
+    client: Optional[httpx.AsyncClient] = None,
+) -> Optional[DownloadedMedia]:
+    """
+    Stream Twilio media to a unique file in the download directory.
+
+    The body is written in chunks (constant memory). Downloads over
+    `max_bytes` or whose Content-Type is not in `allowed_types` (glob
+    patterns such as "audio/*") are rejected and any partial file is removed.
+    When `hash_algorithm` is given (e.g. "sha256"), the hex digest of the
+    content is computed while streaming.
+
+    Returns:
+        DownloadedMedia or None if the download failed or was rejected
+    """
+    max_bytes = settings.twilio.media_max_bytes if max_bytes is None else max_bytes
+    allowed_types = (
+        settings.twilio.media_allowed_types if allowed_types is None else allowed_types
+    )
+
+    # Tenta pegar credenciais das settings, fallback para env vars
+    account_sid = settings.twilio.account_sid or os.environ.get("TWILIO_ACCOUNT_SID")
+    auth_token = settings.twilio.auth_token or os.environ.get("TWILIO_AUTH_TOKEN")
+
+    if not account_sid or not auth_token:
+        logger.warning("Twilio credentials missing. Cannot download media.")
+        return None
+
+    client = client or get_media_client()
+    filepath = None
+    try:
+        async with client.stream(
+            "GET", media_url, auth=(account_sid, auth_token)
+        ) as response:
+            # Verificar se o download foi bem-sucedido
+            response.raise_for_status()
+
+            content_type = (
+                response.headers.get("Content-Type", media_type).split(";")[0].strip()
+                or media_type
+            )
+            if allowed_types and not _is_allowed(content_type, allowed_types):
+                logger.warning(
+                    "Media type not allowed", content_type=content_type, media_url=media_url
+                )
+                return None
+
+            declared_size = int(response.headers.get("Content-Length") or 0)
+            if max_bytes and declared_size > max_bytes:
+                logger.warning(
+                    "Media too large", size=declared_size, max_bytes=max_bytes, media_url=media_url
+                )
+                return None
+
+            download_dir = settings.twilio.media_download_dir
+            os.makedirs(download_dir, exist_ok=True)
+            # Unique name so concurrent downloads never collide
+            fd, filepath = tempfile.mkstemp(
+                prefix="media_", suffix=_guess_extension(media_type), dir=download_dir
+            )
+
+            hasher = hashlib.new(hash_algorithm) if hash_algorithm else None
+            size = 0
+            with os.fdopen(fd, "wb") as f:
+                async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                    size += len(chunk)
+                    if max_bytes and size > max_bytes:
+                        raise ValueError(f"Media exceeds {max_bytes} bytes")
+                    if hasher:
+                        hasher.update(chunk)
+                    f.write(chunk)
+
+        logger.info(f"Media saved to {filepath}", size=size)
+        return DownloadedMedia(
+            path=filepath,
+            content_type=content_type,
+            size=size,
+            digest=hasher.hexdigest() if hasher else None,
+        )
+
+    except Exception as e:
+        logger.error(f"Error downloading media: {e}")
+        if filepath and os.path.exists(filepath):
+            os.remove(filepath)
+        return None
+
+
+async def download_media(media_type: str, media_url: str) -> Optional[str]:
     """
     Baixa o media do Twilio.
-    
+
     Args:
         media_type: Content-Type da mídia (ex: image/jpeg)
         media_url: URL para download
-        
+
     Returns:
         Caminho do arquivo salvo ou None se falhar
     """
-    try:
-        # Tenta pegar credenciais das settings, fallback para env vars
-        account_sid = settings.twilio.account_sid or os.environ.get("TWILIO_ACCOUNT_SID")
-        auth_token = settings.twilio.auth_token or os.environ.get("TWILIO_AUTH_TOKEN")
-        
-        if not account_sid or not auth_token:
-            logger.warning("Twilio credentials missing. Cannot download media.")
-            return None
-
-        auth = (account_sid, auth_token)
-        media_response = requests.get(media_url, auth=auth, timeout=50)
-
-        # Verificar se o download foi bem-sucedido
-        media_response.raise_for_status()
-
-        # Determinar extensão
-        ext = mimetypes.guess_extension(media_type)
-        if not ext:
-            # Fallback simples
-            parts = media_type.split("/")
-            ext = f".{parts[-1]}" if len(parts) > 1 else ""
-
-        # Nome do arquivo
-        original_name = media_url.split("/")[-1]
-        # Limpar query params se existirem
-        if "?" in original_name:
-            original_name = original_name.split("?")[0]
-        
-        filename = f"{original_name}{ext}" if not original_name.endswith(ext) else original_name
-
-        # Diretório de downloads
-        download_dir = "downloads"
-        os.makedirs(download_dir, exist_ok=True)
-        
-        filepath = os.path.join(download_dir, filename)
-
-        # Salvar localmente
-        with open(filepath, "wb") as f:
-            f.write(media_response.content)
-
-        logger.info(f"Media saved to {filepath}")
-        return filepath
-        
-    except Exception as e:
-        logger.error(f"Error downloading media: {e}")
-        return None
+    media = await fetch_media(media_type, media_url)
+    return media.path if media else None
@@ -1,7 +1,10 @@
 import asyncio
-from typing import Any, Dict
+from functools import partial
+from typing import Any, Dict, Optional
 
+from src.core.ratelimit import RateLimiter
 from src.core.utils.logging import get_logger
+from src.modules.channels.twilio.exceptions import TwilioRateLimitError
 from src.modules.channels.twilio.services.twilio_service import TwilioService
 from src.modules.conversation.repositories.message_repository import MessageRepository
 
@@ -19,9 +22,13 @@ class TwilioOutboundWorker:
         self,
         twilio_service: TwilioService,
         message_repo: MessageRepository,
+        rate_limiter: Optional[RateLimiter] = None,
     ):
         self.twilio_service = twilio_service
         self.message_repo = message_repo
+        # Token bucket per (owner_id, from_number): sends wait for their turn
+        # instead of hitting Twilio's per-sender limits and retrying
+        self.rate_limiter = rate_limiter
 
     async def handle_send_message_task(self, task_payload: Dict[str, Any]):
         """
@@ -59,29 +66,55 @@ class TwilioOutboundWorker:
             correlation_id=correlation_id
         )
 
+        rate_key = f"{owner_id}:{from_number}"
+
+        # One token per Twilio request, i.e. per chunk of a long body
+        throttle = (
+            partial(self._throttle, self.rate_limiter, rate_key, msg_id)
+            if self.rate_limiter
+            else None
+        )
+
         try:
-            # 1. Send via Twilio API
-            response = await self.twilio_service.send_message(
-                owner_id=owner_id,
-                from_number=from_number,
-                to_number=to_number,
-                body=body,
+            existing_message = (
+                await self.message_repo.find_by_id(msg_id, id_column="msg_id")
+                if msg_id
+                else None
             )
+            existing_metadata = (
+                dict(existing_message.metadata) if existing_message and existing_message.metadata else {}
+            )
+            # Chunks delivered by an earlier attempt that hit a 429 midway
+            start_chunk = int(existing_metadata.get("chunks_sent") or 0)
+
+            # 1. Send via Twilio API, at the sender's allowed rate
+            try:
+                response = await self.twilio_service.send_message(
+                    owner_id=owner_id,
+                    from_number=from_number,
+                    to_number=to_number,
+                    body=body,
+                    start_chunk=start_chunk,
+                    before_chunk=throttle,
+                )
+            except TwilioRateLimitError as e:
+                # Slow this sender down for every worker sharing the limiter
+                if self.rate_limiter:
+                    await self.rate_limiter.penalize(rate_key, e.retry_after)
+                if msg_id and e.sent_chunks > start_chunk:
+                    await self._record_partial_send(msg_id, existing_metadata, e)
+                raise
             
             # Log the type of response to debug
             logger.info(f"DEBUG: send_message returned type={type(response)}")
 
             # 2. Update Message Status in DB (if persisted message exists)
             if msg_id and response:
-                existing_message = await self.message_repo.find_by_id(
-                    msg_id, id_column="msg_id"
-                )
-                existing_metadata = (
-                    dict(existing_message.metadata) if existing_message and existing_message.metadata else {}
-                )
+                existing_metadata.pop("chunks_sent", None)
                 existing_metadata.update(
                     {
-                        "message_sid": response.sid,
+                        # A resumed send keeps the SID of its first chunk
+                        "message_sid": existing_metadata.get("message_sid") if start_chunk else response.sid,
                         "status": response.status,
                         "num_media": response.num_media,
                         "delivery_status": "sent",
@@ -111,3 +144,31 @@ class TwilioOutboundWorker:
             )
             # Depending on queue configuration, this might retry automatically.
             raise
+
+    async def _throttle(
+        self, rate_limiter: RateLimiter, rate_key: str, msg_id: Optional[str]
+    ) -> None:
+        """Wait for the sender's next token before a Twilio request."""
+        waited = await rate_limiter.acquire(rate_key)
+        if waited > 1:
+            logger.info("Outbound send throttled", msg_id=msg_id, waited=round(waited, 2))
+
+    async def _record_partial_send(
+        self, msg_id: str, metadata: Dict[str, Any], error: TwilioRateLimitError
+    ) -> None:
+        """Remember how many chunks went out so the retry does not resend them."""
+        metadata = dict(metadata)
+        metadata["chunks_sent"] = error.sent_chunks
+        if error.first_sid and not metadata.get("message_sid"):
+            metadata["message_sid"] = error.first_sid
+
+        await self.message_repo.update(
+            id_value=msg_id,
+            data={"metadata": metadata},
+            id_column="msg_id",
+        )
+        logger.warning(
+            "Outbound message rate limited midway",
+            msg_id=msg_id,
+            chunks_sent=error.sent_chunks,
+        )
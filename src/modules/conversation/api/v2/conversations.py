@@ -2,10 +2,13 @@
 API routes for conversation management (V2).
 """
 
+import base64
+import json
 from typing import List, Optional
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from src.core.di.container import Container
@@ -16,6 +19,8 @@ from src.modules.conversation.dtos.conversation_dto import \
 from src.modules.conversation.dtos.message_dto import MessageCreateDTO
 from src.modules.conversation.enums.conversation_status import \
     ConversationStatus
+from src.modules.conversation.repositories.message_repository import (
+    MessageCursor, message_cursor)
 from src.modules.conversation.services.conversation_service import \
     ConversationService
 
@@ -66,6 +71,23 @@ class ConversationListResponse(BaseModel):
     total: int
 
 
+def encode_message_cursor(timestamp: Optional[datetime], msg_id: str) -> str:
+    """Opaque page cursor for the message after (timestamp, msg_id)."""
+    raw = f"{timestamp.isoformat() if timestamp else ''}|{msg_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_message_cursor(cursor: str) -> MessageCursor:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        timestamp, msg_id = raw.split("|", 1)
+        if not msg_id:
+            raise ValueError("Cursor without msg_id")
+        return (datetime.fromisoformat(timestamp) if timestamp else None), msg_id
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 @router.post("/", response_model=ConversationResponse, status_code=201)
 @inject
 async def create_conversation(
@@ -138,14 +160,23 @@ async def list_conversations(
 @inject
 async def get_conversation_messages(
     conv_id: str,
+    response: Response,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(
+        None, description="X-Next-Cursor of the previous page (replaces offset)"
+    ),
     owner_id: str = Depends(get_current_owner_id),
     service: ConversationService = Depends(
         Provide[Container.conversation_service]
     ),
 ):
-    """Get messages from a conversation (V2)."""
+    """
+    Get messages from a conversation (V2), oldest first.
+    A full page sets the X-Next-Cursor header; pass it back as `cursor`.
+    """
+    after = decode_message_cursor(cursor) if cursor else None
+
     # Verify conversation exists
     conversation = await service.get_conversation_by_id(conv_id)
     if not conversation:
@@ -154,11 +185,43 @@ async def get_conversation_messages(
     if conversation.owner_id != owner_id:
         raise HTTPException(status_code=403, detail="Not authorized to access this conversation")
 
-    messages = await service.get_conversation_messages(conv_id, limit, offset)
+    if after is not None:
+        messages = await service.get_conversation_messages(conv_id, limit, after=after)
+    else:
+        messages = await service.get_conversation_messages(conv_id, limit, offset)
+
+    if len(messages) == limit:
+        response.headers["X-Next-Cursor"] = encode_message_cursor(
+            *message_cursor(messages[-1])
+        )
 
     return [MessageResponse.model_validate(m) for m in messages]
 
 
+@router.get("/{conv_id}/messages/export")
+@inject
+async def export_conversation_messages(
+    conv_id: str,
+    owner_id: str = Depends(get_current_owner_id),
+    service: ConversationService = Depends(
+        Provide[Container.conversation_service]
+    ),
+):
+    """Stream the whole message history as NDJSON, one message per line (V2)."""
+    conversation = await service.get_conversation_by_id(conv_id)
+    if not conversation:
+        raise HTTPException(status_code=404, detail="Conversation not found")
+
+    if conversation.owner_id != owner_id:
+        raise HTTPException(status_code=403, detail="Not authorized to access this conversation")
+
+    async def ndjson():
+        async for row in service.stream_conversation_messages(conv_id):
+            yield json.dumps(row, default=str) + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 @router.post("/{conv_id}/messages", response_model=MessageResponse, status_code=201)
 @inject
 async def add_message(
@@ -26,7 +26,8 @@ class ConversationFinder:
     def __init__(self, repository: ConversationRepository):
         self.repository = repository
 
-    def calculate_session_key(self, number1: str, number2: str) -> str:
+    @staticmethod
+    def calculate_session_key(number1: str, number2: str) -> str:
         """
         Calculate session key for two phone numbers.
         The session key is always the same regardless of order.
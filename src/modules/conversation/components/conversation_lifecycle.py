@@ -4,7 +4,7 @@ Responsible for state transitions and expiration management.
 """
 
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import List, Optional
 
 from src.core.utils import get_logger
 from src.core.utils.exceptions import ConcurrencyError
@@ -66,8 +66,16 @@ class ConversationLifecycle:
         ConversationStatus.FAILED: [],
     }
 
-    def __init__(self, repository: ConversationRepository):
+    def __init__(
+        self,
+        repository: ConversationRepository,
+        bulk_sweeps: bool = False,
+        sweep_max_batches: int = 50,
+    ):
         self.repository = repository
+        # Expiration/idle sweeps use repository.bulk_transition (set-based)
+        self.bulk_sweeps = bulk_sweeps
+        self.sweep_max_batches = sweep_max_batches
 
     def _is_valid_transition(
         self, from_status: ConversationStatus, to_status: ConversationStatus
@@ -288,11 +296,66 @@ class ConversationLifecycle:
         
         return updated
 
+    async def _sweep(
+        self,
+        from_statuses: List[ConversationStatus],
+        to_status: ConversationStatus,
+        before_column: str,
+        before: datetime,
+        reason: str,
+        batch_size: int,
+    ) -> int:
+        """
+        Transition matching conversations in set-based batches of batch_size,
+        paging by conv_id, until a short batch or sweep_max_batches.
+        """
+        processed = 0
+        after_conv_id = None
+        for _ in range(self.sweep_max_batches):
+            conv_ids = await self.repository.bulk_transition(
+                from_statuses=from_statuses,
+                to_status=to_status,
+                before_column=before_column,
+                before=before,
+                reason=reason,
+                limit=batch_size,
+                after_conv_id=after_conv_id,
+            )
+            processed += len(conv_ids)
+            if len(conv_ids) < batch_size:
+                break
+            after_conv_id = conv_ids[-1]
+
+        logger.info(
+            "Sweep completed",
+            to_status=to_status.value,
+            reason=reason,
+            processed=processed,
+        )
+        return processed
+
     async def process_expirations(self, limit: int = 100) -> int:
         """
         Process expired conversations.
-        Returns count of processed items.
+        Returns count of processed items. With bulk sweeps, `limit` is the
+        batch size and the whole backlog is swept.
         """
+        if self.bulk_sweeps:
+            # Active statuses that may expire (HUMAN_HANDOFF may not)
+            from_statuses = [
+                s
+                for s in ConversationStatus.active_statuses()
+                if self._is_valid_transition(s, ConversationStatus.EXPIRED)
+            ]
+            return await self._sweep(
+                from_statuses,
+                ConversationStatus.EXPIRED,
+                "expires_at",
+                datetime.now(timezone.utc),
+                "ttl_expired",
+                limit,
+            )
+
         candidates = await self.repository.find_expired_candidates(limit=limit)
         processed = 0
 
@@ -325,6 +388,17 @@ class ConversationLifecycle:
         Process idle conversations (move from PROGRESS to IDLE_TIMEOUT).
         """
         threshold = datetime.now(timezone.utc) - timedelta(minutes=idle_minutes)
+        if self.bulk_sweeps:
+            # Only PROGRESS goes to IDLE_TIMEOUT; PENDING waits for expiration
+            return await self._sweep(
+                [ConversationStatus.PROGRESS],
+                ConversationStatus.IDLE_TIMEOUT,
+                "updated_at",
+                threshold,
+                "inactivity_timeout",
+                limit,
+            )
+
         candidates = await self.repository.find_idle_candidates(
             threshold, limit=limit
         )
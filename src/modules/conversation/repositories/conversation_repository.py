@@ -1,10 +1,13 @@
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Union
 
+from src.core.utils import get_logger
 from src.modules.conversation.enums.conversation_status import ConversationStatus
 from src.modules.conversation.models.conversation import Conversation
 
+logger = get_logger(__name__)
+
 
 class ConversationRepository(ABC):
     """
@@ -146,3 +149,63 @@ class ConversationRepository(ABC):
     async def find_expired_conversations(self, limit: int = 100) -> List[Conversation]:
         """Find expired conversations (alias for find_expired_candidates)."""
         return await self.find_expired_candidates(limit)
+
+    async def bulk_transition(
+        self,
+        *,
+        from_statuses: List[ConversationStatus],
+        to_status: ConversationStatus,
+        before_column: str,
+        before: datetime,
+        reason: str,
+        limit: int = 100,
+        after_conv_id: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Transition up to `limit` conversations in one of from_statuses whose
+        before_column is older than `before`, recording their history.
+        Returns the transitioned conv_ids in order; pass the last one as
+        after_conv_id to continue.
+
+        Default implementation: fetch a page of find_expired_candidates
+        (expires_at, cut off at now) or find_idle_candidates (updated_at) and
+        call update_status per row. Transitioned
+        rows stop matching, so after_conv_id is not needed to make progress.
+        Set-based backends should override it.
+        """
+        if before_column == "expires_at":
+            candidates = await self.find_expired_candidates(limit=limit)
+        elif before_column == "updated_at":
+            candidates = await self.find_idle_candidates(before.isoformat(), limit=limit)
+        else:
+            raise ValueError(f"Unsupported sweep column: {before_column}")
+
+        statuses = {s.value for s in from_statuses}
+        ended_at = (
+            datetime.now(timezone.utc)
+            if to_status in ConversationStatus.closed_statuses()
+            else None
+        )
+        transitioned: List[str] = []
+        for conv in sorted(candidates, key=lambda c: c.conv_id or ""):
+            # The finders already applied the time cutoff
+            if conv.status not in statuses:
+                continue
+            try:
+                updated = await self.update_status(
+                    conv.conv_id,
+                    to_status,
+                    initiated_by="system",
+                    reason=reason,
+                    ended_at=ended_at,
+                )
+            except Exception as e:
+                logger.warning(
+                    "Bulk transition skipped conversation",
+                    conv_id=conv.conv_id,
+                    error=str(e),
+                )
+                continue
+            if updated:
+                transitioned.append(conv.conv_id)
+        return transitioned
@@ -190,6 +190,75 @@ class PostgresConversationRepository(PostgresAsyncRepository[Conversation], Conv
         rows = await self._execute_query(query, (statuses, threshold_dt, limit), fetch_all=True)
         return [self.model_class(**r) for r in rows]
 
+    # Sweep columns accepted by bulk_transition
+    BULK_TRANSITION_COLUMNS = ("expires_at", "updated_at")
+
+    async def bulk_transition(
+        self,
+        *,
+        from_statuses: List[ConversationStatus],
+        to_status: ConversationStatus,
+        before_column: str,
+        before: datetime,
+        reason: str,
+        limit: int = 100,
+        after_conv_id: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Set-based transition: one statement locks a page of candidates in
+        conv_id order (skipping rows locked by in-flight transitions),
+        updates them and inserts their history rows.
+        """
+        if before_column not in self.BULK_TRANSITION_COLUMNS:
+            raise ValueError(f"Unsupported sweep column: {before_column}")
+
+        query = self._compile(
+            ("bulk_transition", before_column),
+            lambda: sql.SQL(
+                "WITH batch AS ("
+                " SELECT conv_id, status, context FROM conversations"
+                " WHERE status = ANY(%s) AND {} < %s AND conv_id > %s"
+                " ORDER BY conv_id"
+                " LIMIT %s"
+                " FOR UPDATE SKIP LOCKED"
+                "), updated AS ("
+                " UPDATE conversations c"
+                " SET status = %s, updated_at = %s,"
+                " ended_at = COALESCE(%s, c.ended_at),"
+                " version = c.version + 1"
+                " FROM batch"
+                " WHERE c.conv_id = batch.conv_id"
+                " RETURNING c.conv_id, batch.status AS previous_status, batch.context AS previous_context"
+                "), history AS ("
+                " INSERT INTO conversation_state_history"
+                " (conv_id, from_status, to_status, changed_by, reason, metadata)"
+                " SELECT conv_id, previous_status, %s, 'system', %s,"
+                " jsonb_build_object("
+                "'timestamp', %s::text, 'original_initiated_by', 'system', 'context', previous_context"
+                ")"
+                " FROM updated"
+                ") "
+                "SELECT conv_id FROM updated ORDER BY conv_id"
+            ).format(self._id(before_column)),
+        )
+
+        now = datetime.now(timezone.utc)
+        ended_at = now if to_status in ConversationStatus.closed_statuses() else None
+        params = (
+            [s.value for s in from_statuses],
+            before,
+            after_conv_id or "",
+            limit,
+            to_status.value,
+            now,
+            ended_at,
+            to_status.value,
+            reason,
+            now.isoformat(),
+        )
+        rows = await self._execute_query(query, params, fetch_all=True)
+        return [row["conv_id"] for row in rows]
+
     async def cleanup_expired_conversations(self, limit: int = 100) -> int:
         processed = 0
         candidates = await self.find_expired_candidates(limit)
@@ -280,6 +349,33 @@ class PostgresConversationRepository(PostgresAsyncRepository[Conversation], Conv
         data = {"updated_at": datetime.now(timezone.utc)}
         return await self.update(conv_id, data, id_column="conv_id")
 
+    # One round trip: read the current row, apply the transition only if its
+    # version is unchanged (optimistic lock, re-checked under the row lock),
+    # and record the history row from the UPDATE's RETURNING.
+    UPDATE_STATUS_SQL = sql.SQL(
+        "WITH snapshot AS ("
+        " SELECT conv_id, status, version, context FROM conversations WHERE conv_id = %s"
+        "), updated AS ("
+        " UPDATE conversations c"
+        " SET status = %s, updated_at = %s,"
+        " ended_at = COALESCE(%s, c.ended_at),"
+        " expires_at = COALESCE(%s, c.expires_at),"
+        " version = c.version + 1"
+        " FROM snapshot"
+        " WHERE c.conv_id = snapshot.conv_id AND c.version = snapshot.version"
+        " RETURNING c.*, snapshot.status AS previous_status, snapshot.context AS previous_context"
+        "), history AS ("
+        " INSERT INTO conversation_state_history"
+        " (conv_id, from_status, to_status, changed_by, reason, metadata)"
+        " SELECT conv_id, previous_status, status, %s, %s,"
+        " jsonb_build_object("
+        "'timestamp', %s::text, 'original_initiated_by', %s::text, 'context', previous_context"
+        ")"
+        " FROM updated"
+        ") "
+        "SELECT * FROM updated"
+    )
+
     async def update_status(
         self,
         conv_id: str,
@@ -291,63 +387,39 @@ class PostgresConversationRepository(PostgresAsyncRepository[Conversation], Conv
         expires_at: Optional[datetime] = None,
         force: bool = False,
     ) -> Optional[Conversation]:
-        current = await self.find_by_id(conv_id, id_column="conv_id")
-        if not current:
-            return None
-
-        from_status = ConversationStatus(current.status)
         to_status = (
             status if isinstance(status, ConversationStatus) else ConversationStatus(status)
         )
+        now = datetime.now(timezone.utc)
+        if not ended_at and to_status in ConversationStatus.closed_statuses():
+            ended_at = now
+        changed_by = (
+            initiated_by
+            if initiated_by in {"agent", "support", "user", "system"}
+            else "system"
+        )
 
-        update_data: Dict[str, Any] = {
-            "status": to_status.value,
-            "updated_at": datetime.now(timezone.utc),
-        }
-        if ended_at or to_status in ConversationStatus.closed_statuses():
-            update_data["ended_at"] = (
-                ended_at or datetime.now(timezone.utc)
-            )
-        if expires_at:
-            update_data["expires_at"] = expires_at
-
-        updated = await self.update(
+        params = (
             conv_id,
-            update_data,
-            id_column="conv_id",
-            current_version=current.version,
+            to_status.value,
+            now,
+            ended_at,
+            expires_at,
+            changed_by,
+            reason,
+            now.isoformat(),
+            initiated_by,
         )
-        if updated:
-            try:
-                changed_by = (
-                    initiated_by
-                    if initiated_by in {"agent", "support", "user", "system"}
-                    else "system"
-                )
-                await self._log_history(
-                    conv_id=conv_id,
-                    from_status=from_status.value,
-                    to_status=to_status.value,
-                    changed_by=changed_by,
-                    reason=reason,
-                    metadata={
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                        "original_initiated_by": initiated_by,
-                        "context": current.context,
-                    },
-                )
-            except Exception as e:
-                logger.error(
-                    "Failed to write conversation state history",
-                    conv_id=conv_id,
-                    error=str(e),
-                )
-            return updated
+        result = await self._execute_query(self.UPDATE_STATUS_SQL, params, fetch_one=True)
+        if result:
+            return self.model_class(**result)
 
+        # Nothing updated: the conversation is gone, or its version changed
+        # between the read and the update
         after = await self.find_by_id(conv_id, id_column="conv_id")
-        if after and after.version != current.version:
+        if after:
             raise ConcurrencyError(
-                f"Expected version {current.version}, found {after.version}",
+                f"Conversation {conv_id} was modified concurrently (version {after.version})",
                 current_version=after.version,
             )
         return None
@@ -1,5 +1,6 @@
 import json
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from psycopg2 import sql
 # from psycopg2.extras import Json, RealDictCursor # Removed
@@ -10,7 +11,10 @@ from src.core.utils import get_logger
 from src.core.utils.exceptions import DuplicateError
 from src.modules.conversation.enums.message_owner import MessageOwner
 from src.modules.conversation.models.message import Message
-from src.modules.conversation.repositories.message_repository import MessageRepository
+from src.modules.conversation.repositories.message_repository import (
+    MessageCursor,
+    MessageRepository,
+)
 
 logger = get_logger(__name__)
 
@@ -33,16 +37,99 @@ class PostgresMessageRepository(PostgresAsyncRepository[Message], MessageReposit
             raise
 
     async def find_by_conversation(
-        self, conv_id: str, limit: int = 100, offset: int = 0
+        self,
+        conv_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[MessageCursor] = None,
     ) -> List[Message]:
+        rows = await self._fetch_page(conv_id, limit, offset, after)
+        return [self.model_class(**r) for r in rows]
+
+    async def _fetch_page(
+        self,
+        conv_id: str,
+        limit: int,
+        offset: int = 0,
+        after: Optional[MessageCursor] = None,
+    ) -> List[Dict[str, Any]]:
+        if after is not None and after[0] is None:
+            # Past the last timestamped message: only the NULL tail is left
+            return await self._fetch_null_tail(conv_id, limit, after[1])
+
+        if after is None:
+            query = sql.SQL(
+                "SELECT * FROM messages WHERE conv_id = %s "
+                "ORDER BY timestamp ASC, msg_id ASC "
+                "LIMIT %s OFFSET %s"
+            )
+            return await self._execute_query(query, (conv_id, limit, offset), fetch_all=True)
+
+        # Keyset: a plain row comparison is an index range on
+        # idx_messages_conv_ts_id, so deep pages cost the same as the first
         query = sql.SQL(
             "SELECT * FROM messages WHERE conv_id = %s "
-            "ORDER BY timestamp ASC "
-            "LIMIT %s OFFSET %s"
+            "AND (timestamp, msg_id) > (%s, %s) "
+            "ORDER BY timestamp ASC, msg_id ASC "
+            "LIMIT %s"
         )
-        
-        rows = await self._execute_query(query, (conv_id, limit, offset), fetch_all=True)
-        return [self.model_class(**r) for r in rows]
+        rows = await self._execute_query(
+            query, (conv_id, after[0], after[1], limit), fetch_all=True
+        )
+        if len(rows) < limit:
+            # Timestamped messages ran out; NULL timestamps sort after them
+            rows = list(rows) + await self._fetch_null_tail(conv_id, limit - len(rows))
+        return rows
+
+    async def _fetch_null_tail(
+        self, conv_id: str, limit: int, after_msg_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Messages without a timestamp, by msg_id (optionally after after_msg_id)."""
+        if after_msg_id is None:
+            query = sql.SQL(
+                "SELECT * FROM messages WHERE conv_id = %s "
+                "AND timestamp IS NULL "
+                "ORDER BY msg_id ASC "
+                "LIMIT %s"
+            )
+            params: tuple = (conv_id, limit)
+        else:
+            query = sql.SQL(
+                "SELECT * FROM messages WHERE conv_id = %s "
+                "AND timestamp IS NULL AND msg_id > %s "
+                "ORDER BY msg_id ASC "
+                "LIMIT %s"
+            )
+            params = (conv_id, after_msg_id, limit)
+        return await self._execute_query(query, params, fetch_all=True)
+
+    async def stream_by_conversation(
+        self, conv_id: str, batch_size: int = 500
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream raw rows page by page (one short keyset query per batch_size
+        rows), so memory stays flat however long the conversation is and no
+        connection or transaction is held while the client reads.
+        """
+        after: Optional[MessageCursor] = None
+        while True:
+            rows = await self._fetch_page(conv_id, batch_size, after=after)
+            for row in rows:
+                yield self._export_row(row)
+            if len(rows) < batch_size:
+                return
+            after = (rows[-1]["timestamp"], rows[-1]["msg_id"])
+
+    @staticmethod
+    def _export_row(row: Any) -> Dict[str, Any]:
+        """Raw row as a JSON-ready dict (no model validation)."""
+        data = dict(row)
+        for key, value in data.items():
+            if isinstance(value, datetime):
+                data[key] = value.isoformat()
+        if isinstance(data.get("metadata"), str):
+            data["metadata"] = json.loads(data["metadata"])
+        return data
 
     async def count_by_conversation(self, conv_id: str) -> int:
         query = sql.SQL("SELECT COUNT(*) as count FROM messages WHERE conv_id = %s")
@@ -12,7 +12,10 @@ from src.core.utils import get_logger
 from src.core.utils.exceptions import DuplicateError
 from src.modules.conversation.enums.message_owner import MessageOwner
 from src.modules.conversation.models.message import Message
-from src.modules.conversation.repositories.message_repository import MessageRepository
+from src.modules.conversation.repositories.message_repository import (
+    MessageCursor,
+    MessageRepository,
+)
 
 logger = get_logger(__name__)
 
@@ -76,23 +79,61 @@ class SupabaseMessageRepository(SupabaseRepository[Message], MessageRepository):
         return await run_in_threadpool(_create)
 
     async def find_by_conversation(
-        self, conv_id: str, limit: int = 100, offset: int = 0
+        self,
+        conv_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[MessageCursor] = None,
     ) -> List[Message]:
         """
         Find messages by conversation ID.
+        With `after`, returns the messages following that (timestamp, msg_id).
         """
+        def _select():
+            return self.client.table(self.table_name).select("*").eq("conv_id", conv_id)
+
+        def _null_tail(count: int, after_msg_id: Optional[str] = None) -> List[Dict[str, Any]]:
+            query = _select().is_("timestamp", "null")
+            if after_msg_id is not None:
+                query = query.gt("msg_id", after_msg_id)
+            return query.order("msg_id", desc=False).limit(count).execute().data
+
         def _find():
             try:
-                result = (
-                    self.client.table(self.table_name)
-                    .select("*")
-                    .eq("conv_id", conv_id)
-                    .order("timestamp", desc=False)
-                    .range(offset, offset + limit - 1)
-                    .execute()
-                )
-
-                return [self.model_class(**item) for item in result.data]
+                if after is not None and after[0] is None:
+                    # Past the last timestamped message: only the NULL tail is left
+                    rows = _null_tail(limit, after[1])
+                elif after is not None:
+                    # PostgREST has no row comparison; the separate gte bound
+                    # (and no NULL branch) keeps this an index range scan
+                    timestamp, msg_id = after[0].isoformat(), after[1]
+                    rows = (
+                        _select()
+                        .gte("timestamp", timestamp)
+                        .or_(
+                            f'timestamp.gt."{timestamp}",'
+                            f'and(timestamp.eq."{timestamp}",msg_id.gt.{msg_id})'
+                        )
+                        .order("timestamp", desc=False)
+                        .order("msg_id", desc=False)
+                        .limit(limit)
+                        .execute()
+                        .data
+                    )
+                    if len(rows) < limit:
+                        # Timestamped messages ran out; NULL timestamps sort after them
+                        rows = list(rows) + _null_tail(limit - len(rows))
+                else:
+                    rows = (
+                        _select()
+                        .order("timestamp", desc=False)
+                        .order("msg_id", desc=False)
+                        .range(offset, offset + limit - 1)
+                        .execute()
+                        .data
+                    )
+
+                return [self.model_class(**item) for item in rows]
             except Exception as e:
                 logger.error("Error finding messages by conversation", error=str(e))
                 raise
@@ -1,8 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from src.modules.conversation.models.message import Message
 
+# Keyset position in a conversation: (timestamp, msg_id) of the last message
+# seen. Messages without a timestamp sort after all others (NULLS LAST).
+MessageCursor = Tuple[Optional[datetime], str]
+
+
+def message_cursor(message: Message) -> MessageCursor:
+    """Keyset position right after a stored message."""
+    if message.msg_id is None:
+        raise ValueError("Cannot page after a message without msg_id")
+    return message.timestamp, message.msg_id
+
 
 class MessageRepository(ABC):
     """
@@ -33,9 +45,17 @@ class MessageRepository(ABC):
 
     @abstractmethod
     async def find_by_conversation(
-        self, conv_id: str, limit: int = 100, offset: int = 0
+        self,
+        conv_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[MessageCursor] = None,
     ) -> List[Message]:
-        """Find messages by conversation ID."""
+        """
+        Find messages by conversation ID, ordered by (timestamp, msg_id).
+        With `after`, returns the messages following that position (keyset
+        pagination; offset is ignored).
+        """
         pass
 
     @abstractmethod
@@ -59,3 +79,20 @@ class MessageRepository(ABC):
     async def count_by_conversation(self, conv_id: str) -> int:
         """Count messages in a conversation."""
         pass
+
+    async def stream_by_conversation(
+        self, conv_id: str, batch_size: int = 500
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield every message of a conversation as a JSON-ready dict, oldest
+        first. Pages with find_by_conversation(after=...); backends with
+        server-side cursors override this.
+        """
+        after: Optional[MessageCursor] = None
+        while True:
+            page = await self.find_by_conversation(conv_id, batch_size, after=after)
+            for message in page:
+                yield message.model_dump(mode="json")
+            if len(page) < batch_size:
+                return
+            after = message_cursor(page[-1])
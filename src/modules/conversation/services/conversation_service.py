@@ -4,9 +4,10 @@ Facade for conversation management using decomposed components.
 """
 
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from src.core.config import settings
+from src.core.database.unit_of_work import AsyncUnitOfWork
 from src.core.utils import get_logger
 from src.core.utils.exceptions import DuplicateError
 from src.modules.conversation.dtos.message_dto import MessageCreateDTO
@@ -15,8 +16,8 @@ from src.modules.conversation.enums.conversation_status import \
 from src.modules.conversation.enums.message_owner import MessageOwner
 from src.modules.conversation.models.conversation import Conversation
 from src.modules.conversation.models.message import Message
-from src.modules.conversation.repositories.message_repository import \
-    MessageRepository
+from src.modules.conversation.repositories.message_repository import (
+    MessageCursor, MessageRepository)
 from src.modules.conversation.components.conversation_closer import \
     ConversationCloser
 from src.modules.conversation.components.conversation_finder import \
@@ -42,12 +43,14 @@ class ConversationService:
         finder: ConversationFinder,
         lifecycle: ConversationLifecycle,
         closer: ConversationCloser,
+        unit_of_work: Optional[AsyncUnitOfWork] = None,
     ):
         self.conversation_repo = conversation_repo
         self.message_repo = message_repo
         self.finder = finder
         self.lifecycle = lifecycle
         self.closer = closer
+        self.unit_of_work = unit_of_work or AsyncUnitOfWork()
 
     async def get_or_create_conversation(
         self,
@@ -118,7 +121,15 @@ class ConversationService:
     ) -> Message:
         """
         Add a message to the conversation and handle state transitions.
+        The message, the transition (with its history) and the timestamp
+        update are written in one unit of work.
         """
+        async with self.unit_of_work.begin():
+            return await self._add_message(conversation, message_create)
+
+    async def _add_message(
+        self, conversation: Conversation, message_create: MessageCreateDTO
+    ) -> Message:
         from src.core.utils.exceptions import ConcurrencyError
         
         # 1. Detect closure intent BEFORE creating message (optional, but cleaner logic)
@@ -416,11 +427,29 @@ class ConversationService:
         )
 
     async def get_conversation_messages(
-        self, conv_id: str, limit: int = 100, offset: int = 0
+        self,
+        conv_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[MessageCursor] = None,
     ) -> List[Message]:
-        """Get messages for a conversation."""
+        """Get messages for a conversation (after the cursor, when given)."""
+        if after is not None:
+            return await self.message_repo.find_by_conversation(
+                conv_id, limit, after=after
+            )
         return await self.message_repo.find_by_conversation(conv_id, limit, offset)
 
+    def stream_conversation_messages(
+        self, conv_id: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every message of a conversation as JSON-ready dicts."""
+        return self.message_repo.stream_by_conversation(conv_id)
+
+    async def get_recent_messages(self, conv_id: str, limit: int = 10) -> List[Message]:
+        """Get the latest messages of a conversation, oldest first."""
+        return await self.message_repo.find_recent_by_conversation(conv_id, limit)
+
     async def _update_acceptance_context(
         self, conversation: Conversation, message_create: MessageCreateDTO
     ):
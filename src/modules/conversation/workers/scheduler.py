@@ -103,33 +103,28 @@ class BackgroundScheduler:
         self.running = False
 
     async def _schedule_tasks(self):
-        """Enqueue tasks."""
+        """Enqueue this cycle's maintenance tasks in a single batch."""
+        tasks = []
+
         # 1. Idle Conversations
         if settings.conversation.idle_timeout_minutes > 0:
-            try:
-                await self.queue_service.enqueue(
-                    "process_idle_conversations",
-                    {
+            tasks.append(
+                {
+                    "task_name": "process_idle_conversations",
+                    "payload": {
                         "limit": self.batch_size,
                         "idle_minutes": settings.conversation.idle_timeout_minutes,
                     },
-                )
-                self.metrics.tasks_enqueued += 1
-                logger.info("Enqueued idle conversation task")
-            except Exception as e:
-                logger.error(f"Failed to enqueue idle task: {e}")
-                self.metrics.errors += 1
+                }
+            )
 
         # 2. Expired Conversations
-        try:
-            await self.queue_service.enqueue(
-                "process_expired_conversations", {"limit": self.batch_size}
-            )
-            self.metrics.tasks_enqueued += 1
-            logger.info("Enqueued expired conversation task")
-        except Exception as e:
-            logger.error(f"Failed to enqueue expired task: {e}")
-            self.metrics.errors += 1
+        tasks.append(
+            {
+                "task_name": "process_expired_conversations",
+                "payload": {"limit": self.batch_size},
+            }
+        )
 
         # 3. Cleanup AI Logs (Run once per day, or check every cycle and decide)
         # For simplicity, we enqueue it every cycle but the worker can be smart, 
@@ -140,16 +135,23 @@ class BackgroundScheduler:
         # Let's do a simple check: only enqueue if current minute is 0 (once an hour)
         current_time = datetime.now(timezone.utc)
         if current_time.minute == 0:
-            try:
-                await self.queue_service.enqueue(
-                    "cleanup_ai_logs", 
-                    {"retention_days": settings.ai.log_retention_days}
-                )
-                self.metrics.tasks_enqueued += 1
-                logger.info("Enqueued AI cleanup task")
-            except Exception as e:
-                logger.error(f"Failed to enqueue AI cleanup task: {e}")
-                # Don't increment error metric to avoid noise for non-critical task
+            tasks.append(
+                {
+                    "task_name": "cleanup_ai_logs",
+                    "payload": {"retention_days": settings.ai.log_retention_days},
+                }
+            )
+
+        try:
+            await self.queue_service.enqueue_many(tasks)
+            self.metrics.tasks_enqueued += len(tasks)
+            logger.info(
+                f"Enqueued {len(tasks)} tasks: "
+                f"{', '.join(task['task_name'] for task in tasks)}"
+            )
+        except Exception as e:
+            logger.error(f"Failed to enqueue scheduled tasks: {e}")
+            self.metrics.errors += 1
 
 
 async def main_async():
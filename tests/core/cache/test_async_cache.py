@@ -0,0 +1,39 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.cache import AsyncCache, TTLCache
+
+
+@pytest.mark.asyncio
+async def test_in_process_cache_is_called_directly():
+    cache = AsyncCache(TTLCache())
+
+    await cache.set("a", 1, 60)
+    assert cache.in_process is True
+    assert await cache.get("a") == 1
+    assert await cache.add("a", 2) is False
+    await cache.delete("a")
+    assert await cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_runs_in_threadpool():
+    backend = Mock()
+    backend.get.return_value = {"x": 1}
+    cache = AsyncCache(backend)
+
+    assert cache.in_process is False
+    assert await cache.get("a") == {"x": 1}
+    await cache.set("a", 2, 30)
+    backend.set.assert_called_once_with("a", 2, 30)
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_unless_swallowed():
+    backend = Mock()
+    backend.get.side_effect = ConnectionError("redis down")
+
+    with pytest.raises(ConnectionError):
+        await AsyncCache(backend).get("a")
+    assert await AsyncCache(backend, unavailable_message="Cache down").get("a") is None
@@ -0,0 +1,43 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.cache import RedisCache
+
+
+@pytest.fixture
+def client():
+    with patch("redis.from_url") as from_url:
+        client = MagicMock()
+        from_url.return_value = client
+        yield client
+
+
+def test_set_and_get_round_trip_json(client):
+    cache = RedisCache("redis://localhost", prefix="t:", default_ttl=5)
+    cache.set("k", {"a": 1})
+
+    client.set.assert_called_once_with("t:k", '{"a": 1}', px=5000)
+
+    client.get.return_value = '{"a": 1}'
+    assert cache.get("k") == {"a": 1}
+    client.get.assert_called_with("t:k")
+
+
+def test_add_uses_nx(client):
+    cache = RedisCache("redis://localhost", prefix="t:")
+    client.set.return_value = None  # Key already exists
+
+    assert cache.add("k", 1, ttl=2) is False
+    client.set.assert_called_once_with("t:k", "1", px=2000, nx=True)
+
+
+def test_errors_degrade_to_miss(client):
+    cache = RedisCache("redis://localhost")
+    client.get.side_effect = ConnectionError("down")
+    client.set.side_effect = ConnectionError("down")
+
+    assert cache.get("k") is None
+    cache.set("k", 1)  # Does not raise
+    # Fail open: an unreachable store must not drop new events
+    assert cache.add("k", 1) is True
@@ -0,0 +1,44 @@
+from unittest.mock import patch
+
+from src.core.cache import SqliteCache
+
+
+def test_get_set_and_delete(tmp_path):
+    cache = SqliteCache(db_path=str(tmp_path / "cache.db"))
+    cache.set("a", {"x": 1})
+
+    assert cache.get("a") == {"x": 1}
+    cache.delete("a")
+    assert cache.get("a") is None
+
+
+def test_persists_across_instances(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    SqliteCache(db_path=db_path).set("a", "text")
+
+    assert SqliteCache(db_path=db_path).get("a") == "text"
+
+
+def test_add_only_when_absent_or_expired(tmp_path):
+    cache = SqliteCache(db_path=str(tmp_path / "cache.db"), default_ttl=10)
+    with patch("src.core.cache.sqlite_cache.time.time", return_value=100.0):
+        assert cache.add("a", 1) is True
+        assert cache.add("a", 2) is False
+        assert cache.get("a") == 1
+    with patch("src.core.cache.sqlite_cache.time.time", return_value=111.0):
+        assert cache.get("a") is None
+        assert cache.add("a", 3) is True
+
+
+def test_evicts_least_recently_read(tmp_path):
+    cache = SqliteCache(db_path=str(tmp_path / "cache.db"), max_entries=2)
+    with patch("src.core.cache.sqlite_cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0, 5.0, 5.0, 5.0]):
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now the least recently read
+        cache.set("c", 3)
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
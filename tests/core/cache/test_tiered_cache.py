@@ -0,0 +1,69 @@
+import unittest
+from unittest.mock import patch
+
+from src.core.cache import TieredCache, TTLCache
+
+
+class TestTieredCache(unittest.TestCase):
+
+    def setUp(self):
+        self.remote = TTLCache()
+        self.cache = TieredCache(remote=self.remote, default_ttl=60, local_ttl=5)
+
+    def test_local_only_without_remote(self):
+        cache = TieredCache(default_ttl=60)
+
+        cache.set("k", {"v": 1})
+
+        self.assertEqual(cache.get("k"), {"v": 1})
+        self.assertIsNone(cache.get("missing"))
+        self.assertEqual((cache.stats.local_hits, cache.stats.misses), (1, 1))
+
+    def test_writes_go_to_both_tiers(self):
+        self.cache.set("k", "v")
+
+        self.assertEqual(self.remote.get("k"), "v")
+        self.assertEqual(self.cache.local.get("k"), "v")
+
+        self.cache.delete("k")
+        self.assertIsNone(self.remote.get("k"))
+        self.assertIsNone(self.cache.get("k"))
+
+    def test_remote_hit_fills_local_tier(self):
+        self.remote.set("k", "v")
+
+        self.assertEqual(self.cache.get("k"), "v")
+        self.assertEqual(self.cache.get("k"), "v")
+
+        self.assertEqual(self.cache.stats.remote_hits, 1)
+        self.assertEqual(self.cache.stats.local_hits, 1)
+        self.assertEqual(self.cache.stats.hit_rate, 1.0)
+
+    def test_local_copy_expires_after_local_ttl(self):
+        with patch("src.core.cache.memory.time.monotonic", return_value=1000.0):
+            self.cache.set("k", "v")
+        # Another process updated the shared tier meanwhile
+        self.remote.set("k", "new")
+
+        with patch("src.core.cache.memory.time.monotonic", return_value=1006.0):
+            self.assertEqual(self.cache.local.get("k"), None)
+        self.assertEqual(self.cache.get("k"), "new")
+
+    def test_add_claims_in_remote_tier(self):
+        self.remote.set("k", "other")
+
+        self.assertFalse(self.cache.add("k", "mine"))
+        self.assertTrue(self.cache.add("k2", "mine"))
+        self.assertEqual(self.cache.get("k2"), "mine")
+
+    def test_stats_to_dict(self):
+        self.cache.get("missing")
+        self.cache.set("k", "v")
+        self.cache.get("k")
+
+        stats = self.cache.stats.to_dict()
+
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["sets"], 1)
+        self.assertEqual(stats["hit_rate"], 0.5)
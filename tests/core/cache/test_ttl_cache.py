@@ -0,0 +1,45 @@
+from unittest.mock import patch
+
+from src.core.cache import TTLCache
+
+
+def test_get_set_and_delete():
+    cache = TTLCache()
+    cache.set("a", {"x": 1})
+
+    assert cache.get("a") == {"x": 1}
+    cache.delete("a")
+    assert cache.get("a") is None
+
+
+def test_add_only_when_absent():
+    cache = TTLCache()
+
+    assert cache.add("a", 1) is True
+    assert cache.add("a", 2) is False
+    assert cache.get("a") == 1
+
+
+def test_entries_expire():
+    cache = TTLCache(default_ttl=10)
+    with patch("src.core.cache.memory.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=60)
+    with patch("src.core.cache.memory.time.monotonic", return_value=111.0):
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        # An expired key can be claimed again
+        assert cache.add("a", 3) is True
+
+
+def test_evicts_least_recently_used():
+    cache = TTLCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now the least recently used
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
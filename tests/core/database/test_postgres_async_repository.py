@@ -0,0 +1,104 @@
+"""Tests for PostgresAsyncRepository compiled-query cache."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from psycopg2 import sql
+from pydantic import BaseModel
+
+from src.core.database.postgres_async_repository import PostgresAsyncRepository
+
+
+class Item(BaseModel):
+    id: str
+    name: str
+    version: int = 1
+
+
+@pytest.fixture
+def conn():
+    conn = MagicMock()
+    conn.fetchrow = AsyncMock(return_value={"id": "1", "name": "a", "version": 2})
+    conn.fetch = AsyncMock(return_value=[{"id": "1", "name": "a", "version": 1}])
+    conn.execute = AsyncMock(return_value="DELETE 1")
+    return conn
+
+
+@pytest.fixture
+def repository(conn):
+    db = MagicMock()
+
+    @asynccontextmanager
+    async def connection():
+        yield conn
+
+    db.connection = connection
+    return PostgresAsyncRepository(db, "app.items", Item)
+
+
+def test_convert_query_replaces_placeholders(repository):
+    query = sql.SQL("SELECT * FROM t WHERE a = %s AND b = %s")
+
+    assert repository._convert_query_to_asyncpg(query) == (
+        "SELECT * FROM t WHERE a = $1 AND b = $2"
+    )
+    # Strings are already compiled
+    assert repository._convert_query_to_asyncpg("SELECT $1") == "SELECT $1"
+
+
+@pytest.mark.asyncio
+async def test_create_compiles_once_per_column_set(repository, conn):
+    await repository.create({"id": "1", "name": "a"})
+    await repository.create({"id": "2", "name": "b"})
+
+    first, second = (c.args for c in conn.fetchrow.call_args_list)
+    assert first[0] == (
+        'INSERT INTO "app"."items" ("id", "name") VALUES ($1, $2) RETURNING *'
+    )
+    assert second[0] is first[0]
+    assert second[1:] == ("2", "b")
+    assert list(repository._compiled) == [("create", "id", "name")]
+
+    await repository.create({"name": "c"})
+    assert conn.fetchrow.call_args.args[0] == (
+        'INSERT INTO "app"."items" ("name") VALUES ($1) RETURNING *'
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_keys_on_version_check(repository, conn):
+    await repository.update("1", {"name": "x"})
+    plain = conn.fetchrow.call_args.args
+    assert plain == ('UPDATE "app"."items" SET "name" = $1 WHERE "id" = $2 RETURNING *', "x", "1")
+
+    await repository.update("1", {"name": "y"}, current_version=1)
+    versioned = conn.fetchrow.call_args.args
+    assert versioned == (
+        'UPDATE "app"."items" SET "name" = $1, "version" = $2 '
+        'WHERE "id" = $3 AND version = $4 RETURNING *',
+        "y",
+        2,
+        "1",
+        1,
+    )
+    assert ("update", "id", False, "name") in repository._compiled
+    assert ("update", "id", True, "name", "version") in repository._compiled
+
+
+@pytest.mark.asyncio
+async def test_find_by_count_and_delete(repository, conn):
+    conn.fetchrow.return_value = {"count": 3}
+
+    await repository.find_by({"name": "a"}, limit=5)
+    assert conn.fetch.call_args.args == (
+        'SELECT * FROM "app"."items" WHERE "name" = $1 LIMIT $2',
+        "a",
+        5,
+    )
+
+    assert await repository.count() == 3
+    assert conn.fetchrow.call_args.args == ('SELECT COUNT(*) as count FROM "app"."items"',)
+
+    assert await repository.delete("1") is True
+    assert conn.execute.call_args.args == ('DELETE FROM "app"."items" WHERE "id" = $1', "1")
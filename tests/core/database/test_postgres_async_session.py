@@ -0,0 +1,118 @@
+"""Tests for AsyncPostgresDatabase transaction binding."""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from src.core.database.postgres_async_session import AsyncPostgresDatabase
+from src.core.database.unit_of_work import AsyncUnitOfWork
+
+
+class FakeConnection:
+    def __init__(self, name, events):
+        self.name = name
+        self.events = events
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.events.append(("begin", self.name))
+        try:
+            yield
+        except Exception:
+            self.events.append(("rollback", self.name))
+            raise
+        self.events.append(("commit", self.name))
+
+
+class FakePool:
+    def __init__(self):
+        self.events = []
+        self.checkouts = 0
+
+    @asynccontextmanager
+    async def acquire(self):
+        self.checkouts += 1
+        yield FakeConnection(f"conn{self.checkouts}", self.events)
+
+
+@pytest.fixture
+def db():
+    db = AsyncPostgresDatabase(dsn="postgresql://unused")
+    db._pool = FakePool()
+    return db
+
+
+@pytest.mark.asyncio
+async def test_connections_without_transaction_are_separate(db):
+    async with db.connection() as first:
+        pass
+    async with db.connection() as second:
+        pass
+
+    assert first is not second
+    assert db._pool.checkouts == 2
+
+
+@pytest.mark.asyncio
+async def test_transaction_binds_one_connection(db):
+    async with db.transaction() as conn:
+        async with db.connection() as inner:
+            assert inner is conn
+        async with db.transaction() as nested:
+            assert nested is conn
+
+    assert db._pool.checkouts == 1
+    assert db._pool.events == [
+        ("begin", "conn1"),
+        ("begin", "conn1"),  # savepoint
+        ("commit", "conn1"),
+        ("commit", "conn1"),
+    ]
+
+    # Released after the block
+    async with db.connection() as after:
+        assert after is not conn
+
+
+@pytest.mark.asyncio
+async def test_transaction_rolls_back_and_unbinds_on_error(db):
+    with pytest.raises(RuntimeError):
+        async with db.transaction():
+            raise RuntimeError("boom")
+
+    assert db._pool.events == [("begin", "conn1"), ("rollback", "conn1")]
+    assert db._bound.get() is None
+
+
+@pytest.mark.asyncio
+async def test_binding_is_per_task(db):
+    seen = {}
+
+    async def work(name):
+        async with db.transaction() as conn:
+            await asyncio.sleep(0)
+            async with db.connection() as inner:
+                seen[name] = (conn, inner)
+
+    await asyncio.gather(work("a"), work("b"))
+
+    assert seen["a"][0] is seen["a"][1]
+    assert seen["b"][0] is seen["b"][1]
+    assert seen["a"][0] is not seen["b"][0]
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_without_database_is_noop():
+    async with AsyncUnitOfWork().begin():
+        pass
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_uses_database_transaction(db):
+    async with AsyncUnitOfWork(db).begin():
+        async with db.connection():
+            pass
+
+    assert db._pool.checkouts == 1
+    assert db._pool.events == [("begin", "conn1"), ("commit", "conn1")]
@@ -93,3 +93,60 @@ async def test_bullmq_backend_start_consuming(
     mock_bullmq_worker.assert_called_once()
     # Check if worker was initialized with correct queue name
     assert mock_bullmq_worker.call_args[0][0] == "default_queue"
+
+
+@pytest.mark.asyncio
+async def test_bullmq_backend_enqueue_routes_lane_to_own_queue(
+    mock_bullmq_queue, mock_aioredis
+):
+    backend = BullMQBackend("redis://localhost:6379", lanes=["realtime", "default"])
+
+    message = QueueMessage(
+        id=generate_ulid(), task_name="test_task", payload={}, lane="realtime"
+    )
+    await backend.enqueue(message)
+
+    queue_names = [call[0][0] for call in mock_bullmq_queue.call_args_list]
+    assert queue_names == ["default_queue", "realtime_queue"]
+
+
+@pytest.mark.asyncio
+async def test_bullmq_backend_starts_worker_per_lane(
+    mock_bullmq_queue, mock_bullmq_worker, mock_aioredis
+):
+    backend = BullMQBackend("redis://localhost:6379", lanes=["realtime", "bulk"])
+
+    with patch("src.core.queue.backends.bullmq.asyncio.Event") as MockEvent:
+        mock_event_instance = MagicMock()
+        mock_event_instance.wait = AsyncMock(return_value=None)
+        MockEvent.return_value = mock_event_instance
+
+        await backend.start_consuming(AsyncMock(), lanes=["realtime"])
+
+    mock_bullmq_worker.assert_called_once()
+    assert mock_bullmq_worker.call_args[0][0] == "realtime_queue"
+
+
+@pytest.mark.asyncio
+async def test_bullmq_backend_enqueue_many_adds_bulk_per_lane(
+    mock_bullmq_queue, mock_aioredis
+):
+    backend = BullMQBackend("redis://localhost:6379")
+    queue_instance = mock_bullmq_queue.return_value
+    queue_instance.addBulk.side_effect = lambda jobs: [
+        MagicMock(id=job["opts"]["jobId"]) for job in jobs
+    ]
+
+    messages = [
+        QueueMessage(id="a", task_name="send_whatsapp_message", payload={}, lane="realtime"),
+        QueueMessage(id="b", task_name="generate_embedding", payload={}, lane="bulk"),
+        QueueMessage(id="c", task_name="send_whatsapp_message", payload={}, lane="realtime"),
+    ]
+
+    job_ids = await backend.enqueue_many(messages)
+
+    assert job_ids == ["a", "b", "c"]
+    assert queue_instance.addBulk.await_count == 2
+    first_jobs = queue_instance.addBulk.await_args_list[0][0][0]
+    assert [job["name"] for job in first_jobs] == ["send_whatsapp_message"] * 2
+    queue_instance.add.assert_not_called()
@@ -0,0 +1,366 @@
+import asyncio
+import unittest
+from collections import deque
+from typing import Optional
+from unittest.mock import AsyncMock
+
+from src.core.queue.interfaces import QueueBackend
+from src.core.queue.models import QueueMessage
+
+
+class InMemoryBackend(QueueBackend):
+    def __init__(self):
+        self.pending = deque()
+        self.acked = []
+        self.nacked = []
+        self.failed = []
+
+    async def enqueue(self, message: QueueMessage) -> str:
+        self.pending.append(message)
+        await self.notifier.notify()
+        return message.id
+
+    async def dequeue(self, lanes=None) -> Optional[QueueMessage]:
+        for msg in list(self.pending):
+            if not lanes or msg.lane in lanes:
+                self.pending.remove(msg)
+                return msg
+        return None
+
+    async def ack(self, message_id: str) -> None:
+        self.acked.append(message_id)
+
+    async def nack(self, message_id: str, retry_after: int = 0) -> None:
+        self.nacked.append((message_id, retry_after))
+
+    async def fail(self, message_id: str, error: str = "") -> None:
+        self.failed.append((message_id, error))
+
+
+class TestConsumerLoop(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.backend = InMemoryBackend()
+
+    async def _wait_for(self, predicate, timeout: float = 2.0):
+        async def poll():
+            while not predicate():
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(poll(), timeout)
+
+    async def _stop(self, consumer: asyncio.Task):
+        consumer.cancel()
+        await consumer
+
+    async def test_handlers_run_concurrently(self):
+        for i in range(3):
+            await self.backend.enqueue(QueueMessage(task_name="slow", payload={"i": i}))
+
+        running = 0
+        peak = 0
+        release = asyncio.Event()
+
+        async def handler(msg):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+
+        consumer = asyncio.create_task(
+            self.backend.start_consuming(handler, concurrency=3)
+        )
+        await self._wait_for(lambda: peak == 3)
+        release.set()
+        await self._wait_for(lambda: len(self.backend.acked) == 3)
+        await self._stop(consumer)
+
+        self.assertEqual(peak, 3)
+
+    async def test_batch_claims_are_capped_at_free_slots(self):
+        self.backend.batch_size = 10
+        self.backend.dequeue_batch = AsyncMock(
+            wraps=QueueBackend.dequeue_batch.__get__(self.backend)
+        )
+        for i in range(5):
+            await self.backend.enqueue(QueueMessage(task_name="slow", payload={"i": i}))
+        release = asyncio.Event()
+
+        async def handler(msg):
+            await release.wait()
+
+        consumer = asyncio.create_task(
+            self.backend.start_consuming(handler, concurrency=3)
+        )
+        await self._wait_for(lambda: len(self.backend.pending) == 2)
+        await asyncio.sleep(0.05)
+        # Only as many messages as there are handlers were claimed
+        self.assertEqual(len(self.backend.pending), 2)
+        self.assertEqual(self.backend.dequeue_batch.await_args_list[0].args[0], 3)
+
+        release.set()
+        await self._wait_for(lambda: len(self.backend.acked) == 5)
+        await self._stop(consumer)
+
+    async def test_task_concurrency_limit(self):
+        for i in range(4):
+            await self.backend.enqueue(
+                QueueMessage(task_name="transcribe_audio", payload={"i": i})
+            )
+        await self.backend.enqueue(QueueMessage(task_name="other", payload={}))
+
+        running = {"transcribe_audio": 0, "other": 0}
+        peak = {"transcribe_audio": 0, "other": 0}
+
+        async def handler(msg):
+            running[msg.task_name] += 1
+            peak[msg.task_name] = max(peak[msg.task_name], running[msg.task_name])
+            await asyncio.sleep(0.05)
+            running[msg.task_name] -= 1
+
+        consumer = asyncio.create_task(
+            self.backend.start_consuming(
+                handler, concurrency=10, task_concurrency={"transcribe_audio": 2}
+            )
+        )
+        await self._wait_for(lambda: len(self.backend.acked) == 5)
+        await self._stop(consumer)
+
+        self.assertEqual(peak["transcribe_audio"], 2)
+        self.assertEqual(peak["other"], 1)
+
+    async def test_failed_message_is_retried_with_backoff(self):
+        msg = QueueMessage(task_name="boom", payload={}, attempts=1)
+        await self.backend.enqueue(msg)
+
+        async def handler(msg):
+            raise RuntimeError("boom")
+
+        consumer = asyncio.create_task(
+            self.backend.start_consuming(handler, concurrency=2)
+        )
+        await self._wait_for(lambda: self.backend.nacked)
+        await self._stop(consumer)
+
+        self.assertEqual(self.backend.nacked, [(msg.id, 20)])
+        self.assertEqual(self.backend.acked, [])
+
+    async def test_message_over_max_retries_is_failed(self):
+        msg = QueueMessage(task_name="boom", payload={}, attempts=3)
+        await self.backend.enqueue(msg)
+
+        async def handler(msg):
+            raise RuntimeError("boom")
+
+        consumer = asyncio.create_task(
+            self.backend.start_consuming(handler, concurrency=2)
+        )
+        await self._wait_for(lambda: self.backend.failed)
+        await self._stop(consumer)
+
+        self.assertEqual(self.backend.failed, [(msg.id, "boom")])
+        self.assertEqual(self.backend.nacked, [])
+
+    async def test_cancel_drains_in_flight_handlers(self):
+        msg = QueueMessage(task_name="slow", payload={})
+        await self.backend.enqueue(msg)
+        started = asyncio.Event()
+
+        async def handler(msg):
+            started.set()
+            await asyncio.sleep(0.1)
+
+        consumer = asyncio.create_task(
+            self.backend.start_consuming(handler, concurrency=2)
+        )
+        await started.wait()
+        await self._stop(consumer)
+
+        self.assertEqual(self.backend.acked, [msg.id])
+
+    async def test_cancel_after_shutdown_timeout_cancels_handlers(self):
+        msg = QueueMessage(task_name="stuck", payload={})
+        await self.backend.enqueue(msg)
+        started = asyncio.Event()
+
+        async def handler(msg):
+            started.set()
+            await asyncio.sleep(10)
+
+        consumer = asyncio.create_task(
+            self.backend.start_consuming(handler, shutdown_timeout=0.05)
+        )
+        await started.wait()
+        await self._stop(consumer)
+
+        self.assertEqual(self.backend.acked, [])
+
+    async def test_consumes_only_subscribed_lanes(self):
+        bulk = QueueMessage(task_name="generate_embedding", payload={}, lane="bulk")
+        realtime = QueueMessage(
+            task_name="process_ai_response", payload={}, lane="realtime"
+        )
+        await self.backend.enqueue(bulk)
+        await self.backend.enqueue(realtime)
+
+        handler_calls = []
+
+        async def handler(msg):
+            handler_calls.append(msg.id)
+
+        consumer = asyncio.create_task(
+            self.backend.start_consuming(handler, lanes=["realtime"])
+        )
+        await self._wait_for(lambda: self.backend.acked)
+        await self._stop(consumer)
+
+        self.assertEqual(handler_calls, [realtime.id])
+        self.assertEqual(list(self.backend.pending), [bulk])
+
+    async def test_enqueue_wakes_idle_consumer(self):
+        handled = asyncio.Event()
+
+        async def handler(msg):
+            handled.set()
+
+        consumer = asyncio.create_task(
+            self.backend.start_consuming(handler, min_idle_wait=30, max_idle_wait=30)
+        )
+        # Let the consumer find the queue empty and go idle
+        await asyncio.sleep(0.05)
+
+        await self.backend.enqueue(QueueMessage(task_name="fast", payload={}))
+        await asyncio.wait_for(handled.wait(), timeout=1)
+        await self._stop(consumer)
+
+
+    async def test_partition_runs_in_order_one_at_a_time(self):
+        for i in range(3):
+            await self.backend.enqueue(
+                QueueMessage(task_name="t", payload={"i": i}, partition_key="chat-1")
+            )
+        await self.backend.enqueue(
+            QueueMessage(task_name="t", payload={"i": "other"}, partition_key="chat-2")
+        )
+
+        events = []
+
+        async def handler(msg):
+            events.append(("start", msg.payload["i"]))
+            await asyncio.sleep(0.01)
+            events.append(("end", msg.payload["i"]))
+
+        consumer = asyncio.create_task(
+            self.backend.start_consuming(handler, concurrency=4)
+        )
+        await self._wait_for(lambda: len(self.backend.acked) == 4)
+        await self._stop(consumer)
+
+        chat_1 = [e for e in events if e[1] != "other"]
+        self.assertEqual(
+            chat_1,
+            [("start", 0), ("end", 0), ("start", 1), ("end", 1), ("start", 2), ("end", 2)],
+        )
+        # chat-2 did not wait behind chat-1
+        self.assertLess(events.index(("start", "other")), events.index(("end", 0)))
+
+
+class LeasedInMemoryBackend(InMemoryBackend):
+    visibility_timeout = 0.03
+
+    def __init__(self):
+        super().__init__()
+        self.heartbeats = []
+        self.reaps = 0
+
+    async def extend_lease(self, message_id: str) -> None:
+        self.heartbeats.append(message_id)
+
+    async def reap_expired(self) -> int:
+        self.reaps += 1
+        return 0
+
+
+class TestConsumerLoopLeases(unittest.IsolatedAsyncioTestCase):
+
+    async def test_handler_heartbeats_until_done(self):
+        backend = LeasedInMemoryBackend()
+        msg = QueueMessage(task_name="slow", payload={})
+        await backend.enqueue(msg)
+
+        async def handler(msg):
+            await asyncio.sleep(0.1)
+
+        consumer = asyncio.create_task(backend.start_consuming(handler))
+        await asyncio.wait_for(self._until(lambda: backend.acked), 2)
+        heartbeats = len(backend.heartbeats)
+        await asyncio.sleep(0.05)
+        consumer.cancel()
+        await consumer
+
+        self.assertGreaterEqual(heartbeats, 2)
+        self.assertEqual(set(backend.heartbeats), {msg.id})
+        # Heartbeat stops once the handler returns
+        self.assertEqual(len(backend.heartbeats), heartbeats)
+
+    async def test_heartbeat_covers_partition_wait(self):
+        backend = LeasedInMemoryBackend()
+        first = QueueMessage(task_name="slow", payload={}, partition_key="chat-1")
+        second = QueueMessage(task_name="slow", payload={}, partition_key="chat-1")
+        await backend.enqueue(first)
+        await backend.enqueue(second)
+        release = asyncio.Event()
+
+        async def handler(msg):
+            if msg.id == first.id:
+                await release.wait()
+
+        consumer = asyncio.create_task(backend.start_consuming(handler, concurrency=2))
+        # second is still queued behind first, yet its lease is kept alive
+        await asyncio.wait_for(
+            self._until(lambda: backend.heartbeats.count(second.id) >= 2), 2
+        )
+        self.assertEqual(backend.acked, [])
+        release.set()
+        await asyncio.wait_for(self._until(lambda: len(backend.acked) == 2), 2)
+        heartbeats = len(backend.heartbeats)
+        await asyncio.sleep(0.05)
+        consumer.cancel()
+        await consumer
+
+        # Both heartbeats stop once the messages are settled
+        self.assertEqual(len(backend.heartbeats), heartbeats)
+
+    async def test_reaper_runs_periodically(self):
+        backend = LeasedInMemoryBackend()
+
+        async def handler(msg):
+            pass
+
+        consumer = asyncio.create_task(
+            backend.start_consuming(handler, reap_interval=0.01)
+        )
+        await asyncio.wait_for(self._until(lambda: backend.reaps >= 2), 2)
+        consumer.cancel()
+        await consumer
+
+    async def test_no_reaper_without_leases(self):
+        backend = InMemoryBackend()
+        backend.reap_expired = AsyncMock(return_value=0)
+
+        async def handler(msg):
+            pass
+
+        consumer = asyncio.create_task(
+            backend.start_consuming(handler, reap_interval=0.01)
+        )
+        await asyncio.sleep(0.05)
+        consumer.cancel()
+        await consumer
+
+        backend.reap_expired.assert_not_awaited()
+
+    async def _until(self, predicate):
+        while not predicate():
+            await asyncio.sleep(0.01)
@@ -0,0 +1,65 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.core.queue.notifier import LocalQueueNotifier, RedisQueueNotifier
+
+
+class TestLocalQueueNotifier(unittest.IsolatedAsyncioTestCase):
+
+    async def test_wait_times_out_without_notify(self):
+        notifier = LocalQueueNotifier()
+
+        self.assertFalse(await notifier.wait(0.01))
+
+    async def test_notify_wakes_waiter(self):
+        notifier = LocalQueueNotifier()
+        waiter = asyncio.create_task(notifier.wait(5))
+        await asyncio.sleep(0)
+
+        await notifier.notify()
+
+        self.assertTrue(await asyncio.wait_for(waiter, timeout=1))
+
+    async def test_notify_before_wait_is_not_lost(self):
+        notifier = LocalQueueNotifier()
+        await notifier.wait(0.001)  # bind to the loop
+
+        await notifier.notify()
+
+        self.assertTrue(await notifier.wait(5))
+
+    async def test_notify_from_other_thread(self):
+        notifier = LocalQueueNotifier()
+        waiter = asyncio.create_task(notifier.wait(5))
+        await asyncio.sleep(0)
+
+        thread = threading.Thread(target=lambda: asyncio.run(notifier.notify()))
+        thread.start()
+
+        self.assertTrue(await asyncio.wait_for(waiter, timeout=1))
+        thread.join()
+
+
+class TestRedisQueueNotifier(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        patcher = patch("redis.asyncio.from_url")
+        self.mock_from_url = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.redis = MagicMock()
+        self.mock_from_url.return_value = self.redis
+
+    async def test_wait_uses_blpop(self):
+        self.redis.blpop = AsyncMock(return_value=(b"queue:wakeup", b"1"))
+        notifier = RedisQueueNotifier("redis://localhost:6379")
+
+        self.assertTrue(await notifier.wait(0.5))
+        self.redis.blpop.assert_awaited_once_with(["queue:wakeup"], timeout=0.5)
+
+    async def test_wait_falls_back_to_sleep_on_error(self):
+        self.redis.blpop = AsyncMock(side_effect=ConnectionError("down"))
+        notifier = RedisQueueNotifier("redis://localhost:6379")
+
+        self.assertFalse(await notifier.wait(0.01))
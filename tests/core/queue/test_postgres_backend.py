@@ -0,0 +1,236 @@
+import asyncio
+import json
+import unittest
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+from src.core.queue.backends.postgres import (NOTIFY_CHANNEL,
+                                              PostgresQueueBackend)
+from src.core.queue.interfaces import MAX_RETRIES
+from src.core.queue.models import QueueMessage
+
+
+class TestPostgresQueueBackend(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.conn = MagicMock()
+        self.conn.execute = AsyncMock()
+        self.conn.executemany = AsyncMock()
+        self.conn.fetch = AsyncMock(return_value=[])
+
+        @asynccontextmanager
+        async def transaction():
+            yield
+
+        self.conn.transaction = transaction
+
+        @asynccontextmanager
+        async def connection():
+            yield self.conn
+
+        self.db = MagicMock()
+        self.db.dsn = "postgresql://localhost/test"
+        self.db.connection = connection
+
+        self.backend = PostgresQueueBackend(
+            db=self.db, batch_size=2, visibility_timeout=60
+        )
+
+    def _row(self, msg_id: str, priority: int = 0, offset: int = 0) -> dict:
+        return {
+            "id": msg_id,
+            "task_name": "test_task",
+            "payload": json.dumps({"id": msg_id}),
+            "attempts": 0,
+            "created_at": datetime(2024, 1, 1) + timedelta(seconds=offset),
+            "correlation_id": None,
+            "owner_id": "owner-1",
+            "lane": "default",
+            "priority": priority,
+        }
+
+    async def test_enqueue_inserts_and_notifies(self):
+        message = QueueMessage(task_name="t", payload={"a": 1}, lane="realtime")
+
+        result = await self.backend.enqueue(message)
+
+        self.assertEqual(result, message.id)
+        query, rows = self.conn.executemany.await_args.args
+        self.assertIn("INSERT INTO message_queue", query)
+        self.assertEqual(rows[0][2], json.dumps({"a": 1}))
+        notify_call = self.conn.execute.await_args
+        self.assertEqual(notify_call.args[1:], (NOTIFY_CHANNEL, "realtime"))
+
+    async def test_enqueue_with_connection_uses_caller_connection(self):
+        other_conn = MagicMock()
+        other_conn.execute = AsyncMock()
+        other_conn.executemany = AsyncMock()
+
+        await self.backend.enqueue_with_connection(
+            other_conn, QueueMessage(task_name="t", payload={})
+        )
+
+        other_conn.executemany.assert_awaited_once()
+        other_conn.execute.assert_awaited_once()
+        self.conn.executemany.assert_not_awaited()
+
+    async def test_enqueue_many_single_insert_and_one_notify_per_lane(self):
+        messages = [
+            QueueMessage(task_name="send_whatsapp_message", payload={}, lane="realtime"),
+            QueueMessage(task_name="generate_embedding", payload={}, lane="bulk"),
+            QueueMessage(task_name="generate_embedding", payload={}, lane="bulk"),
+        ]
+
+        ids = await self.backend.enqueue_many(messages)
+
+        self.assertEqual(ids, [m.id for m in messages])
+        self.conn.executemany.assert_awaited_once()
+        self.assertEqual(len(self.conn.executemany.await_args.args[1]), 3)
+        lanes = [c.args[2] for c in self.conn.execute.await_args_list]
+        self.assertEqual(lanes, ["realtime", "bulk"])
+
+    async def test_dequeue_batch_uses_skip_locked(self):
+        self.conn.fetch.return_value = [
+            self._row("low", priority=0, offset=0),
+            self._row("high", priority=10, offset=1),
+        ]
+
+        batch = await self.backend.dequeue_batch(5, lanes=["realtime", "default"])
+
+        query, *params = self.conn.fetch.await_args.args
+        self.assertIn("FOR UPDATE SKIP LOCKED", query)
+        self.assertIn("locked_until < NOW()", query)
+        self.assertIn("lane = ANY($3::text[])", query)
+        self.assertEqual(params, [5, 60.0, ["realtime", "default"]])
+        self.assertEqual([m.id for m in batch], ["high", "low"])
+        self.assertEqual(batch[0].payload, {"id": "high"})
+        self.assertEqual(batch[0].status, "processing")
+
+    async def test_dequeue_batch_claims_partition_heads_only(self):
+        row = self._row("a")
+        row["partition_key"] = "chat-1"
+        self.conn.fetch.return_value = [row]
+
+        batch = await self.backend.dequeue_batch(5)
+
+        query = self.conn.fetch.await_args.args[0]
+        self.assertIn("other.partition_key = m.partition_key", query)
+        self.assertIn("(other.created_at, other.id) < (m.created_at, m.id)", query)
+        self.assertEqual(batch[0].partition_key, "chat-1")
+
+    async def test_enqueue_stores_partition_key(self):
+        await self.backend.enqueue(QueueMessage(task_name="t", payload={}, partition_key="chat-1"))
+
+        rows = self.conn.executemany.await_args.args[1]
+        self.assertEqual(rows[0][-1], "chat-1")
+
+    async def test_dequeue_batch_without_lanes(self):
+        await self.backend.dequeue_batch(5)
+
+        query, *params = self.conn.fetch.await_args.args
+        self.assertNotIn("ANY(", query)
+        self.assertEqual(params, [5, 60.0])
+
+    async def test_dequeue_batch_error_returns_empty(self):
+        self.conn.fetch.side_effect = Exception("connection lost")
+
+        self.assertEqual(await self.backend.dequeue_batch(5), [])
+
+    async def test_dequeue_claims_one_message(self):
+        self.conn.fetch.return_value = [self._row("a")]
+
+        first = await self.backend.dequeue()
+
+        self.assertEqual(first.id, "a")
+        # Nothing is claimed ahead of a handler
+        self.assertEqual(self.conn.fetch.await_args.args[1], 1)
+
+    async def test_consumer_claims_only_for_free_slots(self):
+        rows = [[self._row("a")]]
+
+        async def fetch(query, *params):
+            if "FOR UPDATE SKIP LOCKED" in query and rows:
+                return rows.pop()
+            return []
+
+        async def wait(timeout):
+            await asyncio.sleep(0.01)
+            return False
+
+        self.conn.fetch.side_effect = fetch
+        self.backend.notifier.wait = wait
+        self.backend.notifier.close = AsyncMock()
+        handled = asyncio.Event()
+
+        async def handler(msg):
+            handled.set()
+
+        consumer = asyncio.create_task(
+            self.backend.start_consuming(handler, concurrency=1, reap_interval=60)
+        )
+        await asyncio.wait_for(handled.wait(), 1)
+        consumer.cancel()
+        await consumer
+
+        claims = [
+            call.args[1]
+            for call in self.conn.fetch.await_args_list
+            if "FOR UPDATE SKIP LOCKED" in call.args[0]
+        ]
+        # batch_size is 2, but one handler slot means one message per claim
+        self.assertEqual(set(claims), {1})
+
+    async def test_ack_deletes(self):
+        await self.backend.ack("msg-1")
+
+        query, msg_id = self.conn.execute.await_args.args
+        self.assertIn("DELETE FROM message_queue", query)
+        self.assertEqual(msg_id, "msg-1")
+
+    async def test_nack_schedules_retry(self):
+        await self.backend.nack("msg-1", retry_after=20)
+
+        query, msg_id, delay = self.conn.execute.await_args.args
+        self.assertIn("next_retry_at = NOW() + make_interval(secs => $2)", query)
+        self.assertIn("attempts = attempts + 1", query)
+        self.assertEqual((msg_id, delay), ("msg-1", 20.0))
+
+    async def test_fail_moves_to_dlq(self):
+        await self.backend.fail("msg-1", error="boom")
+
+        query, msg_id, error = self.conn.execute.await_args.args
+        self.assertIn("DELETE FROM message_queue", query)
+        self.assertIn("INSERT INTO message_queue_dlq", query)
+        self.assertEqual((msg_id, error), ("msg-1", "boom"))
+
+    async def test_extend_lease(self):
+        await self.backend.extend_lease("msg-1")
+
+        query, msg_id, lease = self.conn.execute.await_args.args
+        self.assertIn("SET locked_until = NOW() + make_interval(secs => $2)", query)
+        self.assertEqual((msg_id, lease), ("msg-1", 60.0))
+
+    async def test_reap_expired(self):
+        self.conn.fetch.side_effect = [[], [{"id": "a"}, {"id": "b"}]]
+
+        self.assertEqual(await self.backend.reap_expired(), 2)
+        query = self.conn.fetch.await_args.args[0]
+        self.assertIn("locked_until < NOW()", query)
+        self.assertIn("attempts = attempts + 1", query)
+
+    async def test_reap_expired_dead_letters_exhausted_messages(self):
+        self.conn.fetch.side_effect = [[{"id": "a"}], [{"id": "b"}]]
+
+        self.assertEqual(await self.backend.reap_expired(), 2)
+
+        dead_letter = self.conn.fetch.await_args_list[0].args
+        self.assertIn("INSERT INTO message_queue_dlq", dead_letter[0])
+        self.assertIn("attempts >= $1", dead_letter[0])
+        self.assertEqual(dead_letter[1], MAX_RETRIES)
+
+    async def test_dequeue_batch_skips_exhausted_expired_leases(self):
+        await self.backend.dequeue_batch(5)
+
+        query = self.conn.fetch.await_args.args[0]
+        self.assertIn(f"attempts < {MAX_RETRIES}", query)
@@ -58,6 +58,59 @@ class TestQueueService(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(message.correlation_id, "corr_1")
         self.assertEqual(message.owner_id, "owner_1")
 
+    async def test_enqueue_routes_task_to_configured_lane(self):
+        with patch.object(
+            settings.queue, "task_lanes", {"generate_embedding": "bulk"}
+        ), patch.object(settings.queue, "lane_priorities", {"bulk": -10}):
+            await self.service.enqueue("generate_embedding", {})
+            await self.service.enqueue("unknown_task", {})
+
+        routed = self.mock_backend.enqueue.call_args_list[0][0][0]
+        unrouted = self.mock_backend.enqueue.call_args_list[1][0][0]
+        self.assertEqual((routed.lane, routed.priority), ("bulk", -10))
+        self.assertEqual((unrouted.lane, unrouted.priority), ("default", 0))
+
+    async def test_enqueue_explicit_lane_and_priority(self):
+        await self.service.enqueue(
+            "generate_embedding", {}, lane="realtime", priority=99
+        )
+
+        message = self.mock_backend.enqueue.call_args[0][0]
+        self.assertEqual(message.lane, "realtime")
+        self.assertEqual(message.priority, 99)
+
+    async def test_enqueue_partition_key(self):
+        await self.service.enqueue("process_twilio_event", {}, partition_key="chat-1")
+
+        message = self.mock_backend.enqueue.call_args[0][0]
+        self.assertEqual(message.partition_key, "chat-1")
+
+    async def test_enqueue_many_builds_routed_messages(self):
+        self.mock_backend.enqueue_many = AsyncMock(return_value=["m1", "m2"])
+
+        with patch.object(
+            settings.queue, "task_lanes", {"generate_embedding": "bulk"}
+        ), patch.object(settings.queue, "lane_priorities", {"bulk": -10}):
+            ids = await self.service.enqueue_many(
+                [
+                    {"task_name": "send_whatsapp_message", "payload": {"a": 1}, "owner_id": "o1"},
+                    {"task_name": "generate_embedding", "payload": {"b": 2}},
+                ]
+            )
+
+        self.assertEqual(ids, ["m1", "m2"])
+        messages = self.mock_backend.enqueue_many.call_args[0][0]
+        self.assertEqual([m.task_name for m in messages], ["send_whatsapp_message", "generate_embedding"])
+        self.assertEqual(messages[0].owner_id, "o1")
+        self.assertEqual((messages[1].lane, messages[1].priority), ("bulk", -10))
+        self.mock_backend.enqueue.assert_not_called()
+
+    async def test_enqueue_many_empty(self):
+        self.mock_backend.enqueue_many = AsyncMock()
+
+        self.assertEqual(await self.service.enqueue_many([]), [])
+        self.mock_backend.enqueue_many.assert_not_called()
+
     async def test_process_message_success(self):
         handler = AsyncMock()
         self.service.register_handler("test_task", handler)
@@ -81,3 +134,12 @@ class TestQueueService(unittest.IsolatedAsyncioTestCase):
         # Check that it passes _process_message as handler
         args = self.mock_backend.start_consuming.call_args
         self.assertEqual(args[0][0], self.service._process_message)
+
+    async def test_start_worker_orders_lanes_by_priority(self):
+        with patch.object(
+            settings.queue, "lane_priorities", {"realtime": 10, "bulk": -10}
+        ):
+            await self.service.start_worker(lanes=["bulk", "realtime"])
+
+        kwargs = self.mock_backend.start_consuming.call_args[1]
+        self.assertEqual(kwargs["lanes"], ["realtime", "bulk"])
@@ -0,0 +1,94 @@
+import asyncio
+import unittest
+
+from src.core.queue.sequencer import PartitionSequencer
+
+
+class TestPartitionSequencer(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.sequencer = PartitionSequencer()
+
+    async def test_same_key_runs_in_order_one_at_a_time(self):
+        events = []
+
+        async def job(name, delay):
+            events.append(f"start:{name}")
+            await asyncio.sleep(delay)
+            events.append(f"end:{name}")
+
+        await asyncio.gather(
+            self.sequencer.run("a", lambda: job(1, 0.03)),
+            self.sequencer.run("a", lambda: job(2, 0.01)),
+            self.sequencer.run("a", lambda: job(3, 0)),
+        )
+
+        self.assertEqual(
+            events, ["start:1", "end:1", "start:2", "end:2", "start:3", "end:3"]
+        )
+        self.assertEqual(self.sequencer._tails, {})
+
+    async def test_different_keys_run_concurrently(self):
+        running = 0
+        peak = 0
+
+        async def job():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        await asyncio.gather(
+            self.sequencer.run("a", job),
+            self.sequencer.run("b", job),
+            self.sequencer.run(None, job),
+        )
+
+        self.assertEqual(peak, 3)
+
+    async def test_failure_does_not_block_next_call(self):
+        async def boom():
+            raise ValueError("boom")
+
+        async def ok():
+            return "ok"
+
+        results = await asyncio.gather(
+            self.sequencer.run("a", boom),
+            self.sequencer.run("a", ok),
+            return_exceptions=True,
+        )
+
+        self.assertIsInstance(results[0], ValueError)
+        self.assertEqual(results[1], "ok")
+
+    async def test_cancelled_waiter_keeps_order(self):
+        release = asyncio.Event()
+        events = []
+
+        async def first():
+            await release.wait()
+            events.append("first")
+
+        async def second():
+            events.append("second")
+
+        async def third():
+            events.append("third")
+
+        t1 = asyncio.create_task(self.sequencer.run("a", first))
+        await asyncio.sleep(0)
+        t2 = asyncio.create_task(self.sequencer.run("a", second))
+        await asyncio.sleep(0)
+        t3 = asyncio.create_task(self.sequencer.run("a", third))
+        await asyncio.sleep(0)
+
+        t2.cancel()
+        await asyncio.sleep(0.01)
+        self.assertEqual(events, [])  # third still waits for first
+
+        release.set()
+        await asyncio.gather(t1, t3)
+        self.assertEqual(events, ["first", "third"])
+        self.assertTrue(t2.cancelled())
@@ -107,3 +107,183 @@ class TestSqliteQueueBackend(unittest.IsolatedAsyncioTestCase):
     async def test_dequeue_empty(self):
         dequeued_msg = await self.backend.dequeue()
         self.assertIsNone(dequeued_msg)
+
+    async def test_dequeue_higher_priority_first(self):
+        low = QueueMessage(
+            id=generate_ulid(), task_name="bulk_task", payload={}, lane="bulk", priority=-10
+        )
+        high = QueueMessage(
+            id=generate_ulid(),
+            task_name="rt_task",
+            payload={},
+            lane="realtime",
+            priority=10,
+        )
+        await self.backend.enqueue(low)
+        await self.backend.enqueue(high)
+
+        first = await self.backend.dequeue()
+        second = await self.backend.dequeue()
+
+        self.assertEqual(first.id, high.id)
+        self.assertEqual(first.lane, "realtime")
+        self.assertEqual(first.priority, 10)
+        self.assertEqual(second.id, low.id)
+
+    async def test_dequeue_filters_by_lane(self):
+        bulk = QueueMessage(
+            id=generate_ulid(), task_name="bulk_task", payload={}, lane="bulk"
+        )
+        await self.backend.enqueue(bulk)
+
+        self.assertIsNone(await self.backend.dequeue(lanes=["realtime"]))
+
+        dequeued = await self.backend.dequeue(lanes=["realtime", "bulk"])
+        self.assertEqual(dequeued.id, bulk.id)
+
+    async def test_dequeue_serializes_partition(self):
+        first = QueueMessage(id=generate_ulid(), task_name="t", payload={}, partition_key="chat-1")
+        second = QueueMessage(
+            id=generate_ulid(), task_name="t", payload={}, partition_key="chat-1", priority=10
+        )
+        other = QueueMessage(id=generate_ulid(), task_name="t", payload={}, partition_key="chat-2")
+        for message in (first, second, other):
+            await self.backend.enqueue(message)
+
+        # The older message of a partition goes first, whatever the priority
+        claimed = [await self.backend.dequeue(), await self.backend.dequeue()]
+        self.assertEqual({m.id for m in claimed}, {first.id, other.id})
+        self.assertEqual(claimed[0].partition_key, "chat-1")
+        # chat-1 is still processing
+        self.assertIsNone(await self.backend.dequeue())
+
+        await self.backend.ack(first.id)
+        self.assertEqual((await self.backend.dequeue()).id, second.id)
+
+    def test_migrates_existing_table(self):
+        os.remove(self.db_path)
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            """
+            CREATE TABLE message_queue (
+                id TEXT PRIMARY KEY, task_name TEXT NOT NULL, payload TEXT NOT NULL,
+                status TEXT NOT NULL, attempts INTEGER DEFAULT 0,
+                created_at TIMESTAMP, updated_at TIMESTAMP, next_retry_at TIMESTAMP,
+                correlation_id TEXT, owner_id TEXT
+            )
+            """
+        )
+        conn.commit()
+        conn.close()
+
+        SqliteQueueBackend(db_path=self.db_path)
+
+        conn = sqlite3.connect(self.db_path)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(message_queue)")}
+        conn.close()
+        self.assertTrue({"error_reason", "lane", "priority"} <= columns)
+
+    def _expire_lease(self, msg_id: str):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            "UPDATE message_queue SET locked_until = ? WHERE id = ?",
+            (datetime(2000, 1, 1), msg_id),
+        )
+        conn.commit()
+        conn.close()
+
+    def _fetch(self, msg_id: str, columns: str):
+        conn = sqlite3.connect(self.db_path)
+        row = conn.execute(
+            f"SELECT {columns} FROM message_queue WHERE id = ?", (msg_id,)
+        ).fetchone()
+        conn.close()
+        return row
+
+    async def test_dequeue_sets_lease(self):
+        msg_id = await self.backend.enqueue(
+            QueueMessage(id=generate_ulid(), task_name="t", payload={})
+        )
+        await self.backend.dequeue()
+
+        (locked_until,) = self._fetch(msg_id, "locked_until")
+        self.assertGreater(datetime.fromisoformat(locked_until), datetime.utcnow())
+
+    async def test_extend_lease(self):
+        msg_id = await self.backend.enqueue(
+            QueueMessage(id=generate_ulid(), task_name="t", payload={})
+        )
+        await self.backend.dequeue()
+        self._expire_lease(msg_id)
+
+        await self.backend.extend_lease(msg_id)
+
+        (locked_until,) = self._fetch(msg_id, "locked_until")
+        self.assertGreater(datetime.fromisoformat(locked_until), datetime.utcnow())
+        self.assertEqual(await self.backend.reap_expired(), 0)
+
+    async def test_reap_expired_returns_message_to_pending(self):
+        msg_id = await self.backend.enqueue(
+            QueueMessage(id=generate_ulid(), task_name="t", payload={})
+        )
+        await self.backend.dequeue()
+        self._expire_lease(msg_id)
+
+        reaped = await self.backend.reap_expired()
+
+        self.assertEqual(reaped, 1)
+        self.assertEqual(self._fetch(msg_id, "status, attempts, locked_until"), ("pending", 1, None))
+        msg = await self.backend.dequeue()
+        self.assertEqual(msg.id, msg_id)
+        self.assertEqual(msg.attempts, 1)
+
+    async def test_reap_expired_fails_exhausted_message(self):
+        msg_id = await self.backend.enqueue(
+            QueueMessage(id=generate_ulid(), task_name="t", payload={}, attempts=3)
+        )
+        await self.backend.dequeue()
+        self._expire_lease(msg_id)
+
+        await self.backend.reap_expired()
+
+        self.assertEqual(
+            self._fetch(msg_id, "status, error_reason"), ("failed", "Lease expired")
+        )
+
+    async def test_reap_ignores_live_leases(self):
+        await self.backend.enqueue(
+            QueueMessage(id=generate_ulid(), task_name="t", payload={})
+        )
+        await self.backend.dequeue()
+
+        self.assertEqual(await self.backend.reap_expired(), 0)
+
+    async def test_enqueue_many(self):
+        messages = [
+            QueueMessage(id=generate_ulid(), task_name="t", payload={"i": i})
+            for i in range(3)
+        ]
+
+        ids = await self.backend.enqueue_many(messages)
+
+        self.assertEqual(ids, [m.id for m in messages])
+        for message in messages:
+            msg = await self.backend.dequeue()
+            self.assertEqual(msg.id, message.id)
+            self.assertEqual(msg.payload, message.payload)
+
+    async def test_enqueue_many_is_atomic(self):
+        msg = QueueMessage(id=generate_ulid(), task_name="t", payload={})
+        await self.backend.enqueue(msg)
+
+        duplicate_batch = [
+            QueueMessage(id=generate_ulid(), task_name="t", payload={}),
+            msg,
+        ]
+        with self.assertRaises(sqlite3.IntegrityError):
+            await self.backend.enqueue_many(duplicate_batch)
+
+        conn = sqlite3.connect(self.db_path)
+        count = conn.execute("SELECT count(*) FROM message_queue").fetchone()[0]
+        conn.close()
+        self.assertEqual(count, 1)
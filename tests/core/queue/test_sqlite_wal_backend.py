@@ -0,0 +1,226 @@
+import asyncio
+import os
+import sqlite3
+import unittest
+from collections import Counter
+
+from src.core.queue.backends.sqlite_wal import SqliteWalQueueBackend
+from src.core.queue.models import QueueMessage
+from src.core.utils.custom_ulid import generate_ulid
+
+
+class TestSqliteWalQueueBackend(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.db_path = "test_queue_wal.db"
+        self.backend = SqliteWalQueueBackend(
+            db_path=self.db_path, batch_size=5, ack_batch_size=3
+        )
+
+    def tearDown(self):
+        self.backend.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.db_path + suffix):
+                os.remove(self.db_path + suffix)
+
+    def _count(self, where: str = "1=1", params: tuple = ()) -> int:
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.execute(
+                f"SELECT count(*) FROM message_queue WHERE {where}", params
+            )
+            return cursor.fetchone()[0]
+        finally:
+            conn.close()
+
+    async def _enqueue(self, n: int):
+        ids = []
+        for i in range(n):
+            message = QueueMessage(
+                id=generate_ulid(), task_name="test_task", payload={"i": i}
+            )
+            ids.append(await self.backend.enqueue(message))
+        return ids
+
+    def test_wal_mode_enabled(self):
+        conn = sqlite3.connect(self.db_path)
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.close()
+
+        self.assertEqual(mode, "wal")
+
+    async def test_dequeue_batch_claims_in_order(self):
+        ids = await self._enqueue(7)
+
+        batch = await self.backend.dequeue_batch(5)
+
+        self.assertEqual([m.id for m in batch], ids[:5])
+        self.assertTrue(all(m.status == "processing" for m in batch))
+        self.assertEqual(self._count("status = 'processing'"), 5)
+        self.assertEqual(self._count("status = 'pending'"), 2)
+
+    async def test_dequeue_claims_one_message(self):
+        ids = await self._enqueue(3)
+
+        first = await self.backend.dequeue()
+
+        self.assertEqual(first.id, ids[0])
+        # Nothing is claimed ahead of a handler
+        self.assertEqual(self._count("status = 'processing'"), 1)
+
+    async def test_acks_are_batched(self):
+        await self._enqueue(4)
+        batch = await self.backend.dequeue_batch(4)
+
+        await self.backend.ack(batch[0].id)
+        await self.backend.ack(batch[1].id)
+        # Below ack_batch_size: nothing deleted yet
+        self.assertEqual(self._count(), 4)
+
+        await self.backend.ack(batch[2].id)
+        self.assertEqual(self._count(), 1)
+
+    async def test_pending_acks_flushed_on_next_claim(self):
+        await self._enqueue(2)
+        msg = (await self.backend.dequeue_batch(1))[0]
+        await self.backend.ack(msg.id)
+
+        await self.backend.dequeue_batch(1)
+
+        self.assertEqual(self._count("id = ?", (msg.id,)), 0)
+
+    async def test_pending_acks_flushed_periodically(self):
+        await self._enqueue(1)
+        self.backend.ack_flush_interval = 0.05
+
+        async def handler(msg):
+            pass
+
+        consumer = asyncio.create_task(self.backend.start_consuming(handler))
+        try:
+            for _ in range(40):
+                await asyncio.sleep(0.05)
+                if self._count() == 0:
+                    break
+            # Deleted while the consumer is still running, not on shutdown
+            self.assertEqual(self._count(), 0)
+        finally:
+            consumer.cancel()
+            await asyncio.gather(consumer, return_exceptions=True)
+
+    async def test_two_consumers_do_not_rerun_claimed_or_acked_messages(self):
+        ids = await self._enqueue(5)
+        other = SqliteWalQueueBackend(
+            db_path=self.db_path, batch_size=5, visibility_timeout=2
+        )
+        self.backend.visibility_timeout = 2
+        runs = Counter()
+
+        async def slow_handler(msg):
+            runs[msg.id] += 1
+            await asyncio.sleep(1)
+
+        consumers = [
+            asyncio.create_task(
+                backend.start_consuming(slow_handler, concurrency=1, reap_interval=0.2)
+            )
+            for backend in (self.backend, other)
+        ]
+        try:
+            for _ in range(100):
+                await asyncio.sleep(0.1)
+                if self._count() == 0:
+                    break
+        finally:
+            for consumer in consumers:
+                consumer.cancel()
+            await asyncio.gather(*consumers, return_exceptions=True)
+            other.close()
+
+        self.assertEqual(self._count(), 0)
+        self.assertEqual(runs, Counter({msg_id: 1 for msg_id in ids}))
+
+    async def test_nack(self):
+        await self._enqueue(1)
+        msg = await self.backend.dequeue()
+
+        await self.backend.nack(msg.id, retry_after=10)
+
+        self.assertEqual(self._count("status = 'pending' AND attempts = 1"), 1)
+        self.assertIsNone(await self.backend.dequeue())
+
+    async def test_dequeue_batch_respects_lanes_and_priority(self):
+        bulk = QueueMessage(
+            id=generate_ulid(), task_name="t", payload={}, lane="bulk", priority=-10
+        )
+        default = QueueMessage(id=generate_ulid(), task_name="t", payload={})
+        realtime = QueueMessage(
+            id=generate_ulid(), task_name="t", payload={}, lane="realtime", priority=10
+        )
+        for message in (bulk, default, realtime):
+            await self.backend.enqueue(message)
+
+        batch = await self.backend.dequeue_batch(5, lanes=["realtime", "default"])
+
+        self.assertEqual([m.id for m in batch], [realtime.id, default.id])
+        self.assertEqual(self._count("status = 'pending' AND lane = 'bulk'"), 1)
+
+    async def test_dequeue_empty(self):
+        self.assertIsNone(await self.backend.dequeue())
+        self.assertEqual(await self.backend.dequeue_batch(10), [])
+
+    async def test_dequeue_batch_claims_one_message_per_partition(self):
+        messages = [
+            QueueMessage(id=generate_ulid(), task_name="t", payload={"i": i}, partition_key=key)
+            for i, key in enumerate(["chat-1", "chat-1", "chat-2", None])
+        ]
+        for message in messages:
+            await self.backend.enqueue(message)
+
+        batch = await self.backend.dequeue_batch(5)
+        self.assertEqual([m.id for m in batch], [messages[0].id, messages[2].id, messages[3].id])
+
+        await self.backend.ack(messages[0].id)
+        batch = await self.backend.dequeue_batch(5)
+        self.assertEqual([m.id for m in batch], [messages[1].id])
+
+    async def test_partitioned_ack_is_flushed_immediately(self):
+        first = QueueMessage(id=generate_ulid(), task_name="t", payload={}, partition_key="chat-1")
+        plain = QueueMessage(id=generate_ulid(), task_name="t", payload={})
+        for message in (first, plain):
+            await self.backend.enqueue(message)
+        await self.backend.dequeue_batch(5)
+
+        await self.backend.ack(plain.id)
+        self.assertEqual(self._count("id = ?", (plain.id,)), 1)
+
+        await self.backend.ack(first.id)
+        # The partition head is gone, so the partition is free again
+        self.assertEqual(self._count(), 0)
+
+    async def test_failed_statement_is_rolled_back(self):
+        await self._enqueue(1)
+        msg = await self.backend.dequeue()
+        conn = self.backend._get_conn()
+        conn.execute("BEGIN")
+        conn.execute("UPDATE message_queue SET attempts = 9")
+
+        with self.assertRaises(sqlite3.OperationalError):
+            # Nested BEGIN fails inside a transaction left open by a caller
+            self.backend._rolling_back(conn.execute, "BEGIN")
+
+        self.assertFalse(conn.in_transaction)
+        await self.backend.nack(msg.id)
+        self.assertEqual(self._count("attempts = 1"), 1)
+
+    async def test_ack_logs_flush_errors(self):
+        await self._enqueue(3)
+        batch = await self.backend.dequeue_batch(3)
+
+        async def broken_flush():
+            raise sqlite3.OperationalError("database is locked")
+
+        self.backend.flush = broken_flush
+        with self.assertLogs("src.core.queue.backends.sqlite_wal", "ERROR"):
+            for msg in batch:
+                await self.backend.ack(msg.id)
@@ -0,0 +1,89 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("boto3")
+
+from src.core.queue.backends.sqs import SQSBackend  # noqa: E402
+from src.core.queue.models import QueueMessage  # noqa: E402
+
+
+class TestSQSBackendEnqueueMany(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        patcher = patch("src.core.queue.backends.sqs.boto3")
+        self.mock_boto3 = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.sqs = MagicMock()
+        self.mock_boto3.client.return_value = self.sqs
+        self.sqs.send_message_batch.side_effect = lambda QueueUrl, Entries: {
+            "Successful": [
+                {"Id": entry["Id"], "MessageId": f"{QueueUrl}#{entry['Id']}"}
+                for entry in Entries
+            ]
+        }
+
+        self.backend = SQSBackend(
+            queue_url="default-url",
+            region_name="us-east-1",
+            lane_queue_urls={"realtime": "realtime-url"},
+        )
+
+    async def test_batches_per_queue_in_chunks_of_ten(self):
+        messages = [
+            QueueMessage(task_name="generate_embedding", payload={"i": i})
+            for i in range(12)
+        ] + [QueueMessage(task_name="send_whatsapp_message", payload={}, lane="realtime")]
+
+        ids = await self.backend.enqueue_many(messages)
+
+        calls = self.sqs.send_message_batch.call_args_list
+        self.assertEqual(
+            [(c.kwargs["QueueUrl"], len(c.kwargs["Entries"])) for c in calls],
+            [("default-url", 10), ("default-url", 2), ("realtime-url", 1)],
+        )
+        self.assertEqual(ids[0], "default-url#0")
+        self.assertEqual(ids[11], "default-url#1")
+        self.assertEqual(ids[12], "realtime-url#0")
+        self.sqs.send_message.assert_not_called()
+
+    async def test_partial_failure_raises(self):
+        self.sqs.send_message_batch.side_effect = None
+        self.sqs.send_message_batch.return_value = {
+            "Successful": [],
+            "Failed": [{"Id": "0", "Code": "InternalError", "Message": "boom"}],
+        }
+
+        with self.assertRaises(RuntimeError):
+            await self.backend.enqueue_many(
+                [QueueMessage(task_name="t", payload={})]
+            )
+
+
+class TestSQSBackendFifo(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        patcher = patch("src.core.queue.backends.sqs.boto3")
+        self.mock_boto3 = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.sqs = MagicMock()
+        self.mock_boto3.client.return_value = self.sqs
+        self.sqs.send_message.return_value = {"MessageId": "sqs-id"}
+
+    async def test_fifo_queue_groups_by_partition_key(self):
+        backend = SQSBackend(queue_url="orders.fifo", region_name="us-east-1")
+        message = QueueMessage(task_name="t", payload={}, partition_key="chat-1")
+
+        await backend.enqueue(message)
+
+        kwargs = self.sqs.send_message.call_args.kwargs
+        self.assertEqual(kwargs["MessageGroupId"], "chat-1")
+        self.assertEqual(kwargs["MessageDeduplicationId"], message.id)
+
+    async def test_standard_queue_has_no_group(self):
+        backend = SQSBackend(queue_url="default-url", region_name="us-east-1")
+
+        await backend.enqueue(QueueMessage(task_name="t", payload={}, partition_key="chat-1"))
+
+        self.assertNotIn("MessageGroupId", self.sqs.send_message.call_args.kwargs)
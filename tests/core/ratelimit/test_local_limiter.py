@@ -0,0 +1,81 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.core.ratelimit import LocalTokenBucketLimiter, create_rate_limiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = FakeClock()
+    with patch("src.core.ratelimit.local.time.monotonic", clock):
+        yield clock
+
+
+@pytest.mark.asyncio
+async def test_burst_then_refill_at_rate(clock):
+    limiter = LocalTokenBucketLimiter(rate=2, burst=3)
+
+    for _ in range(3):
+        assert await limiter._try_acquire("k") == 0
+    assert await limiter._try_acquire("k") == pytest.approx(0.5)
+
+    clock.now += 0.5
+    assert await limiter._try_acquire("k") == 0
+    # Other keys have their own bucket
+    assert await limiter._try_acquire("other") == 0
+
+
+@pytest.mark.asyncio
+async def test_acquire_sleeps_until_token(clock):
+    limiter = LocalTokenBucketLimiter(rate=4, burst=1)
+
+    async def advance(seconds):
+        clock.now += seconds
+
+    with patch("src.core.ratelimit.interfaces.asyncio.sleep", AsyncMock(side_effect=advance)) as sleep:
+        await limiter.acquire("k")
+        await limiter.acquire("k")
+
+    sleep.assert_awaited_once_with(pytest.approx(0.25))
+
+
+@pytest.mark.asyncio
+async def test_penalize_blocks_and_halves_rate(clock):
+    limiter = LocalTokenBucketLimiter(rate=10, burst=10, min_rate=2, recovery_seconds=30)
+
+    await limiter.penalize("k", retry_after=5)
+
+    assert limiter.current_rate("k") == 5
+    assert await limiter._try_acquire("k") == pytest.approx(5)
+
+    await limiter.penalize("k")
+    await limiter.penalize("k")
+    assert limiter.current_rate("k") == 2  # Floor at min_rate
+
+
+@pytest.mark.asyncio
+async def test_rate_recovers_after_quiet_period(clock):
+    limiter = LocalTokenBucketLimiter(rate=10, burst=10, recovery_seconds=30)
+    await limiter.penalize("k", retry_after=0)
+
+    clock.now += 31
+    await limiter._try_acquire("k")
+
+    assert limiter.current_rate("k") == 6
+
+
+def test_factory_backends():
+    assert isinstance(create_rate_limiter("local", rate=1, burst=1), LocalTokenBucketLimiter)
+    with pytest.raises(ValueError):
+        create_rate_limiter("redis", rate=1, burst=1)
+    with pytest.raises(ValueError):
+        create_rate_limiter("memcached", rate=1, burst=1)
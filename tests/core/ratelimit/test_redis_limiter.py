@@ -0,0 +1,46 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.ratelimit import RedisTokenBucketLimiter
+
+
+@pytest.fixture
+def redis_client():
+    with patch("redis.asyncio.from_url") as from_url:
+        client = MagicMock()
+        client.register_script.side_effect = lambda script: AsyncMock(name=script[:20])
+        from_url.return_value = client
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_acquire_runs_script_with_bucket_params(redis_client):
+    limiter = RedisTokenBucketLimiter("redis://localhost", rate=5, burst=10, prefix="rl:")
+    limiter._acquire.return_value = b"0.2"
+
+    assert await limiter._try_acquire("owner:+1") == pytest.approx(0.2)
+
+    kwargs = limiter._acquire.call_args.kwargs
+    assert kwargs["keys"] == ["rl:owner:+1"]
+    assert kwargs["args"][:3] == [5, 10, 30.0]
+
+
+@pytest.mark.asyncio
+async def test_penalize_passes_retry_after(redis_client):
+    limiter = RedisTokenBucketLimiter("redis://localhost", rate=8, burst=8, prefix="rl:")
+
+    await limiter.penalize("k", retry_after=3)
+
+    kwargs = limiter._penalize.call_args.kwargs
+    assert kwargs["keys"] == ["rl:k"]
+    assert kwargs["args"][:3] == [8, 1.0, 3]
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_local_bucket_when_redis_down(redis_client):
+    limiter = RedisTokenBucketLimiter("redis://localhost", rate=1, burst=1)
+    limiter._acquire.side_effect = ConnectionError("down")
+
+    assert await limiter._try_acquire("k") == 0
+    assert await limiter._try_acquire("k") > 0
@@ -0,0 +1,30 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.cache import TTLCache
+from src.modules.ai.services.transcription_cache import TranscriptionCache
+
+
+@pytest.mark.asyncio
+async def test_keyed_by_digest_language_and_model():
+    cache = TTLCache()
+    transcripts = TranscriptionCache(cache, namespace="base")
+
+    await transcripts.set("abc", "olá", language="pt")
+
+    assert await transcripts.get("abc", "pt") == "olá"
+    assert await transcripts.get("abc") is None
+    assert await transcripts.get("abd", "pt") is None
+    assert await TranscriptionCache(cache, namespace="small").get("abc", "pt") is None
+
+
+@pytest.mark.asyncio
+async def test_cache_errors_are_misses():
+    backend = MagicMock()
+    backend.get.side_effect = RuntimeError("disk I/O error")
+    backend.set.side_effect = RuntimeError("disk I/O error")
+    transcripts = TranscriptionCache(backend)
+
+    assert await transcripts.get("abc") is None
+    await transcripts.set("abc", "text")  # Does not raise
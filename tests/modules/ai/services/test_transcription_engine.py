@@ -0,0 +1,69 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.modules.ai.services.transcription_engine import TranscriptionEngine
+
+
+@pytest.fixture
+def pool():
+    pool = ThreadPoolExecutor(max_workers=2)
+    yield pool
+    pool.shutdown(wait=True, cancel_futures=True)
+
+
+@pytest.fixture
+def service(pool):
+    service = MagicMock()
+    service.transcribe.side_effect = lambda path, language: f"{language}:{path}"
+    service.submit.side_effect = lambda path, language: pool.submit(
+        service.transcribe, path, language
+    )
+    return service
+
+
+@pytest.mark.asyncio
+async def test_each_clip_goes_straight_to_the_model_pool(service):
+    engine = TranscriptionEngine(service)
+
+    results = await asyncio.gather(
+        engine.transcribe("a.ogg", "pt"), engine.transcribe("b.ogg", "en")
+    )
+
+    assert results == ["pt:a.ogg", "en:b.ogg"]
+    assert service.submit.call_count == 2
+    await engine.close()
+
+
+@pytest.mark.asyncio
+async def test_failure_propagates(service):
+    service.transcribe.side_effect = RuntimeError("model crashed")
+    engine = TranscriptionEngine(service)
+
+    with pytest.raises(RuntimeError):
+        await engine.transcribe("a.ogg")
+
+
+@pytest.mark.asyncio
+async def test_close_releases_in_flight_callers(service):
+    release = threading.Event()
+
+    def blocked(path, language):
+        release.wait(2)
+        return path
+
+    service.transcribe.side_effect = blocked
+    engine = TranscriptionEngine(service)
+    # Two running on the pool, the third not started yet
+    callers = [asyncio.create_task(engine.transcribe(f"{i}.ogg")) for i in range(3)]
+    await asyncio.sleep(0.05)
+
+    await asyncio.wait_for(engine.close(), timeout=1)
+    release.set()
+
+    results = await asyncio.gather(*callers, return_exceptions=True)
+    assert all(isinstance(r, asyncio.CancelledError) for r in results)
+    assert not engine._in_flight
@@ -22,7 +22,9 @@ class TestTranscriptionService:
         # First access triggers load
         model = service.model
         assert model is not None
-        mock_whisper_model.assert_called_once_with("tiny", device="cpu", compute_type="int8")
+        mock_whisper_model.assert_called_once_with(
+            "tiny", device="cpu", compute_type="int8", cpu_threads=0, num_workers=1
+        )
         
         # Second access returns cached model
         model2 = service.model
@@ -52,7 +54,11 @@ class TestTranscriptionService:
         
         assert result == "Hello world"
         mock_instance.transcribe.assert_called_once_with(
-            "test_audio.mp3", language="en", beam_size=5
+            "test_audio.mp3",
+            language="en",
+            beam_size=5,
+            vad_filter=True,
+            vad_parameters={"min_silence_duration_ms": 500},
         )
 
     @patch("os.path.exists")
@@ -80,3 +86,24 @@ class TestTranscriptionService:
         result = service.transcribe("test_audio.mp3")
         
         assert result == ""
+
+    @patch("os.path.exists")
+    def test_submit_runs_on_the_model_pool(self, mock_exists, mock_whisper_model):
+        """Test submitted transcriptions run across workers with the default language."""
+        mock_exists.return_value = True
+        service = TranscriptionService(model_size="tiny", num_workers=2, language="pt")
+
+        def fake_transcribe(path, **kwargs):
+            segment = Mock()
+            segment.text = f"text of {path}"
+            return [segment], Mock(language=kwargs["language"], language_probability=1.0)
+
+        mock_whisper_model.return_value.transcribe.side_effect = fake_transcribe
+
+        futures = [service.submit(path) for path in ["a.ogg", "b.ogg", "c.ogg"]]
+        result = [future.result(timeout=5) for future in futures]
+        service.shutdown()
+
+        assert result == ["text of a.ogg", "text of b.ogg", "text of c.ogg"]
+        for call in mock_whisper_model.return_value.transcribe.call_args_list:
+            assert call.kwargs["language"] == "pt"
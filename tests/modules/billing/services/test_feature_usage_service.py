@@ -183,3 +183,99 @@ def test_increment_usage_success(feature_usage_service, mock_usage_repo, mock_ca
         feature_id="feat_1",
         amount=1
     )
+
+def _feature_and_usage(owner_id, feature_key="finance", current_usage=10):
+    feature = Feature(
+        feature_id="feat_1",
+        feature_key=feature_key,
+        name="Finance",
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow()
+    )
+    usage = FeatureUsage(
+        usage_id="usage_1",
+        owner_id=owner_id,
+        feature_id="feat_1",
+        current_usage=current_usage,
+        quota_limit=100,
+        is_active=True,
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow()
+    )
+    return feature, usage
+
+def test_get_usage_summary_uses_joined_query(feature_usage_service, mock_usage_repo):
+    feature, usage = _feature_and_usage("owner_123")
+    mock_usage_repo.find_all_with_features_by_owner.return_value = [(usage, feature)]
+
+    summary = feature_usage_service.get_usage_summary("owner_123")
+
+    assert summary["finance"].feature_id == "feat_1"
+    assert summary["finance"].percentage_used == 10.0
+    mock_usage_repo.find_all_with_features_by_owner.assert_called_once_with("owner_123")
+    mock_usage_repo.find_all_by_owner.assert_not_called()
+
+def test_get_usage_summary_cached_until_usage_changes(mock_usage_repo, mock_catalog_service):
+    from src.core.cache import TTLCache
+
+    service = FeatureUsageService(
+        usage_repository=mock_usage_repo,
+        catalog_service=mock_catalog_service,
+        summary_cache=TTLCache(),
+    )
+    feature, usage = _feature_and_usage("owner_123")
+    mock_usage_repo.find_all_with_features_by_owner.return_value = [(usage, feature)]
+    mock_catalog_service.get_feature_by_key.return_value = feature
+    mock_usage_repo.increment.return_value = usage
+
+    service.get_usage_summary("owner_123")
+    service.get_usage_summary("owner_123")
+    assert mock_usage_repo.find_all_with_features_by_owner.call_count == 1
+
+    service.increment_usage("owner_123", "finance", check_access=False)
+    service.get_usage_summary("owner_123")
+    assert mock_usage_repo.find_all_with_features_by_owner.call_count == 2
+
+def test_check_feature_access_served_from_cache(mock_usage_repo, mock_catalog_service):
+    from src.core.cache import TieredCache
+
+    cache = TieredCache()
+    service = FeatureUsageService(
+        usage_repository=mock_usage_repo,
+        catalog_service=mock_catalog_service,
+        cache_service=cache,
+    )
+    feature, usage = _feature_and_usage("owner_123", current_usage=50)
+    mock_catalog_service.get_feature_by_key.return_value = feature
+    mock_usage_repo.find_by_owner_and_feature.return_value = usage
+
+    first = service.check_feature_access("owner_123", "finance")
+    second = service.check_feature_access("owner_123", "finance")
+
+    assert second == first
+    assert second.feature_id == "feat_1"
+    mock_usage_repo.find_by_owner_and_feature.assert_called_once()
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+def test_increment_usage_writes_through_cache(mock_usage_repo, mock_catalog_service):
+    from src.core.cache import TieredCache
+
+    cache = TieredCache()
+    service = FeatureUsageService(
+        usage_repository=mock_usage_repo,
+        catalog_service=mock_catalog_service,
+        cache_service=cache,
+    )
+    feature, usage = _feature_and_usage("owner_123", current_usage=99)
+    _, updated = _feature_and_usage("owner_123", current_usage=100)
+    mock_catalog_service.get_feature_by_key.return_value = feature
+    mock_usage_repo.find_by_owner_and_feature.return_value = usage
+    mock_usage_repo.increment.return_value = updated
+
+    service.increment_usage("owner_123", "finance")
+    result = service.check_feature_access("owner_123", "finance")
+
+    assert result.allowed is False
+    assert result.reason == "Quota exceeded"
+    # Only the pre-increment access check hit the database
+    mock_usage_repo.find_by_owner_and_feature.assert_called_once()
@@ -0,0 +1,78 @@
+import pytest
+from datetime import datetime
+from unittest.mock import Mock
+
+from src.core.cache import TTLCache
+from src.modules.billing.enums.feature_type import FeatureType
+from src.modules.billing.models.feature import Feature
+from src.modules.billing.services.features_catalog_service import FeaturesCatalogService
+
+
+def make_feature(feature_key="finance"):
+    return Feature(
+        feature_id="feat_1",
+        feature_key=feature_key,
+        name="Finance",
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow()
+    )
+
+
+@pytest.fixture
+def catalog_repo():
+    return Mock()
+
+
+@pytest.fixture
+def service(catalog_repo):
+    return FeaturesCatalogService(catalog_repository=catalog_repo, cache=TTLCache())
+
+
+def test_get_feature_by_key_is_cached(service, catalog_repo):
+    catalog_repo.find_by_key.return_value = make_feature()
+
+    assert service.get_feature_by_key("finance").feature_id == "feat_1"
+    assert service.get_feature_by_key("finance").feature_id == "feat_1"
+
+    catalog_repo.find_by_key.assert_called_once_with("finance")
+
+
+def test_missing_feature_is_not_cached(service, catalog_repo):
+    catalog_repo.find_by_key.return_value = None
+
+    with pytest.raises(ValueError):
+        service.get_feature_by_key("finance")
+
+    catalog_repo.find_by_key.return_value = make_feature()
+    assert service.get_feature_by_key("finance").feature_key == "finance"
+
+
+def test_deprecate_feature_invalidates_cache(service, catalog_repo):
+    catalog_repo.find_by_key.return_value = make_feature()
+    catalog_repo.update.return_value = make_feature()
+    service.get_feature_by_key("finance")
+
+    service.deprecate_feature("finance", reason="replaced")
+    service.get_feature_by_key("finance")
+
+    assert catalog_repo.find_by_key.call_count == 2
+
+
+def test_create_feature_invalidates_cached_key(service, catalog_repo):
+    service.cache.set("new_feature", make_feature("new_feature"))
+    catalog_repo.find_by_key.return_value = None
+    catalog_repo.create.return_value = make_feature("new_feature")
+
+    service.create_feature("new_feature", "New", FeatureType.BOOLEAN)
+
+    assert service.cache.get("new_feature") is None
+
+
+def test_works_without_cache(catalog_repo):
+    service = FeaturesCatalogService(catalog_repository=catalog_repo)
+    catalog_repo.find_by_key.return_value = make_feature()
+
+    service.get_feature_by_key("finance")
+    service.get_feature_by_key("finance")
+
+    assert catalog_repo.find_by_key.call_count == 2
@@ -0,0 +1,43 @@
+import pytest
+from unittest.mock import Mock, patch
+
+from src.core.cache import TTLCache
+from src.modules.billing.services.subscription_access_cache import SubscriptionAccessCache
+
+
+@pytest.mark.asyncio
+async def test_denied_access_uses_negative_ttl():
+    cache = SubscriptionAccessCache(TTLCache(), ttl=300, negative_ttl=30, local_ttl=300)
+
+    with patch("src.core.cache.memory.time.monotonic", return_value=0.0):
+        await cache.set("owner_ok", True)
+        await cache.set("owner_denied", False)
+
+    with patch("src.core.cache.memory.time.monotonic", return_value=60.0):
+        assert await cache.get("owner_ok") is True
+        assert await cache.get("owner_denied") is None
+
+
+@pytest.mark.asyncio
+async def test_shared_backend_keys_and_ttls():
+    backend = Mock()
+    backend.get.return_value = True
+    cache = SubscriptionAccessCache(backend, ttl=300, negative_ttl=30)
+
+    assert await cache.get("owner_1") is True
+    await cache.set("owner_1", False)
+    await cache.invalidate("owner_1")
+
+    backend.get.assert_called_once_with("billing:access:owner_1")
+    backend.set.assert_called_once_with("billing:access:owner_1", False, 30)
+    backend.delete.assert_called_once_with("billing:access:owner_1")
+
+
+@pytest.mark.asyncio
+async def test_in_process_cache_caps_ttls():
+    cache = SubscriptionAccessCache(TTLCache(), ttl=300, negative_ttl=30, local_ttl=20)
+    assert (cache.ttl, cache.negative_ttl) == (20, 20)
+
+    # A shared cache is invalidated across processes, so its TTLs stand
+    shared = SubscriptionAccessCache(Mock(), ttl=300, negative_ttl=30, local_ttl=20)
+    assert (shared.ttl, shared.negative_ttl) == (300, 30)
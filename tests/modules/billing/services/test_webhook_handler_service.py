@@ -105,3 +105,24 @@ async def test_handle_subscription_deleted_cancels_subscription(webhook_handler,
         reason="Canceled via Stripe",
         triggered_by="stripe"
     )
+
+@pytest.mark.asyncio
+async def test_handle_event_invalidates_access_cache(mock_subscription_service, mock_plan_service):
+    access_cache = Mock()
+    access_cache.invalidate = AsyncMock()
+    webhook_handler = WebhookHandlerService(
+        mock_subscription_service, mock_plan_service, access_cache=access_cache
+    )
+    event = {
+        "type": "customer.subscription.deleted",
+        "data": {"object": {"id": "sub_123"}}
+    }
+
+    mock_sub = Mock()
+    mock_sub.subscription_id = "internal_sub_123"
+    mock_sub.owner_id = "owner_123"
+    mock_subscription_service.subscription_repo.find_by_stripe_subscription_id.return_value = mock_sub
+
+    await webhook_handler.handle_event(event)
+
+    access_cache.invalidate.assert_awaited_once_with("owner_123")
@@ -0,0 +1,52 @@
+from urllib.parse import urlencode
+
+import pytest
+from starlette.requests import Request
+
+from src.modules.channels.twilio.api.dependencies import parse_twilio_payload, read_twilio_form
+
+
+def make_request(body: bytes, content_type: str) -> Request:
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/webhooks/inbound",
+        "query_string": b"",
+        "headers": [(b"content-type", content_type.encode())],
+    }
+    return Request(scope, receive)
+
+
+FORM = {
+    "MessageSid": "SM123",
+    "AccountSid": "AC123",
+    "Body": "Olá, tudo bem? a+b=c&d",
+    "From": "whatsapp:+5511999999999",
+    "To": "whatsapp:+14155238886",
+    "NumMedia": "0",
+    "NumSegments": "1",
+    "SmsStatus": "received",
+    "ApiVersion": "2010-04-01",
+    "ProfileName": "",
+}
+
+
+@pytest.mark.asyncio
+async def test_read_twilio_form_decodes_urlencoded_body():
+    request = make_request(urlencode(FORM).encode(), "application/x-www-form-urlencoded")
+
+    form_data = await read_twilio_form(request)
+
+    assert form_data == FORM
+
+
+@pytest.mark.asyncio
+async def test_parse_twilio_payload_from_form():
+    payload = await parse_twilio_payload(FORM)
+
+    assert payload.message_sid == "SM123"
+    assert payload.body == "Olá, tudo bem? a+b=c&d"
+    assert payload.num_media == 0
@@ -115,3 +115,38 @@ class TestTwilioAccountService:
             assert result is None
             # Should not call repo with default SID
             assert mock_repo.find_by_account_sid.call_count == 0
+
+    async def test_resolve_account_cached(self, mock_repo, mock_account):
+        """Test that repeated resolutions are served from the account cache."""
+        from src.core.cache import TTLCache
+
+        service = TwilioAccountService(mock_repo, account_cache=TTLCache())
+        mock_repo.find_by_account_sid.return_value = mock_account
+
+        first = await service.resolve_account(to_number="whatsapp:+1234567890", account_sid="AC12345")
+        second = await service.resolve_account(to_number="+1234567890", account_sid="AC12345")
+
+        assert first == second == mock_account
+        mock_repo.find_by_account_sid.assert_called_once()
+
+    async def test_resolve_account_negative_cache_expires(self, mock_repo, mock_account):
+        """Test that failed lookups are cached for negative_ttl only."""
+        from src.core.cache import TTLCache
+
+        service = TwilioAccountService(mock_repo, account_cache=TTLCache(), negative_ttl=10)
+        mock_repo.find_by_account_sid.return_value = None
+        mock_repo.find_by_phone_number.return_value = None
+
+        with patch("src.modules.channels.twilio.services.twilio_account_service.settings") as mock_settings:
+            mock_settings.api.environment = "production"
+
+            with patch("src.core.cache.memory.time.monotonic", return_value=0.0):
+                assert await service.resolve_account(to_number="+1234567890", account_sid=None) is None
+                assert await service.resolve_account(to_number="+1234567890", account_sid=None) is None
+            mock_repo.find_by_phone_number.assert_called_once()
+
+            # The number was added meanwhile (possibly by another process)
+            mock_repo.find_by_phone_number.return_value = mock_account
+            with patch("src.core.cache.memory.time.monotonic", return_value=11.0):
+                assert await service.resolve_account(to_number="+1234567890", account_sid=None) == mock_account
+            assert mock_repo.find_by_phone_number.call_count == 2
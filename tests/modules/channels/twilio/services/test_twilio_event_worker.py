@@ -87,3 +87,83 @@ async def test_handle_webhook_event_task_failure(service, payload):
         await service.handle_webhook_event_task(payload_dict)
     
     assert "DB Error" in str(exc.value)
+
+@pytest.mark.asyncio
+async def test_enqueue_webhook_event_drops_duplicate(mock_components, payload):
+    from src.modules.channels.twilio.services.webhook.deduplicator import TwilioWebhookDeduplicator
+
+    mock_components["queue_service"].enqueue = AsyncMock()
+    service = TwilioWebhookService(
+        **mock_components, deduplicator=TwilioWebhookDeduplicator(ttl_seconds=60)
+    )
+
+    first = await service.enqueue_webhook_event(payload)
+    retry = await service.enqueue_webhook_event(payload)
+
+    assert first.success is True
+    assert retry.success is True
+    assert "Duplicate" in retry.message
+    mock_components["queue_service"].enqueue.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_enqueue_webhook_event_releases_claim_on_error(mock_components, payload):
+    from src.modules.channels.twilio.services.webhook.deduplicator import TwilioWebhookDeduplicator
+
+    mock_components["queue_service"].enqueue = AsyncMock(side_effect=[Exception("down"), None])
+    service = TwilioWebhookService(
+        **mock_components, deduplicator=TwilioWebhookDeduplicator(ttl_seconds=60)
+    )
+
+    with pytest.raises(Exception):
+        await service.enqueue_webhook_event(payload)
+
+    # Twilio's retry must be accepted since nothing was enqueued
+    result = await service.enqueue_webhook_event(payload)
+    assert "enqueued" in result.message
+    assert mock_components["queue_service"].enqueue.call_count == 2
+
+@pytest.mark.asyncio
+async def test_enqueue_webhook_form_enqueues_raw_form(service, mock_components):
+    form_data = {
+        "MessageSid": "SM999",
+        "Body": "Oi",
+        "NumMedia": "0",
+        "From": "whatsapp:+1234567890",
+        "To": "whatsapp:+0987654321",
+    }
+
+    result = await service.enqueue_webhook_form(form_data)
+
+    assert result.success is True
+    mock_components["queue_service"].enqueue.assert_called_once_with(
+        "process_twilio_event",
+        form_data,
+        correlation_id="SM999",
+        partition_key="whatsapp:+0987654321::whatsapp:+1234567890",
+    )
+
+@pytest.mark.asyncio
+async def test_handle_webhook_event_task_accepts_raw_form(service):
+    await service.handle_webhook_event_task({
+        "MessageSid": "SM999",
+        "AccountSid": "AC123",
+        "Body": "Oi",
+        "From": "whatsapp:+1234567890",
+        "To": "whatsapp:+0987654321",
+        "NumMedia": "0",
+        "NumSegments": "1",
+        "SmsStatus": "received",
+        "ApiVersion": "2010-04-01",
+        "ChannelMetadata": '{"type": "whatsapp"}',
+    })
+
+    payload = service.process_webhook.call_args[0][0]
+    assert payload.num_media == 0
+    assert payload.channel_metadata == {"type": "whatsapp"}
+
+@pytest.mark.asyncio
+async def test_handle_webhook_event_task_discards_invalid_payload(service):
+    # Missing required fields: logged and dropped instead of retried
+    await service.handle_webhook_event_task({"MessageSid": "SM999"})
+
+    service.process_webhook.assert_not_called()
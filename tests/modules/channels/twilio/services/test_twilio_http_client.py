@@ -0,0 +1,119 @@
+"""Tests for PooledTwilioHttpClient."""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+from twilio.base.exceptions import TwilioRestException
+from twilio.rest import Client as TwilioClient
+
+from src.modules.channels.twilio.services.http_client import (
+    PooledTwilioHttpClient, parse_retry_after)
+
+MESSAGE_JSON = {
+    "sid": "SM123",
+    "status": "queued",
+    "to": "whatsapp:+5511999999999",
+    "from": "whatsapp:+5511888888888",
+    "body": "Hello",
+    "num_media": "0",
+    "error_code": None,
+    "error_message": None,
+}
+
+
+def make_client(handler, **kwargs) -> PooledTwilioHttpClient:
+    http_client = PooledTwilioHttpClient(**kwargs)
+    http_client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return http_client
+
+
+@pytest.mark.asyncio
+async def test_sdk_create_async_over_pooled_client():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(201, json=MESSAGE_JSON)
+
+    http_client = make_client(handler)
+    client = TwilioClient("AC123", "token", http_client=http_client)
+
+    message = await client.messages.create_async(
+        body="Hello", from_="whatsapp:+5511888888888", to="whatsapp:+5511999999999"
+    )
+
+    assert message.sid == "SM123"
+    assert requests[0].url.path == "/2010-04-01/Accounts/AC123/Messages.json"
+    assert b"Body=Hello" in requests[0].content
+    await http_client.close()
+
+
+@pytest.mark.asyncio
+async def test_retries_429_honouring_retry_after():
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "2"}, json={"code": 20429}),
+        httpx.Response(201, json=MESSAGE_JSON),
+    ]
+    http_client = make_client(lambda request: responses.pop(0))
+
+    with patch(
+        "src.modules.channels.twilio.services.http_client.asyncio.sleep"
+    ) as mock_sleep:
+        response = await http_client.request(
+            "POST", "https://api.twilio.com/x", auth=("AC123", "token")
+        )
+
+    assert response.status_code == 201
+    delay = mock_sleep.call_args[0][0]
+    assert 1.5 < delay <= 2
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_retries():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(429, json={"code": 20429, "message": "Too Many Requests"})
+
+    http_client = make_client(handler, max_retries=2, backoff_base=0.001)
+    client = TwilioClient("AC123", "token", http_client=http_client)
+
+    with pytest.raises(TwilioRestException) as exc:
+        await client.messages.create_async(body="Hi", from_="+1", to="+2")
+
+    assert exc.value.status == 429
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_bounds_concurrency_per_account():
+    in_flight = {"AC1": 0, "AC2": 0}
+    peak = {"AC1": 0, "AC2": 0}
+
+    async def handler(request):
+        account = request.url.path.strip("/")
+        in_flight[account] += 1
+        peak[account] = max(peak[account], in_flight[account])
+        await asyncio.sleep(0.01)
+        in_flight[account] -= 1
+        return httpx.Response(200, json={})
+
+    http_client = make_client(handler, max_per_account=2)
+
+    await asyncio.gather(
+        *[
+            http_client.request("GET", f"https://api.twilio.com/{sid}", auth=(sid, "t"))
+            for sid in ["AC1"] * 6 + ["AC2"] * 3
+        ]
+    )
+
+    assert peak == {"AC1": 2, "AC2": 2}
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") is None
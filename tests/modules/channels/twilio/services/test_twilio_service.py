@@ -1,6 +1,6 @@
 """Tests for TwilioService."""
 
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 from twilio.base.exceptions import TwilioRestException
@@ -31,6 +31,8 @@ class TestTwilioService:
             "src.modules.channels.twilio.services.twilio_service.TwilioClient"
         ) as mock:
             client_instance = mock.return_value
+            client_instance.messages.create_async = AsyncMock()
+            client_instance.messages.return_value.fetch_async = AsyncMock()
             yield client_instance
 
     async def test_get_client_cached(self, service):
@@ -108,7 +110,7 @@ class TestTwilioService:
             error_code=None,
             error_message=None,
         )
-        mock_twilio_client.messages.create.return_value = mock_msg
+        mock_twilio_client.messages.create_async.return_value = mock_msg
 
         # Inject client into cache to avoid lookup
         owner_id = "01ARZ3NDEKTSV4RRFFQ69G5FAV"
@@ -123,7 +125,7 @@ class TestTwilioService:
 
         assert isinstance(result, TwilioMessageResult)
         assert result.sid == "SM123"
-        mock_twilio_client.messages.create.assert_called_with(
+        mock_twilio_client.messages.create_async.assert_called_with(
             body="Hello", from_="+5511888888888", to="+5511999999999"
         )
 
@@ -150,7 +152,7 @@ class TestTwilioService:
         owner_id = "01ARZ3NDEKTSV4RRFFQ69G5FAV"
         service._clients[owner_id] = mock_twilio_client
 
-        mock_twilio_client.messages.create.side_effect = TwilioRestException(
+        mock_twilio_client.messages.create_async.side_effect = TwilioRestException(
             status=400, uri="/Messages", msg="Invalid number"
         )
 
@@ -176,7 +178,7 @@ class TestTwilioService:
             error_code=None,
             error_message=None,
         )
-        mock_twilio_client.messages.return_value.fetch.return_value = mock_msg
+        mock_twilio_client.messages.return_value.fetch_async.return_value = mock_msg
 
         result = await service.get_message_status(owner_id, "SM123")
 
@@ -255,7 +257,7 @@ class TestTwilioService:
             error_message=None,
         )
 
-        mock_twilio_client.messages.create.side_effect = [
+        mock_twilio_client.messages.create_async.side_effect = [
             mock_msg1,
             mock_msg2,
             mock_msg3,
@@ -269,15 +271,15 @@ class TestTwilioService:
             media_url="http://media.com",
         )
 
-        assert mock_twilio_client.messages.create.call_count == 3
+        assert mock_twilio_client.messages.create_async.call_count == 3
 
         # Check args for first call
-        args1, kwargs1 = mock_twilio_client.messages.create.call_args_list[0]
+        args1, kwargs1 = mock_twilio_client.messages.create_async.call_args_list[0]
         assert kwargs1["body"] == long_body[:1500]
         assert kwargs1["media_url"] == ["http://media.com"]
 
         # Check args for second call
-        args2, kwargs2 = mock_twilio_client.messages.create.call_args_list[1]
+        args2, kwargs2 = mock_twilio_client.messages.create_async.call_args_list[1]
         assert kwargs2["body"] == long_body[1500:3000]
         assert "media_url" not in kwargs2
 
@@ -285,3 +287,66 @@ class TestTwilioService:
         assert result.sid == "SM1"  # We decided to return first SID
         assert result.body == long_body  # Full body
         assert result.num_media == 1  # Total media
+
+    async def test_send_message_rate_limited(self, service, mock_twilio_client):
+        """Test that a persistent 429 surfaces as TwilioRateLimitError."""
+        from src.modules.channels.twilio.exceptions import TwilioRateLimitError
+
+        owner_id = "01ARZ3NDEKTSV4RRFFQ69G5FAV"
+        mock_twilio_client.username = "AC123"
+        service._clients[owner_id] = mock_twilio_client
+        service.http_client.pause("AC123", 5)
+        mock_twilio_client.messages.create_async.side_effect = TwilioRestException(
+            status=429, uri="/Messages", msg="Too Many Requests"
+        )
+
+        with pytest.raises(TwilioRateLimitError) as exc:
+            await service.send_message(
+                owner_id=owner_id, from_number="123", to_number="456", body="Test"
+            )
+
+        assert 4 < exc.value.retry_after <= 5
+
+    async def test_send_message_resumes_and_reports_sent_chunks(
+        self, service, mock_twilio_client
+    ):
+        """A 429 midway reports the delivered chunks; a retry resumes after them."""
+        from src.modules.channels.twilio.exceptions import TwilioRateLimitError
+
+        owner_id = "01ARZ3NDEKTSV4RRFFQ69G5FAV"
+        mock_twilio_client.username = "AC123"
+        service._clients[owner_id] = mock_twilio_client
+        long_body = "a" * 1500 + "b" * 1500 + "c" * 10
+        sent = Mock(
+            sid="SM1", status="queued", num_media=0, to="to", from_="from",
+            error_code=None, error_message=None,
+        )
+        mock_twilio_client.messages.create_async.side_effect = [
+            sent,
+            TwilioRestException(status=429, uri="/Messages", msg="Too Many Requests"),
+        ]
+        before_chunk = AsyncMock()
+
+        with pytest.raises(TwilioRateLimitError) as exc:
+            await service.send_message(
+                owner_id=owner_id, from_number="from", to_number="to",
+                body=long_body, media_url="http://media.com",
+                before_chunk=before_chunk,
+            )
+
+        assert (exc.value.sent_chunks, exc.value.first_sid) == (1, "SM1")
+        # One limiter token per Twilio request
+        assert before_chunk.await_count == 2
+
+        mock_twilio_client.messages.create_async.reset_mock()
+        mock_twilio_client.messages.create_async.side_effect = [sent, sent]
+        result = await service.send_message(
+            owner_id=owner_id, from_number="from", to_number="to",
+            body=long_body, media_url="http://media.com", start_chunk=1,
+        )
+
+        calls = mock_twilio_client.messages.create_async.call_args_list
+        assert [c.kwargs["body"] for c in calls] == ["b" * 1500, "c" * 10]
+        # Media went out with the first chunk already
+        assert all("media_url" not in c.kwargs for c in calls)
+        assert result.body == long_body
@@ -66,6 +66,20 @@ async def test_enqueue_ai_task(processor, mock_services, owner_id, conv_id, msg_
     mock_services["queue_service"].enqueue.assert_called_once()
     args = mock_services["queue_service"].enqueue.call_args[1]
     assert args["task_name"] == "process_ai_response"
+    assert args["partition_key"] is None
+
+@pytest.mark.asyncio
+async def test_enqueue_ai_task_partitions_by_conversation(processor, mock_services, owner_id, conv_id, msg_id):
+    await processor.enqueue_ai_task(
+        owner_id=owner_id,
+        conversation_id=conv_id,
+        msg_id=msg_id,
+        payload_dump={"from_number": "whatsapp:+5511999999999", "to_number": "+14155238886"},
+        correlation_id="corr_1"
+    )
+
+    args = mock_services["queue_service"].enqueue.call_args[1]
+    assert args["partition_key"] == "whatsapp:+14155238886::whatsapp:+5511999999999#ai"
 
 @pytest.mark.asyncio
 async def test_handle_ai_response_success(processor, mock_services, payload, owner_id, conv_id, msg_id):
@@ -76,11 +90,7 @@ async def test_handle_ai_response_success(processor, mock_services, payload, own
     # Mock feature usage
     mock_usage = MagicMock()
     mock_usage.is_active = True
-    
-    # Mock feature catalog object
-    mock_feature_obj = MagicMock()
-    mock_feature_obj.feature_key = "finance"
-    mock_feature_obj.feature_id = "feat_123"
+    mock_usage.feature_id = "feat_123"
     
     # Mock agent
     mock_agent = MagicMock()
@@ -94,13 +104,11 @@ async def test_handle_ai_response_success(processor, mock_services, payload, own
     ) as mock_run:
         # Sequence:
         # 1. get_user_by_phone
-        # 2. get_usage_summary
-        # 3. get_feature_by_key
+        # 2. get_usage_summary (carries feature_id, no catalog lookup)
         # Agent run is called directly, not via run_in_threadpool
         mock_run.side_effect = [
             mock_user,
             {"finance": mock_usage},
-            mock_feature_obj
         ]
         
         mock_services["agent_factory"].get_agent.return_value = mock_agent
@@ -153,11 +161,7 @@ async def test_handle_ai_response_persists_profile_name_and_injects_context(proc
     # Mock feature usage
     mock_usage = MagicMock()
     mock_usage.is_active = True
-    
-    # Mock feature catalog object
-    mock_feature_obj = MagicMock()
-    mock_feature_obj.feature_key = "finance"
-    mock_feature_obj.feature_id = "feat_123"
+    mock_usage.feature_id = "feat_123"
 
     mock_agent = MagicMock()
     mock_agent.run = AsyncMock(return_value="AI Response Text")
@@ -169,14 +173,12 @@ async def test_handle_ai_response_persists_profile_name_and_injects_context(proc
     ) as mock_run:
         # Sequence:
         # 1. get_user_by_phone
-        # 2. get_usage_summary
-        # 3. get_feature_by_key
-        # 4. update_user_profile_name (since profile name detected)
+        # 2. get_usage_summary (carries feature_id, no catalog lookup)
+        # 3. update_user_profile_name (since profile name detected)
         # Agent run is direct
         mock_run.side_effect = [
             mock_user,
             {"finance": mock_usage},
-            mock_feature_obj,
             mock_user, # update_user_profile_name returns updated user
         ]
 
@@ -188,10 +190,10 @@ async def test_handle_ai_response_persists_profile_name_and_injects_context(proc
             correlation_id="corr_1",
         )
 
-        # Call 4 (index 3) is update_user_profile_name
-        assert mock_run.call_args_list[3].args[0] == mock_services["identity_service"].update_user_profile_name
-        assert mock_run.call_args_list[3].args[1] == "user_1"
-        assert mock_run.call_args_list[3].args[2] == "Lennon"
+        # Call 3 (index 2) is update_user_profile_name
+        assert mock_run.call_args_list[2].args[0] == mock_services["identity_service"].update_user_profile_name
+        assert mock_run.call_args_list[2].args[1] == "user_1"
+        assert mock_run.call_args_list[2].args[2] == "Lennon"
 
         # Agent run verification
         mock_agent.run.assert_called_once()
@@ -221,11 +223,7 @@ async def test_handle_ai_response_forgets_profile_name(processor, mock_services,
     # Mock feature usage
     mock_usage = MagicMock()
     mock_usage.is_active = True
-    
-    # Mock feature catalog object
-    mock_feature_obj = MagicMock()
-    mock_feature_obj.feature_key = "finance"
-    mock_feature_obj.feature_id = "feat_123"
+    mock_usage.feature_id = "feat_123"
 
     mock_agent = MagicMock()
     mock_agent.run = AsyncMock(return_value="AI Response Text")
@@ -237,13 +235,11 @@ async def test_handle_ai_response_forgets_profile_name(processor, mock_services,
     ) as mock_run:
         # Sequence:
         # 1. get_user_by_phone
-        # 2. get_usage_summary
-        # 3. get_feature_by_key
-        # 4. clear_user_profile_name
+        # 2. get_usage_summary (carries feature_id, no catalog lookup)
+        # 3. clear_user_profile_name
         mock_run.side_effect = [
             mock_user,
             {"finance": mock_usage},
-            mock_feature_obj,
             mock_user, # clear_user_profile_name returns user
         ]
 
@@ -255,8 +251,8 @@ async def test_handle_ai_response_forgets_profile_name(processor, mock_services,
             correlation_id="corr_1",
         )
 
-        assert mock_run.call_args_list[3].args[0] == mock_services["identity_service"].clear_user_profile_name
-        assert mock_run.call_args_list[3].args[1] == "user_1"
+        assert mock_run.call_args_list[2].args[0] == mock_services["identity_service"].clear_user_profile_name
+        assert mock_run.call_args_list[2].args[1] == "user_1"
 
 @pytest.mark.asyncio
 async def test_handle_ai_response_user_not_found(processor, mock_services, payload, owner_id, conv_id, msg_id):
@@ -266,11 +262,9 @@ async def test_handle_ai_response_user_not_found(processor, mock_services, paylo
     ) as mock_run:
         # 1. get_user_by_phone -> None
         # 2. get_usage_summary -> {finance: usage}
-        # 3. get_feature_by_key -> feature
         mock_run.side_effect = [
             None,
-            {"finance": MagicMock(is_active=True)},
-            MagicMock(feature_key="finance", feature_id="123")
+            {"finance": MagicMock(is_active=True, feature_id="123")},
         ]
         
         await processor.handle_ai_response(
@@ -310,3 +304,70 @@ async def test_handle_ai_response_exception(processor, mock_services, payload, o
         call_kwargs = mock_services["message_handler"].send_and_persist_response.call_args.kwargs
         assert "dificuldades técnicas" in call_kwargs.get("body", "")
         assert call_kwargs.get("is_error") is True
+
+@pytest.mark.asyncio
+async def test_handle_ai_response_task_skips_superseded_turn(processor, payload, owner_id, conv_id, msg_id):
+    processor.coalescer = MagicMock()
+    processor.coalescer.wait_turn = AsyncMock(return_value=False)
+    processor.handle_ai_response = AsyncMock()
+
+    await processor.handle_ai_response_task({
+        "owner_id": owner_id,
+        "conversation_id": conv_id,
+        "msg_id": msg_id,
+        "payload": payload.model_dump(),
+        "correlation_id": "corr_1",
+    })
+
+    processor.handle_ai_response.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_handle_ai_response_merges_turn_messages(processor, mock_services, payload, owner_id, conv_id, msg_id):
+    first, second = MagicMock(msg_id="m1", body="oi"), MagicMock(msg_id=msg_id, body="tudo bem?")
+    mock_user = MagicMock(user_id="user_1")
+    mock_user.model_dump.return_value = {"user_id": "user_1"}
+    mock_agent = MagicMock()
+    mock_agent.run = AsyncMock(return_value="AI Response Text")
+    mock_services["agent_factory"].get_agent.return_value = mock_agent
+
+    with patch(
+        "src.modules.channels.twilio.services.webhook.ai_processor.run_in_threadpool",
+        new_callable=AsyncMock,
+    ) as mock_run:
+        mock_run.side_effect = [mock_user, {"finance": MagicMock(is_active=True, feature_id="feat_123")}]
+
+        await processor.handle_ai_response(
+            owner_id=owner_id,
+            conversation_id=conv_id,
+            msg_id=msg_id,
+            payload=payload,
+            correlation_id="corr_1",
+            turn_messages=[first, second],
+        )
+
+    assert mock_agent.run.call_args.kwargs["user_input"] == "oi\ntudo bem?"
+    mock_services["message_handler"].send_and_persist_response.assert_called_once()
+    extra_tasks = mock_services["message_handler"].send_and_persist_response.call_args.kwargs["extra_tasks"]
+    assert [t["payload"]["metadata"]["msg_id"] for t in extra_tasks] == ["m1", msg_id]
+
+@pytest.mark.asyncio
+async def test_handle_ai_response_task_loads_turn_from_coalescer(processor, mock_services, payload, owner_id, conv_id, msg_id):
+    from src.modules.channels.twilio.services.webhook.coalescer import TwilioWebhookCoalescer
+
+    coalescer = TwilioWebhookCoalescer(window_seconds=0, max_messages=3)
+    processor.coalescer = coalescer
+    turn = [MagicMock(msg_id=msg_id, body="oi", direction="inbound")]
+    conversation_service = mock_services["message_handler"].conversation_service
+    conversation_service.get_recent_messages = AsyncMock(return_value=turn)
+    processor.handle_ai_response = AsyncMock()
+
+    await processor.handle_ai_response_task({
+        "owner_id": owner_id,
+        "conversation_id": conv_id,
+        "msg_id": msg_id,
+        "payload": payload.model_dump(),
+        "correlation_id": "corr_1",
+    })
+
+    conversation_service.get_recent_messages.assert_awaited_once_with(conv_id, limit=6)
+    assert processor.handle_ai_response.call_args.kwargs["turn_messages"] == turn
@@ -3,7 +3,12 @@ from unittest.mock import MagicMock, AsyncMock, patch
 import pytest
 import os
 
+from src.core.cache import TTLCache
+from src.modules.ai.services.transcription_cache import TranscriptionCache
 from src.modules.channels.twilio.services.webhook.audio_processor import TwilioWebhookAudioProcessor
+from src.modules.channels.twilio.utils.helpers import DownloadedMedia
+
+FETCH_MEDIA = "src.modules.channels.twilio.services.webhook.audio_processor.fetch_media"
 
 @pytest.fixture
 def mock_services():
@@ -57,18 +62,20 @@ async def test_handle_audio_transcription_task_success(processor, mock_services)
          patch("os.remove") as mock_remove:
              
         with patch(
-            "src.modules.channels.twilio.services.webhook.audio_processor.run_in_threadpool",
+            FETCH_MEDIA,
             new_callable=AsyncMock,
-        ) as mock_run:
-            # Side effects:
-            # 1. download_media -> returns fake_file
-            # 2. transcribe -> returns text
-            mock_run.side_effect = [fake_file, "Transcribed text"]
-            
+            return_value=DownloadedMedia(fake_file, "audio/ogg", 100),
+        ) as mock_download, patch.object(
+            processor.transcription_engine,
+            "transcribe",
+            new_callable=AsyncMock,
+            return_value="Transcribed text",
+        ) as mock_transcribe:
             await processor.handle_audio_transcription_task(task_payload)
             
-            # Verify download
-            assert mock_run.call_count == 2
+            # Verify download and transcription
+            mock_download.assert_awaited_once()
+            mock_transcribe.assert_awaited_once_with(fake_file, language=None)
             
             # Verify DB update
             mock_services["message_handler"].update_message_body.assert_called_once_with(
@@ -92,14 +99,165 @@ async def test_handle_audio_transcription_failure(processor, mock_services):
     }
     
     with patch(
-        "src.modules.channels.twilio.services.webhook.audio_processor.run_in_threadpool",
+        FETCH_MEDIA,
         new_callable=AsyncMock,
-    ) as mock_run:
+    ) as mock_download:
         # Download fails
-        mock_run.return_value = None
+        mock_download.return_value = None
         
         await processor.handle_audio_transcription_task(task_payload)
         
         # Should stop processing
         mock_services["message_handler"].update_message_body.assert_not_called()
         mock_services["queue_service"].enqueue.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_handle_audio_transcription_uses_language_preference(mock_services):
+    identity_service = MagicMock()
+    identity_service.get_user_by_phone.return_value = MagicMock(preferences={"language": "pt"})
+    processor = TwilioWebhookAudioProcessor(
+        transcription_service=mock_services["transcription_service"],
+        queue_service=mock_services["queue_service"],
+        message_handler=mock_services["message_handler"],
+        identity_service=identity_service,
+    )
+    task_payload = {
+        "msg_id": "msg_123",
+        "media_url": "http://audio.com",
+        "media_type": "audio/ogg",
+        "payload_dump": {"from_number": "whatsapp:+5511999999999"},
+    }
+
+    with patch(
+        FETCH_MEDIA,
+        new_callable=AsyncMock,
+        return_value=DownloadedMedia("temp_audio.ogg", "audio/ogg", 100),
+    ), patch.object(
+        processor.transcription_engine, "transcribe", new_callable=AsyncMock, return_value=""
+    ) as mock_transcribe:
+        await processor.handle_audio_transcription_task(task_payload)
+
+    identity_service.get_user_by_phone.assert_called_once_with("+5511999999999")
+    mock_transcribe.assert_awaited_once_with("temp_audio.ogg", language="pt")
+
+
+@pytest.mark.asyncio
+async def test_handle_audio_transcription_reuses_cached_transcript(mock_services):
+    processor = TwilioWebhookAudioProcessor(
+        transcription_service=mock_services["transcription_service"],
+        queue_service=mock_services["queue_service"],
+        message_handler=mock_services["message_handler"],
+        transcription_cache=TranscriptionCache(TTLCache()),
+    )
+    task_payload = {"msg_id": "msg_123", "media_url": "http://audio.com", "media_type": "audio/ogg"}
+
+    with patch(
+        FETCH_MEDIA,
+        new_callable=AsyncMock,
+        side_effect=lambda **kwargs: DownloadedMedia("temp_audio.ogg", "audio/ogg", 100, "abc"),
+    ) as mock_fetch, patch.object(
+        processor.transcription_engine, "transcribe", new_callable=AsyncMock, return_value="Oi"
+    ) as mock_transcribe:
+        await processor.handle_audio_transcription_task(task_payload)
+        await processor.handle_audio_transcription_task(dict(task_payload, msg_id="msg_456"))
+
+    assert mock_fetch.call_args.kwargs["hash_algorithm"] == "sha256"
+    mock_transcribe.assert_awaited_once()  # Second (identical) audio hit the cache
+    mock_services["message_handler"].update_message_body.assert_any_call(
+        "msg_456", "[Transcrição de Áudio: Oi]"
+    )
+
+
+@pytest.mark.asyncio
+async def test_handle_audio_transcription_user_without_preferences(mock_services):
+    """A real User (no preferences field) falls back to auto-detect."""
+    from src.modules.identity.models.user import User
+
+    identity_service = MagicMock()
+    identity_service.get_user_by_phone.return_value = User(
+        owner_id="01ARZ3NDEKTSV4RRFFQ69G5FAV", phone="+5511999999999"
+    )
+    processor = TwilioWebhookAudioProcessor(
+        transcription_service=mock_services["transcription_service"],
+        queue_service=mock_services["queue_service"],
+        message_handler=mock_services["message_handler"],
+        identity_service=identity_service,
+    )
+    task_payload = {
+        "msg_id": "msg_123",
+        "media_url": "http://audio.com",
+        "media_type": "audio/ogg",
+        "conversation_id": "conv_1",
+        "payload_dump": {"from_number": "whatsapp:+5511999999999"},
+    }
+
+    with patch(
+        FETCH_MEDIA,
+        new_callable=AsyncMock,
+        return_value=DownloadedMedia("temp_audio.ogg", "audio/ogg", 100),
+    ), patch.object(
+        processor.transcription_engine, "transcribe", new_callable=AsyncMock, return_value="Oi"
+    ) as mock_transcribe:
+        await processor.handle_audio_transcription_task(task_payload)
+
+    mock_transcribe.assert_awaited_once_with("temp_audio.ogg", language=None)
+    mock_services["message_handler"].update_message_body.assert_awaited_once()
+    assert mock_services["queue_service"].enqueue.call_args.kwargs["task_name"] == "process_ai_response"
+
+@pytest.mark.asyncio
+async def test_handle_audio_transcription_skips_coalescer_without_conversation(mock_services):
+    coalescer = MagicMock()
+    coalescer.mark = AsyncMock()
+    processor = TwilioWebhookAudioProcessor(
+        transcription_service=mock_services["transcription_service"],
+        queue_service=mock_services["queue_service"],
+        message_handler=mock_services["message_handler"],
+        coalescer=coalescer,
+    )
+    task_payload = {
+        "msg_id": "msg_123",
+        "media_url": "http://audio.com",
+        "media_type": "audio/ogg",
+        "owner_id": "owner_1",
+        "payload_dump": {"body": "original"},
+    }
+
+    with patch(FETCH_MEDIA, new_callable=AsyncMock) as mock_fetch, \
+         patch("os.path.exists", return_value=True), patch("os.remove"), \
+         patch.object(processor.transcription_engine, "transcribe", new_callable=AsyncMock, return_value="Oi"):
+        mock_fetch.return_value = DownloadedMedia(path="temp_audio.ogg", content_type="audio/ogg", size=10)
+        await processor.handle_audio_transcription_task(task_payload)
+
+    coalescer.mark.assert_not_called()
+    mock_services["queue_service"].enqueue.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_handle_audio_transcription_without_media_type(processor, mock_services):
+    task_payload = {"msg_id": "msg_123", "media_url": "http://audio.com", "conversation_id": "conv_1"}
+
+    with patch(FETCH_MEDIA, new_callable=AsyncMock) as mock_fetch, \
+         patch("os.path.exists", return_value=True), patch("os.remove"), \
+         patch.object(processor.transcription_engine, "transcribe", new_callable=AsyncMock, return_value="Oi"):
+        mock_fetch.return_value = DownloadedMedia(path="temp_audio.ogg", content_type="audio/ogg", size=10)
+        await processor.handle_audio_transcription_task(task_payload)
+
+    # No None reaches the file-extension guess; the response Content-Type decides
+    assert mock_fetch.call_args.kwargs["media_type"] == ""
+    mock_services["message_handler"].update_message_body.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_handle_audio_transcription_without_engine_cleans_up(mock_services):
+    processor = TwilioWebhookAudioProcessor(
+        transcription_service=None,
+        queue_service=mock_services["queue_service"],
+        message_handler=mock_services["message_handler"],
+    )
+    task_payload = {"msg_id": "msg_123", "media_url": "http://audio.com", "media_type": "audio/ogg"}
+
+    with patch(FETCH_MEDIA, new_callable=AsyncMock) as mock_fetch, \
+         patch("os.path.exists", return_value=True), patch("os.remove") as mock_remove:
+        mock_fetch.return_value = DownloadedMedia(path="temp_audio.ogg", content_type="audio/ogg", size=10)
+        await processor.handle_audio_transcription_task(task_payload)
+
+    mock_remove.assert_called_once_with("temp_audio.ogg")
+    mock_services["queue_service"].enqueue.assert_not_called()
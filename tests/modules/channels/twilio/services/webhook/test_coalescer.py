@@ -0,0 +1,122 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+
+from src.core.utils.custom_ulid import generate_ulid
+from src.modules.channels.twilio.services.webhook.coalescer import TwilioWebhookCoalescer
+from src.modules.conversation.enums.message_direction import MessageDirection
+from src.modules.conversation.models.message import Message
+
+CONV_ID = "01HRZ32M1X6Z4P5R7W8K9A0M1C"
+OWNER_ID = "01HRZ32M1X6Z4P5R7W8K9A0M1N"
+IDS = {f"m{i}": generate_ulid() for i in range(6)}
+IDS["r0"] = generate_ulid()
+NAMES = {v: k for k, v in IDS.items()}
+
+
+def make_message(msg_id, body, direction=MessageDirection.INBOUND):
+    return Message(
+        msg_id=IDS[msg_id],
+        conv_id=CONV_ID,
+        owner_id=OWNER_ID,
+        from_number="whatsapp:+1",
+        to_number="whatsapp:+2",
+        body=body,
+        direction=direction,
+    )
+
+
+@pytest.mark.asyncio
+async def test_newer_message_supersedes_waiting_turn():
+    coalescer = TwilioWebhookCoalescer(window_seconds=0.05)
+    await coalescer.mark(CONV_ID, "m1")
+
+    first = asyncio.create_task(coalescer.wait_turn(CONV_ID, "m1"))
+    await asyncio.sleep(0.01)
+    await coalescer.mark(CONV_ID, "m2")
+
+    assert await first is False
+    assert await coalescer.wait_turn(CONV_ID, "m2") is True
+
+
+@pytest.mark.asyncio
+async def test_wait_turn_waits_for_window():
+    coalescer = TwilioWebhookCoalescer(window_seconds=0.05)
+    await coalescer.mark(CONV_ID, "m1")
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    assert await coalescer.wait_turn(CONV_ID, "m1") is True
+    assert loop.time() - start >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_cache_errors_fall_back_to_one_turn_per_message():
+    shared = MagicMock()
+    shared.get.side_effect = ConnectionError("redis down")
+    shared.set.side_effect = ConnectionError("redis down")
+    coalescer = TwilioWebhookCoalescer(window_seconds=10, shared_cache=shared)
+
+    await coalescer.mark(CONV_ID, "m1")
+    assert await coalescer.wait_turn(CONV_ID, "m1") is True
+
+
+def test_turn_messages_merges_inbound_run_since_last_reply():
+    coalescer = TwilioWebhookCoalescer(max_messages=4)
+    messages = [
+        make_message("m0", "old question"),
+        make_message("r0", "answer", MessageDirection.OUTBOUND),
+        make_message("m1", "oi"),
+        make_message("m2", ""),  # Audio not transcribed yet
+        make_message("m3", "tudo bem?"),
+        make_message("m4", "quero ver meus gastos"),
+        make_message("m5", "later"),
+    ]
+
+    turn = coalescer.turn_messages(messages, IDS["m4"])
+
+    assert [NAMES[m.msg_id] for m in turn] == ["m1", "m3", "m4", "m5"]
+    assert coalescer.turn_messages(messages, "missing") == []
+
+
+def test_turn_messages_caps_merged_messages():
+    coalescer = TwilioWebhookCoalescer(max_messages=2)
+    messages = [make_message(f"m{i}", f"msg {i}") for i in range(5)]
+
+    turn = coalescer.turn_messages(messages, IDS["m4"])
+
+    assert [NAMES[m.msg_id] for m in turn] == ["m3", "m4"]
+
+
+@pytest.mark.asyncio
+async def test_audio_marked_after_text_answers_both():
+    coalescer = TwilioWebhookCoalescer(window_seconds=0.05)
+    # m0 (audio) arrives before m1 (text), but is only marked once its
+    # transcription finishes, inside the text's window
+    await coalescer.mark(CONV_ID, IDS["m1"])
+    text_turn = asyncio.create_task(coalescer.wait_turn(CONV_ID, IDS["m1"]))
+    await asyncio.sleep(0.01)
+    await coalescer.mark(CONV_ID, IDS["m0"])
+
+    assert await text_turn is False
+    assert await coalescer.wait_turn(CONV_ID, IDS["m0"]) is True
+    messages = [
+        make_message("m0", "[Transcrição de Áudio: paguei o aluguel]"),
+        make_message("m1", "quanto sobrou?"),
+    ]
+    turn = coalescer.turn_messages(messages, IDS["m0"])
+
+    assert [NAMES[m.msg_id] for m in turn] == ["m0", "m1"]
+
+
+def test_turn_messages_after_reply_answers_only_the_late_message():
+    coalescer = TwilioWebhookCoalescer()
+    messages = [
+        make_message("m0", "[Transcrição de Áudio: paguei o aluguel]"),
+        make_message("m1", "quanto sobrou?"),
+        make_message("r0", "answer", MessageDirection.OUTBOUND),
+    ]
+
+    turn = coalescer.turn_messages(messages, IDS["m0"])
+
+    assert [NAMES[m.msg_id] for m in turn] == ["m0"]
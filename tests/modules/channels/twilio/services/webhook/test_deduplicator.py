@@ -0,0 +1,54 @@
+import pytest
+from unittest.mock import MagicMock
+
+from src.modules.channels.twilio.services.webhook.deduplicator import TwilioWebhookDeduplicator
+
+
+@pytest.mark.asyncio
+async def test_claim_rejects_repeated_sid():
+    dedup = TwilioWebhookDeduplicator(ttl_seconds=60)
+
+    assert await dedup.claim("SM1") is True
+    assert await dedup.claim("SM1") is False
+    assert await dedup.claim("SM2") is True
+
+
+@pytest.mark.asyncio
+async def test_release_allows_reclaim():
+    dedup = TwilioWebhookDeduplicator(ttl_seconds=60)
+
+    await dedup.claim("SM1")
+    await dedup.release("SM1")
+
+    assert await dedup.claim("SM1") is True
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_catches_other_replicas():
+    shared = MagicMock()
+    shared.add.return_value = False  # Another process already claimed it
+    dedup = TwilioWebhookDeduplicator(ttl_seconds=60, shared_cache=shared)
+
+    assert await dedup.claim("SM1") is False
+    shared.add.assert_called_once_with("twilio:webhook:SM1", 1, 60)
+
+
+@pytest.mark.asyncio
+async def test_local_hit_skips_shared_cache():
+    shared = MagicMock()
+    shared.add.return_value = True
+    dedup = TwilioWebhookDeduplicator(ttl_seconds=60, shared_cache=shared)
+
+    await dedup.claim("SM1")
+    assert await dedup.claim("SM1") is False
+    assert shared.add.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_release_clears_shared_cache():
+    shared = MagicMock()
+    dedup = TwilioWebhookDeduplicator(ttl_seconds=60, shared_cache=shared)
+
+    await dedup.release("SM1")
+
+    shared.delete.assert_called_once_with("twilio:webhook:SM1")
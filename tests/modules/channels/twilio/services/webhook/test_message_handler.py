@@ -14,6 +14,7 @@ from src.modules.conversation.enums.message_owner import MessageOwner
 def mock_services():
     queue_service = MagicMock()
     queue_service.enqueue = AsyncMock()
+    queue_service.enqueue_many = AsyncMock()
     
     conversation_service = MagicMock()
     conversation_service.get_or_create_conversation = AsyncMock()
@@ -174,8 +175,35 @@ async def test_send_and_persist_response_success(handler, mock_services, owner_i
     
     assert mock_services["conversation_service"].get_or_create_conversation.call_count == 1
     assert mock_services["conversation_service"].add_message.call_count == 1
-    # 1 for enqueue sending, 1 for enqueue embedding
-    assert mock_services["queue_service"].enqueue.call_count == 2
+    # Sending and embedding tasks go out in one batch
+    mock_services["queue_service"].enqueue_many.assert_called_once()
+    tasks = mock_services["queue_service"].enqueue_many.call_args[0][0]
+    assert [t["task_name"] for t in tasks] == ["send_whatsapp_message", "generate_embedding"]
+
+
+@pytest.mark.asyncio
+async def test_send_and_persist_response_batches_extra_tasks(handler, mock_services, owner_id, conv_id):
+    mock_message = MagicMock()
+    mock_message.msg_id = str(uuid.uuid4())
+    mock_message.body = ""
+    mock_services["conversation_service"].get_or_create_conversation.return_value = MagicMock(conv_id=conv_id)
+    mock_services["conversation_service"].add_message.return_value = mock_message
+    inbound_embedding = {"task_name": "generate_embedding", "payload": {"content": "hi"}}
+
+    await handler.send_and_persist_response(
+        owner_id=owner_id,
+        conversation_id=conv_id,
+        sender_number="123",
+        recipient_number="456",
+        body="msg",
+        correlation_id="corr",
+        extra_tasks=[inbound_embedding],
+    )
+
+    tasks = mock_services["queue_service"].enqueue_many.call_args[0][0]
+    # Empty outbound body: no outbound embedding, inbound one still batched
+    assert [t["task_name"] for t in tasks] == ["send_whatsapp_message", "generate_embedding"]
+    assert tasks[1] is inbound_embedding
 
 @pytest.mark.asyncio
 async def test_send_and_persist_response_failure(handler, mock_services, owner_id, conv_id):
@@ -195,3 +223,4 @@ async def test_send_and_persist_response_failure(handler, mock_services, owner_i
     assert mock_services["conversation_service"].get_or_create_conversation.call_count == 1
     assert mock_services["conversation_service"].add_message.call_count == 1
     mock_services["queue_service"].enqueue.assert_not_called()
+    mock_services["queue_service"].enqueue_many.assert_not_called()
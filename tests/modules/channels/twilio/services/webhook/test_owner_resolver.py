@@ -76,3 +76,24 @@ async def test_validate_owner_access(resolver, mock_services, owner_id):
         # Ensure it calls identity_service method (indirectly via run_in_threadpool args)
         # Note: checking args of run_in_threadpool is tricky as it takes func as first arg
         assert mock_run.call_args[0][0] == mock_services["identity_service"].validate_owner_access
+
+@pytest.mark.asyncio
+async def test_validate_owner_access_cached(mock_services, owner_id):
+    from src.core.cache import TTLCache
+    from src.modules.billing.services.subscription_access_cache import SubscriptionAccessCache
+
+    resolver = TwilioWebhookOwnerResolver(
+        twilio_account_service=mock_services["twilio_account_service"],
+        identity_service=mock_services["identity_service"],
+        access_cache=SubscriptionAccessCache(TTLCache()),
+    )
+    mock_services["identity_service"].validate_owner_access.return_value = False
+
+    assert await resolver.validate_owner_access(owner_id) is False
+    assert await resolver.validate_owner_access(owner_id) is False
+    mock_services["identity_service"].validate_owner_access.assert_called_once_with(owner_id)
+
+    await resolver.access_cache.invalidate(owner_id)
+    mock_services["identity_service"].validate_owner_access.return_value = True
+
+    assert await resolver.validate_owner_access(owner_id) is True
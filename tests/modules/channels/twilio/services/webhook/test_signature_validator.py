@@ -0,0 +1,67 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from twilio.request_validator import RequestValidator
+
+from src.modules.channels.twilio.services.webhook.signature_validator import TwilioSignatureValidator
+
+URL = "https://example.com/webhooks/inbound"
+
+
+@pytest.fixture
+def mock_settings():
+    with patch(
+        "src.modules.channels.twilio.services.webhook.signature_validator.settings"
+    ) as mock_settings:
+        mock_settings.twilio.account_sid = "AC_default"
+        mock_settings.twilio.auth_token = "default_token"
+        yield mock_settings
+
+
+def sign(token, params):
+    return RequestValidator(token).compute_signature(URL, params)
+
+
+@pytest.mark.asyncio
+async def test_validates_with_the_sending_accounts_token(mock_settings):
+    account_service = MagicMock()
+    account_service.resolve_account = AsyncMock(
+        return_value=MagicMock(account_sid="AC_tenant", auth_token="tenant_token")
+    )
+    validator = TwilioSignatureValidator(twilio_account_service=account_service)
+    params = {"AccountSid": "AC_tenant", "To": "whatsapp:+1555", "Body": "Oi"}
+
+    assert await validator.validate(URL, params, sign("tenant_token", params)) is True
+    assert await validator.validate(URL, params, sign("default_token", params)) is False
+    # Validator is cached per AccountSid
+    account_service.resolve_account.assert_awaited_once_with("whatsapp:+1555", "AC_tenant")
+
+
+@pytest.mark.asyncio
+async def test_default_account_uses_settings_token(mock_settings):
+    account_service = MagicMock()
+    account_service.resolve_account = AsyncMock()
+    validator = TwilioSignatureValidator(twilio_account_service=account_service)
+    params = {"AccountSid": "AC_default", "Body": "Oi"}
+
+    assert await validator.validate(URL, params, sign("default_token", params)) is True
+    account_service.resolve_account.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_lookup_failure_falls_back_without_caching(mock_settings):
+    account_service = MagicMock()
+    account_service.resolve_account = AsyncMock(side_effect=Exception("db down"))
+    validator = TwilioSignatureValidator(twilio_account_service=account_service)
+    params = {"AccountSid": "AC_tenant", "Body": "Oi"}
+
+    assert await validator.validate(URL, params, sign("default_token", params)) is True
+    assert await validator.validate(URL, params, sign("default_token", params)) is True
+    assert account_service.resolve_account.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_no_token_rejects(mock_settings):
+    mock_settings.twilio.auth_token = None
+
+    assert await TwilioSignatureValidator().validate(URL, {"Body": "Oi"}, "sig") is False
@@ -1,75 +1,95 @@
-import unittest
-from unittest.mock import MagicMock, patch, mock_open
+import hashlib
 import os
-import requests
-from src.modules.channels.twilio.utils.helpers import download_media
-
-class TestTwilioHelpers(unittest.TestCase):
-    def setUp(self):
-        self.media_url = "http://api.twilio.com/media/123"
-        self.media_type = "image/jpeg"
-        self.content = b"fake-image-content"
-
-    @patch("src.modules.channels.twilio.utils.helpers.settings")
-    @patch("src.modules.channels.twilio.utils.helpers.requests.get")
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("os.makedirs")
-    def test_download_media_success(self, mock_makedirs, mock_file, mock_get, mock_settings):
-        # Configure Mocks
-        mock_settings.twilio.account_sid = "AC123"
-        mock_settings.twilio.auth_token = "token123"
-        
-        mock_response = MagicMock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.content = self.content
-        mock_get.return_value = mock_response
-
-        # Execute
-        filepath = download_media(self.media_type, self.media_url)
-
-        # Assertions
-        mock_get.assert_called_with(self.media_url, auth=("AC123", "token123"), timeout=50)
-        mock_makedirs.assert_called_with("downloads", exist_ok=True)
-        mock_file.assert_called() # Checking if file was opened
-        # We expect filename to be 123.jpe or 123.jpg depending on system mime
-        # Let's just check it returns a string ending in download dir
-        self.assertTrue(filepath.startswith("downloads/"))
-        self.assertIn("123", filepath)
-
-    @patch("src.modules.channels.twilio.utils.helpers.settings")
-    def test_download_media_no_credentials(self, mock_settings):
-        mock_settings.twilio.account_sid = None
-        mock_settings.twilio.auth_token = None
-        with patch.dict(os.environ, {}, clear=True):
-             result = download_media(self.media_type, self.media_url)
-             self.assertIsNone(result)
-
-    @patch("src.modules.channels.twilio.utils.helpers.settings")
-    @patch("src.modules.channels.twilio.utils.helpers.requests.get")
-    def test_download_media_request_error(self, mock_get, mock_settings):
-        mock_settings.twilio.account_sid = "AC123"
-        mock_settings.twilio.auth_token = "token123"
-        
-        mock_get.side_effect = requests.RequestException("Network Error")
-        
-        result = download_media(self.media_type, self.media_url)
-        
-        self.assertIsNone(result)
-
-    @patch("src.modules.channels.twilio.utils.helpers.settings")
-    @patch("src.modules.channels.twilio.utils.helpers.requests.get")
-    @patch("builtins.open", new_callable=mock_open)
-    def test_download_media_fallback_extension(self, mock_file, mock_get, mock_settings):
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from src.modules.channels.twilio.utils.helpers import download_media, fetch_media
+
+MEDIA_URL = "https://api.twilio.com/2010-04-01/Accounts/AC123/Messages/MM1/Media/ME123"
+CONTENT = b"fake-audio-content" * 1000
+
+
+@pytest.fixture
+def mock_settings(tmp_path):
+    with patch("src.modules.channels.twilio.utils.helpers.settings") as mock_settings:
         mock_settings.twilio.account_sid = "AC123"
         mock_settings.twilio.auth_token = "token123"
-        
-        mock_response = MagicMock()
-        mock_response.content = self.content
-        mock_get.return_value = mock_response
-        
-        # Unknown mime type
-        filepath = download_media("application/unknown-xyz", self.media_url)
-        
-        # Should fallback to extension from mime subtype or similar logic
-        # Implementation does: ext = f".{parts[-1]}"
-        self.assertTrue(filepath.endswith(".unknown-xyz"))
+        mock_settings.twilio.media_download_dir = str(tmp_path)
+        mock_settings.twilio.media_max_bytes = 1024 * 1024
+        mock_settings.twilio.media_allowed_types = ["audio/*", "image/*"]
+        yield mock_settings
+
+
+def make_client(content=CONTENT, content_type="audio/ogg", status=200, requests=None):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if requests is not None:
+            requests.append(request)
+        return httpx.Response(status, headers={"Content-Type": content_type}, content=content)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_fetch_media_streams_to_unique_files(mock_settings, tmp_path):
+    requests = []
+    client = make_client(requests=requests)
+
+    first = await fetch_media("audio/ogg", MEDIA_URL, client=client, hash_algorithm="sha256")
+    second = await fetch_media("audio/ogg", MEDIA_URL, client=client)
+
+    assert first.path != second.path
+    assert os.path.dirname(first.path) == str(tmp_path)
+    assert first.path.endswith(".oga") or first.path.endswith(".ogg")
+    with open(first.path, "rb") as f:
+        assert f.read() == CONTENT
+    assert first.size == len(CONTENT)
+    assert first.digest == hashlib.sha256(CONTENT).hexdigest()
+    assert second.digest is None
+    assert requests[0].headers["Authorization"].startswith("Basic ")
+
+
+@pytest.mark.asyncio
+async def test_fetch_media_rejects_oversized(mock_settings, tmp_path):
+    client = make_client()
+
+    result = await fetch_media("audio/ogg", MEDIA_URL, client=client, max_bytes=1000)
+
+    assert result is None
+    assert os.listdir(tmp_path) == []  # Partial file removed
+
+
+@pytest.mark.asyncio
+async def test_fetch_media_rejects_disallowed_type(mock_settings, tmp_path):
+    client = make_client(content_type="application/x-msdownload")
+
+    assert await fetch_media("audio/ogg", MEDIA_URL, client=client) is None
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.asyncio
+async def test_fetch_media_http_error(mock_settings):
+    client = make_client(status=404)
+
+    assert await fetch_media("audio/ogg", MEDIA_URL, client=client) is None
+
+
+@pytest.mark.asyncio
+async def test_download_media_no_credentials(mock_settings):
+    mock_settings.twilio.account_sid = None
+    mock_settings.twilio.auth_token = None
+    with patch.dict(os.environ, {}, clear=True):
+        assert await download_media("image/jpeg", MEDIA_URL) is None
+
+
+@pytest.mark.asyncio
+async def test_download_media_fallback_extension(mock_settings):
+    mock_settings.twilio.media_allowed_types = []  # Allow any type
+    with patch(
+        "src.modules.channels.twilio.utils.helpers.get_media_client",
+        return_value=make_client(content_type="application/unknown-xyz"),
+    ):
+        filepath = await download_media("application/unknown-xyz", MEDIA_URL)
+
+    assert filepath.endswith(".unknown-xyz")
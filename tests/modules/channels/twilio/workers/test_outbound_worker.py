@@ -15,7 +15,7 @@ class TestTwilioOutboundWorker:
     @pytest.fixture
     def mock_message_repo(self):
         repo = MagicMock()
-        repo.find_by_id = AsyncMock()
+        repo.find_by_id = AsyncMock(return_value=None)
         repo.update = AsyncMock()
         return repo
 
@@ -56,7 +56,9 @@ class TestTwilioOutboundWorker:
             owner_id="owner_123",
             from_number="whatsapp:+123",
             to_number="whatsapp:+456",
-            body="Hello"
+            body="Hello",
+            start_chunk=0,
+            before_chunk=None,
         )
         
         mock_message_repo.find_by_id.assert_called_with("msg_123", id_column="msg_id")
@@ -106,3 +108,55 @@ class TestTwilioOutboundWorker:
         mock_twilio_service.send_message.assert_called()
         args = mock_twilio_service.send_message.call_args[1]
         assert args["owner_id"] == "override_owner"
+
+    @pytest.mark.asyncio
+    async def test_handle_send_message_task_rate_limited(self, mock_twilio_service, mock_message_repo, mock_payload):
+        from src.modules.channels.twilio.exceptions import TwilioRateLimitError
+
+        rate_limiter = MagicMock()
+        rate_limiter.acquire = AsyncMock(return_value=0.0)
+        rate_limiter.penalize = AsyncMock()
+        worker = TwilioOutboundWorker(mock_twilio_service, mock_message_repo, rate_limiter=rate_limiter)
+        mock_twilio_service.send_message.side_effect = TwilioRateLimitError(retry_after=4.0)
+
+        with pytest.raises(TwilioRateLimitError):
+            await worker.handle_send_message_task(mock_payload)
+
+        rate_limiter.penalize.assert_awaited_once_with("owner_123:whatsapp:+123", 4.0)
+        # Nothing went out, so there is no progress to record
+        mock_message_repo.update.assert_not_called()
+
+        # The service takes one limiter token per chunk
+        before_chunk = mock_twilio_service.send_message.call_args.kwargs["before_chunk"]
+        await before_chunk()
+        await before_chunk()
+        assert rate_limiter.acquire.await_count == 2
+        rate_limiter.acquire.assert_awaited_with("owner_123:whatsapp:+123")
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_midway_resumes_after_sent_chunks(self, worker, mock_twilio_service, mock_message_repo, mock_payload):
+        from src.modules.channels.twilio.exceptions import TwilioRateLimitError
+
+        mock_message_repo.find_by_id.return_value = MagicMock(metadata={})
+        mock_twilio_service.send_message.side_effect = TwilioRateLimitError(
+            retry_after=4.0, sent_chunks=2, first_sid="SM1"
+        )
+
+        with pytest.raises(TwilioRateLimitError):
+            await worker.handle_send_message_task(mock_payload)
+
+        progress = mock_message_repo.update.call_args.kwargs["data"]["metadata"]
+        assert progress == {"chunks_sent": 2, "message_sid": "SM1"}
+
+        # The queue retries the task: only the remaining chunks are sent
+        mock_message_repo.find_by_id.return_value = MagicMock(metadata=progress)
+        mock_twilio_service.send_message.side_effect = None
+        mock_twilio_service.send_message.return_value = MagicMock(sid="SM3", status="queued", num_media=0)
+
+        await worker.handle_send_message_task(mock_payload)
+
+        assert mock_twilio_service.send_message.call_args.kwargs["start_chunk"] == 2
+        metadata = mock_message_repo.update.call_args.kwargs["data"]["metadata"]
+        assert metadata["message_sid"] == "SM1"
+        assert metadata["delivery_status"] == "sent"
+        assert "chunks_sent" not in metadata
@@ -164,6 +164,81 @@ class TestConversationApiV2:
         assert len(response.json()) == 1
         assert response.json()[0]["body"] == "Hello"
 
+    def test_get_conversation_messages_keyset_cursor(self, client, mock_service, mock_conversation):
+        from datetime import datetime, timezone
+        from src.modules.conversation.api.v2.conversations import encode_message_cursor
+
+        mock_service.get_conversation_by_id.return_value = mock_conversation
+        last_ts = datetime(2024, 1, 1, 10, 0, tzinfo=timezone.utc)
+        message = Message(
+            msg_id=VALID_MSG_ID,
+            conv_id=VALID_CONV_ID,
+            owner_id=VALID_OWNER_ID,
+            from_number="whatsapp:+123",
+            to_number="whatsapp:+456",
+            body="Hello",
+            direction="inbound",
+            message_owner="user",
+            timestamp=last_ts,
+        )
+        mock_service.get_conversation_messages.return_value = [message]
+
+        # Full page: next cursor points after the last message
+        response = client.get(f"/conversation/v2/conversations/{VALID_CONV_ID}/messages?limit=1")
+        assert response.status_code == 200
+        next_cursor = response.headers["X-Next-Cursor"]
+        assert next_cursor == encode_message_cursor(last_ts, VALID_MSG_ID)
+
+        response = client.get(
+            f"/conversation/v2/conversations/{VALID_CONV_ID}/messages?limit=5&cursor={next_cursor}"
+        )
+        assert response.status_code == 200
+        assert "X-Next-Cursor" not in response.headers
+        mock_service.get_conversation_messages.assert_called_with(
+            VALID_CONV_ID, 5, after=(last_ts, VALID_MSG_ID)
+        )
+
+    def test_message_cursor_without_timestamp_round_trips(self):
+        from src.modules.conversation.api.v2.conversations import (
+            decode_message_cursor, encode_message_cursor)
+
+        assert decode_message_cursor(encode_message_cursor(None, VALID_MSG_ID)) == (None, VALID_MSG_ID)
+
+    def test_get_conversation_messages_invalid_cursor(self, client, mock_service):
+        response = client.get(
+            f"/conversation/v2/conversations/{VALID_CONV_ID}/messages?cursor=not-a-cursor"
+        )
+        assert response.status_code == 400
+        mock_service.get_conversation_messages.assert_not_called()
+
+    def test_export_conversation_messages_ndjson(self, client, mock_service, mock_conversation):
+        import json
+
+        mock_service.get_conversation_by_id.return_value = mock_conversation
+        rows = [{"msg_id": "1", "body": "Oi"}, {"msg_id": "2", "body": "Tudo bem?"}]
+
+        async def stream():
+            for row in rows:
+                yield row
+
+        mock_service.stream_conversation_messages = MagicMock(return_value=stream())
+
+        response = client.get(f"/conversation/v2/conversations/{VALID_CONV_ID}/messages/export")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = response.text.strip().split("\n")
+        assert [json.loads(line) for line in lines] == rows
+        mock_service.stream_conversation_messages.assert_called_once_with(VALID_CONV_ID)
+
+    def test_export_conversation_messages_forbidden(self, client, mock_service, mock_conversation):
+        mock_conversation.owner_id = OTHER_OWNER_ID
+        mock_service.get_conversation_by_id.return_value = mock_conversation
+
+        response = client.get(f"/conversation/v2/conversations/{VALID_CONV_ID}/messages/export")
+
+        assert response.status_code == 403
+
     def test_add_message_success(self, client, mock_service, mock_conversation):
         mock_service.get_conversation_by_id.return_value = mock_conversation
         
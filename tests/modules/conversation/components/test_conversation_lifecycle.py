@@ -294,6 +294,42 @@ class TestConversationLifecycle:
         assert processed == 0
         # Should catch and continue
 
+    async def test_process_expirations_bulk_sweep_pages_by_conv_id(self, mock_repo):
+        """Bulk sweeps page through the backlog with the last conv_id as cursor."""
+        lifecycle = ConversationLifecycle(mock_repo, bulk_sweeps=True)
+        mock_repo.bulk_transition.side_effect = [["a", "b"], ["c", "d"], ["e"]]
+
+        processed = await lifecycle.process_expirations(limit=2)
+
+        assert processed == 5
+        calls = mock_repo.bulk_transition.call_args_list
+        assert [c.kwargs["after_conv_id"] for c in calls] == [None, "b", "d"]
+        first = calls[0].kwargs
+        assert first["to_status"] == ConversationStatus.EXPIRED
+        assert first["before_column"] == "expires_at"
+        assert first["limit"] == 2
+        # HUMAN_HANDOFF may not expire
+        assert first["from_statuses"] == [
+            ConversationStatus.PENDING,
+            ConversationStatus.PROGRESS,
+        ]
+        mock_repo.find_expired_candidates.assert_not_called()
+        mock_repo.update_status.assert_not_called()
+
+    async def test_process_idle_timeouts_bulk_sweep_stops_at_max_batches(self, mock_repo):
+        lifecycle = ConversationLifecycle(mock_repo, bulk_sweeps=True, sweep_max_batches=2)
+        mock_repo.bulk_transition.return_value = ["a"]
+
+        processed = await lifecycle.process_idle_timeouts(idle_minutes=30, limit=1)
+
+        assert processed == 2
+        assert mock_repo.bulk_transition.await_count == 2
+        kwargs = mock_repo.bulk_transition.call_args.kwargs
+        assert kwargs["from_statuses"] == [ConversationStatus.PROGRESS]
+        assert kwargs["to_status"] == ConversationStatus.IDLE_TIMEOUT
+        assert kwargs["before_column"] == "updated_at"
+        mock_repo.find_idle_candidates.assert_not_called()
+
     async def test_log_history_exception(self, lifecycle, mock_repo, mock_conv):
         """Test exception logging in log_transition_history."""
         mock_repo.update_status.return_value = mock_conv
@@ -623,3 +623,48 @@ class TestConversationRepository:
                 conv_id="01ARZ3NDEKTSV4RRFFQ69G5FAV",
                 error="History Error",
             )
+
+    async def test_bulk_transition_falls_back_to_per_row_updates(self):
+        """Without a set-based override, sweeps reuse the candidate finders and update_status."""
+        idle = Conversation(**{**self.mock_conversation_data, "conv_id": "01ARZ3NDEKTSV4RRFFQ69G5FB2"})
+        pending = Conversation(
+            **{**self.mock_conversation_data, "conv_id": "01ARZ3NDEKTSV4RRFFQ69G5FB1", "status": "pending"}
+        )
+        self.repository.find_idle_candidates = AsyncMock(return_value=[idle, pending])
+        self.repository.update_status = AsyncMock(return_value=idle)
+        before = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        conv_ids = await self.repository.bulk_transition(
+            from_statuses=[ConversationStatus.PROGRESS],
+            to_status=ConversationStatus.IDLE_TIMEOUT,
+            before_column="updated_at",
+            before=before,
+            reason="inactivity_timeout",
+            limit=10,
+        )
+
+        assert conv_ids == [idle.conv_id]
+        self.repository.find_idle_candidates.assert_awaited_once_with(before.isoformat(), limit=10)
+        self.repository.update_status.assert_awaited_once_with(
+            idle.conv_id,
+            ConversationStatus.IDLE_TIMEOUT,
+            initiated_by="system",
+            reason="inactivity_timeout",
+            ended_at=None,
+        )
+
+    async def test_bulk_transition_fallback_skips_failed_rows(self):
+        expired = Conversation(**self.mock_conversation_data)
+        self.repository.find_expired_candidates = AsyncMock(return_value=[expired])
+        self.repository.update_status = AsyncMock(side_effect=ConcurrencyError("conflict"))
+
+        conv_ids = await self.repository.bulk_transition(
+            from_statuses=[ConversationStatus.PENDING, ConversationStatus.PROGRESS],
+            to_status=ConversationStatus.EXPIRED,
+            before_column="expires_at",
+            before=datetime.now(timezone.utc),
+            reason="ttl_expired",
+        )
+
+        assert conv_ids == []
+        assert self.repository.update_status.await_args.kwargs["ended_at"] is not None
@@ -1,7 +1,7 @@
 
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
-from datetime import datetime
+from datetime import datetime, timezone
 
 from src.modules.conversation.repositories.impl.supabase.message_repository import SupabaseMessageRepository
 from src.modules.conversation.models.message import Message
@@ -70,9 +70,86 @@ class TestSupabaseMessageRepository:
         # Verify calls
         self.mock_client.table.assert_called_with("messages")
         mock_query.eq.assert_called_with("conv_id", "01ARZ3NDEKTSV4RRFFQ69G5FAV")
-        mock_query.order.assert_called_with("timestamp", desc=False)
+        mock_query.order.assert_any_call("timestamp", desc=False)
+        mock_query.order.assert_called_with("msg_id", desc=False)
         mock_query.range.assert_called_with(0, 9)
 
+    async def test_find_by_conversation_after_cursor(self):
+        mock_query = MagicMock()
+        self.mock_client.table.return_value = mock_query
+        for method in ("select", "eq", "gte", "or_", "limit", "order"):
+            getattr(mock_query, method).return_value = mock_query
+        mock_query.execute.return_value = MagicMock(data=[self.mock_message_data])
+        after = (datetime(2024, 1, 1, tzinfo=timezone.utc), "01ARZ3NDEKTSV4RRFFQ69G5FA0")
+
+        messages = await self.repository.find_by_conversation(
+            "01ARZ3NDEKTSV4RRFFQ69G5FAV", limit=1, after=after
+        )
+
+        assert len(messages) == 1
+        mock_query.gte.assert_called_once_with("timestamp", "2024-01-01T00:00:00+00:00")
+        mock_query.or_.assert_called_once_with(
+            'timestamp.gt."2024-01-01T00:00:00+00:00",'
+            'and(timestamp.eq."2024-01-01T00:00:00+00:00",msg_id.gt.01ARZ3NDEKTSV4RRFFQ69G5FA0)'
+        )
+        mock_query.limit.assert_called_once_with(1)
+        mock_query.range.assert_not_called()
+        # A full page: the NULL tail is not queried
+        mock_query.is_.assert_not_called()
+
+    async def test_find_by_conversation_after_cursor_continues_into_null_tail(self):
+        mock_query = MagicMock()
+        self.mock_client.table.return_value = mock_query
+        for method in ("select", "eq", "gte", "or_", "is_", "limit", "order"):
+            getattr(mock_query, method).return_value = mock_query
+        null_row = {**self.mock_message_data, "msg_id": "01ARZ3NDEKTSV4RRFFQ69G5FA9", "timestamp": None}
+        mock_query.execute.side_effect = [
+            MagicMock(data=[self.mock_message_data]),
+            MagicMock(data=[null_row]),
+        ]
+        after = (datetime(2024, 1, 1, tzinfo=timezone.utc), "01ARZ3NDEKTSV4RRFFQ69G5FA0")
+
+        messages = await self.repository.find_by_conversation("conv", limit=3, after=after)
+
+        assert [m.msg_id for m in messages] == [
+            self.mock_message_data["msg_id"], "01ARZ3NDEKTSV4RRFFQ69G5FA9"
+        ]
+        mock_query.is_.assert_called_once_with("timestamp", "null")
+        mock_query.limit.assert_called_with(2)
+
+    async def test_stream_by_conversation_pages_past_null_timestamps(self):
+        """The default stream keeps paging once it reaches messages without a timestamp."""
+        pages = [
+            [Message(**{**self.mock_message_data, "msg_id": "01ARZ3NDEKTSV4RRFFQ69G5FA1"}),
+             Message(**{**self.mock_message_data, "msg_id": "01ARZ3NDEKTSV4RRFFQ69G5FA2", "timestamp": None})],
+            [Message(**{**self.mock_message_data, "msg_id": "01ARZ3NDEKTSV4RRFFQ69G5FA3", "timestamp": None})],
+        ]
+        self.repository.find_by_conversation = AsyncMock(side_effect=pages)
+
+        rows = [row async for row in self.repository.stream_by_conversation("conv", batch_size=2)]
+
+        assert [r["msg_id"] for r in rows] == [
+            "01ARZ3NDEKTSV4RRFFQ69G5FA1", "01ARZ3NDEKTSV4RRFFQ69G5FA2", "01ARZ3NDEKTSV4RRFFQ69G5FA3"
+        ]
+        self.repository.find_by_conversation.assert_called_with(
+            "conv", 2, after=(None, "01ARZ3NDEKTSV4RRFFQ69G5FA2")
+        )
+
+    async def test_find_by_conversation_after_null_timestamp(self):
+        mock_query = MagicMock()
+        self.mock_client.table.return_value = mock_query
+        for method in ("select", "eq", "is_", "gt", "limit", "order"):
+            getattr(mock_query, method).return_value = mock_query
+        mock_query.execute.return_value = MagicMock(data=[])
+
+        await self.repository.find_by_conversation(
+            "01ARZ3NDEKTSV4RRFFQ69G5FAV", limit=10, after=(None, "01ARZ3NDEKTSV4RRFFQ69G5FA0")
+        )
+
+        mock_query.is_.assert_called_once_with("timestamp", "null")
+        mock_query.gt.assert_called_once_with("msg_id", "01ARZ3NDEKTSV4RRFFQ69G5FA0")
+        mock_query.or_.assert_not_called()
+
     async def test_create_success(self):
         # Setup mock chain
         mock_query = MagicMock()
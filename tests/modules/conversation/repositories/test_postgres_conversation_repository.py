@@ -91,29 +91,45 @@ class TestPostgresConversationRepository:
         assert isinstance(result[0], Conversation)
 
     async def test_update_status(self, repository, mock_conversation_data):
-        # 1. find_by_id (initial load) -> Mocked
-        # 2. update (perform update) -> Mocked
-        # 3. _log_history -> _execute_query
-        
+        # Transition and history insert run as one statement
         updated_data = mock_conversation_data.copy()
         updated_data["status"] = "agent_closed"
         updated_data["version"] = 2
-        
-        repository.find_by_id.return_value = Conversation(**mock_conversation_data)
-        repository.update.return_value = Conversation(**updated_data)
+        updated_data["previous_status"] = "progress"
+        repository._execute_query.return_value = updated_data
         
         result = await repository.update_status(
             "01ARZ3NDEKTSV4RRFFQ69G5FAV",
             ConversationStatus.AGENT_CLOSED,
+            initiated_by="agent",
             reason="done"
         )
         
         assert result is not None
         assert result.status == "agent_closed"
         assert result.version == 2
-        
-        # Verify history log
-        assert repository._execute_query.called
+
+        repository._execute_query.assert_awaited_once()
+        query, params = repository._execute_query.call_args[0]
+        query_str = query.as_string(None)
+        assert "UPDATE conversations" in query_str
+        assert "INSERT INTO conversation_state_history" in query_str
+        assert "c.version = snapshot.version" in query_str
+        assert params[0] == "01ARZ3NDEKTSV4RRFFQ69G5FAV"
+        assert params[1] == "agent_closed"
+        assert params[3] is not None  # ended_at set for closed statuses
+        assert params[5:7] == ("agent", "done")
+        repository.find_by_id.assert_not_called()
+
+    async def test_update_status_not_found(self, repository):
+        repository._execute_query.return_value = None
+        repository.find_by_id.return_value = None
+
+        result = await repository.update_status(
+            "01ARZ3NDEKTSV4RRFFQ69G5FAV", ConversationStatus.PROGRESS
+        )
+
+        assert result is None
         
     async def test_find_expired_candidates(self, repository, mock_conversation_data):
         repository._execute_query.return_value = [mock_conversation_data]
@@ -133,6 +149,39 @@ class TestPostgresConversationRepository:
                 assert count == 1
                 mock_update.assert_called_once()
 
+    async def test_bulk_transition(self, repository):
+        repository._execute_query.return_value = [{"conv_id": "a"}, {"conv_id": "b"}]
+        before = datetime.now(timezone.utc)
+
+        result = await repository.bulk_transition(
+            from_statuses=[ConversationStatus.PENDING, ConversationStatus.PROGRESS],
+            to_status=ConversationStatus.EXPIRED,
+            before_column="expires_at",
+            before=before,
+            reason="ttl_expired",
+            limit=2,
+            after_conv_id="0",
+        )
+
+        assert result == ["a", "b"]
+        query, params = repository._execute_query.call_args[0]
+        assert isinstance(query, str)  # compiled once per sweep column
+        assert 'AND "expires_at" < $2 AND conv_id > $3' in query
+        assert "FOR UPDATE SKIP LOCKED" in query
+        assert "INSERT INTO conversation_state_history" in query
+        assert params[:5] == (["pending", "progress"], before, "0", 2, "expired")
+        assert params[6] is not None  # ended_at for closed statuses
+
+    async def test_bulk_transition_rejects_unknown_column(self, repository):
+        with pytest.raises(ValueError):
+            await repository.bulk_transition(
+                from_statuses=[ConversationStatus.PROGRESS],
+                to_status=ConversationStatus.IDLE_TIMEOUT,
+                before_column="status; DROP TABLE conversations",
+                before=datetime.now(timezone.utc),
+                reason="inactivity_timeout",
+            )
+
     async def test_find_active_by_session_key(self, repository, mock_conversation_data):
         repository._execute_query.return_value = mock_conversation_data
         
@@ -213,15 +262,11 @@ class TestPostgresConversationRepository:
         updated_data_db = mock_conversation_data.copy()
         updated_data_db["version"] = 2 # Different version in DB
         
-        # 1. find_by_id -> returns current
-        # 2. update -> returns None (simulating update failure)
-        # 3. find_by_id -> returns updated version (triggering ConcurrencyError)
+        # 1. CTE update -> no row (version changed between read and update)
+        # 2. find_by_id -> returns updated version (triggering ConcurrencyError)
         
-        repository.update.return_value = None
-        repository.find_by_id.side_effect = [
-            Conversation(**current_data), # Initial fetch
-            Conversation(**updated_data_db) # Fetch after update fail
-        ]
+        repository._execute_query.return_value = None
+        repository.find_by_id.return_value = Conversation(**updated_data_db)
         
         with pytest.raises(ConcurrencyError):
             await repository.update_status(
@@ -59,6 +59,70 @@ class TestPostgresMessageRepository:
         assert isinstance(result[0], Message)
         repository._execute_query.assert_called()
         
+    async def test_find_by_conversation_after_cursor(self, repository, mock_message_data):
+        repository._execute_query.return_value = [mock_message_data]
+        after = (datetime(2024, 1, 1, tzinfo=timezone.utc), "01ARZ3NDEKTSV4RRFFQ69G5FA0")
+
+        result = await repository.find_by_conversation(
+            "01ARZ3NDEKTSV4RRFFQ69G5FAV", limit=1, after=after
+        )
+
+        assert len(result) == 1
+        query, params = repository._execute_query.call_args[0]
+        sql_text = query.as_string(None)
+        assert "(timestamp, msg_id) > (%s, %s)" in sql_text
+        # A plain row comparison, so the index serves it as a range
+        assert " OR " not in sql_text.upper()
+        assert "IS NULL" not in sql_text
+        assert "OFFSET" not in sql_text
+        assert params == ("01ARZ3NDEKTSV4RRFFQ69G5FAV", after[0], after[1], 1)
+        repository._execute_query.assert_called_once()
+
+    async def test_find_by_conversation_after_cursor_continues_into_null_tail(
+        self, repository, mock_message_data
+    ):
+        null_row = {**mock_message_data, "msg_id": "01ARZ3NDEKTSV4RRFFQ69G5FA9", "timestamp": None}
+        repository._execute_query.side_effect = [[mock_message_data], [null_row]]
+        after = (datetime(2024, 1, 1, tzinfo=timezone.utc), "01ARZ3NDEKTSV4RRFFQ69G5FA0")
+
+        result = await repository.find_by_conversation("conv", limit=3, after=after)
+
+        assert [m.msg_id for m in result] == [mock_message_data["msg_id"], "01ARZ3NDEKTSV4RRFFQ69G5FA9"]
+        query, params = repository._execute_query.call_args[0]
+        assert "timestamp IS NULL" in query.as_string(None)
+        assert " OR " not in query.as_string(None).upper()
+        assert params == ("conv", 2)
+
+    async def test_find_by_conversation_after_null_timestamp(self, repository):
+        repository._execute_query.return_value = []
+
+        await repository.find_by_conversation("conv", limit=20, after=(None, "01ARZ3NDEKTSV4RRFFQ69G5FA0"))
+
+        query, params = repository._execute_query.call_args[0]
+        assert "timestamp IS NULL AND msg_id > %s" in query.as_string(None)
+        assert params == ("conv", "01ARZ3NDEKTSV4RRFFQ69G5FA0", 20)
+
+    async def test_stream_by_conversation_pages_by_keyset(self, repository, mock_message_data):
+        ts = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        first = {**mock_message_data, "msg_id": "a", "timestamp": ts, "metadata": '{"sid": "123"}'}
+        second = {**mock_message_data, "msg_id": "b", "timestamp": ts}
+        third = {**mock_message_data, "msg_id": "c", "timestamp": None}
+        repository._execute_query.side_effect = [[first, second], [], [third]]
+
+        rows = [r async for r in repository.stream_by_conversation("conv", batch_size=2)]
+
+        assert [r["msg_id"] for r in rows] == ["a", "b", "c"]
+        assert rows[0]["timestamp"] == "2024-01-01T00:00:00+00:00"
+        assert rows[0]["metadata"] == {"sid": "123"}
+        # One short query per page, no transaction or server-side cursor
+        (q1, p1), (q2, p2), (q3, p3) = (c.args for c in repository._execute_query.call_args_list)
+        assert p1 == ("conv", 2, 0)
+        assert "(timestamp, msg_id) > (%s, %s)" in q2.as_string(None)
+        assert p2 == ("conv", ts, "b", 2)
+        # The keyset page came back short, so the NULL tail fills it
+        assert "timestamp IS NULL" in q3.as_string(None)
+        assert p3 == ("conv", 2)
+
     async def test_count_by_conversation(self, repository):
         repository._execute_query.return_value = {"count": 42}
         
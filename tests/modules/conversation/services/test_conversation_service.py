@@ -225,6 +225,51 @@ class TestConversationService:
             expires_at=None,
         )
 
+    async def test_add_message_runs_in_unit_of_work(self):
+        """Message, transition and timestamp update share one unit of work."""
+        from contextlib import asynccontextmanager
+
+        from src.modules.conversation.dtos.message_dto import MessageCreateDTO
+
+        events = []
+
+        class RecordingUnitOfWork:
+            @asynccontextmanager
+            async def begin(self):
+                events.append("begin")
+                yield
+                events.append("commit")
+
+        self.service.unit_of_work = RecordingUnitOfWork()
+        self.mock_msg_repo.create.side_effect = lambda data: events.append("message")
+        self.mock_conv_repo.update_timestamp.side_effect = (
+            lambda conv_id: events.append("timestamp")
+        )
+        self.mock_closer.detect_intent.return_value = Mock(should_close=False, reasons=[])
+
+        conversation = Conversation(
+            conv_id="01ARZ3NDEKTSV4RRFFQ69G5FAV",
+            owner_id="01ARZ3NDEKTSV4RRFFQ69G5FAV",
+            from_number="+5511988887777",
+            to_number="+5511999998888",
+            status=ConversationStatus.PROGRESS,
+            context={},
+        )
+        message_create = MessageCreateDTO(
+            conv_id="01ARZ3NDEKTSV4RRFFQ69G5FAV",
+            owner_id="01ARZ3NDEKTSV4RRFFQ69G5FAV",
+            from_number="+5511988887777",
+            to_number="+5511999998888",
+            body="Oi",
+            direction=MessageDirection.INBOUND,
+            message_owner=MessageOwner.USER,
+            message_type=MessageType.TEXT,
+        )
+
+        await self.service.add_message(conversation, message_create)
+
+        assert events == ["begin", "message", "timestamp", "commit"]
+
     async def test_close_conversation(self):
         """Test close_conversation delegation."""
         conversation = Mock()
@@ -319,6 +364,12 @@ class TestConversationService:
         await self.service.get_conversation_messages("123", limit=10, offset=5)
         self.mock_msg_repo.find_by_conversation.assert_called_with("123", 10, 5)
 
+    async def test_get_conversation_messages_after_cursor(self):
+        """Keyset cursor is passed through instead of the offset."""
+        after = (datetime(2024, 1, 1), "01ARZ3NDEKTSV4RRFFQ69G5FA1")
+        await self.service.get_conversation_messages("123", limit=10, after=after)
+        self.mock_msg_repo.find_by_conversation.assert_called_with("123", 10, after=after)
+
     async def test_process_expired_conversations(self):
         """Test delegation of expiration processing."""
         await self.service.process_expired_conversations(limit=10)
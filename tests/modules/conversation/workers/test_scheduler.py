@@ -24,6 +24,12 @@ class TestBackgroundScheduler(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(self.scheduler.metrics.total_cycles, 0)
         self.assertFalse(self.scheduler.running)
 
+    def _enqueued_tasks(self):
+        self.mock_queue_service.enqueue_many.assert_called_once()
+        tasks = self.mock_queue_service.enqueue_many.call_args[0][0]
+        # cleanup_ai_logs is only added at the top of the hour
+        return [t for t in tasks if t["task_name"] != "cleanup_ai_logs"]
+
     async def test_schedule_tasks_success(self):
         # Setup settings
         with patch(
@@ -33,22 +39,23 @@ class TestBackgroundScheduler(unittest.IsolatedAsyncioTestCase):
 
             await self.scheduler._schedule_tasks()
 
-            # Should enqueue 2 tasks: idle and expired
-            self.assertEqual(self.mock_queue_service.enqueue.call_count, 2)
+            # Should enqueue 2 tasks in one batch: idle and expired
+            tasks = self._enqueued_tasks()
+            self.assertEqual(len(tasks), 2)
+            self.mock_queue_service.enqueue.assert_not_called()
 
             # Verify idle task
-            call_args_list = self.mock_queue_service.enqueue.call_args_list
-            idle_call = call_args_list[0]
-            self.assertEqual(idle_call[0][0], "process_idle_conversations")
-            self.assertEqual(idle_call[0][1]["limit"], 10)
-            self.assertEqual(idle_call[0][1]["idle_minutes"], 30)
+            idle_task = tasks[0]
+            self.assertEqual(idle_task["task_name"], "process_idle_conversations")
+            self.assertEqual(idle_task["payload"]["limit"], 10)
+            self.assertEqual(idle_task["payload"]["idle_minutes"], 30)
 
             # Verify expired task
-            expired_call = call_args_list[1]
-            self.assertEqual(expired_call[0][0], "process_expired_conversations")
-            self.assertEqual(expired_call[0][1]["limit"], 10)
+            expired_task = tasks[1]
+            self.assertEqual(expired_task["task_name"], "process_expired_conversations")
+            self.assertEqual(expired_task["payload"]["limit"], 10)
 
-            self.assertEqual(self.scheduler.metrics.tasks_enqueued, 2)
+            self.assertGreaterEqual(self.scheduler.metrics.tasks_enqueued, 2)
 
     async def test_schedule_tasks_idle_disabled(self):
         with patch(
@@ -59,25 +66,25 @@ class TestBackgroundScheduler(unittest.IsolatedAsyncioTestCase):
             await self.scheduler._schedule_tasks()
 
             # Should enqueue only 1 task: expired (idle is skipped)
-            self.assertEqual(self.mock_queue_service.enqueue.call_count, 1)
+            tasks = self._enqueued_tasks()
             self.assertEqual(
-                self.mock_queue_service.enqueue.call_args[0][0],
-                "process_expired_conversations",
+                [t["task_name"] for t in tasks], ["process_expired_conversations"]
             )
-            self.assertEqual(self.scheduler.metrics.tasks_enqueued, 1)
+            self.assertGreaterEqual(self.scheduler.metrics.tasks_enqueued, 1)
 
     async def test_schedule_tasks_error(self):
         with patch(
             "src.modules.conversation.workers.scheduler.settings"
         ) as mock_settings:
             mock_settings.conversation.idle_timeout_minutes = 30
-            self.mock_queue_service.enqueue.side_effect = Exception("Queue Error")
+            self.mock_queue_service.enqueue_many.side_effect = Exception("Queue Error")
 
             await self.scheduler._schedule_tasks()
 
-            # Should try both but fail
-            self.assertEqual(self.mock_queue_service.enqueue.call_count, 2)
-            self.assertEqual(self.scheduler.metrics.errors, 2)
+            # One batch attempted, one error recorded
+            self.mock_queue_service.enqueue_many.assert_called_once()
+            self.assertEqual(self.scheduler.metrics.tasks_enqueued, 0)
+            self.assertEqual(self.scheduler.metrics.errors, 1)
 
     async def test_start_and_shutdown(self):
         # We need to run start() but interrupt it or it will loop forever.